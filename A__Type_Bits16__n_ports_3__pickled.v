@@ -0,0 +1,36 @@
+//-------------------------------------------------------------------------
+// A__Type_Bits16__n_ports_3.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component A Definition
+// At /root/package/pymtl3/passes/backends/verilog/test/TranslationImport_closed_loop_component_input_test.py
+module A__Type_Bits16__n_ports_3
+(
+  input  logic [0:0]    clk,
+  input  logic [15:0]   in___0,
+  input  logic [15:0]   in___1,
+  input  logic [15:0]   in___2,
+  output logic [15:0]   out,
+  input  logic [0:0]    reset,
+  input  logic [1:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [15:0]   in_ [0:2];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/passes/backends/verilog/test/TranslationImport_closed_loop_component_input_test.py:56
+  // @update
+  // def add_upblk():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : add_upblk
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+  assign in_[2] = in___2;
+
+endmodule
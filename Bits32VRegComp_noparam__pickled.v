@@ -0,0 +1,71 @@
+//-------------------------------------------------------------------------
+// Bits32VRegComp_noparam.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL SystemVerilog translation pass.
+
+// PyMTL VerilogPlaceholder Bits32VRegComp Definition
+// At /root/package/pymtl3/passes/backends/verilog/testcases/test_cases.py
+
+//***********************************************************
+// Pickled source file of placeholder Bits32VRegComp_noparam
+//***********************************************************
+
+//-----------------------------------------------------------
+// Dependency of placeholder Bits32VRegComp
+//-----------------------------------------------------------
+
+`ifndef BITS32VREGCOMP
+`define BITS32VREGCOMP
+
+// The source code below are included because they are specified
+// as the v_libs Verilog placeholder option of component Bits32VRegComp_noparam.
+
+// If you get a duplicated def error from files included below, please
+// make sure they are included either through the v_libs option or the
+// explicit `include statement in the Verilog source code -- if they
+// appear in both then they will be included twice!
+
+
+// End of all v_libs files for component Bits32VRegComp_noparam
+
+`line 1 "VReg.v" 0
+module VReg(
+  input  logic          clk,
+  input  logic          reset,
+  output logic [32-1:0] q,
+  input  logic [32-1:0] d
+);
+  always_ff @(posedge clk) begin
+    q <= d;
+  end
+
+endmodule
+
+`endif /* BITS32VREGCOMP */
+//-----------------------------------------------------------
+// Wrapper of placeholder Bits32VRegComp_noparam
+//-----------------------------------------------------------
+
+`ifndef BITS32VREGCOMP_NOPARAM
+`define BITS32VREGCOMP_NOPARAM
+
+module Bits32VRegComp_noparam
+(
+  input logic [1-1:0] clk ,
+  input logic [32-1:0] d ,
+  output logic [32-1:0] q ,
+  input logic [1-1:0] reset 
+);
+  VReg
+  #(
+  ) v
+  (
+    .clk( clk ),
+    .d( d ),
+    .q( q ),
+    .reset( reset )
+  );
+endmodule
+
+`endif /* BITS32VREGCOMP_NOPARAM */
+
@@ -0,0 +1,195 @@
+//-------------------------------------------------------------------------
+// BypassQueue1RTL__Type_Bits32.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component RegEn Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegEn__Type_Bits32
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    en,
+  input  logic [31:0]   in_,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:25
+  // @update_ff
+  // def up_regen():
+  //   if s.en:
+  //     s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regen
+    if ( en ) begin
+      out <= in_;
+    end
+  end
+
+endmodule
+
+
+// PyMTL Component Mux Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__Type_Bits32__ninputs_2
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in___0,
+  input  logic [31:0]   in___1,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [31:0]   in_ [0:1];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+
+endmodule
+
+
+// PyMTL Component RegRst Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegRst__Type_Bits1__reset_value_0
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    in_,
+  output logic [0:0]    out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:39
+  // @update_ff
+  // def up_regrst():
+  //   if s.reset: s.out <<= reset_value
+  //   else:       s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regrst
+    if ( reset ) begin
+      out <= 1'd0;
+    end
+    else
+      out <= in_;
+  end
+
+endmodule
+
+
+// PyMTL Component BypassQueue1RTL Definition
+// At /root/package/pymtl3/stdlib/queues/enrdy_queues.py
+module BypassQueue1RTL__Type_Bits32
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    reset,
+  output logic [0:0]    deq__en,
+  output logic [31:0]   deq__msg,
+  input  logic [0:0]    deq__rdy,
+  input  logic [0:0]    enq__en,
+  input  logic [31:0]   enq__msg,
+  output logic [0:0]    enq__rdy
+);
+  // Struct/Array ports of sub-components in the form of wires
+  logic [31:0]   byp_mux__in_ [0:1];
+
+  // Sub-component declarations
+  logic [0:0]    buffer__clk;
+  logic [0:0]    buffer__en;
+  logic [31:0]   buffer__in_;
+  logic [31:0]   buffer__out;
+  logic [0:0]    buffer__reset;
+
+  RegEn__Type_Bits32 buffer
+  (
+    .clk            (        buffer__clk        ),
+    .en             (         buffer__en        ),
+    .in_            (        buffer__in_        ),
+    .out            (        buffer__out        ),
+    .reset          (       buffer__reset       )
+  );
+
+  logic [0:0]    byp_mux__clk;
+  logic [31:0]   byp_mux__in___0;
+  logic [31:0]   byp_mux__in___1;
+  logic [31:0]   byp_mux__out;
+  logic [0:0]    byp_mux__reset;
+  logic [0:0]    byp_mux__sel;
+
+  Mux__Type_Bits32__ninputs_2 byp_mux
+  (
+    .clk            (        byp_mux__clk       ),
+    .in___0         (      byp_mux__in___0      ),
+    .in___1         (      byp_mux__in___1      ),
+    .out            (        byp_mux__out       ),
+    .reset          (       byp_mux__reset      ),
+    .sel            (        byp_mux__sel       )
+  );
+
+  logic [0:0]    full__clk;
+  logic [0:0]    full__in_;
+  logic [0:0]    full__out;
+  logic [0:0]    full__reset;
+
+  RegRst__Type_Bits1__reset_value_0 full
+  (
+    .clk            (         full__clk         ),
+    .in_            (         full__in_         ),
+    .out            (         full__out         ),
+    .reset          (        full__reset        )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign byp_mux__in___0 = byp_mux__in_[0];
+  assign byp_mux__in___1 = byp_mux__in_[1];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/enrdy_queues.py:58
+  // @update
+  // def up_bypq_set_enq_rdy():
+  //   s.enq.rdy @= ~s.full.out
+  
+  always_comb begin : up_bypq_set_enq_rdy
+    enq__rdy = ~full__out;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/enrdy_queues.py:62
+  // @update
+  // def up_bypq_use_enq_en():
+  //   s.deq.en    @= (s.enq.en | s.full.out) & s.deq.rdy
+  //   s.buffer.en @=  s.enq.en & ~s.deq.en
+  //   s.full.in_  @= (s.enq.en | s.full.out) & ~s.deq.en
+  
+  always_comb begin : up_bypq_use_enq_en
+    deq__en = ( enq__en | full__out ) & deq__rdy;
+    buffer__en = enq__en & ( ~deq__en );
+    full__in_ = ( enq__en | full__out ) & ( ~deq__en );
+  end
+
+  // Connections
+  assign buffer__clk = clk;
+  assign buffer__reset = reset;
+  assign buffer__in_ = enq__msg;
+  assign full__clk = clk;
+  assign full__reset = reset;
+  assign byp_mux__clk = clk;
+  assign byp_mux__reset = reset;
+  assign deq__msg = byp_mux__out;
+  assign byp_mux__in_[0] = enq__msg;
+  assign byp_mux__in_[1] = buffer__out;
+  assign byp_mux__sel = full__out;
+
+endmodule
@@ -0,0 +1,181 @@
+//-------------------------------------------------------------------------
+// BypassQueueRTL__EntryType_Bits16__num_entries_1.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component Mux Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__Type_Bits16__ninputs_2
+(
+  input  logic [0:0]    clk,
+  input  logic [15:0]   in___0,
+  input  logic [15:0]   in___1,
+  output logic [15:0]   out,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [15:0]   in_ [0:1];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+
+endmodule
+
+
+// PyMTL Component BypassQueue1EntryRTL Definition
+// At /root/package/pymtl3/stdlib/stream/queues.py
+module BypassQueue1EntryRTL__EntryType_Bits16
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [15:0]   recv__msg,
+  output logic [0:0]    recv__rdy,
+  input  logic [0:0]    recv__val,
+  output logic [15:0]   send__msg,
+  input  logic [0:0]    send__rdy,
+  output logic [0:0]    send__val
+);
+  // Wire declarations
+  logic [15:0]   entry;
+  logic [0:0]    full;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [15:0]   bypass_mux__in_ [0:1];
+
+  // Sub-component declarations
+  logic [0:0]    bypass_mux__clk;
+  logic [15:0]   bypass_mux__in___0;
+  logic [15:0]   bypass_mux__in___1;
+  logic [15:0]   bypass_mux__out;
+  logic [0:0]    bypass_mux__reset;
+  logic [0:0]    bypass_mux__sel;
+
+  Mux__Type_Bits16__ninputs_2 bypass_mux
+  (
+    .clk            (      bypass_mux__clk      ),
+    .in___0         (     bypass_mux__in___0    ),
+    .in___1         (     bypass_mux__in___1    ),
+    .out            (      bypass_mux__out      ),
+    .reset          (     bypass_mux__reset     ),
+    .sel            (      bypass_mux__sel      )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign bypass_mux__in___0 = bypass_mux__in_[0];
+  assign bypass_mux__in___1 = bypass_mux__in_[1];
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:392
+  // s.recv.rdy //= lambda: ~s.full
+  
+  always_comb begin : _lambda__s_dut_q_recv_rdy
+    recv__rdy = ~full;
+  end
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:391
+  // s.send.val //= lambda: s.full | s.recv.val
+  
+  always_comb begin : _lambda__s_dut_q_send_val
+    send__val = full | recv__val;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:394
+  // @update_ff
+  // def ff_bypass1():
+  //   if s.reset:
+  //     s.full <<= 0
+  //   else:
+  //     s.full <<= ~s.send.rdy & (s.full | s.recv.val)
+  // 
+  //   # buffer the incoming message if we cannot directly send it out
+  //   if ~s.send.rdy & ~s.full & s.recv.val:
+  //     s.entry <<= s.recv.msg
+  
+  always_ff @(posedge clk) begin : ff_bypass1
+    if ( reset ) begin
+      full <= 1'd0;
+    end
+    else
+      full <= ( ~send__rdy ) & ( full | recv__val );
+    if ( ( ( ~send__rdy ) & ( ~full ) ) & recv__val ) begin
+      entry <= recv__msg;
+    end
+  end
+
+  // Connections
+  assign bypass_mux__clk = clk;
+  assign bypass_mux__reset = reset;
+  assign bypass_mux__in_[0] = recv__msg;
+  assign bypass_mux__in_[1] = entry;
+  assign send__msg = bypass_mux__out;
+  assign bypass_mux__sel = full;
+  assign count = full;
+
+endmodule
+
+
+// PyMTL Component BypassQueueRTL Definition
+// At /root/package/pymtl3/stdlib/stream/queues.py
+module BypassQueueRTL__EntryType_Bits16__num_entries_1
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [15:0]   recv__msg,
+  output logic [0:0]    recv__rdy,
+  input  logic [0:0]    recv__val,
+  output logic [15:0]   send__msg,
+  input  logic [0:0]    send__rdy,
+  output logic [0:0]    send__val
+);
+  // Sub-component declarations
+  logic [0:0]    q__clk;
+  logic [0:0]    q__count;
+  logic [0:0]    q__reset;
+  logic [15:0]   q__recv__msg;
+  logic [0:0]    q__recv__rdy;
+  logic [0:0]    q__recv__val;
+  logic [15:0]   q__send__msg;
+  logic [0:0]    q__send__rdy;
+  logic [0:0]    q__send__val;
+
+  BypassQueue1EntryRTL__EntryType_Bits16 q
+  (
+    .clk            (           q__clk          ),
+    .count          (          q__count         ),
+    .reset          (          q__reset         ),
+    .recv__msg      (        q__recv__msg       ),
+    .recv__rdy      (        q__recv__rdy       ),
+    .recv__val      (        q__recv__val       ),
+    .send__msg      (        q__send__msg       ),
+    .send__rdy      (        q__send__rdy       ),
+    .send__val      (        q__send__val       )
+  );
+
+  // Connections
+  assign q__clk = clk;
+  assign q__reset = reset;
+  assign q__recv__msg = recv__msg;
+  assign recv__rdy = q__recv__rdy;
+  assign q__recv__val = recv__val;
+  assign send__msg = q__send__msg;
+  assign q__send__rdy = send__rdy;
+  assign send__val = q__send__val;
+  assign count = q__count;
+
+endmodule
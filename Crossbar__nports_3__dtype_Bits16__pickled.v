@@ -0,0 +1,52 @@
+//-------------------------------------------------------------------------
+// Crossbar__nports_3__dtype_Bits16.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component Crossbar Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/crossbars.py
+module Crossbar__nports_3__dtype_Bits16
+(
+  input  logic [0:0]    clk,
+  input  logic [15:0]   in___0,
+  input  logic [15:0]   in___1,
+  input  logic [15:0]   in___2,
+  output logic [15:0]   out__0,
+  output logic [15:0]   out__1,
+  output logic [15:0]   out__2,
+  input  logic [0:0]    reset,
+  input  logic [1:0]    sel__0,
+  input  logic [1:0]    sel__1,
+  input  logic [1:0]    sel__2
+);
+  // Struct/Array ports in the form of wires
+  logic [15:0]   in_ [0:2];
+  logic [15:0]   out [0:2];
+  logic [1:0]    sel [0:2];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/crossbars.py:18
+  // @update
+  // def comb_logic():
+  //   for i in range( nports ):
+  //     s.out[i] @= s.in_[ s.sel[ i ] ]
+  
+  integer __loopvar__comb_logic_i;
+  
+  always_comb begin : comb_logic
+    for ( __loopvar__comb_logic_i = 1'd0; __loopvar__comb_logic_i < 2'd3; __loopvar__comb_logic_i = __loopvar__comb_logic_i + 1'd1 )
+      out[2'(__loopvar__comb_logic_i)] = in_[sel[2'(__loopvar__comb_logic_i)]];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+  assign in_[2] = in___2;
+  assign out__0 = out[0];
+  assign out__1 = out[1];
+  assign out__2 = out[2];
+  assign sel[0] = sel__0;
+  assign sel[1] = sel__1;
+  assign sel[2] = sel__2;
+
+endmodule
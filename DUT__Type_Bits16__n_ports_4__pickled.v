@@ -0,0 +1,38 @@
+//-------------------------------------------------------------------------
+// DUT__Type_Bits16__n_ports_4.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component DUT Definition
+// At /root/package/pymtl3/passes/testcases/test_cases.py
+module DUT__Type_Bits16__n_ports_4
+(
+  input  logic [0:0]    clk,
+  input  logic [15:0]   in___0,
+  input  logic [15:0]   in___1,
+  input  logic [15:0]   in___2,
+  input  logic [15:0]   in___3,
+  output logic [15:0]   out,
+  input  logic [0:0]    reset,
+  input  logic [1:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [15:0]   in_ [0:3];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/passes/testcases/test_cases.py:2376
+  // @update
+  // def add_upblk():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : add_upblk
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+  assign in_[2] = in___2;
+  assign in_[3] = in___3;
+
+endmodule
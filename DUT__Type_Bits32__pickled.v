@@ -0,0 +1,49 @@
+//-------------------------------------------------------------------------
+// DUT__Type_Bits32.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component DUT Definition
+// At /root/package/pymtl3/passes/testcases/test_cases.py
+module DUT__Type_Bits32
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in___0,
+  input  logic [31:0]   in___1,
+  output logic [31:0]   out__0,
+  output logic [31:0]   out__1,
+  input  logic [0:0]    reset
+);
+  // Struct/Array ports in the form of wires
+  logic [31:0]   in_ [0:1];
+  logic [31:0]   out [0:1];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/passes/testcases/test_cases.py:2429
+  // @update
+  // def index_upblk():
+  //   if s.in_[0] > s.in_[1]:
+  //     s.out[0] @= 1
+  //     s.out[1] @= 0
+  //   else:
+  //     s.out[0] @= 0
+  //     s.out[1] @= 1
+  
+  always_comb begin : index_upblk
+    if ( in_[1'd0] > in_[1'd1] ) begin
+      out[1'd0] = 32'd1;
+      out[1'd1] = 32'd0;
+    end
+    else begin
+      out[1'd0] = 32'd0;
+      out[1'd1] = 32'd1;
+    end
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+  assign out__0 = out[0];
+  assign out__1 = out[1];
+
+endmodule
@@ -0,0 +1,96 @@
+//-------------------------------------------------------------------------
+// DUT_noparam.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component Bits32OutDrivenComp Definition
+// At /root/package/pymtl3/passes/testcases/test_cases.py
+module Bits32OutDrivenComp_noparam
+(
+  input  logic [0:0]    clk,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // Connections
+  assign out = 32'd42;
+
+endmodule
+
+
+// PyMTL Component DUT Definition
+// At /root/package/pymtl3/passes/testcases/test_cases.py
+module DUT_noparam
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in___foo,
+  input  logic [31:0]   in___inner__bar,
+  input  logic [15:0]   in___packed_array__0__0,
+  input  logic [15:0]   in___packed_array__0__1,
+  input  logic [15:0]   in___packed_array__1__0,
+  input  logic [15:0]   in___packed_array__1__1,
+  input  logic [15:0]   in___packed_array__2__0,
+  input  logic [15:0]   in___packed_array__2__1,
+  output logic [31:0]   out_bar,
+  output logic [31:0]   out_foo,
+  output logic [15:0]   out_sum,
+  input  logic [0:0]    reset
+);
+  // Struct/Array ports in the form of wires
+  logic [31:0]   in___inner;
+  logic [15:0]   in___packed_array [0:2][0:1];
+  logic [159:0]  in_;
+
+  // Wire declarations
+  logic [15:0]   sum [0:2];
+
+  // Sub-component declarations
+  logic [0:0]    b__clk;
+  logic [31:0]   b__out;
+  logic [0:0]    b__reset;
+
+  Bits32OutDrivenComp_noparam b
+  (
+    .clk            (           b__clk          ),
+    .out            (           b__out          ),
+    .reset          (          b__reset         )
+  );
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/passes/testcases/test_cases.py:2415
+  // @update
+  // def upblk():
+  //   for i in range(3):
+  //     s.sum[i] @= s.in_.packed_array[i][0] + s.in_.packed_array[i][1]
+  //   s.out_sum @= s.sum[0] + s.sum[1] + s.sum[2]
+  
+  integer __loopvar__upblk_i;
+  
+  always_comb begin : upblk
+    for ( __loopvar__upblk_i = 1'd0; __loopvar__upblk_i < 2'd3; __loopvar__upblk_i = __loopvar__upblk_i + 1'd1 )
+      sum[2'(__loopvar__upblk_i)] = in___packed_array[2'(__loopvar__upblk_i)][1'd0] + in___packed_array[2'(__loopvar__upblk_i)][1'd1];
+    out_sum = ( sum[2'd0] + sum[2'd1] ) + sum[2'd2];
+  end
+
+  // Connections
+  assign in___inner[31:0] = in___inner__bar;
+  assign in___packed_array[0][0] = in___packed_array__0__0;
+  assign in___packed_array[0][1] = in___packed_array__0__1;
+  assign in___packed_array[1][0] = in___packed_array__1__0;
+  assign in___packed_array[1][1] = in___packed_array__1__1;
+  assign in___packed_array[2][0] = in___packed_array__2__0;
+  assign in___packed_array[2][1] = in___packed_array__2__1;
+  assign in_[159:128] = in___foo;
+  assign in_[127:96] = in___inner__bar;
+  assign in_[95:80] = in___packed_array__2__1;
+  assign in_[79:64] = in___packed_array__2__0;
+  assign in_[63:48] = in___packed_array__1__1;
+  assign in_[47:32] = in___packed_array__1__0;
+  assign in_[31:16] = in___packed_array__0__1;
+  assign in_[15:0] = in___packed_array__0__0;
+  assign b__clk = clk;
+  assign b__reset = reset;
+  assign out_foo = b__out;
+  assign out_bar = in___inner__bar;
+
+endmodule
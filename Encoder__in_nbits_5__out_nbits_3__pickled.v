@@ -0,0 +1,35 @@
+//-------------------------------------------------------------------------
+// Encoder__in_nbits_5__out_nbits_3.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component Encoder Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/encoders.py
+module Encoder__in_nbits_5__out_nbits_3
+(
+  input  logic [0:0]    clk,
+  input  logic [4:0]    in_,
+  output logic [2:0]    out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/encoders.py:28
+  // @update
+  // def encode():
+  //   s.out @= 0
+  //   for i in range( s.in_nbits ):
+  //     if s.in_[i]:
+  //       s.out @= i
+  
+  integer __loopvar__encode_i;
+  
+  always_comb begin : encode
+    out = 3'd0;
+    for ( __loopvar__encode_i = 1'd0; __loopvar__encode_i < 3'd5; __loopvar__encode_i = __loopvar__encode_i + 1'd1 )
+      if ( in_[3'(__loopvar__encode_i)] ) begin
+        out = 3'(__loopvar__encode_i);
+      end
+  end
+
+endmodule
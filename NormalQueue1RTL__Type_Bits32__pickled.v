@@ -0,0 +1,134 @@
+//-------------------------------------------------------------------------
+// NormalQueue1RTL__Type_Bits32.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component RegEn Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegEn__Type_Bits32
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    en,
+  input  logic [31:0]   in_,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:25
+  // @update_ff
+  // def up_regen():
+  //   if s.en:
+  //     s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regen
+    if ( en ) begin
+      out <= in_;
+    end
+  end
+
+endmodule
+
+
+// PyMTL Component Reg Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module Reg__Type_Bits1
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    in_,
+  output logic [0:0]    out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:10
+  // @update_ff
+  // def up_reg():
+  //   s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_reg
+    out <= in_;
+  end
+
+endmodule
+
+
+// PyMTL Component NormalQueue1RTL Definition
+// At /root/package/pymtl3/stdlib/queues/enrdy_queues.py
+module NormalQueue1RTL__Type_Bits32
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    reset,
+  output logic [0:0]    deq__en,
+  output logic [31:0]   deq__msg,
+  input  logic [0:0]    deq__rdy,
+  input  logic [0:0]    enq__en,
+  input  logic [31:0]   enq__msg,
+  output logic [0:0]    enq__rdy
+);
+  // Sub-component declarations
+  logic [0:0]    buffer__clk;
+  logic [0:0]    buffer__en;
+  logic [31:0]   buffer__in_;
+  logic [31:0]   buffer__out;
+  logic [0:0]    buffer__reset;
+
+  RegEn__Type_Bits32 buffer
+  (
+    .clk            (        buffer__clk        ),
+    .en             (         buffer__en        ),
+    .in_            (        buffer__in_        ),
+    .out            (        buffer__out        ),
+    .reset          (       buffer__reset       )
+  );
+
+  logic [0:0]    full__clk;
+  logic [0:0]    full__in_;
+  logic [0:0]    full__out;
+  logic [0:0]    full__reset;
+
+  Reg__Type_Bits1 full
+  (
+    .clk            (         full__clk         ),
+    .in_            (         full__in_         ),
+    .out            (         full__out         ),
+    .reset          (        full__reset        )
+  );
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/enrdy_queues.py:105
+  // @update
+  // def up_normq_full():
+  //   # When the bufferf is full and deq side is ready, we enable deq
+  //   s.deq.en @= s.full.out & s.deq.rdy
+  // 
+  //   # not full and valid enq, or no deque and enq, or no deque and already full
+  //   s.full.in_ @= (~s.full.out & s.enq.en) | \
+  //                 (~s.deq.rdy & s.enq.en)  | \
+  //                 (~s.deq.rdy & s.full.out)
+  
+  always_comb begin : up_normq_full
+    deq__en = full__out & deq__rdy;
+    full__in_ = ( ( ( ~full__out ) & enq__en ) | ( ( ~deq__rdy ) & enq__en ) ) | ( ( ~deq__rdy ) & full__out );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/enrdy_queues.py:101
+  // @update
+  // def up_normq_set_enq_rdy():
+  //   s.enq.rdy @= ~s.full.out
+  
+  always_comb begin : up_normq_set_enq_rdy
+    enq__rdy = ~full__out;
+  end
+
+  // Connections
+  assign buffer__clk = clk;
+  assign buffer__reset = reset;
+  assign buffer__en = enq__en;
+  assign buffer__in_ = enq__msg;
+  assign deq__msg = buffer__out;
+  assign full__clk = clk;
+  assign full__reset = reset;
+
+endmodule
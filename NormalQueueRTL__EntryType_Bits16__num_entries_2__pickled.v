@@ -0,0 +1,308 @@
+//-------------------------------------------------------------------------
+// NormalQueueRTL__EntryType_Bits16__num_entries_2.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component NormalQueueCtrlRTL Definition
+// At /root/package/pymtl3/stdlib/stream/queues.py
+module NormalQueueCtrlRTL__num_entries_2
+(
+  input  logic [0:0]    clk,
+  output logic [1:0]    count,
+  output logic [0:0]    raddr,
+  output logic [0:0]    recv_rdy,
+  input  logic [0:0]    recv_val,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    send_rdy,
+  output logic [0:0]    send_val,
+  output logic [0:0]    waddr,
+  output logic [0:0]    wen
+);
+  // Wire declarations
+  logic [0:0]    head;
+  logic [0:0]    recv_xfer;
+  logic [0:0]    send_xfer;
+  logic [0:0]    tail;
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:121
+  // s.recv_rdy  //= lambda: s.count < num_entries
+  
+  always_comb begin : _lambda__s_dut_ctrl_recv_rdy
+    recv_rdy = count < 2'd2;
+  end
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:124
+  // s.recv_xfer //= lambda: s.recv_val & s.recv_rdy
+  
+  always_comb begin : _lambda__s_dut_ctrl_recv_xfer
+    recv_xfer = recv_val & recv_rdy;
+  end
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:122
+  // s.send_val  //= lambda: s.count > 0
+  
+  always_comb begin : _lambda__s_dut_ctrl_send_val
+    send_val = count > 2'd0;
+  end
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:125
+  // s.send_xfer //= lambda: s.send_val & s.send_rdy
+  
+  always_comb begin : _lambda__s_dut_ctrl_send_xfer
+    send_xfer = send_val & send_rdy;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:127
+  // @update_ff
+  // def up_reg():
+  // 
+  //   if s.reset:
+  //     s.head  <<= 0
+  //     s.tail  <<= 0
+  //     s.count <<= 0
+  // 
+  //   else:
+  //     if s.recv_xfer:
+  //       s.tail <<= s.tail + 1 if ( s.tail < num_entries - 1 ) else 0
+  // 
+  //     if s.send_xfer:
+  //       s.head <<= s.head + 1 if ( s.head < num_entries -1 ) else 0
+  // 
+  //     if s.recv_xfer & ~s.send_xfer:
+  //       s.count <<= s.count + 1
+  //     elif ~s.recv_xfer & s.send_xfer:
+  //       s.count <<= s.count - 1
+  
+  always_ff @(posedge clk) begin : up_reg
+    if ( reset ) begin
+      head <= 1'd0;
+      tail <= 1'd0;
+      count <= 2'd0;
+    end
+    else begin
+      if ( recv_xfer ) begin
+        tail <= ( tail < ( 1'd2 - 1'd1 ) ) ? tail + 1'd1 : 1'd0;
+      end
+      if ( send_xfer ) begin
+        head <= ( head < ( 1'd2 - 1'd1 ) ) ? head + 1'd1 : 1'd0;
+      end
+      if ( recv_xfer & ( ~send_xfer ) ) begin
+        count <= count + 2'd1;
+      end
+      else if ( ( ~recv_xfer ) & send_xfer ) begin
+        count <= count - 2'd1;
+      end
+    end
+  end
+
+  // Connections
+  assign wen = recv_xfer;
+  assign waddr = tail;
+  assign raddr = head;
+
+endmodule
+
+
+// PyMTL Component RegisterFile Definition
+// Full name: RegisterFile__Type_Bits16__nregs_2__rd_ports_1__wr_ports_1__const_zero_False
+// At /root/package/pymtl3/stdlib/basic_rtl/register_files.py
+module RegisterFile__83609b5f30513273
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    raddr__0,
+  output logic [15:0]   rdata__0,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    waddr__0,
+  input  logic [15:0]   wdata__0,
+  input  logic [0:0]    wen__0
+);
+  // Struct/Array ports in the form of wires
+  logic [0:0]    raddr [0:0];
+  logic [15:0]   rdata [0:0];
+  logic [0:0]    waddr [0:0];
+  logic [15:0]   wdata [0:0];
+  logic [0:0]    wen [0:0];
+
+  // Wire declarations
+  logic [15:0]   regs [0:1];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/register_files.py:20
+  // @update
+  // def up_rf_read():
+  //   for i in range( rd_ports ):
+  //     s.rdata[i] @= s.regs[ s.raddr[i] ]
+  
+  integer __loopvar__up_rf_read_i;
+  
+  always_comb begin : up_rf_read
+    for ( __loopvar__up_rf_read_i = 1'd0; __loopvar__up_rf_read_i < 1'd1; __loopvar__up_rf_read_i = __loopvar__up_rf_read_i + 1'd1 )
+      rdata[1'(__loopvar__up_rf_read_i)] = regs[raddr[1'(__loopvar__up_rf_read_i)]];
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/register_files.py:32
+  // @update_ff
+  // def up_rf_write():
+  //   for i in range( wr_ports ):
+  //     if s.wen[i]:
+  //       s.regs[ s.waddr[i] ] <<= s.wdata[i]
+  
+  integer __loopvar__up_rf_write_i;
+  
+  always_ff @(posedge clk) begin : up_rf_write
+    for ( __loopvar__up_rf_write_i = 1'd0; __loopvar__up_rf_write_i < 1'd1; __loopvar__up_rf_write_i = __loopvar__up_rf_write_i + 1'd1 )
+      if ( wen[1'(__loopvar__up_rf_write_i)] ) begin
+        regs[waddr[1'(__loopvar__up_rf_write_i)]] <= wdata[1'(__loopvar__up_rf_write_i)];
+      end
+  end
+
+  // Connections
+  assign raddr[0] = raddr__0;
+  assign rdata__0 = rdata[0];
+  assign waddr[0] = waddr__0;
+  assign wdata[0] = wdata__0;
+  assign wen[0] = wen__0;
+
+endmodule
+
+
+// PyMTL Component NormalQueueDpathRTL Definition
+// At /root/package/pymtl3/stdlib/stream/queues.py
+module NormalQueueDpathRTL__EntryType_Bits16__num_entries_2
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    raddr,
+  input  logic [15:0]   recv_msg,
+  input  logic [0:0]    reset,
+  output logic [15:0]   send_msg,
+  input  logic [0:0]    waddr,
+  input  logic [0:0]    wen
+);
+  // Struct/Array ports of sub-components in the form of wires
+  logic [0:0]    rf__raddr [0:0];
+  logic [15:0]   rf__rdata [0:0];
+  logic [0:0]    rf__waddr [0:0];
+  logic [15:0]   rf__wdata [0:0];
+  logic [0:0]    rf__wen [0:0];
+
+  // Sub-component declarations
+  logic [0:0]    rf__clk;
+  logic [0:0]    rf__raddr__0;
+  logic [15:0]   rf__rdata__0;
+  logic [0:0]    rf__reset;
+  logic [0:0]    rf__waddr__0;
+  logic [15:0]   rf__wdata__0;
+  logic [0:0]    rf__wen__0;
+
+  RegisterFile__83609b5f30513273 rf
+  (
+    .clk            (          rf__clk          ),
+    .raddr__0       (        rf__raddr__0       ),
+    .rdata__0       (        rf__rdata__0       ),
+    .reset          (         rf__reset         ),
+    .waddr__0       (        rf__waddr__0       ),
+    .wdata__0       (        rf__wdata__0       ),
+    .wen__0         (         rf__wen__0        )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign rf__raddr__0 = rf__raddr[0];
+  assign rf__rdata[0] = rf__rdata__0;
+  assign rf__waddr__0 = rf__waddr[0];
+  assign rf__wdata__0 = rf__wdata[0];
+  assign rf__wen__0 = rf__wen[0];
+
+  // Connections
+  assign rf__clk = clk;
+  assign rf__reset = reset;
+  assign rf__raddr[0] = raddr;
+  assign send_msg = rf__rdata[0];
+  assign rf__wen[0] = wen;
+  assign rf__waddr[0] = waddr;
+  assign rf__wdata[0] = recv_msg;
+
+endmodule
+
+
+// PyMTL Component NormalQueueRTL Definition
+// At /root/package/pymtl3/stdlib/stream/queues.py
+module NormalQueueRTL__EntryType_Bits16__num_entries_2
+(
+  input  logic [0:0]    clk,
+  output logic [1:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [15:0]   recv__msg,
+  output logic [0:0]    recv__rdy,
+  input  logic [0:0]    recv__val,
+  output logic [15:0]   send__msg,
+  input  logic [0:0]    send__rdy,
+  output logic [0:0]    send__val
+);
+  // Sub-component declarations
+  logic [0:0]    ctrl__clk;
+  logic [1:0]    ctrl__count;
+  logic [0:0]    ctrl__raddr;
+  logic [0:0]    ctrl__recv_rdy;
+  logic [0:0]    ctrl__recv_val;
+  logic [0:0]    ctrl__reset;
+  logic [0:0]    ctrl__send_rdy;
+  logic [0:0]    ctrl__send_val;
+  logic [0:0]    ctrl__waddr;
+  logic [0:0]    ctrl__wen;
+
+  NormalQueueCtrlRTL__num_entries_2 ctrl
+  (
+    .clk            (         ctrl__clk         ),
+    .count          (        ctrl__count        ),
+    .raddr          (        ctrl__raddr        ),
+    .recv_rdy       (       ctrl__recv_rdy      ),
+    .recv_val       (       ctrl__recv_val      ),
+    .reset          (        ctrl__reset        ),
+    .send_rdy       (       ctrl__send_rdy      ),
+    .send_val       (       ctrl__send_val      ),
+    .waddr          (        ctrl__waddr        ),
+    .wen            (         ctrl__wen         )
+  );
+
+  logic [0:0]    dpath__clk;
+  logic [0:0]    dpath__raddr;
+  logic [15:0]   dpath__recv_msg;
+  logic [0:0]    dpath__reset;
+  logic [15:0]   dpath__send_msg;
+  logic [0:0]    dpath__waddr;
+  logic [0:0]    dpath__wen;
+
+  NormalQueueDpathRTL__EntryType_Bits16__num_entries_2 dpath
+  (
+    .clk            (         dpath__clk        ),
+    .raddr          (        dpath__raddr       ),
+    .recv_msg       (      dpath__recv_msg      ),
+    .reset          (        dpath__reset       ),
+    .send_msg       (      dpath__send_msg      ),
+    .waddr          (        dpath__waddr       ),
+    .wen            (         dpath__wen        )
+  );
+
+  // Connections
+  assign ctrl__clk = clk;
+  assign ctrl__reset = reset;
+  assign dpath__clk = clk;
+  assign dpath__reset = reset;
+  assign dpath__wen = ctrl__wen;
+  assign dpath__waddr = ctrl__waddr;
+  assign dpath__raddr = ctrl__raddr;
+  assign ctrl__recv_val = recv__val;
+  assign recv__rdy = ctrl__recv_rdy;
+  assign dpath__recv_msg = recv__msg;
+  assign send__val = ctrl__send_val;
+  assign ctrl__send_rdy = send__rdy;
+  assign send__msg = dpath__send_msg;
+  assign count = ctrl__count;
+
+endmodule
@@ -0,0 +1,117 @@
+//-------------------------------------------------------------------------
+// PipeQueueRTL__EntryType_Bits16__num_entries_1.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component PipeQueue1EntryRTL Definition
+// At /root/package/pymtl3/stdlib/stream/queues.py
+module PipeQueue1EntryRTL__EntryType_Bits16
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [15:0]   recv__msg,
+  output logic [0:0]    recv__rdy,
+  input  logic [0:0]    recv__val,
+  output logic [15:0]   send__msg,
+  input  logic [0:0]    send__rdy,
+  output logic [0:0]    send__val
+);
+  // Wire declarations
+  logic [15:0]   entry;
+  logic [0:0]    full;
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:226
+  // s.recv.rdy //= lambda: s.send.rdy | ~s.full
+  
+  always_comb begin : _lambda__s_dut_q_recv_rdy
+    recv__rdy = send__rdy | ( ~full );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/stream/queues.py:228
+  // @update_ff
+  // def ff_pipe1():
+  //   if s.reset:
+  //     s.full <<= 0
+  //   else:
+  //     # The pipe queue is full if in this cycle it cannot receive a
+  //     # message due to back pressure and the entry is already full.
+  //     # Otherwise it is not full and it becomes full only if there is
+  //     # a valid incoming message.
+  //     s.full <<= ~s.recv.rdy | s.recv.val
+  // 
+  //   # AND rdy and val to buffer the incoming message
+  //   if s.recv.rdy & s.recv.val:
+  //     s.entry <<= s.recv.msg
+  
+  always_ff @(posedge clk) begin : ff_pipe1
+    if ( reset ) begin
+      full <= 1'd0;
+    end
+    else
+      full <= ( ~recv__rdy ) | recv__val;
+    if ( recv__rdy & recv__val ) begin
+      entry <= recv__msg;
+    end
+  end
+
+  // Connections
+  assign count = full;
+  assign send__msg = entry;
+  assign send__val = full;
+
+endmodule
+
+
+// PyMTL Component PipeQueueRTL Definition
+// At /root/package/pymtl3/stdlib/stream/queues.py
+module PipeQueueRTL__EntryType_Bits16__num_entries_1
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [15:0]   recv__msg,
+  output logic [0:0]    recv__rdy,
+  input  logic [0:0]    recv__val,
+  output logic [15:0]   send__msg,
+  input  logic [0:0]    send__rdy,
+  output logic [0:0]    send__val
+);
+  // Sub-component declarations
+  logic [0:0]    q__clk;
+  logic [0:0]    q__count;
+  logic [0:0]    q__reset;
+  logic [15:0]   q__recv__msg;
+  logic [0:0]    q__recv__rdy;
+  logic [0:0]    q__recv__val;
+  logic [15:0]   q__send__msg;
+  logic [0:0]    q__send__rdy;
+  logic [0:0]    q__send__val;
+
+  PipeQueue1EntryRTL__EntryType_Bits16 q
+  (
+    .clk            (           q__clk          ),
+    .count          (          q__count         ),
+    .reset          (          q__reset         ),
+    .recv__msg      (        q__recv__msg       ),
+    .recv__rdy      (        q__recv__rdy       ),
+    .recv__val      (        q__recv__val       ),
+    .send__msg      (        q__send__msg       ),
+    .send__rdy      (        q__send__rdy       ),
+    .send__val      (        q__send__val       )
+  );
+
+  // Connections
+  assign q__clk = clk;
+  assign q__reset = reset;
+  assign q__recv__msg = recv__msg;
+  assign recv__rdy = q__recv__rdy;
+  assign q__recv__val = recv__val;
+  assign send__msg = q__send__msg;
+  assign q__send__rdy = send__rdy;
+  assign send__val = q__send__val;
+  assign count = q__count;
+
+endmodule
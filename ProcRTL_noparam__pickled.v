@@ -0,0 +1,3635 @@
+//-------------------------------------------------------------------------
+// ProcRTL_noparam.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component DecodeInstType Definition
+// At /root/package/examples/ex03_proc/TinyRV0InstRTL.py
+module DecodeInstType_noparam
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in_,
+  output logic [7:0]    out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/TinyRV0InstRTL.py:115
+  // @update
+  // def comb_logic():
+  // 
+  //   s.out @= ZERO
+  // 
+  //   if   s.in_ == 0b10011:                 s.out @= NOP
+  //   elif s.in_[OPCODE] == 0b0110011:
+  //     if   s.in_[FUNCT3] == 0b000:     s.out @= ADD
+  //     elif s.in_[FUNCT3] == 0b001:     s.out @= SLL
+  //     elif s.in_[FUNCT3] == 0b111:     s.out @= AND
+  //     elif s.in_[FUNCT3] == 0b101:     s.out @= SRL
+  // 
+  //   elif s.in_[OPCODE] == 0b0010011:
+  //     if   s.in_[FUNCT3] == 0b000:       s.out @= ADDI
+  // 
+  //   elif s.in_[OPCODE] == 0b0100011:
+  //     if s.in_[FUNCT3] == 0b010:       s.out @= SW
+  // 
+  //   elif s.in_[OPCODE] == 0b0000011:
+  //     if s.in_[FUNCT3] == 0b010:       s.out @= LW
+  // 
+  //   elif s.in_[OPCODE] == 0b1100011:
+  //     if s.in_[FUNCT3] == 0b001:       s.out @= BNE
+  // 
+  //   elif s.in_[OPCODE] == 0b1110011:
+  //     if   s.in_[FUNCT3] == 0b001:       s.out @= CSRW
+  // 
+  //     elif s.in_[FUNCT3] == 0b010:
+  //       if s.in_[FUNCT7] == 0b0111111:   s.out @= CSRRX
+  //       else:                                s.out @= CSRR
+  
+  always_comb begin : comb_logic
+    out = 8'd51;
+    if ( in_ == 32'd19 ) begin
+      out = 8'd0;
+    end
+    else if ( in_[5'd6:5'd0] == 7'd51 ) begin
+      if ( in_[5'd14:5'd12] == 3'd0 ) begin
+        out = 8'd15;
+      end
+      else if ( in_[5'd14:5'd12] == 3'd1 ) begin
+        out = 8'd9;
+      end
+      else if ( in_[5'd14:5'd12] == 3'd7 ) begin
+        out = 8'd24;
+      end
+      else if ( in_[5'd14:5'd12] == 3'd5 ) begin
+        out = 8'd11;
+      end
+    end
+    else if ( in_[5'd6:5'd0] == 7'd19 ) begin
+      if ( in_[5'd14:5'd12] == 3'd0 ) begin
+        out = 8'd16;
+      end
+    end
+    else if ( in_[5'd6:5'd0] == 7'd35 ) begin
+      if ( in_[5'd14:5'd12] == 3'd2 ) begin
+        out = 8'd8;
+      end
+    end
+    else if ( in_[5'd6:5'd0] == 7'd3 ) begin
+      if ( in_[5'd14:5'd12] == 3'd2 ) begin
+        out = 8'd3;
+      end
+    end
+    else if ( in_[5'd6:5'd0] == 7'd99 ) begin
+      if ( in_[5'd14:5'd12] == 3'd1 ) begin
+        out = 8'd31;
+      end
+    end
+    else if ( in_[5'd6:5'd0] == 7'd115 ) begin
+      if ( in_[5'd14:5'd12] == 3'd1 ) begin
+        out = 8'd47;
+      end
+      else if ( in_[5'd14:5'd12] == 3'd2 ) begin
+        if ( in_[5'd31:5'd25] == 7'd63 ) begin
+          out = 8'd36;
+        end
+        else
+          out = 8'd46;
+      end
+    end
+  end
+
+endmodule
+
+
+// PyMTL Component ProcCtrl Definition
+// At /root/package/examples/ex03_proc/ProcCtrlRTL.py
+module ProcCtrl_noparam
+(
+  output logic [3:0]    alu_fn_X,
+  input  logic [0:0]    clk,
+  output logic [0:0]    commit_inst,
+  output logic [0:0]    dmemreq_en,
+  input  logic [0:0]    dmemreq_rdy,
+  output logic [3:0]    dmemreq_type,
+  output logic [0:0]    dmemresp_en,
+  input  logic [0:0]    dmemresp_rdy,
+  output logic [0:0]    imemreq_en,
+  input  logic [0:0]    imemreq_rdy,
+  output logic [0:0]    imemresp_drop,
+  output logic [0:0]    imemresp_en,
+  input  logic [0:0]    imemresp_rdy,
+  output logic [2:0]    imm_type_D,
+  input  logic [31:0]   inst_D,
+  output logic [0:0]    mngr2proc_en,
+  input  logic [0:0]    mngr2proc_rdy,
+  input  logic [0:0]    ne_X,
+  output logic [1:0]    op1_byp_sel_D,
+  output logic [1:0]    op2_byp_sel_D,
+  output logic [1:0]    op2_sel_D,
+  output logic [0:0]    pc_sel_F,
+  output logic [0:0]    proc2mngr_en,
+  input  logic [0:0]    proc2mngr_rdy,
+  output logic [0:0]    reg_en_D,
+  output logic [0:0]    reg_en_F,
+  output logic [0:0]    reg_en_M,
+  output logic [0:0]    reg_en_W,
+  output logic [0:0]    reg_en_X,
+  input  logic [0:0]    reset,
+  output logic [4:0]    rf_waddr_W,
+  output logic [0:0]    rf_wen_W,
+  output logic [1:0]    wb_result_sel_M,
+  output logic [0:0]    xcelreq_en,
+  input  logic [0:0]    xcelreq_rdy,
+  output logic [0:0]    xcelreq_type,
+  output logic [0:0]    xcelresp_en,
+  input  logic [0:0]    xcelresp_rdy
+);
+  // Wire declarations
+  logic [3:0]    alu_fn_D;
+  logic [0:0]    br_type_D;
+  logic [0:0]    br_type_X;
+  logic [19:0]   cs;
+  logic [0:0]    csrr_D;
+  logic [0:0]    csrw_D;
+  logic [1:0]    dmemreq_type_D;
+  logic [1:0]    dmemreq_type_M;
+  logic [1:0]    dmemreq_type_X;
+  logic [7:0]    inst_type_M;
+  logic [7:0]    inst_type_W;
+  logic [7:0]    inst_type_X;
+  logic [0:0]    inst_val_D;
+  logic [0:0]    mngr2proc_D;
+  logic [0:0]    next_val_D;
+  logic [0:0]    next_val_F;
+  logic [0:0]    next_val_M;
+  logic [0:0]    next_val_X;
+  logic [0:0]    osquash_D;
+  logic [0:0]    osquash_X;
+  logic [0:0]    ostall_D;
+  logic [0:0]    ostall_F;
+  logic [0:0]    ostall_M;
+  logic [0:0]    ostall_W;
+  logic [0:0]    ostall_X;
+  logic [0:0]    ostall_dmem_M;
+  logic [0:0]    ostall_dmem_X;
+  logic [0:0]    ostall_hazard_D;
+  logic [0:0]    ostall_ld_X_rs1_D;
+  logic [0:0]    ostall_ld_X_rs2_D;
+  logic [0:0]    ostall_mngr_D;
+  logic [0:0]    ostall_proc2mngr_W;
+  logic [0:0]    ostall_xcel_M;
+  logic [0:0]    ostall_xcel_X;
+  logic [0:0]    ostall_xcel_X_rs1_D;
+  logic [0:0]    ostall_xcel_X_rs2_D;
+  logic [0:0]    pc_redirect_X;
+  logic [0:0]    proc2mngr_en_D;
+  logic [0:0]    proc2mngr_en_M;
+  logic [0:0]    proc2mngr_en_W;
+  logic [0:0]    proc2mngr_en_X;
+  logic [4:0]    rf_waddr_D;
+  logic [4:0]    rf_waddr_M;
+  logic [4:0]    rf_waddr_X;
+  logic [2:0]    rf_waddr_sel_D;
+  logic [0:0]    rf_wen_pending_D;
+  logic [0:0]    rf_wen_pending_M;
+  logic [0:0]    rf_wen_pending_W;
+  logic [0:0]    rf_wen_pending_X;
+  logic [0:0]    rs1_en_D;
+  logic [0:0]    rs2_en_D;
+  logic [0:0]    squash_D;
+  logic [0:0]    squash_F;
+  logic [0:0]    stall_D;
+  logic [0:0]    stall_F;
+  logic [0:0]    stall_M;
+  logic [0:0]    stall_W;
+  logic [0:0]    stall_X;
+  logic [0:0]    val_D;
+  logic [0:0]    val_F;
+  logic [0:0]    val_M;
+  logic [0:0]    val_W;
+  logic [0:0]    val_X;
+  logic [1:0]    wb_result_sel_D;
+  logic [1:0]    wb_result_sel_X;
+  logic [0:0]    xcelreq_D;
+  logic [0:0]    xcelreq_M;
+  logic [0:0]    xcelreq_X;
+  logic [0:0]    xcelreq_type_D;
+  logic [0:0]    xcelreq_type_X;
+
+  // Sub-component declarations
+  logic [0:0]    inst_type_decoder_D__clk;
+  logic [31:0]   inst_type_decoder_D__in_;
+  logic [7:0]    inst_type_decoder_D__out;
+  logic [0:0]    inst_type_decoder_D__reset;
+
+  DecodeInstType_noparam inst_type_decoder_D
+  (
+    .clk            (  inst_type_decoder_D__clk ),
+    .in_            (  inst_type_decoder_D__in_ ),
+    .out            (  inst_type_decoder_D__out ),
+    .reset          ( inst_type_decoder_D__reset )
+  );
+
+  // Temporary wire definitions
+  logic [7:0]    __tmpvar__comb_control_table_D_inst;
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:456
+  // @update
+  // def comb_D():
+  // 
+  //   # ostall due to mngr2proc not ready
+  //   s.ostall_mngr_D @= s.mngr2proc_D & ~s.mngr2proc_rdy # This is get, rdy means we can get the message
+  // 
+  //   # put together all ostall conditions
+  //   s.ostall_D @= s.val_D & ( s.ostall_mngr_D | s.ostall_hazard_D )
+  // 
+  //   # stall in D stage
+  //   s.stall_D  @= s.val_D & ( s.ostall_D | s.ostall_X | s.ostall_M | s.ostall_W   )
+  // 
+  //   # D won't osquash
+  //   # squash in D stage
+  //   s.squash_D @= s.val_D & s.osquash_X
+  // 
+  //   # next valid bit
+  //   s.next_val_D @= s.val_D & ~s.stall_D & ~s.squash_D
+  // 
+  //   # enable signal for send/get interface
+  //   s.mngr2proc_en @= s.val_D & ~s.stall_D & ~s.squash_D & s.mngr2proc_D
+  
+  always_comb begin : comb_D
+    ostall_mngr_D = mngr2proc_D & ( ~mngr2proc_rdy );
+    ostall_D = val_D & ( ostall_mngr_D | ostall_hazard_D );
+    stall_D = val_D & ( ( ( ostall_D | ostall_X ) | ostall_M ) | ostall_W );
+    squash_D = val_D & osquash_X;
+    next_val_D = ( val_D & ( ~stall_D ) ) & ( ~squash_D );
+    mngr2proc_en = ( ( val_D & ( ~stall_D ) ) & ( ~squash_D ) ) & mngr2proc_D;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:192
+  // @update
+  // def comb_F():
+  // 
+  //   # ostall due to imemresp
+  // 
+  //   s.ostall_F @= s.val_F & ~s.imemresp_rdy
+  // 
+  //   # stall and squash in F stage
+  // 
+  //   s.stall_F  @= s.val_F & ( s.ostall_F | s.ostall_D | s.ostall_X |
+  //                             s.ostall_M | s.ostall_W )
+  // 
+  //   # imem req is special, it actually be sent out _before_ the F
+  //   # stage, we need to send memreq everytime we are getting squashed
+  //   # because we need to redirect the PC. We also need to factor in
+  //   # reset. When we are resetting we shouldn't send out imem req.
+  // 
+  //   s.imemreq_en  @= ~s.reset & (~s.stall_F | s.squash_F) & s.imemreq_rdy
+  //   s.imemresp_en @= ~s.stall_F | s.squash_F
+  // 
+  //   # We drop the mem response when we are getting squashed
+  // 
+  //   s.next_val_F  @= s.val_F & ~s.stall_F & ~s.squash_F
+  
+  always_comb begin : comb_F
+    ostall_F = val_F & ( ~imemresp_rdy );
+    stall_F = val_F & ( ( ( ( ostall_F | ostall_D ) | ostall_X ) | ostall_M ) | ostall_W );
+    imemreq_en = ( ( ~reset ) & ( ( ~stall_F ) | squash_F ) ) & imemreq_rdy;
+    imemresp_en = ( ~stall_F ) | squash_F;
+    next_val_F = ( val_F & ( ~stall_F ) ) & ( ~squash_F );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:187
+  // @update
+  // def comb_F_squash():
+  //   s.squash_F @= s.val_F & ( s.osquash_D | s.osquash_X  )
+  //   s.imemresp_drop @= s.squash_F
+  
+  always_comb begin : comb_F_squash
+    squash_F = val_F & ( osquash_D | osquash_X );
+    imemresp_drop = squash_F;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:593
+  // @update
+  // def comb_M():
+  // 
+  //   # ostall due to xcel resp or dmem resp
+  // 
+  //   s.ostall_xcel_M @= (s.xcelreq_M & ~s.xcelresp_rdy)
+  //   s.ostall_dmem_M @= (s.dmemreq_type_M != nr ) & ~s.dmemresp_rdy
+  // 
+  //   s.ostall_M @= s.val_M & ( s.ostall_dmem_M | s.ostall_xcel_M )
+  // 
+  //   # stall in M stage
+  // 
+  //   s.stall_M  @= s.val_M & ( s.ostall_M | s.ostall_W )
+  // 
+  //   # dmemresp/xcelresp get enable if not stalling
+  // 
+  //   s.dmemresp_en @= s.val_M & ~s.stall_M & ( s.dmemreq_type_M != nr )
+  //   s.xcelresp_en @= s.val_M & ~s.stall_M & s.xcelreq_M
+  // 
+  //   # next valid bit
+  // 
+  //   s.next_val_M  @= s.val_M & ~s.stall_M
+  
+  always_comb begin : comb_M
+    ostall_xcel_M = xcelreq_M & ( ~xcelresp_rdy );
+    ostall_dmem_M = ( dmemreq_type_M != 2'd0 ) & ( ~dmemresp_rdy );
+    ostall_M = val_M & ( ostall_dmem_M | ostall_xcel_M );
+    stall_M = val_M & ( ostall_M | ostall_W );
+    dmemresp_en = ( val_M & ( ~stall_M ) ) & ( dmemreq_type_M != 2'd0 );
+    xcelresp_en = ( val_M & ( ~stall_M ) ) & xcelreq_M;
+    next_val_M = val_M & ( ~stall_M );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:178
+  // @update
+  // def comb_PC_sel_F():
+  //   if   s.pc_redirect_X:
+  //     s.pc_sel_F @= 1 # branch target
+  //   else:
+  //     s.pc_sel_F @= 0 # use pc+4
+  
+  always_comb begin : comb_PC_sel_F
+    if ( pc_redirect_X ) begin
+      pc_sel_F = 1'd1;
+    end
+    else
+      pc_sel_F = 1'd0;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:641
+  // @update
+  // def comb_W():
+  // 
+  //   # set RF write enable if valid
+  // 
+  //   s.rf_wen_W @= s.val_W & s.rf_wen_pending_W
+  // 
+  //   # ostall due to proc2mngr
+  // 
+  //   s.ostall_W @= s.val_W & s.proc2mngr_en_W & ~s.proc2mngr_rdy
+  // 
+  //   # stall in W stage
+  // 
+  //   s.stall_W  @= s.val_W & s.ostall_W
+  // 
+  //   # proc2mngr send is enabled if not stalling
+  // 
+  //   s.proc2mngr_en @= s.val_W & ~s.stall_W & s.proc2mngr_en_W
+  // 
+  //   s.commit_inst @= s.val_W & ~s.stall_W
+  
+  always_comb begin : comb_W
+    rf_wen_W = val_W & rf_wen_pending_W;
+    ostall_W = ( val_W & proc2mngr_en_W ) & ( ~proc2mngr_rdy );
+    stall_W = val_W & ostall_W;
+    proc2mngr_en = ( val_W & ( ~stall_W ) ) & proc2mngr_en_W;
+    commit_inst = val_W & ( ~stall_W );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:523
+  // @update
+  // def comb_X():
+  // 
+  //   # ostall due to dmemreq
+  // 
+  //   s.ostall_dmem_X @= ( s.dmemreq_type_X != nr ) & ~s.dmemreq_rdy
+  // 
+  //   # ostall due to xcelreq
+  //   s.ostall_xcel_X @= s.xcelreq_X & ~s.xcelreq_rdy # This is send
+  // 
+  //   s.ostall_X @= s.val_X & ( s.ostall_dmem_X | s.ostall_xcel_X )
+  // 
+  //   # stall in X stage
+  // 
+  //   s.stall_X  @= s.val_X & ( s.ostall_X | s.ostall_M | s.ostall_W )
+  // 
+  //   # osquash due to taken branches
+  //   # Note that, in the same combinational block, we have to calculate
+  //   # s.stall_X first then use it in osquash_X. Several people have
+  //   # stuck here just because they calculate osquash_X before stall_X!
+  // 
+  //   s.osquash_X @= s.val_X & ~s.stall_X & s.pc_redirect_X
+  // 
+  //   # send dmemreq enable if not stalling
+  // 
+  //   s.dmemreq_en @= s.val_X & ~s.stall_X & ( s.dmemreq_type_X != nr )
+  // 
+  //   s.dmemreq_type @= zext( s.dmemreq_type_X == st, 4 )  # 0-load/DC, 1-store
+  // 
+  //   # send xcelreq enable if not stalling
+  // 
+  //   s.xcelreq_en @= s.val_X & ~s.stall_X & s.xcelreq_X
+  //   s.xcelreq_type @= s.xcelreq_type_X
+  // 
+  //   # next valid bit
+  // 
+  //   s.next_val_X @= s.val_X & ~s.stall_X
+  
+  always_comb begin : comb_X
+    ostall_dmem_X = ( dmemreq_type_X != 2'd0 ) & ( ~dmemreq_rdy );
+    ostall_xcel_X = xcelreq_X & ( ~xcelreq_rdy );
+    ostall_X = val_X & ( ostall_dmem_X | ostall_xcel_X );
+    stall_X = val_X & ( ( ostall_X | ostall_M ) | ostall_W );
+    osquash_X = ( val_X & ( ~stall_X ) ) & pc_redirect_X;
+    dmemreq_en = ( val_X & ( ~stall_X ) ) & ( dmemreq_type_X != 2'd0 );
+    dmemreq_type = { { 3 { 1'b0 } }, dmemreq_type_X == 2'd2 };
+    xcelreq_en = ( val_X & ( ~stall_X ) ) & xcelreq_X;
+    xcelreq_type = xcelreq_type_X;
+    next_val_X = val_X & ( ~stall_X );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:514
+  // @update
+  // def comb_br_X():
+  //   s.pc_redirect_X @= s.val_X & (s.br_type_X == br_ne) & s.ne_X
+  
+  always_comb begin : comb_br_X
+    pc_redirect_X = ( val_X & ( br_type_X == 1'd1 ) ) & ne_X;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:404
+  // @update
+  // def comb_bypass_D():
+  // 
+  //   s.op1_byp_sel_D @= byp_d
+  // 
+  //   if s.rs1_en_D:
+  // 
+  //     if   s.val_X & ( s.inst_D[ RS1 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != 0 ) \
+  //                  & s.rf_wen_pending_X:    s.op1_byp_sel_D @= byp_x
+  //     elif s.val_M & ( s.inst_D[ RS1 ] == s.rf_waddr_M ) & ( s.rf_waddr_M != 0 ) \
+  //                  & s.rf_wen_pending_M:    s.op1_byp_sel_D @= byp_m
+  //     elif s.val_W & ( s.inst_D[ RS1 ] == s.rf_waddr_W ) & ( s.rf_waddr_W != 0 ) \
+  //                  & s.rf_wen_pending_W:    s.op1_byp_sel_D @= byp_w
+  // 
+  //   s.op2_byp_sel_D @= byp_d
+  // 
+  //   if s.rs2_en_D:
+  // 
+  //     if   s.val_X & ( s.inst_D[ RS2 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != 0 ) \
+  //                  & s.rf_wen_pending_X:    s.op2_byp_sel_D @= byp_x
+  //     elif s.val_M & ( s.inst_D[ RS2 ] == s.rf_waddr_M ) & ( s.rf_waddr_M != 0 ) \
+  //                  & s.rf_wen_pending_M:    s.op2_byp_sel_D @= byp_m
+  //     elif s.val_W & ( s.inst_D[ RS2 ] == s.rf_waddr_W ) & ( s.rf_waddr_W != 0 ) \
+  //                  & s.rf_wen_pending_W:    s.op2_byp_sel_D @= byp_w
+  
+  always_comb begin : comb_bypass_D
+    op1_byp_sel_D = 2'd0;
+    if ( rs1_en_D ) begin
+      if ( ( ( val_X & ( inst_D[5'd19:5'd15] == rf_waddr_X ) ) & ( rf_waddr_X != 5'd0 ) ) & rf_wen_pending_X ) begin
+        op1_byp_sel_D = 2'd1;
+      end
+      else if ( ( ( val_M & ( inst_D[5'd19:5'd15] == rf_waddr_M ) ) & ( rf_waddr_M != 5'd0 ) ) & rf_wen_pending_M ) begin
+        op1_byp_sel_D = 2'd2;
+      end
+      else if ( ( ( val_W & ( inst_D[5'd19:5'd15] == rf_waddr_W ) ) & ( rf_waddr_W != 5'd0 ) ) & rf_wen_pending_W ) begin
+        op1_byp_sel_D = 2'd3;
+      end
+    end
+    op2_byp_sel_D = 2'd0;
+    if ( rs2_en_D ) begin
+      if ( ( ( val_X & ( inst_D[5'd24:5'd20] == rf_waddr_X ) ) & ( rf_waddr_X != 5'd0 ) ) & rf_wen_pending_X ) begin
+        op2_byp_sel_D = 2'd1;
+      end
+      else if ( ( ( val_M & ( inst_D[5'd24:5'd20] == rf_waddr_M ) ) & ( rf_waddr_M != 5'd0 ) ) & rf_wen_pending_M ) begin
+        op2_byp_sel_D = 2'd2;
+      end
+      else if ( ( ( val_W & ( inst_D[5'd24:5'd20] == rf_waddr_W ) ) & ( rf_waddr_W != 5'd0 ) ) & rf_wen_pending_W ) begin
+        op2_byp_sel_D = 2'd3;
+      end
+    end
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:317
+  // @update
+  // def comb_control_table_D():
+  //   inst = s.inst_type_decoder_D.out
+  //   #                                      br     rs1 imm    op2    rs2 alu      dmm wbmux rf  cs cs
+  //   #                                  val type    en type   muxsel  en fn       typ sel   wen rr rw
+  //   if   inst == NOP  : s.cs @= concat( y, br_na,  n, imm_x, bm_x,   n, alu_x,   nr, wm_a, n,  n, n )
+  //   elif inst == CSRRX: s.cs @= concat( y, br_na,  n, imm_i, bm_imm, n, alu_cp1, nr, wm_c, y,  y, n )
+  //   elif inst == CSRR : s.cs @= concat( y, br_na,  n, imm_i, bm_csr, n, alu_cp1, nr, wm_a, y,  y, n )
+  //   elif inst == CSRW : s.cs @= concat( y, br_na,  y, imm_i, bm_imm, n, alu_cp0, nr, wm_a, n,  n, y )
+  //   elif inst == ADD  : s.cs @= concat( y, br_na,  y, imm_x, bm_rf,  y, alu_add, nr, wm_a, y,  n, n )
+  //   elif inst == SLL  : s.cs @= concat( y, br_na,  y, imm_x, bm_rf,  y, alu_sll, nr, wm_a, y,  n, n )
+  //   elif inst == SRL  : s.cs @= concat( y, br_na,  y, imm_x, bm_rf,  y, alu_srl, nr, wm_a, y,  n, n )
+  //   elif inst == ADDI : s.cs @= concat( y, br_na,  y, imm_i, bm_imm, n, alu_add, nr, wm_a, y,  n, n )
+  //   elif inst == LW   : s.cs @= concat( y, br_na,  y, imm_i, bm_imm, n, alu_add, ld, wm_m, y,  n, n )
+  //   elif inst == SW   : s.cs @= concat( y, br_na,  y, imm_s, bm_imm, y, alu_add, st, wm_m, n,  n, n )
+  //   elif inst == BNE  : s.cs @= concat( y, br_ne,  y, imm_b, bm_rf,  y, alu_x,   nr, wm_x, n,  n, n )
+  // 
+  //   # ''' TUTORIAL TASK ''''''''''''''''''''''''''''''''''''''''''''''''
+  //   # Implement instruction AND in RTL processor
+  //   # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''\/
+  //   #; Add a single line to set up control signals for AND instruction.
+  // 
+  //   elif inst == AND  : s.cs @= concat( y, br_na,  y, imm_x, bm_rf,  y, alu_and, nr, wm_a, y,  n, n )
+  // 
+  //   # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''/\
+  // 
+  //   else:               s.cs @= concat( n, br_x,   n, imm_x, bm_x,   n, alu_x,   nr, wm_x, n,  n, n )
+  // 
+  //   s.inst_val_D       @= s.cs[19:20]
+  //   s.br_type_D        @= s.cs[18:19]
+  //   s.rs1_en_D         @= s.cs[17:18]
+  //   s.imm_type_D       @= s.cs[14:17]
+  //   s.op2_sel_D        @= s.cs[12:14]
+  //   s.rs2_en_D         @= s.cs[11:12]
+  //   s.alu_fn_D         @= s.cs[7:11]
+  //   s.dmemreq_type_D   @= s.cs[5:7]
+  //   s.wb_result_sel_D  @= s.cs[3:5]
+  //   s.rf_wen_pending_D @= s.cs[2:3]
+  //   s.csrr_D           @= s.cs[1:2]
+  //   s.csrw_D           @= s.cs[0:1]
+  // 
+  //   # setting the actual write address
+  // 
+  //   s.rf_waddr_D @= s.inst_D[RD]
+  // 
+  //   # csrr/csrw logic
+  // 
+  //   s.proc2mngr_en_D @= s.csrw_D & ( s.inst_D[CSRNUM] == CSR_PROC2MNGR )
+  //   s.mngr2proc_D    @= s.csrr_D & ( s.inst_D[CSRNUM] == CSR_MNGR2PROC )
+  // 
+  //   # accelerator
+  //   if s.csrr_D & (s.inst_D[CSRNUM] != CSR_MNGR2PROC):
+  //     s.xcelreq_type_D @= XcelMsgType.READ
+  //     s.xcelreq_D @= 1
+  //   elif s.csrw_D & (s.inst_D[CSRNUM] != CSR_PROC2MNGR):
+  //     s.xcelreq_type_D @= XcelMsgType.WRITE
+  //     s.xcelreq_D @= 1
+  //   else:
+  //     s.xcelreq_type_D @= 0
+  //     s.xcelreq_D @= 0
+  
+  always_comb begin : comb_control_table_D
+    __tmpvar__comb_control_table_D_inst = inst_type_decoder_D__out;
+    if ( __tmpvar__comb_control_table_D_inst == 8'd0 ) begin
+      cs = { 1'd1, 1'd0, 1'd0, 3'd0, 2'd0, 1'd0, 4'd0, 2'd0, 2'd0, 1'd0, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd36 ) begin
+      cs = { 1'd1, 1'd0, 1'd0, 3'd0, 2'd1, 1'd0, 4'd1, 2'd0, 2'd2, 1'd1, 1'd1, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd46 ) begin
+      cs = { 1'd1, 1'd0, 1'd0, 3'd0, 2'd2, 1'd0, 4'd1, 2'd0, 2'd0, 1'd1, 1'd1, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd47 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd0, 2'd1, 1'd0, 4'd0, 2'd0, 2'd0, 1'd0, 1'd0, 1'd1 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd15 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd0, 2'd0, 1'd1, 4'd2, 2'd0, 2'd0, 1'd1, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd9 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd0, 2'd0, 1'd1, 4'd3, 2'd0, 2'd0, 1'd1, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd11 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd0, 2'd0, 1'd1, 4'd4, 2'd0, 2'd0, 1'd1, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd16 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd0, 2'd1, 1'd0, 4'd2, 2'd0, 2'd0, 1'd1, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd3 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd0, 2'd1, 1'd0, 4'd2, 2'd1, 2'd1, 1'd1, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd8 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd1, 2'd1, 1'd1, 4'd2, 2'd2, 2'd1, 1'd0, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd31 ) begin
+      cs = { 1'd1, 1'd1, 1'd1, 3'd2, 2'd0, 1'd1, 4'd0, 2'd0, 2'd0, 1'd0, 1'd0, 1'd0 };
+    end
+    else if ( __tmpvar__comb_control_table_D_inst == 8'd24 ) begin
+      cs = { 1'd1, 1'd0, 1'd1, 3'd0, 2'd0, 1'd1, 4'd5, 2'd0, 2'd0, 1'd1, 1'd0, 1'd0 };
+    end
+    else
+      cs = { 1'd0, 1'd0, 1'd0, 3'd0, 2'd0, 1'd0, 4'd0, 2'd0, 2'd0, 1'd0, 1'd0, 1'd0 };
+    inst_val_D = cs[5'd19:5'd19];
+    br_type_D = cs[5'd18:5'd18];
+    rs1_en_D = cs[5'd17:5'd17];
+    imm_type_D = cs[5'd16:5'd14];
+    op2_sel_D = cs[5'd13:5'd12];
+    rs2_en_D = cs[5'd11:5'd11];
+    alu_fn_D = cs[5'd10:5'd7];
+    dmemreq_type_D = cs[5'd6:5'd5];
+    wb_result_sel_D = cs[5'd4:5'd3];
+    rf_wen_pending_D = cs[5'd2:5'd2];
+    csrr_D = cs[5'd1:5'd1];
+    csrw_D = cs[5'd0:5'd0];
+    rf_waddr_D = inst_D[5'd11:5'd7];
+    proc2mngr_en_D = csrw_D & ( inst_D[5'd31:5'd20] == 12'd1984 );
+    mngr2proc_D = csrr_D & ( inst_D[5'd31:5'd20] == 12'd4032 );
+    if ( csrr_D & ( inst_D[5'd31:5'd20] != 12'd4032 ) ) begin
+      xcelreq_type_D = 1'd0;
+      xcelreq_D = 1'd1;
+    end
+    else if ( csrw_D & ( inst_D[5'd31:5'd20] != 12'd1984 ) ) begin
+      xcelreq_type_D = 1'd1;
+      xcelreq_D = 1'd1;
+    end
+    else begin
+      xcelreq_type_D = 1'd0;
+      xcelreq_D = 1'd0;
+    end
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:433
+  // @update
+  // def comb_hazard_D():
+  //   s.ostall_ld_X_rs1_D @= s.rs1_en_D & s.val_X & s.rf_wen_pending_X \
+  //                          & ( s.inst_D[ RS1 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != 0 ) \
+  //                          & ( s.dmemreq_type_X == ld )
+  // 
+  //   s.ostall_ld_X_rs2_D @= s.rs2_en_D & s.val_X & s.rf_wen_pending_X \
+  //                          & ( s.inst_D[ RS2 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != 0 ) \
+  //                          & ( s.dmemreq_type_X == ld )
+  // 
+  //   s.ostall_xcel_X_rs1_D @= s.rs1_en_D & s.val_X & s.rf_wen_pending_X \
+  //                          & ( s.inst_D[ RS1 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != 0 ) \
+  //                          & s.xcelreq_X
+  // 
+  //   s.ostall_xcel_X_rs2_D @= s.rs2_en_D & s.val_X & s.rf_wen_pending_X \
+  //                          & ( s.inst_D[ RS2 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != 0 ) \
+  //                          & s.xcelreq_X
+  // 
+  //   s.ostall_hazard_D  @= s.ostall_ld_X_rs1_D   | s.ostall_ld_X_rs2_D | \
+  //                         s.ostall_xcel_X_rs1_D | s.ostall_xcel_X_rs2_D
+  
+  always_comb begin : comb_hazard_D
+    ostall_ld_X_rs1_D = ( ( ( ( rs1_en_D & val_X ) & rf_wen_pending_X ) & ( inst_D[5'd19:5'd15] == rf_waddr_X ) ) & ( rf_waddr_X != 5'd0 ) ) & ( dmemreq_type_X == 2'd1 );
+    ostall_ld_X_rs2_D = ( ( ( ( rs2_en_D & val_X ) & rf_wen_pending_X ) & ( inst_D[5'd24:5'd20] == rf_waddr_X ) ) & ( rf_waddr_X != 5'd0 ) ) & ( dmemreq_type_X == 2'd1 );
+    ostall_xcel_X_rs1_D = ( ( ( ( rs1_en_D & val_X ) & rf_wen_pending_X ) & ( inst_D[5'd19:5'd15] == rf_waddr_X ) ) & ( rf_waddr_X != 5'd0 ) ) & xcelreq_X;
+    ostall_xcel_X_rs2_D = ( ( ( ( rs2_en_D & val_X ) & rf_wen_pending_X ) & ( inst_D[5'd24:5'd20] == rf_waddr_X ) ) & ( rf_waddr_X != 5'd0 ) ) & xcelreq_X;
+    ostall_hazard_D = ( ( ostall_ld_X_rs1_D | ostall_ld_X_rs2_D ) | ostall_xcel_X_rs1_D ) | ostall_xcel_X_rs2_D;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:220
+  // @update
+  // def comb_reg_en_D():
+  //   s.reg_en_D @= ~s.stall_D | s.squash_D
+  
+  always_comb begin : comb_reg_en_D
+    reg_en_D = ( ~stall_D ) | squash_D;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:161
+  // @update
+  // def comb_reg_en_F():
+  //   s.reg_en_F @= ~s.stall_F | s.squash_F
+  
+  always_comb begin : comb_reg_en_F
+    reg_en_F = ( ~stall_F ) | squash_F;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:565
+  // @update
+  // def comb_reg_en_M():
+  //   s.reg_en_M @= ~s.stall_M
+  
+  always_comb begin : comb_reg_en_M
+    reg_en_M = ~stall_M;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:620
+  // @update
+  // def comb_reg_en_W():
+  //   s.reg_en_W @= ~s.stall_W
+  
+  always_comb begin : comb_reg_en_W
+    reg_en_W = ~stall_W;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:482
+  // @update
+  // def comb_reg_en_X():
+  //   s.reg_en_X @= ~s.stall_X
+  
+  always_comb begin : comb_reg_en_X
+    reg_en_X = ~stall_X;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:224
+  // @update_ff
+  // def reg_D():
+  //   if s.reset:
+  //     s.val_D <<= 0
+  //   elif s.reg_en_D:
+  //     s.val_D <<= s.next_val_F
+  
+  always_ff @(posedge clk) begin : reg_D
+    if ( reset ) begin
+      val_D <= 1'd0;
+    end
+    else if ( reg_en_D ) begin
+      val_D <= next_val_F;
+    end
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:165
+  // @update_ff
+  // def reg_F():
+  //   if s.reset:
+  //     s.val_F <<= 0
+  //   elif s.reg_en_F:
+  //     s.val_F <<= 1
+  
+  always_ff @(posedge clk) begin : reg_F
+    if ( reset ) begin
+      val_F <= 1'd0;
+    end
+    else if ( reg_en_F ) begin
+      val_F <= 1'd1;
+    end
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:575
+  // @update_ff
+  // def reg_M():
+  //   if s.reset:
+  //     s.val_M            <<= 0
+  //   elif s.reg_en_M:
+  //     s.val_M            <<= s.next_val_X
+  //     s.rf_wen_pending_M <<= s.rf_wen_pending_X
+  //     s.inst_type_M      <<= s.inst_type_X
+  //     s.rf_waddr_M       <<= s.rf_waddr_X
+  //     s.proc2mngr_en_M   <<= s.proc2mngr_en_X
+  //     s.dmemreq_type_M   <<= s.dmemreq_type_X
+  //     s.wb_result_sel_M  <<= s.wb_result_sel_X
+  //     s.xcelreq_M        <<= s.xcelreq_X
+  
+  always_ff @(posedge clk) begin : reg_M
+    if ( reset ) begin
+      val_M <= 1'd0;
+    end
+    else if ( reg_en_M ) begin
+      val_M <= next_val_X;
+      rf_wen_pending_M <= rf_wen_pending_X;
+      inst_type_M <= inst_type_X;
+      rf_waddr_M <= rf_waddr_X;
+      proc2mngr_en_M <= proc2mngr_en_X;
+      dmemreq_type_M <= dmemreq_type_X;
+      wb_result_sel_M <= wb_result_sel_X;
+      xcelreq_M <= xcelreq_X;
+    end
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:628
+  // @update_ff
+  // def reg_W():
+  //   if s.reset:
+  //     s.val_W <<= 0
+  //   elif s.reg_en_W:
+  //     s.val_W            <<= s.next_val_M
+  //     s.rf_wen_pending_W <<= s.rf_wen_pending_M
+  //     s.inst_type_W      <<= s.inst_type_M
+  //     s.rf_waddr_W       <<= s.rf_waddr_M
+  //     s.proc2mngr_en_W   <<= s.proc2mngr_en_M
+  
+  always_ff @(posedge clk) begin : reg_W
+    if ( reset ) begin
+      val_W <= 1'd0;
+    end
+    else if ( reg_en_W ) begin
+      val_W <= next_val_M;
+      rf_wen_pending_W <= rf_wen_pending_M;
+      inst_type_W <= inst_type_M;
+      rf_waddr_W <= rf_waddr_M;
+      proc2mngr_en_W <= proc2mngr_en_M;
+    end
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/ProcCtrlRTL.py:495
+  // @update_ff
+  // def reg_X():
+  //   if s.reset:
+  //     s.val_X <<= 0
+  //   elif s.reg_en_X:
+  //     s.val_X            <<= s.next_val_D
+  //     s.rf_wen_pending_X <<= s.rf_wen_pending_D
+  //     s.inst_type_X      <<= s.inst_type_decoder_D.out
+  //     s.alu_fn_X         <<= s.alu_fn_D
+  //     s.rf_waddr_X       <<= s.rf_waddr_D
+  //     s.proc2mngr_en_X   <<= s.proc2mngr_en_D
+  //     s.dmemreq_type_X   <<= s.dmemreq_type_D
+  //     s.wb_result_sel_X  <<= s.wb_result_sel_D
+  //     s.br_type_X        <<= s.br_type_D
+  //     s.xcelreq_X        <<= s.xcelreq_D
+  //     s.xcelreq_type_X   <<= s.xcelreq_type_D
+  
+  always_ff @(posedge clk) begin : reg_X
+    if ( reset ) begin
+      val_X <= 1'd0;
+    end
+    else if ( reg_en_X ) begin
+      val_X <= next_val_D;
+      rf_wen_pending_X <= rf_wen_pending_D;
+      inst_type_X <= inst_type_decoder_D__out;
+      alu_fn_X <= alu_fn_D;
+      rf_waddr_X <= rf_waddr_D;
+      proc2mngr_en_X <= proc2mngr_en_D;
+      dmemreq_type_X <= dmemreq_type_D;
+      wb_result_sel_X <= wb_result_sel_D;
+      br_type_X <= br_type_D;
+      xcelreq_X <= xcelreq_D;
+      xcelreq_type_X <= xcelreq_type_D;
+    end
+  end
+
+  // Connections
+  assign inst_type_decoder_D__clk = clk;
+  assign inst_type_decoder_D__reset = reset;
+  assign inst_type_decoder_D__in_ = inst_D;
+
+endmodule
+
+
+// PyMTL Component Mux Definition
+// Full name: Mux__Type_MemRespMsg__type__4__opaque_8__test_2__len_2__data_32__ninputs_2
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__e8e959655ba0e64d
+(
+  input  logic [0:0]    clk,
+  input  logic [3:0]    in___0__type_,
+  input  logic [7:0]    in___0__opaque,
+  input  logic [1:0]    in___0__test,
+  input  logic [1:0]    in___0__len,
+  input  logic [31:0]   in___0__data,
+  input  logic [3:0]    in___1__type_,
+  input  logic [7:0]    in___1__opaque,
+  input  logic [1:0]    in___1__test,
+  input  logic [1:0]    in___1__len,
+  input  logic [31:0]   in___1__data,
+  output logic [3:0]    out__type_,
+  output logic [7:0]    out__opaque,
+  output logic [1:0]    out__test,
+  output logic [1:0]    out__len,
+  output logic [31:0]   out__data,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [3:0]    in___type_ [0:1];
+  logic [7:0]    in___opaque [0:1];
+  logic [1:0]    in___test [0:1];
+  logic [1:0]    in___len [0:1];
+  logic [31:0]   in___data [0:1];
+  logic [47:0]   in_ [0:1];
+  logic [47:0]   out;
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in___type_[0] = in___0__type_;
+  assign in___opaque[0] = in___0__opaque;
+  assign in___test[0] = in___0__test;
+  assign in___len[0] = in___0__len;
+  assign in___data[0] = in___0__data;
+  assign in_[0][47:44] = in___0__type_;
+  assign in_[0][43:36] = in___0__opaque;
+  assign in_[0][35:34] = in___0__test;
+  assign in_[0][33:32] = in___0__len;
+  assign in_[0][31:0] = in___0__data;
+  assign in___type_[1] = in___1__type_;
+  assign in___opaque[1] = in___1__opaque;
+  assign in___test[1] = in___1__test;
+  assign in___len[1] = in___1__len;
+  assign in___data[1] = in___1__data;
+  assign in_[1][47:44] = in___1__type_;
+  assign in_[1][43:36] = in___1__opaque;
+  assign in_[1][35:34] = in___1__test;
+  assign in_[1][33:32] = in___1__len;
+  assign in_[1][31:0] = in___1__data;
+  assign out__type_ = out[47:44];
+  assign out__opaque = out[43:36];
+  assign out__test = out[35:34];
+  assign out__len = out[33:32];
+  assign out__data = out[31:0];
+
+endmodule
+
+
+// PyMTL Component BypassQueue1EntryRTL Definition
+// Full name: BypassQueue1EntryRTL__EntryType_MemRespMsg__type__4__opaque_8__test_2__len_2__data_32
+// At /root/package/pymtl3/stdlib/queues/queues.py
+module BypassQueue1EntryRTL__ffaac31347f89140
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    deq__en,
+  output logic [0:0]    deq__rdy,
+  output logic [3:0]    deq__ret__type_,
+  output logic [7:0]    deq__ret__opaque,
+  output logic [1:0]    deq__ret__test,
+  output logic [1:0]    deq__ret__len,
+  output logic [31:0]   deq__ret__data,
+  input  logic [0:0]    enq__en,
+  input  logic [3:0]    enq__msg__type_,
+  input  logic [7:0]    enq__msg__opaque,
+  input  logic [1:0]    enq__msg__test,
+  input  logic [1:0]    enq__msg__len,
+  input  logic [31:0]   enq__msg__data,
+  output logic [0:0]    enq__rdy
+);
+  // Struct/Array ports in the form of wires
+  logic [47:0]   deq__ret;
+  logic [47:0]   enq__msg;
+
+  // Wire declarations
+  logic [3:0]    entry__type_;
+  logic [7:0]    entry__opaque;
+  logic [1:0]    entry__test;
+  logic [1:0]    entry__len;
+  logic [31:0]   entry__data;
+  logic [47:0]   entry;
+  logic [0:0]    full;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [3:0]    bypass_mux__in___type_ [0:1];
+  logic [7:0]    bypass_mux__in___opaque [0:1];
+  logic [1:0]    bypass_mux__in___test [0:1];
+  logic [1:0]    bypass_mux__in___len [0:1];
+  logic [31:0]   bypass_mux__in___data [0:1];
+  logic [47:0]   bypass_mux__in_ [0:1];
+  logic [47:0]   bypass_mux__out;
+
+  // Sub-component declarations
+  logic [0:0]    bypass_mux__clk;
+  logic [3:0]    bypass_mux__in___0__type_;
+  logic [7:0]    bypass_mux__in___0__opaque;
+  logic [1:0]    bypass_mux__in___0__test;
+  logic [1:0]    bypass_mux__in___0__len;
+  logic [31:0]   bypass_mux__in___0__data;
+  logic [3:0]    bypass_mux__in___1__type_;
+  logic [7:0]    bypass_mux__in___1__opaque;
+  logic [1:0]    bypass_mux__in___1__test;
+  logic [1:0]    bypass_mux__in___1__len;
+  logic [31:0]   bypass_mux__in___1__data;
+  logic [3:0]    bypass_mux__out__type_;
+  logic [7:0]    bypass_mux__out__opaque;
+  logic [1:0]    bypass_mux__out__test;
+  logic [1:0]    bypass_mux__out__len;
+  logic [31:0]   bypass_mux__out__data;
+  logic [0:0]    bypass_mux__reset;
+  logic [0:0]    bypass_mux__sel;
+
+  Mux__e8e959655ba0e64d bypass_mux
+  (
+    .clk            (      bypass_mux__clk      ),
+    .in___0__type_  ( bypass_mux__in___0__type_ ),
+    .in___0__opaque ( bypass_mux__in___0__opaque ),
+    .in___0__test   (  bypass_mux__in___0__test ),
+    .in___0__len    (  bypass_mux__in___0__len  ),
+    .in___0__data   (  bypass_mux__in___0__data ),
+    .in___1__type_  ( bypass_mux__in___1__type_ ),
+    .in___1__opaque ( bypass_mux__in___1__opaque ),
+    .in___1__test   (  bypass_mux__in___1__test ),
+    .in___1__len    (  bypass_mux__in___1__len  ),
+    .in___1__data   (  bypass_mux__in___1__data ),
+    .out__type_     (   bypass_mux__out__type_  ),
+    .out__opaque    (  bypass_mux__out__opaque  ),
+    .out__test      (   bypass_mux__out__test   ),
+    .out__len       (    bypass_mux__out__len   ),
+    .out__data      (   bypass_mux__out__data   ),
+    .reset          (     bypass_mux__reset     ),
+    .sel            (      bypass_mux__sel      )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign bypass_mux__in___0__type_ = bypass_mux__in___type_[0];
+  assign bypass_mux__in___0__opaque = bypass_mux__in___opaque[0];
+  assign bypass_mux__in___0__test = bypass_mux__in___test[0];
+  assign bypass_mux__in___0__len = bypass_mux__in___len[0];
+  assign bypass_mux__in___0__data = bypass_mux__in___data[0];
+  assign bypass_mux__in___0__type_ = bypass_mux__in_[0][47:44];
+  assign bypass_mux__in___0__opaque = bypass_mux__in_[0][43:36];
+  assign bypass_mux__in___0__test = bypass_mux__in_[0][35:34];
+  assign bypass_mux__in___0__len = bypass_mux__in_[0][33:32];
+  assign bypass_mux__in___0__data = bypass_mux__in_[0][31:0];
+  assign bypass_mux__in___1__type_ = bypass_mux__in___type_[1];
+  assign bypass_mux__in___1__opaque = bypass_mux__in___opaque[1];
+  assign bypass_mux__in___1__test = bypass_mux__in___test[1];
+  assign bypass_mux__in___1__len = bypass_mux__in___len[1];
+  assign bypass_mux__in___1__data = bypass_mux__in___data[1];
+  assign bypass_mux__in___1__type_ = bypass_mux__in_[1][47:44];
+  assign bypass_mux__in___1__opaque = bypass_mux__in_[1][43:36];
+  assign bypass_mux__in___1__test = bypass_mux__in_[1][35:34];
+  assign bypass_mux__in___1__len = bypass_mux__in_[1][33:32];
+  assign bypass_mux__in___1__data = bypass_mux__in_[1][31:0];
+  assign bypass_mux__out[47:44] = bypass_mux__out__type_;
+  assign bypass_mux__out[43:36] = bypass_mux__out__opaque;
+  assign bypass_mux__out[35:34] = bypass_mux__out__test;
+  assign bypass_mux__out[33:32] = bypass_mux__out__len;
+  assign bypass_mux__out[31:0] = bypass_mux__out__data;
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:532
+  // s.deq.rdy //= lambda: ~s.reset & ( s.full | s.enq.en )
+  
+  always_comb begin : _lambda__s_proc_dmemresp_q_q_deq_rdy
+    deq__rdy = ( ~reset ) & ( full | enq__en );
+  end
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:531
+  // s.enq.rdy //= lambda: ~s.reset & ~s.full
+  
+  always_comb begin : _lambda__s_proc_dmemresp_q_q_enq_rdy
+    enq__rdy = ( ~reset ) & ( ~full );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:534
+  // @update_ff
+  // def ff_bypass1():
+  //   s.full <<= ~s.reset & ( ~s.deq.en & (s.enq.en | s.full) )
+  // 
+  //   if s.enq.en & ~s.deq.en:
+  //     s.entry <<= s.enq.msg
+  
+  always_ff @(posedge clk) begin : ff_bypass1
+    full <= ( ~reset ) & ( ( ~deq__en ) & ( enq__en | full ) );
+    if ( enq__en & ( ~deq__en ) ) begin
+      entry <= enq__msg;
+    end
+  end
+
+  // Connections
+  assign deq__ret__type_ = deq__ret[47:44];
+  assign deq__ret__opaque = deq__ret[43:36];
+  assign deq__ret__test = deq__ret[35:34];
+  assign deq__ret__len = deq__ret[33:32];
+  assign deq__ret__data = deq__ret[31:0];
+  assign enq__msg[47:44] = enq__msg__type_;
+  assign enq__msg[43:36] = enq__msg__opaque;
+  assign enq__msg[35:34] = enq__msg__test;
+  assign enq__msg[33:32] = enq__msg__len;
+  assign enq__msg[31:0] = enq__msg__data;
+  assign bypass_mux__clk = clk;
+  assign bypass_mux__reset = reset;
+  assign bypass_mux__in_[0] = enq__msg;
+  assign bypass_mux__in_[1] = entry;
+  assign deq__ret = bypass_mux__out;
+  assign bypass_mux__sel = full;
+  assign count = full;
+
+endmodule
+
+
+// PyMTL Component BypassQueueRTL Definition
+// Full name: BypassQueueRTL__EntryType_MemRespMsg__type__4__opaque_8__test_2__len_2__data_32__num_entries_1
+// At /root/package/pymtl3/stdlib/queues/queues.py
+module BypassQueueRTL__49a4184f84b04c56
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    deq__en,
+  output logic [0:0]    deq__rdy,
+  output logic [3:0]    deq__ret__type_,
+  output logic [7:0]    deq__ret__opaque,
+  output logic [1:0]    deq__ret__test,
+  output logic [1:0]    deq__ret__len,
+  output logic [31:0]   deq__ret__data,
+  input  logic [0:0]    enq__en,
+  input  logic [3:0]    enq__msg__type_,
+  input  logic [7:0]    enq__msg__opaque,
+  input  logic [1:0]    enq__msg__test,
+  input  logic [1:0]    enq__msg__len,
+  input  logic [31:0]   enq__msg__data,
+  output logic [0:0]    enq__rdy
+);
+  // Struct/Array ports in the form of wires
+  logic [47:0]   deq__ret;
+  logic [47:0]   enq__msg;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [47:0]   q__deq__ret;
+  logic [47:0]   q__enq__msg;
+
+  // Sub-component declarations
+  logic [0:0]    q__clk;
+  logic [0:0]    q__count;
+  logic [0:0]    q__reset;
+  logic [0:0]    q__deq__en;
+  logic [0:0]    q__deq__rdy;
+  logic [3:0]    q__deq__ret__type_;
+  logic [7:0]    q__deq__ret__opaque;
+  logic [1:0]    q__deq__ret__test;
+  logic [1:0]    q__deq__ret__len;
+  logic [31:0]   q__deq__ret__data;
+  logic [0:0]    q__enq__en;
+  logic [3:0]    q__enq__msg__type_;
+  logic [7:0]    q__enq__msg__opaque;
+  logic [1:0]    q__enq__msg__test;
+  logic [1:0]    q__enq__msg__len;
+  logic [31:0]   q__enq__msg__data;
+  logic [0:0]    q__enq__rdy;
+
+  BypassQueue1EntryRTL__ffaac31347f89140 q
+  (
+    .clk            (           q__clk          ),
+    .count          (          q__count         ),
+    .reset          (          q__reset         ),
+    .deq__en        (         q__deq__en        ),
+    .deq__rdy       (        q__deq__rdy        ),
+    .deq__ret__type_(     q__deq__ret__type_    ),
+    .deq__ret__opaque(    q__deq__ret__opaque    ),
+    .deq__ret__test (     q__deq__ret__test     ),
+    .deq__ret__len  (      q__deq__ret__len     ),
+    .deq__ret__data (     q__deq__ret__data     ),
+    .enq__en        (         q__enq__en        ),
+    .enq__msg__type_(     q__enq__msg__type_    ),
+    .enq__msg__opaque(    q__enq__msg__opaque    ),
+    .enq__msg__test (     q__enq__msg__test     ),
+    .enq__msg__len  (      q__enq__msg__len     ),
+    .enq__msg__data (     q__enq__msg__data     ),
+    .enq__rdy       (        q__enq__rdy        )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign q__deq__ret[47:44] = q__deq__ret__type_;
+  assign q__deq__ret[43:36] = q__deq__ret__opaque;
+  assign q__deq__ret[35:34] = q__deq__ret__test;
+  assign q__deq__ret[33:32] = q__deq__ret__len;
+  assign q__deq__ret[31:0] = q__deq__ret__data;
+  assign q__enq__msg__type_ = q__enq__msg[47:44];
+  assign q__enq__msg__opaque = q__enq__msg[43:36];
+  assign q__enq__msg__test = q__enq__msg[35:34];
+  assign q__enq__msg__len = q__enq__msg[33:32];
+  assign q__enq__msg__data = q__enq__msg[31:0];
+
+  // Connections
+  assign deq__ret__type_ = deq__ret[47:44];
+  assign deq__ret__opaque = deq__ret[43:36];
+  assign deq__ret__test = deq__ret[35:34];
+  assign deq__ret__len = deq__ret[33:32];
+  assign deq__ret__data = deq__ret[31:0];
+  assign enq__msg[47:44] = enq__msg__type_;
+  assign enq__msg[43:36] = enq__msg__opaque;
+  assign enq__msg[35:34] = enq__msg__test;
+  assign enq__msg[33:32] = enq__msg__len;
+  assign enq__msg[31:0] = enq__msg__data;
+  assign q__clk = clk;
+  assign q__reset = reset;
+  assign q__enq__en = enq__en;
+  assign q__enq__msg = enq__msg;
+  assign enq__rdy = q__enq__rdy;
+  assign q__deq__en = deq__en;
+  assign deq__rdy = q__deq__rdy;
+  assign deq__ret = q__deq__ret;
+  assign count = q__count;
+
+endmodule
+
+
+// PyMTL Component AluRTL Definition
+// At /root/package/examples/ex03_proc/MiscRTL.py
+module AluRTL__nbits_32
+(
+  input  logic [0:0]    clk,
+  input  logic [3:0]    fn,
+  input  logic [31:0]   in0,
+  input  logic [31:0]   in1,
+  output logic [0:0]    ops_ne,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/MiscRTL.py:124
+  // @update
+  // def comb_logic():
+  //   if   s.fn == 0: s.out @= s.in0               # COPY OP0
+  //   elif s.fn == 1: s.out @= s.in1               # COPY OP1
+  //   elif s.fn == 2: s.out @= s.in0 + s.in1       # ADD
+  //   elif s.fn == 3: s.out @= s.in0 << zext(s.in1[0:5], 32) # SLL
+  //   elif s.fn == 4: s.out @= s.in0 >> zext(s.in1[0:5], 32) # SRL
+  // 
+  //   # ''' TUTORIAL TASK ''''''''''''''''''''''''''''''''''''''''''''''''
+  //   # Implement AND in the ALU
+  //   # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''\/
+  //   #; Add code to implement a bitwise-and operation for in0 and in1.
+  // 
+  //   elif s.fn == 5: s.out @= s.in0 & s.in1       # AND
+  // 
+  //   # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''/\
+  // 
+  //   else:           s.out @= 0            # Unknown
+  // 
+  //   s.ops_ne @= s.in0 != s.in1
+  
+  always_comb begin : comb_logic
+    if ( fn == 4'd0 ) begin
+      out = in0;
+    end
+    else if ( fn == 4'd1 ) begin
+      out = in1;
+    end
+    else if ( fn == 4'd2 ) begin
+      out = in0 + in1;
+    end
+    else if ( fn == 4'd3 ) begin
+      out = in0 << { { 27 { 1'b0 } }, in1[5'd4:5'd0] };
+    end
+    else if ( fn == 4'd4 ) begin
+      out = in0 >> { { 27 { 1'b0 } }, in1[5'd4:5'd0] };
+    end
+    else if ( fn == 4'd5 ) begin
+      out = in0 & in1;
+    end
+    else
+      out = 32'd0;
+    ops_ne = in0 != in1;
+  end
+
+endmodule
+
+
+// PyMTL Component RegEnRst Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegEnRst__Type_Bits32__reset_value_0
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    en,
+  input  logic [31:0]   in_,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:55
+  // @update_ff
+  // def up_regenrst():
+  //   if s.reset: s.out <<= reset_value
+  //   elif s.en:  s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regenrst
+    if ( reset ) begin
+      out <= 32'd0;
+    end
+    else if ( en ) begin
+      out <= in_;
+    end
+  end
+
+endmodule
+
+
+// PyMTL Component ImmGenRTL Definition
+// At /root/package/examples/ex03_proc/MiscRTL.py
+module ImmGenRTL_noparam
+(
+  input  logic [0:0]    clk,
+  output logic [31:0]   imm,
+  input  logic [2:0]    imm_type,
+  input  logic [31:0]   inst,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/MiscRTL.py:90
+  // @update
+  // def up_immgen():
+  //   s.imm @= 0
+  // 
+  //   # Always sext!
+  //   if   s.imm_type == 0: # I-type
+  //     s.imm @= concat( sext( s.inst[ I_IMM ], 32 ) )
+  // 
+  //   elif s.imm_type == 2: # B-type
+  //     s.imm @= concat( sext( s.inst[ B_IMM3 ], 20 ),
+  //                            s.inst[ B_IMM2 ],
+  //                            s.inst[ B_IMM1 ],
+  //                            s.inst[ B_IMM0 ],
+  //                            b1( 0 ) )
+  // 
+  //   elif s.imm_type == 1: # S-type
+  //     s.imm @= concat( sext( s.inst[ S_IMM1 ], 27 ),
+  //                            s.inst[ S_IMM0 ] )
+  
+  always_comb begin : up_immgen
+    imm = 32'd0;
+    if ( imm_type == 3'd0 ) begin
+      imm = { { { 20 { inst[5'd31] } }, inst[5'd31:5'd20] } };
+    end
+    else if ( imm_type == 3'd2 ) begin
+      imm = { { { 19 { inst[5'd31:5'd31] } }, inst[5'd31:5'd31] }, inst[5'd7:5'd7], inst[5'd30:5'd25], inst[5'd11:5'd8], 1'd0 };
+    end
+    else if ( imm_type == 3'd1 ) begin
+      imm = { { { 20 { inst[5'd31] } }, inst[5'd31:5'd25] }, inst[5'd11:5'd7] };
+    end
+  end
+
+endmodule
+
+
+// PyMTL Component Mux Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__Type_Bits32__ninputs_4
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in___0,
+  input  logic [31:0]   in___1,
+  input  logic [31:0]   in___2,
+  input  logic [31:0]   in___3,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset,
+  input  logic [1:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [31:0]   in_ [0:3];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+  assign in_[2] = in___2;
+  assign in_[3] = in___3;
+
+endmodule
+
+
+// PyMTL Component Mux Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__Type_Bits32__ninputs_3
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in___0,
+  input  logic [31:0]   in___1,
+  input  logic [31:0]   in___2,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset,
+  input  logic [1:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [31:0]   in_ [0:2];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+  assign in_[2] = in___2;
+
+endmodule
+
+
+// PyMTL Component Incrementer Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Incrementer__Type_Bits32__amount_4
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in_,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:76
+  // @update
+  // def up_incrementer():
+  //   s.out @= s.in_ + amount
+  
+  always_comb begin : up_incrementer
+    out = in_ + 32'd4;
+  end
+
+endmodule
+
+
+// PyMTL Component Adder Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Adder__Type_Bits32
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in0,
+  input  logic [31:0]   in1,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:89
+  // @update
+  // def up_adder():
+  //   s.out @= s.in0 + s.in1
+  
+  always_comb begin : up_adder
+    out = in0 + in1;
+  end
+
+endmodule
+
+
+// PyMTL Component RegEnRst Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegEnRst__Type_Bits32__reset_value_508
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    en,
+  input  logic [31:0]   in_,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:55
+  // @update_ff
+  // def up_regenrst():
+  //   if s.reset: s.out <<= reset_value
+  //   elif s.en:  s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regenrst
+    if ( reset ) begin
+      out <= 32'd508;
+    end
+    else if ( en ) begin
+      out <= in_;
+    end
+  end
+
+endmodule
+
+
+// PyMTL Component Mux Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__Type_Bits32__ninputs_2
+(
+  input  logic [0:0]    clk,
+  input  logic [31:0]   in___0,
+  input  logic [31:0]   in___1,
+  output logic [31:0]   out,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [31:0]   in_ [0:1];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in_[0] = in___0;
+  assign in_[1] = in___1;
+
+endmodule
+
+
+// PyMTL Component RegisterFile Definition
+// Full name: RegisterFile__Type_Bits32__nregs_32__rd_ports_2__wr_ports_1__const_zero_True
+// At /root/package/pymtl3/stdlib/basic_rtl/register_files.py
+module RegisterFile__cf7325a12c1669d6
+(
+  input  logic [0:0]    clk,
+  input  logic [4:0]    raddr__0,
+  input  logic [4:0]    raddr__1,
+  output logic [31:0]   rdata__0,
+  output logic [31:0]   rdata__1,
+  input  logic [0:0]    reset,
+  input  logic [4:0]    waddr__0,
+  input  logic [31:0]   wdata__0,
+  input  logic [0:0]    wen__0
+);
+  // Struct/Array ports in the form of wires
+  logic [4:0]    raddr [0:1];
+  logic [31:0]   rdata [0:1];
+  logic [4:0]    waddr [0:0];
+  logic [31:0]   wdata [0:0];
+  logic [0:0]    wen [0:0];
+
+  // Wire declarations
+  logic [31:0]   regs [0:31];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/register_files.py:20
+  // @update
+  // def up_rf_read():
+  //   for i in range( rd_ports ):
+  //     s.rdata[i] @= s.regs[ s.raddr[i] ]
+  
+  integer __loopvar__up_rf_read_i;
+  
+  always_comb begin : up_rf_read
+    for ( __loopvar__up_rf_read_i = 1'd0; __loopvar__up_rf_read_i < 2'd2; __loopvar__up_rf_read_i = __loopvar__up_rf_read_i + 1'd1 )
+      rdata[1'(__loopvar__up_rf_read_i)] = regs[raddr[1'(__loopvar__up_rf_read_i)]];
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/register_files.py:26
+  // @update_ff
+  // def up_rf_write_constzero():
+  //   for i in range( wr_ports ):
+  //     if s.wen[i] & (s.waddr[i] != 0):
+  //       s.regs[ s.waddr[i] ] <<= s.wdata[i]
+  
+  integer __loopvar__up_rf_write_constzero_i;
+  
+  always_ff @(posedge clk) begin : up_rf_write_constzero
+    for ( __loopvar__up_rf_write_constzero_i = 1'd0; __loopvar__up_rf_write_constzero_i < 1'd1; __loopvar__up_rf_write_constzero_i = __loopvar__up_rf_write_constzero_i + 1'd1 )
+      if ( wen[1'(__loopvar__up_rf_write_constzero_i)] & ( waddr[1'(__loopvar__up_rf_write_constzero_i)] != 5'd0 ) ) begin
+        regs[waddr[1'(__loopvar__up_rf_write_constzero_i)]] <= wdata[1'(__loopvar__up_rf_write_constzero_i)];
+      end
+  end
+
+  // Connections
+  assign raddr[0] = raddr__0;
+  assign raddr[1] = raddr__1;
+  assign rdata__0 = rdata[0];
+  assign rdata__1 = rdata[1];
+  assign waddr[0] = waddr__0;
+  assign wdata[0] = wdata__0;
+  assign wen[0] = wen__0;
+
+endmodule
+
+
+// PyMTL Component ProcDpath Definition
+// At /root/package/examples/ex03_proc/ProcDpathRTL.py
+module ProcDpath_noparam
+(
+  input  logic [3:0]    alu_fn_X,
+  input  logic [0:0]    clk,
+  output logic [31:0]   dmemreq_addr,
+  output logic [31:0]   dmemreq_data,
+  input  logic [31:0]   dmemresp_data,
+  output logic [31:0]   imemreq_addr,
+  input  logic [31:0]   imemresp_data,
+  input  logic [2:0]    imm_type_D,
+  output logic [31:0]   inst_D,
+  input  logic [31:0]   mngr2proc_data,
+  output logic [0:0]    ne_X,
+  input  logic [1:0]    op1_byp_sel_D,
+  input  logic [1:0]    op2_byp_sel_D,
+  input  logic [1:0]    op2_sel_D,
+  input  logic [0:0]    pc_sel_F,
+  output logic [31:0]   proc2mngr_data,
+  input  logic [0:0]    reg_en_D,
+  input  logic [0:0]    reg_en_F,
+  input  logic [0:0]    reg_en_M,
+  input  logic [0:0]    reg_en_W,
+  input  logic [0:0]    reg_en_X,
+  input  logic [0:0]    reset,
+  input  logic [4:0]    rf_waddr_W,
+  input  logic [0:0]    rf_wen_W,
+  input  logic [1:0]    wb_result_sel_M,
+  output logic [4:0]    xcelreq_addr,
+  output logic [31:0]   xcelreq_data,
+  input  logic [31:0]   xcelresp_data
+);
+  // Wire declarations
+  logic [31:0]   br_target_X;
+  logic [31:0]   bypass_M;
+  logic [31:0]   bypass_W;
+  logic [31:0]   bypass_X;
+  logic [31:0]   pc_F;
+  logic [31:0]   pc_plus4_F;
+  logic [31:0]   rf_rdata0_D;
+  logic [31:0]   rf_rdata1_D;
+  logic [31:0]   rf_wdata_W;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [31:0]   op1_byp_mux_D__in_ [0:3];
+  logic [31:0]   op2_byp_mux_D__in_ [0:3];
+  logic [31:0]   op2_sel_mux_D__in_ [0:2];
+  logic [31:0]   pc_sel_mux_F__in_ [0:1];
+  logic [4:0]    rf__raddr [0:1];
+  logic [31:0]   rf__rdata [0:1];
+  logic [4:0]    rf__waddr [0:0];
+  logic [31:0]   rf__wdata [0:0];
+  logic [0:0]    rf__wen [0:0];
+  logic [31:0]   wb_result_sel_mux_M__in_ [0:2];
+
+  // Sub-component declarations
+  logic [0:0]    alu_X__clk;
+  logic [3:0]    alu_X__fn;
+  logic [31:0]   alu_X__in0;
+  logic [31:0]   alu_X__in1;
+  logic [0:0]    alu_X__ops_ne;
+  logic [31:0]   alu_X__out;
+  logic [0:0]    alu_X__reset;
+
+  AluRTL__nbits_32 alu_X
+  (
+    .clk            (         alu_X__clk        ),
+    .fn             (         alu_X__fn         ),
+    .in0            (         alu_X__in0        ),
+    .in1            (         alu_X__in1        ),
+    .ops_ne         (       alu_X__ops_ne       ),
+    .out            (         alu_X__out        ),
+    .reset          (        alu_X__reset       )
+  );
+
+  logic [0:0]    br_target_reg_X__clk;
+  logic [0:0]    br_target_reg_X__en;
+  logic [31:0]   br_target_reg_X__in_;
+  logic [31:0]   br_target_reg_X__out;
+  logic [0:0]    br_target_reg_X__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 br_target_reg_X
+  (
+    .clk            (    br_target_reg_X__clk   ),
+    .en             (    br_target_reg_X__en    ),
+    .in_            (    br_target_reg_X__in_   ),
+    .out            (    br_target_reg_X__out   ),
+    .reset          (   br_target_reg_X__reset  )
+  );
+
+  logic [0:0]    ex_result_reg_M__clk;
+  logic [0:0]    ex_result_reg_M__en;
+  logic [31:0]   ex_result_reg_M__in_;
+  logic [31:0]   ex_result_reg_M__out;
+  logic [0:0]    ex_result_reg_M__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 ex_result_reg_M
+  (
+    .clk            (    ex_result_reg_M__clk   ),
+    .en             (    ex_result_reg_M__en    ),
+    .in_            (    ex_result_reg_M__in_   ),
+    .out            (    ex_result_reg_M__out   ),
+    .reset          (   ex_result_reg_M__reset  )
+  );
+
+  logic [0:0]    immgen_D__clk;
+  logic [31:0]   immgen_D__imm;
+  logic [2:0]    immgen_D__imm_type;
+  logic [31:0]   immgen_D__inst;
+  logic [0:0]    immgen_D__reset;
+
+  ImmGenRTL_noparam immgen_D
+  (
+    .clk            (       immgen_D__clk       ),
+    .imm            (       immgen_D__imm       ),
+    .imm_type       (     immgen_D__imm_type    ),
+    .inst           (       immgen_D__inst      ),
+    .reset          (      immgen_D__reset      )
+  );
+
+  logic [0:0]    inst_D_reg__clk;
+  logic [0:0]    inst_D_reg__en;
+  logic [31:0]   inst_D_reg__in_;
+  logic [31:0]   inst_D_reg__out;
+  logic [0:0]    inst_D_reg__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 inst_D_reg
+  (
+    .clk            (      inst_D_reg__clk      ),
+    .en             (       inst_D_reg__en      ),
+    .in_            (      inst_D_reg__in_      ),
+    .out            (      inst_D_reg__out      ),
+    .reset          (     inst_D_reg__reset     )
+  );
+
+  logic [0:0]    op1_byp_mux_D__clk;
+  logic [31:0]   op1_byp_mux_D__in___0;
+  logic [31:0]   op1_byp_mux_D__in___1;
+  logic [31:0]   op1_byp_mux_D__in___2;
+  logic [31:0]   op1_byp_mux_D__in___3;
+  logic [31:0]   op1_byp_mux_D__out;
+  logic [0:0]    op1_byp_mux_D__reset;
+  logic [1:0]    op1_byp_mux_D__sel;
+
+  Mux__Type_Bits32__ninputs_4 op1_byp_mux_D
+  (
+    .clk            (     op1_byp_mux_D__clk    ),
+    .in___0         (   op1_byp_mux_D__in___0   ),
+    .in___1         (   op1_byp_mux_D__in___1   ),
+    .in___2         (   op1_byp_mux_D__in___2   ),
+    .in___3         (   op1_byp_mux_D__in___3   ),
+    .out            (     op1_byp_mux_D__out    ),
+    .reset          (    op1_byp_mux_D__reset   ),
+    .sel            (     op1_byp_mux_D__sel    )
+  );
+
+  logic [0:0]    op1_reg_X__clk;
+  logic [0:0]    op1_reg_X__en;
+  logic [31:0]   op1_reg_X__in_;
+  logic [31:0]   op1_reg_X__out;
+  logic [0:0]    op1_reg_X__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 op1_reg_X
+  (
+    .clk            (       op1_reg_X__clk      ),
+    .en             (       op1_reg_X__en       ),
+    .in_            (       op1_reg_X__in_      ),
+    .out            (       op1_reg_X__out      ),
+    .reset          (      op1_reg_X__reset     )
+  );
+
+  logic [0:0]    op2_byp_mux_D__clk;
+  logic [31:0]   op2_byp_mux_D__in___0;
+  logic [31:0]   op2_byp_mux_D__in___1;
+  logic [31:0]   op2_byp_mux_D__in___2;
+  logic [31:0]   op2_byp_mux_D__in___3;
+  logic [31:0]   op2_byp_mux_D__out;
+  logic [0:0]    op2_byp_mux_D__reset;
+  logic [1:0]    op2_byp_mux_D__sel;
+
+  Mux__Type_Bits32__ninputs_4 op2_byp_mux_D
+  (
+    .clk            (     op2_byp_mux_D__clk    ),
+    .in___0         (   op2_byp_mux_D__in___0   ),
+    .in___1         (   op2_byp_mux_D__in___1   ),
+    .in___2         (   op2_byp_mux_D__in___2   ),
+    .in___3         (   op2_byp_mux_D__in___3   ),
+    .out            (     op2_byp_mux_D__out    ),
+    .reset          (    op2_byp_mux_D__reset   ),
+    .sel            (     op2_byp_mux_D__sel    )
+  );
+
+  logic [0:0]    op2_reg_X__clk;
+  logic [0:0]    op2_reg_X__en;
+  logic [31:0]   op2_reg_X__in_;
+  logic [31:0]   op2_reg_X__out;
+  logic [0:0]    op2_reg_X__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 op2_reg_X
+  (
+    .clk            (       op2_reg_X__clk      ),
+    .en             (       op2_reg_X__en       ),
+    .in_            (       op2_reg_X__in_      ),
+    .out            (       op2_reg_X__out      ),
+    .reset          (      op2_reg_X__reset     )
+  );
+
+  logic [0:0]    op2_sel_mux_D__clk;
+  logic [31:0]   op2_sel_mux_D__in___0;
+  logic [31:0]   op2_sel_mux_D__in___1;
+  logic [31:0]   op2_sel_mux_D__in___2;
+  logic [31:0]   op2_sel_mux_D__out;
+  logic [0:0]    op2_sel_mux_D__reset;
+  logic [1:0]    op2_sel_mux_D__sel;
+
+  Mux__Type_Bits32__ninputs_3 op2_sel_mux_D
+  (
+    .clk            (     op2_sel_mux_D__clk    ),
+    .in___0         (   op2_sel_mux_D__in___0   ),
+    .in___1         (   op2_sel_mux_D__in___1   ),
+    .in___2         (   op2_sel_mux_D__in___2   ),
+    .out            (     op2_sel_mux_D__out    ),
+    .reset          (    op2_sel_mux_D__reset   ),
+    .sel            (     op2_sel_mux_D__sel    )
+  );
+
+  logic [0:0]    pc_incr_F__clk;
+  logic [31:0]   pc_incr_F__in_;
+  logic [31:0]   pc_incr_F__out;
+  logic [0:0]    pc_incr_F__reset;
+
+  Incrementer__Type_Bits32__amount_4 pc_incr_F
+  (
+    .clk            (       pc_incr_F__clk      ),
+    .in_            (       pc_incr_F__in_      ),
+    .out            (       pc_incr_F__out      ),
+    .reset          (      pc_incr_F__reset     )
+  );
+
+  logic [0:0]    pc_plus_imm_D__clk;
+  logic [31:0]   pc_plus_imm_D__in0;
+  logic [31:0]   pc_plus_imm_D__in1;
+  logic [31:0]   pc_plus_imm_D__out;
+  logic [0:0]    pc_plus_imm_D__reset;
+
+  Adder__Type_Bits32 pc_plus_imm_D
+  (
+    .clk            (     pc_plus_imm_D__clk    ),
+    .in0            (     pc_plus_imm_D__in0    ),
+    .in1            (     pc_plus_imm_D__in1    ),
+    .out            (     pc_plus_imm_D__out    ),
+    .reset          (    pc_plus_imm_D__reset   )
+  );
+
+  logic [0:0]    pc_reg_D__clk;
+  logic [0:0]    pc_reg_D__en;
+  logic [31:0]   pc_reg_D__in_;
+  logic [31:0]   pc_reg_D__out;
+  logic [0:0]    pc_reg_D__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 pc_reg_D
+  (
+    .clk            (       pc_reg_D__clk       ),
+    .en             (        pc_reg_D__en       ),
+    .in_            (       pc_reg_D__in_       ),
+    .out            (       pc_reg_D__out       ),
+    .reset          (      pc_reg_D__reset      )
+  );
+
+  logic [0:0]    pc_reg_F__clk;
+  logic [0:0]    pc_reg_F__en;
+  logic [31:0]   pc_reg_F__in_;
+  logic [31:0]   pc_reg_F__out;
+  logic [0:0]    pc_reg_F__reset;
+
+  RegEnRst__Type_Bits32__reset_value_508 pc_reg_F
+  (
+    .clk            (       pc_reg_F__clk       ),
+    .en             (        pc_reg_F__en       ),
+    .in_            (       pc_reg_F__in_       ),
+    .out            (       pc_reg_F__out       ),
+    .reset          (      pc_reg_F__reset      )
+  );
+
+  logic [0:0]    pc_sel_mux_F__clk;
+  logic [31:0]   pc_sel_mux_F__in___0;
+  logic [31:0]   pc_sel_mux_F__in___1;
+  logic [31:0]   pc_sel_mux_F__out;
+  logic [0:0]    pc_sel_mux_F__reset;
+  logic [0:0]    pc_sel_mux_F__sel;
+
+  Mux__Type_Bits32__ninputs_2 pc_sel_mux_F
+  (
+    .clk            (     pc_sel_mux_F__clk     ),
+    .in___0         (    pc_sel_mux_F__in___0   ),
+    .in___1         (    pc_sel_mux_F__in___1   ),
+    .out            (     pc_sel_mux_F__out     ),
+    .reset          (    pc_sel_mux_F__reset    ),
+    .sel            (     pc_sel_mux_F__sel     )
+  );
+
+  logic [0:0]    rf__clk;
+  logic [4:0]    rf__raddr__0;
+  logic [4:0]    rf__raddr__1;
+  logic [31:0]   rf__rdata__0;
+  logic [31:0]   rf__rdata__1;
+  logic [0:0]    rf__reset;
+  logic [4:0]    rf__waddr__0;
+  logic [31:0]   rf__wdata__0;
+  logic [0:0]    rf__wen__0;
+
+  RegisterFile__cf7325a12c1669d6 rf
+  (
+    .clk            (          rf__clk          ),
+    .raddr__0       (        rf__raddr__0       ),
+    .raddr__1       (        rf__raddr__1       ),
+    .rdata__0       (        rf__rdata__0       ),
+    .rdata__1       (        rf__rdata__1       ),
+    .reset          (         rf__reset         ),
+    .waddr__0       (        rf__waddr__0       ),
+    .wdata__0       (        rf__wdata__0       ),
+    .wen__0         (         rf__wen__0        )
+  );
+
+  logic [0:0]    store_reg_X__clk;
+  logic [0:0]    store_reg_X__en;
+  logic [31:0]   store_reg_X__in_;
+  logic [31:0]   store_reg_X__out;
+  logic [0:0]    store_reg_X__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 store_reg_X
+  (
+    .clk            (      store_reg_X__clk     ),
+    .en             (      store_reg_X__en      ),
+    .in_            (      store_reg_X__in_     ),
+    .out            (      store_reg_X__out     ),
+    .reset          (     store_reg_X__reset    )
+  );
+
+  logic [0:0]    wb_result_reg_W__clk;
+  logic [0:0]    wb_result_reg_W__en;
+  logic [31:0]   wb_result_reg_W__in_;
+  logic [31:0]   wb_result_reg_W__out;
+  logic [0:0]    wb_result_reg_W__reset;
+
+  RegEnRst__Type_Bits32__reset_value_0 wb_result_reg_W
+  (
+    .clk            (    wb_result_reg_W__clk   ),
+    .en             (    wb_result_reg_W__en    ),
+    .in_            (    wb_result_reg_W__in_   ),
+    .out            (    wb_result_reg_W__out   ),
+    .reset          (   wb_result_reg_W__reset  )
+  );
+
+  logic [0:0]    wb_result_sel_mux_M__clk;
+  logic [31:0]   wb_result_sel_mux_M__in___0;
+  logic [31:0]   wb_result_sel_mux_M__in___1;
+  logic [31:0]   wb_result_sel_mux_M__in___2;
+  logic [31:0]   wb_result_sel_mux_M__out;
+  logic [0:0]    wb_result_sel_mux_M__reset;
+  logic [1:0]    wb_result_sel_mux_M__sel;
+
+  Mux__Type_Bits32__ninputs_3 wb_result_sel_mux_M
+  (
+    .clk            (  wb_result_sel_mux_M__clk ),
+    .in___0         ( wb_result_sel_mux_M__in___0 ),
+    .in___1         ( wb_result_sel_mux_M__in___1 ),
+    .in___2         ( wb_result_sel_mux_M__in___2 ),
+    .out            (  wb_result_sel_mux_M__out ),
+    .reset          ( wb_result_sel_mux_M__reset ),
+    .sel            (  wb_result_sel_mux_M__sel )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign op1_byp_mux_D__in___0 = op1_byp_mux_D__in_[0];
+  assign op1_byp_mux_D__in___1 = op1_byp_mux_D__in_[1];
+  assign op1_byp_mux_D__in___2 = op1_byp_mux_D__in_[2];
+  assign op1_byp_mux_D__in___3 = op1_byp_mux_D__in_[3];
+  assign op2_byp_mux_D__in___0 = op2_byp_mux_D__in_[0];
+  assign op2_byp_mux_D__in___1 = op2_byp_mux_D__in_[1];
+  assign op2_byp_mux_D__in___2 = op2_byp_mux_D__in_[2];
+  assign op2_byp_mux_D__in___3 = op2_byp_mux_D__in_[3];
+  assign op2_sel_mux_D__in___0 = op2_sel_mux_D__in_[0];
+  assign op2_sel_mux_D__in___1 = op2_sel_mux_D__in_[1];
+  assign op2_sel_mux_D__in___2 = op2_sel_mux_D__in_[2];
+  assign pc_sel_mux_F__in___0 = pc_sel_mux_F__in_[0];
+  assign pc_sel_mux_F__in___1 = pc_sel_mux_F__in_[1];
+  assign rf__raddr__0 = rf__raddr[0];
+  assign rf__raddr__1 = rf__raddr[1];
+  assign rf__rdata[0] = rf__rdata__0;
+  assign rf__rdata[1] = rf__rdata__1;
+  assign rf__waddr__0 = rf__waddr[0];
+  assign rf__wdata__0 = rf__wdata[0];
+  assign rf__wen__0 = rf__wen[0];
+  assign wb_result_sel_mux_M__in___0 = wb_result_sel_mux_M__in_[0];
+  assign wb_result_sel_mux_M__in___1 = wb_result_sel_mux_M__in_[1];
+  assign wb_result_sel_mux_M__in___2 = wb_result_sel_mux_M__in_[2];
+
+  // Connections
+  assign pc_incr_F__clk = clk;
+  assign pc_incr_F__reset = reset;
+  assign pc_incr_F__in_ = pc_F;
+  assign pc_plus4_F = pc_incr_F__out;
+  assign pc_sel_mux_F__clk = clk;
+  assign pc_sel_mux_F__reset = reset;
+  assign pc_sel_mux_F__in_[0] = pc_plus4_F;
+  assign pc_sel_mux_F__in_[1] = br_target_X;
+  assign pc_sel_mux_F__sel = pc_sel_F;
+  assign imemreq_addr = pc_sel_mux_F__out;
+  assign pc_reg_F__clk = clk;
+  assign pc_reg_F__reset = reset;
+  assign pc_reg_F__en = reg_en_F;
+  assign pc_reg_F__in_ = pc_sel_mux_F__out;
+  assign pc_F = pc_reg_F__out;
+  assign pc_reg_D__clk = clk;
+  assign pc_reg_D__reset = reset;
+  assign pc_reg_D__en = reg_en_D;
+  assign pc_reg_D__in_ = pc_F;
+  assign inst_D_reg__clk = clk;
+  assign inst_D_reg__reset = reset;
+  assign inst_D_reg__en = reg_en_D;
+  assign inst_D_reg__in_ = imemresp_data;
+  assign inst_D = inst_D_reg__out;
+  assign rf__clk = clk;
+  assign rf__reset = reset;
+  assign rf__raddr[0] = inst_D[19:15];
+  assign rf_rdata0_D = rf__rdata[0];
+  assign rf__raddr[1] = inst_D[24:20];
+  assign rf_rdata1_D = rf__rdata[1];
+  assign rf__wen[0] = rf_wen_W;
+  assign rf__waddr[0] = rf_waddr_W;
+  assign rf__wdata[0] = rf_wdata_W;
+  assign immgen_D__clk = clk;
+  assign immgen_D__reset = reset;
+  assign immgen_D__imm_type = imm_type_D;
+  assign immgen_D__inst = inst_D;
+  assign op1_byp_mux_D__clk = clk;
+  assign op1_byp_mux_D__reset = reset;
+  assign op1_byp_mux_D__in_[0] = rf_rdata0_D;
+  assign op1_byp_mux_D__in_[1] = bypass_X;
+  assign op1_byp_mux_D__in_[2] = bypass_M;
+  assign op1_byp_mux_D__in_[3] = bypass_W;
+  assign op1_byp_mux_D__sel = op1_byp_sel_D;
+  assign op2_byp_mux_D__clk = clk;
+  assign op2_byp_mux_D__reset = reset;
+  assign op2_byp_mux_D__in_[0] = rf_rdata1_D;
+  assign op2_byp_mux_D__in_[1] = bypass_X;
+  assign op2_byp_mux_D__in_[2] = bypass_M;
+  assign op2_byp_mux_D__in_[3] = bypass_W;
+  assign op2_byp_mux_D__sel = op2_byp_sel_D;
+  assign op2_sel_mux_D__clk = clk;
+  assign op2_sel_mux_D__reset = reset;
+  assign op2_sel_mux_D__in_[0] = op2_byp_mux_D__out;
+  assign op2_sel_mux_D__in_[1] = immgen_D__imm;
+  assign op2_sel_mux_D__in_[2] = mngr2proc_data;
+  assign op2_sel_mux_D__sel = op2_sel_D;
+  assign pc_plus_imm_D__clk = clk;
+  assign pc_plus_imm_D__reset = reset;
+  assign pc_plus_imm_D__in0 = pc_reg_D__out;
+  assign pc_plus_imm_D__in1 = immgen_D__imm;
+  assign br_target_reg_X__clk = clk;
+  assign br_target_reg_X__reset = reset;
+  assign br_target_reg_X__en = reg_en_X;
+  assign br_target_reg_X__in_ = pc_plus_imm_D__out;
+  assign br_target_X = br_target_reg_X__out;
+  assign op1_reg_X__clk = clk;
+  assign op1_reg_X__reset = reset;
+  assign op1_reg_X__en = reg_en_X;
+  assign op1_reg_X__in_ = op1_byp_mux_D__out;
+  assign op2_reg_X__clk = clk;
+  assign op2_reg_X__reset = reset;
+  assign op2_reg_X__en = reg_en_X;
+  assign op2_reg_X__in_ = op2_sel_mux_D__out;
+  assign xcelreq_data = op1_reg_X__out;
+  assign xcelreq_addr = op2_reg_X__out[4:0];
+  assign store_reg_X__clk = clk;
+  assign store_reg_X__reset = reset;
+  assign store_reg_X__en = reg_en_X;
+  assign store_reg_X__in_ = op2_byp_mux_D__out;
+  assign dmemreq_data = store_reg_X__out;
+  assign alu_X__clk = clk;
+  assign alu_X__reset = reset;
+  assign alu_X__in0 = op1_reg_X__out;
+  assign alu_X__in1 = op2_reg_X__out;
+  assign alu_X__fn = alu_fn_X;
+  assign ne_X = alu_X__ops_ne;
+  assign bypass_X = alu_X__out;
+  assign dmemreq_addr = alu_X__out;
+  assign ex_result_reg_M__clk = clk;
+  assign ex_result_reg_M__reset = reset;
+  assign ex_result_reg_M__en = reg_en_M;
+  assign ex_result_reg_M__in_ = alu_X__out;
+  assign wb_result_sel_mux_M__clk = clk;
+  assign wb_result_sel_mux_M__reset = reset;
+  assign wb_result_sel_mux_M__in_[0] = ex_result_reg_M__out;
+  assign wb_result_sel_mux_M__in_[1] = dmemresp_data;
+  assign wb_result_sel_mux_M__in_[2] = xcelresp_data;
+  assign wb_result_sel_mux_M__sel = wb_result_sel_M;
+  assign bypass_M = wb_result_sel_mux_M__out;
+  assign wb_result_reg_W__clk = clk;
+  assign wb_result_reg_W__reset = reset;
+  assign wb_result_reg_W__en = reg_en_W;
+  assign wb_result_reg_W__in_ = wb_result_sel_mux_M__out;
+  assign bypass_W = wb_result_reg_W__out;
+  assign rf_wdata_W = wb_result_reg_W__out;
+  assign proc2mngr_data = wb_result_reg_W__out;
+
+endmodule
+
+
+// PyMTL Component RegEn Definition
+// Full name: RegEn__Type_MemReqMsg__type__4__opaque_8__addr_32__len_2__data_32
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegEn__90c12cc44718fc0d
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    en,
+  input  logic [3:0]    in___type_,
+  input  logic [7:0]    in___opaque,
+  input  logic [31:0]   in___addr,
+  input  logic [1:0]    in___len,
+  input  logic [31:0]   in___data,
+  output logic [3:0]    out__type_,
+  output logic [7:0]    out__opaque,
+  output logic [31:0]   out__addr,
+  output logic [1:0]    out__len,
+  output logic [31:0]   out__data,
+  input  logic [0:0]    reset
+);
+  // Struct/Array ports in the form of wires
+  logic [77:0]   in_;
+  logic [77:0]   out;
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:25
+  // @update_ff
+  // def up_regen():
+  //   if s.en:
+  //     s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regen
+    if ( en ) begin
+      out <= in_;
+    end
+  end
+
+  // Connections
+  assign in_[77:74] = in___type_;
+  assign in_[73:66] = in___opaque;
+  assign in_[65:34] = in___addr;
+  assign in_[33:32] = in___len;
+  assign in_[31:0] = in___data;
+  assign out__type_ = out[77:74];
+  assign out__opaque = out[73:66];
+  assign out__addr = out[65:34];
+  assign out__len = out[33:32];
+  assign out__data = out[31:0];
+
+endmodule
+
+
+// PyMTL Component Mux Definition
+// Full name: Mux__Type_MemReqMsg__type__4__opaque_8__addr_32__len_2__data_32__ninputs_2
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__c4fd530f829680a2
+(
+  input  logic [0:0]    clk,
+  input  logic [3:0]    in___0__type_,
+  input  logic [7:0]    in___0__opaque,
+  input  logic [31:0]   in___0__addr,
+  input  logic [1:0]    in___0__len,
+  input  logic [31:0]   in___0__data,
+  input  logic [3:0]    in___1__type_,
+  input  logic [7:0]    in___1__opaque,
+  input  logic [31:0]   in___1__addr,
+  input  logic [1:0]    in___1__len,
+  input  logic [31:0]   in___1__data,
+  output logic [3:0]    out__type_,
+  output logic [7:0]    out__opaque,
+  output logic [31:0]   out__addr,
+  output logic [1:0]    out__len,
+  output logic [31:0]   out__data,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [3:0]    in___type_ [0:1];
+  logic [7:0]    in___opaque [0:1];
+  logic [31:0]   in___addr [0:1];
+  logic [1:0]    in___len [0:1];
+  logic [31:0]   in___data [0:1];
+  logic [77:0]   in_ [0:1];
+  logic [77:0]   out;
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in___type_[0] = in___0__type_;
+  assign in___opaque[0] = in___0__opaque;
+  assign in___addr[0] = in___0__addr;
+  assign in___len[0] = in___0__len;
+  assign in___data[0] = in___0__data;
+  assign in_[0][77:74] = in___0__type_;
+  assign in_[0][73:66] = in___0__opaque;
+  assign in_[0][65:34] = in___0__addr;
+  assign in_[0][33:32] = in___0__len;
+  assign in_[0][31:0] = in___0__data;
+  assign in___type_[1] = in___1__type_;
+  assign in___opaque[1] = in___1__opaque;
+  assign in___addr[1] = in___1__addr;
+  assign in___len[1] = in___1__len;
+  assign in___data[1] = in___1__data;
+  assign in_[1][77:74] = in___1__type_;
+  assign in_[1][73:66] = in___1__opaque;
+  assign in_[1][65:34] = in___1__addr;
+  assign in_[1][33:32] = in___1__len;
+  assign in_[1][31:0] = in___1__data;
+  assign out__type_ = out[77:74];
+  assign out__opaque = out[73:66];
+  assign out__addr = out[65:34];
+  assign out__len = out[33:32];
+  assign out__data = out[31:0];
+
+endmodule
+
+
+// PyMTL Component RegRst Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegRst__Type_Bits1__reset_value_0
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    in_,
+  output logic [0:0]    out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:39
+  // @update_ff
+  // def up_regrst():
+  //   if s.reset: s.out <<= reset_value
+  //   else:       s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regrst
+    if ( reset ) begin
+      out <= 1'd0;
+    end
+    else
+      out <= in_;
+  end
+
+endmodule
+
+
+// PyMTL Component BypassQueue1RTL Definition
+// Full name: BypassQueue1RTL__Type_MemReqMsg__type__4__opaque_8__addr_32__len_2__data_32
+// At /root/package/pymtl3/stdlib/queues/enrdy_queues.py
+module BypassQueue1RTL__90c12cc44718fc0d
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    reset,
+  output logic [0:0]    deq__en,
+  output logic [3:0]    deq__msg__type_,
+  output logic [7:0]    deq__msg__opaque,
+  output logic [31:0]   deq__msg__addr,
+  output logic [1:0]    deq__msg__len,
+  output logic [31:0]   deq__msg__data,
+  input  logic [0:0]    deq__rdy,
+  input  logic [0:0]    enq__en,
+  input  logic [3:0]    enq__msg__type_,
+  input  logic [7:0]    enq__msg__opaque,
+  input  logic [31:0]   enq__msg__addr,
+  input  logic [1:0]    enq__msg__len,
+  input  logic [31:0]   enq__msg__data,
+  output logic [0:0]    enq__rdy
+);
+  // Struct/Array ports in the form of wires
+  logic [77:0]   deq__msg;
+  logic [77:0]   enq__msg;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [77:0]   buffer__in_;
+  logic [77:0]   buffer__out;
+  logic [3:0]    byp_mux__in___type_ [0:1];
+  logic [7:0]    byp_mux__in___opaque [0:1];
+  logic [31:0]   byp_mux__in___addr [0:1];
+  logic [1:0]    byp_mux__in___len [0:1];
+  logic [31:0]   byp_mux__in___data [0:1];
+  logic [77:0]   byp_mux__in_ [0:1];
+  logic [77:0]   byp_mux__out;
+
+  // Sub-component declarations
+  logic [0:0]    buffer__clk;
+  logic [0:0]    buffer__en;
+  logic [3:0]    buffer__in___type_;
+  logic [7:0]    buffer__in___opaque;
+  logic [31:0]   buffer__in___addr;
+  logic [1:0]    buffer__in___len;
+  logic [31:0]   buffer__in___data;
+  logic [3:0]    buffer__out__type_;
+  logic [7:0]    buffer__out__opaque;
+  logic [31:0]   buffer__out__addr;
+  logic [1:0]    buffer__out__len;
+  logic [31:0]   buffer__out__data;
+  logic [0:0]    buffer__reset;
+
+  RegEn__90c12cc44718fc0d buffer
+  (
+    .clk            (        buffer__clk        ),
+    .en             (         buffer__en        ),
+    .in___type_     (     buffer__in___type_    ),
+    .in___opaque    (    buffer__in___opaque    ),
+    .in___addr      (     buffer__in___addr     ),
+    .in___len       (      buffer__in___len     ),
+    .in___data      (     buffer__in___data     ),
+    .out__type_     (     buffer__out__type_    ),
+    .out__opaque    (    buffer__out__opaque    ),
+    .out__addr      (     buffer__out__addr     ),
+    .out__len       (      buffer__out__len     ),
+    .out__data      (     buffer__out__data     ),
+    .reset          (       buffer__reset       )
+  );
+
+  logic [0:0]    byp_mux__clk;
+  logic [3:0]    byp_mux__in___0__type_;
+  logic [7:0]    byp_mux__in___0__opaque;
+  logic [31:0]   byp_mux__in___0__addr;
+  logic [1:0]    byp_mux__in___0__len;
+  logic [31:0]   byp_mux__in___0__data;
+  logic [3:0]    byp_mux__in___1__type_;
+  logic [7:0]    byp_mux__in___1__opaque;
+  logic [31:0]   byp_mux__in___1__addr;
+  logic [1:0]    byp_mux__in___1__len;
+  logic [31:0]   byp_mux__in___1__data;
+  logic [3:0]    byp_mux__out__type_;
+  logic [7:0]    byp_mux__out__opaque;
+  logic [31:0]   byp_mux__out__addr;
+  logic [1:0]    byp_mux__out__len;
+  logic [31:0]   byp_mux__out__data;
+  logic [0:0]    byp_mux__reset;
+  logic [0:0]    byp_mux__sel;
+
+  Mux__c4fd530f829680a2 byp_mux
+  (
+    .clk            (        byp_mux__clk       ),
+    .in___0__type_  (   byp_mux__in___0__type_  ),
+    .in___0__opaque (  byp_mux__in___0__opaque  ),
+    .in___0__addr   (   byp_mux__in___0__addr   ),
+    .in___0__len    (    byp_mux__in___0__len   ),
+    .in___0__data   (   byp_mux__in___0__data   ),
+    .in___1__type_  (   byp_mux__in___1__type_  ),
+    .in___1__opaque (  byp_mux__in___1__opaque  ),
+    .in___1__addr   (   byp_mux__in___1__addr   ),
+    .in___1__len    (    byp_mux__in___1__len   ),
+    .in___1__data   (   byp_mux__in___1__data   ),
+    .out__type_     (    byp_mux__out__type_    ),
+    .out__opaque    (    byp_mux__out__opaque   ),
+    .out__addr      (     byp_mux__out__addr    ),
+    .out__len       (     byp_mux__out__len     ),
+    .out__data      (     byp_mux__out__data    ),
+    .reset          (       byp_mux__reset      ),
+    .sel            (        byp_mux__sel       )
+  );
+
+  logic [0:0]    full__clk;
+  logic [0:0]    full__in_;
+  logic [0:0]    full__out;
+  logic [0:0]    full__reset;
+
+  RegRst__Type_Bits1__reset_value_0 full
+  (
+    .clk            (         full__clk         ),
+    .in_            (         full__in_         ),
+    .out            (         full__out         ),
+    .reset          (        full__reset        )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign buffer__in___type_ = buffer__in_[77:74];
+  assign buffer__in___opaque = buffer__in_[73:66];
+  assign buffer__in___addr = buffer__in_[65:34];
+  assign buffer__in___len = buffer__in_[33:32];
+  assign buffer__in___data = buffer__in_[31:0];
+  assign buffer__out[77:74] = buffer__out__type_;
+  assign buffer__out[73:66] = buffer__out__opaque;
+  assign buffer__out[65:34] = buffer__out__addr;
+  assign buffer__out[33:32] = buffer__out__len;
+  assign buffer__out[31:0] = buffer__out__data;
+  assign byp_mux__in___0__type_ = byp_mux__in___type_[0];
+  assign byp_mux__in___0__opaque = byp_mux__in___opaque[0];
+  assign byp_mux__in___0__addr = byp_mux__in___addr[0];
+  assign byp_mux__in___0__len = byp_mux__in___len[0];
+  assign byp_mux__in___0__data = byp_mux__in___data[0];
+  assign byp_mux__in___0__type_ = byp_mux__in_[0][77:74];
+  assign byp_mux__in___0__opaque = byp_mux__in_[0][73:66];
+  assign byp_mux__in___0__addr = byp_mux__in_[0][65:34];
+  assign byp_mux__in___0__len = byp_mux__in_[0][33:32];
+  assign byp_mux__in___0__data = byp_mux__in_[0][31:0];
+  assign byp_mux__in___1__type_ = byp_mux__in___type_[1];
+  assign byp_mux__in___1__opaque = byp_mux__in___opaque[1];
+  assign byp_mux__in___1__addr = byp_mux__in___addr[1];
+  assign byp_mux__in___1__len = byp_mux__in___len[1];
+  assign byp_mux__in___1__data = byp_mux__in___data[1];
+  assign byp_mux__in___1__type_ = byp_mux__in_[1][77:74];
+  assign byp_mux__in___1__opaque = byp_mux__in_[1][73:66];
+  assign byp_mux__in___1__addr = byp_mux__in_[1][65:34];
+  assign byp_mux__in___1__len = byp_mux__in_[1][33:32];
+  assign byp_mux__in___1__data = byp_mux__in_[1][31:0];
+  assign byp_mux__out[77:74] = byp_mux__out__type_;
+  assign byp_mux__out[73:66] = byp_mux__out__opaque;
+  assign byp_mux__out[65:34] = byp_mux__out__addr;
+  assign byp_mux__out[33:32] = byp_mux__out__len;
+  assign byp_mux__out[31:0] = byp_mux__out__data;
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/enrdy_queues.py:58
+  // @update
+  // def up_bypq_set_enq_rdy():
+  //   s.enq.rdy @= ~s.full.out
+  
+  always_comb begin : up_bypq_set_enq_rdy
+    enq__rdy = ~full__out;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/enrdy_queues.py:62
+  // @update
+  // def up_bypq_use_enq_en():
+  //   s.deq.en    @= (s.enq.en | s.full.out) & s.deq.rdy
+  //   s.buffer.en @=  s.enq.en & ~s.deq.en
+  //   s.full.in_  @= (s.enq.en | s.full.out) & ~s.deq.en
+  
+  always_comb begin : up_bypq_use_enq_en
+    deq__en = ( enq__en | full__out ) & deq__rdy;
+    buffer__en = enq__en & ( ~deq__en );
+    full__in_ = ( enq__en | full__out ) & ( ~deq__en );
+  end
+
+  // Connections
+  assign deq__msg__type_ = deq__msg[77:74];
+  assign deq__msg__opaque = deq__msg[73:66];
+  assign deq__msg__addr = deq__msg[65:34];
+  assign deq__msg__len = deq__msg[33:32];
+  assign deq__msg__data = deq__msg[31:0];
+  assign enq__msg[77:74] = enq__msg__type_;
+  assign enq__msg[73:66] = enq__msg__opaque;
+  assign enq__msg[65:34] = enq__msg__addr;
+  assign enq__msg[33:32] = enq__msg__len;
+  assign enq__msg[31:0] = enq__msg__data;
+  assign buffer__clk = clk;
+  assign buffer__reset = reset;
+  assign buffer__in_ = enq__msg;
+  assign full__clk = clk;
+  assign full__reset = reset;
+  assign byp_mux__clk = clk;
+  assign byp_mux__reset = reset;
+  assign deq__msg = byp_mux__out;
+  assign byp_mux__in_[0] = enq__msg;
+  assign byp_mux__in_[1] = buffer__out;
+  assign byp_mux__sel = full__out;
+
+endmodule
+
+
+// PyMTL Component BypassQueue2RTL Definition
+// Full name: BypassQueue2RTL__MsgType_MemReqMsg__type__4__opaque_8__addr_32__len_2__data_32__queue_size_2
+// At /root/package/pymtl3/stdlib/queues/enrdy_queues.py
+module BypassQueue2RTL__d3c025c421424e3e
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    reset,
+  output logic [0:0]    deq__en,
+  output logic [3:0]    deq__msg__type_,
+  output logic [7:0]    deq__msg__opaque,
+  output logic [31:0]   deq__msg__addr,
+  output logic [1:0]    deq__msg__len,
+  output logic [31:0]   deq__msg__data,
+  input  logic [0:0]    deq__rdy,
+  input  logic [0:0]    enq__en,
+  input  logic [3:0]    enq__msg__type_,
+  input  logic [7:0]    enq__msg__opaque,
+  input  logic [31:0]   enq__msg__addr,
+  input  logic [1:0]    enq__msg__len,
+  input  logic [31:0]   enq__msg__data,
+  output logic [0:0]    enq__rdy
+);
+  // Struct/Array ports in the form of wires
+  logic [77:0]   deq__msg;
+  logic [77:0]   enq__msg;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [77:0]   q1__deq__msg;
+  logic [77:0]   q1__enq__msg;
+  logic [77:0]   q2__deq__msg;
+  logic [77:0]   q2__enq__msg;
+
+  // Sub-component declarations
+  logic [0:0]    q1__clk;
+  logic [0:0]    q1__reset;
+  logic [0:0]    q1__deq__en;
+  logic [3:0]    q1__deq__msg__type_;
+  logic [7:0]    q1__deq__msg__opaque;
+  logic [31:0]   q1__deq__msg__addr;
+  logic [1:0]    q1__deq__msg__len;
+  logic [31:0]   q1__deq__msg__data;
+  logic [0:0]    q1__deq__rdy;
+  logic [0:0]    q1__enq__en;
+  logic [3:0]    q1__enq__msg__type_;
+  logic [7:0]    q1__enq__msg__opaque;
+  logic [31:0]   q1__enq__msg__addr;
+  logic [1:0]    q1__enq__msg__len;
+  logic [31:0]   q1__enq__msg__data;
+  logic [0:0]    q1__enq__rdy;
+
+  BypassQueue1RTL__90c12cc44718fc0d q1
+  (
+    .clk            (          q1__clk          ),
+    .reset          (         q1__reset         ),
+    .deq__en        (        q1__deq__en        ),
+    .deq__msg__type_(    q1__deq__msg__type_    ),
+    .deq__msg__opaque(    q1__deq__msg__opaque   ),
+    .deq__msg__addr (     q1__deq__msg__addr    ),
+    .deq__msg__len  (     q1__deq__msg__len     ),
+    .deq__msg__data (     q1__deq__msg__data    ),
+    .deq__rdy       (        q1__deq__rdy       ),
+    .enq__en        (        q1__enq__en        ),
+    .enq__msg__type_(    q1__enq__msg__type_    ),
+    .enq__msg__opaque(    q1__enq__msg__opaque   ),
+    .enq__msg__addr (     q1__enq__msg__addr    ),
+    .enq__msg__len  (     q1__enq__msg__len     ),
+    .enq__msg__data (     q1__enq__msg__data    ),
+    .enq__rdy       (        q1__enq__rdy       )
+  );
+
+  logic [0:0]    q2__clk;
+  logic [0:0]    q2__reset;
+  logic [0:0]    q2__deq__en;
+  logic [3:0]    q2__deq__msg__type_;
+  logic [7:0]    q2__deq__msg__opaque;
+  logic [31:0]   q2__deq__msg__addr;
+  logic [1:0]    q2__deq__msg__len;
+  logic [31:0]   q2__deq__msg__data;
+  logic [0:0]    q2__deq__rdy;
+  logic [0:0]    q2__enq__en;
+  logic [3:0]    q2__enq__msg__type_;
+  logic [7:0]    q2__enq__msg__opaque;
+  logic [31:0]   q2__enq__msg__addr;
+  logic [1:0]    q2__enq__msg__len;
+  logic [31:0]   q2__enq__msg__data;
+  logic [0:0]    q2__enq__rdy;
+
+  BypassQueue1RTL__90c12cc44718fc0d q2
+  (
+    .clk            (          q2__clk          ),
+    .reset          (         q2__reset         ),
+    .deq__en        (        q2__deq__en        ),
+    .deq__msg__type_(    q2__deq__msg__type_    ),
+    .deq__msg__opaque(    q2__deq__msg__opaque   ),
+    .deq__msg__addr (     q2__deq__msg__addr    ),
+    .deq__msg__len  (     q2__deq__msg__len     ),
+    .deq__msg__data (     q2__deq__msg__data    ),
+    .deq__rdy       (        q2__deq__rdy       ),
+    .enq__en        (        q2__enq__en        ),
+    .enq__msg__type_(    q2__enq__msg__type_    ),
+    .enq__msg__opaque(    q2__enq__msg__opaque   ),
+    .enq__msg__addr (     q2__enq__msg__addr    ),
+    .enq__msg__len  (     q2__enq__msg__len     ),
+    .enq__msg__data (     q2__enq__msg__data    ),
+    .enq__rdy       (        q2__enq__rdy       )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign q1__deq__msg[77:74] = q1__deq__msg__type_;
+  assign q1__deq__msg[73:66] = q1__deq__msg__opaque;
+  assign q1__deq__msg[65:34] = q1__deq__msg__addr;
+  assign q1__deq__msg[33:32] = q1__deq__msg__len;
+  assign q1__deq__msg[31:0] = q1__deq__msg__data;
+  assign q1__enq__msg__type_ = q1__enq__msg[77:74];
+  assign q1__enq__msg__opaque = q1__enq__msg[73:66];
+  assign q1__enq__msg__addr = q1__enq__msg[65:34];
+  assign q1__enq__msg__len = q1__enq__msg[33:32];
+  assign q1__enq__msg__data = q1__enq__msg[31:0];
+  assign q2__deq__msg[77:74] = q2__deq__msg__type_;
+  assign q2__deq__msg[73:66] = q2__deq__msg__opaque;
+  assign q2__deq__msg[65:34] = q2__deq__msg__addr;
+  assign q2__deq__msg[33:32] = q2__deq__msg__len;
+  assign q2__deq__msg[31:0] = q2__deq__msg__data;
+  assign q2__enq__msg__type_ = q2__enq__msg[77:74];
+  assign q2__enq__msg__opaque = q2__enq__msg[73:66];
+  assign q2__enq__msg__addr = q2__enq__msg[65:34];
+  assign q2__enq__msg__len = q2__enq__msg[33:32];
+  assign q2__enq__msg__data = q2__enq__msg[31:0];
+
+  // Connections
+  assign deq__msg__type_ = deq__msg[77:74];
+  assign deq__msg__opaque = deq__msg[73:66];
+  assign deq__msg__addr = deq__msg[65:34];
+  assign deq__msg__len = deq__msg[33:32];
+  assign deq__msg__data = deq__msg[31:0];
+  assign enq__msg[77:74] = enq__msg__type_;
+  assign enq__msg[73:66] = enq__msg__opaque;
+  assign enq__msg[65:34] = enq__msg__addr;
+  assign enq__msg[33:32] = enq__msg__len;
+  assign enq__msg[31:0] = enq__msg__data;
+  assign q1__clk = clk;
+  assign q1__reset = reset;
+  assign q2__clk = clk;
+  assign q2__reset = reset;
+  assign q1__enq__en = enq__en;
+  assign q1__enq__msg = enq__msg;
+  assign enq__rdy = q1__enq__rdy;
+  assign q2__enq__en = q1__deq__en;
+  assign q2__enq__msg = q1__deq__msg;
+  assign q1__deq__rdy = q2__enq__rdy;
+  assign deq__en = q2__deq__en;
+  assign deq__msg = q2__deq__msg;
+  assign q2__deq__rdy = deq__rdy;
+
+endmodule
+
+
+// PyMTL Component DropUnitRTL Definition
+// At /root/package/examples/ex03_proc/MiscRTL.py
+module DropUnitRTL__dtype_Bits32
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    drop,
+  input  logic [0:0]    reset,
+  output logic [0:0]    in___en,
+  input  logic [0:0]    in___rdy,
+  input  logic [31:0]   in___ret,
+  input  logic [0:0]    out__en,
+  output logic [0:0]    out__rdy,
+  output logic [31:0]   out__ret
+);
+  // Wire declarations
+  logic [0:0]    snoop_state;
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/MiscRTL.py:63
+  // @update
+  // def set_outputs():
+  //   s.out.rdy @= 0
+  //   s.in_.en  @= 0
+  // 
+  //   if   s.snoop_state == SNOOP:
+  //     s.out.rdy @= s.in_.rdy & ~s.drop
+  //     s.in_.en  @= s.out.en
+  // 
+  //   elif s.snoop_state == WAIT:
+  //     s.out.rdy @= 0
+  //     s.in_.en  @= s.in_.rdy
+  
+  always_comb begin : set_outputs
+    out__rdy = 1'd0;
+    in___en = 1'd0;
+    if ( snoop_state == 1'd0 ) begin
+      out__rdy = in___rdy & ( ~drop );
+      in___en = out__en;
+    end
+    else if ( snoop_state == 1'd1 ) begin
+      out__rdy = 1'd0;
+      in___en = in___rdy;
+    end
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/examples/ex03_proc/MiscRTL.py:45
+  // @update_ff
+  // def state_transitions():
+  // 
+  //   if s.reset:
+  //     s.snoop_state <<= SNOOP
+  // 
+  //   elif s.snoop_state == SNOOP:
+  //     if s.drop & ~s.in_.rdy:
+  //       s.snoop_state <<= WAIT
+  // 
+  //   elif s.snoop_state == WAIT:
+  //     if s.in_.rdy:
+  //       s.snoop_state <<= SNOOP
+  
+  always_ff @(posedge clk) begin : state_transitions
+    if ( reset ) begin
+      snoop_state <= 1'd0;
+    end
+    else if ( snoop_state == 1'd0 ) begin
+      if ( drop & ( ~in___rdy ) ) begin
+        snoop_state <= 1'd1;
+      end
+    end
+    else if ( snoop_state == 1'd1 ) begin
+      if ( in___rdy ) begin
+        snoop_state <= 1'd0;
+      end
+    end
+  end
+
+  // Connections
+  assign out__ret = in___ret;
+
+endmodule
+
+
+// PyMTL Component BypassQueue1EntryRTL Definition
+// At /root/package/pymtl3/stdlib/queues/queues.py
+module BypassQueue1EntryRTL__EntryType_Bits32
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    deq__en,
+  output logic [0:0]    deq__rdy,
+  output logic [31:0]   deq__ret,
+  input  logic [0:0]    enq__en,
+  input  logic [31:0]   enq__msg,
+  output logic [0:0]    enq__rdy
+);
+  // Wire declarations
+  logic [31:0]   entry;
+  logic [0:0]    full;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [31:0]   bypass_mux__in_ [0:1];
+
+  // Sub-component declarations
+  logic [0:0]    bypass_mux__clk;
+  logic [31:0]   bypass_mux__in___0;
+  logic [31:0]   bypass_mux__in___1;
+  logic [31:0]   bypass_mux__out;
+  logic [0:0]    bypass_mux__reset;
+  logic [0:0]    bypass_mux__sel;
+
+  Mux__Type_Bits32__ninputs_2 bypass_mux
+  (
+    .clk            (      bypass_mux__clk      ),
+    .in___0         (     bypass_mux__in___0    ),
+    .in___1         (     bypass_mux__in___1    ),
+    .out            (      bypass_mux__out      ),
+    .reset          (     bypass_mux__reset     ),
+    .sel            (      bypass_mux__sel      )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign bypass_mux__in___0 = bypass_mux__in_[0];
+  assign bypass_mux__in___1 = bypass_mux__in_[1];
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:532
+  // s.deq.rdy //= lambda: ~s.reset & ( s.full | s.enq.en )
+  
+  always_comb begin : _lambda__s_proc_mngr2proc_q_q_deq_rdy
+    deq__rdy = ( ~reset ) & ( full | enq__en );
+  end
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:531
+  // s.enq.rdy //= lambda: ~s.reset & ~s.full
+  
+  always_comb begin : _lambda__s_proc_mngr2proc_q_q_enq_rdy
+    enq__rdy = ( ~reset ) & ( ~full );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:534
+  // @update_ff
+  // def ff_bypass1():
+  //   s.full <<= ~s.reset & ( ~s.deq.en & (s.enq.en | s.full) )
+  // 
+  //   if s.enq.en & ~s.deq.en:
+  //     s.entry <<= s.enq.msg
+  
+  always_ff @(posedge clk) begin : ff_bypass1
+    full <= ( ~reset ) & ( ( ~deq__en ) & ( enq__en | full ) );
+    if ( enq__en & ( ~deq__en ) ) begin
+      entry <= enq__msg;
+    end
+  end
+
+  // Connections
+  assign bypass_mux__clk = clk;
+  assign bypass_mux__reset = reset;
+  assign bypass_mux__in_[0] = enq__msg;
+  assign bypass_mux__in_[1] = entry;
+  assign deq__ret = bypass_mux__out;
+  assign bypass_mux__sel = full;
+  assign count = full;
+
+endmodule
+
+
+// PyMTL Component BypassQueueRTL Definition
+// At /root/package/pymtl3/stdlib/queues/queues.py
+module BypassQueueRTL__EntryType_Bits32__num_entries_1
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    deq__en,
+  output logic [0:0]    deq__rdy,
+  output logic [31:0]   deq__ret,
+  input  logic [0:0]    enq__en,
+  input  logic [31:0]   enq__msg,
+  output logic [0:0]    enq__rdy
+);
+  // Sub-component declarations
+  logic [0:0]    q__clk;
+  logic [0:0]    q__count;
+  logic [0:0]    q__reset;
+  logic [0:0]    q__deq__en;
+  logic [0:0]    q__deq__rdy;
+  logic [31:0]   q__deq__ret;
+  logic [0:0]    q__enq__en;
+  logic [31:0]   q__enq__msg;
+  logic [0:0]    q__enq__rdy;
+
+  BypassQueue1EntryRTL__EntryType_Bits32 q
+  (
+    .clk            (           q__clk          ),
+    .count          (          q__count         ),
+    .reset          (          q__reset         ),
+    .deq__en        (         q__deq__en        ),
+    .deq__rdy       (        q__deq__rdy        ),
+    .deq__ret       (        q__deq__ret        ),
+    .enq__en        (         q__enq__en        ),
+    .enq__msg       (        q__enq__msg        ),
+    .enq__rdy       (        q__enq__rdy        )
+  );
+
+  // Connections
+  assign q__clk = clk;
+  assign q__reset = reset;
+  assign q__enq__en = enq__en;
+  assign q__enq__msg = enq__msg;
+  assign enq__rdy = q__enq__rdy;
+  assign q__deq__en = deq__en;
+  assign deq__rdy = q__deq__rdy;
+  assign deq__ret = q__deq__ret;
+  assign count = q__count;
+
+endmodule
+
+
+// PyMTL Component Mux Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py
+module Mux__Type_XcelRespMsg__type__1__data_32__ninputs_2
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    in___0__type_,
+  input  logic [31:0]   in___0__data,
+  input  logic [0:0]    in___1__type_,
+  input  logic [31:0]   in___1__data,
+  output logic [0:0]    out__type_,
+  output logic [31:0]   out__data,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    sel
+);
+  // Struct/Array ports in the form of wires
+  logic [0:0]    in___type_ [0:1];
+  logic [31:0]   in___data [0:1];
+  logic [32:0]   in_ [0:1];
+  logic [32:0]   out;
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arithmetics.py:13
+  // @update
+  // def up_mux():
+  //   s.out @= s.in_[ s.sel ]
+  
+  always_comb begin : up_mux
+    out = in_[sel];
+  end
+
+  // Connections
+  assign in___type_[0] = in___0__type_;
+  assign in___data[0] = in___0__data;
+  assign in_[0][32:32] = in___0__type_;
+  assign in_[0][31:0] = in___0__data;
+  assign in___type_[1] = in___1__type_;
+  assign in___data[1] = in___1__data;
+  assign in_[1][32:32] = in___1__type_;
+  assign in_[1][31:0] = in___1__data;
+  assign out__type_ = out[32:32];
+  assign out__data = out[31:0];
+
+endmodule
+
+
+// PyMTL Component BypassQueue1EntryRTL Definition
+// At /root/package/pymtl3/stdlib/queues/queues.py
+module BypassQueue1EntryRTL__EntryType_XcelRespMsg__type__1__data_32
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    deq__en,
+  output logic [0:0]    deq__rdy,
+  output logic [0:0]    deq__ret__type_,
+  output logic [31:0]   deq__ret__data,
+  input  logic [0:0]    enq__en,
+  input  logic [0:0]    enq__msg__type_,
+  input  logic [31:0]   enq__msg__data,
+  output logic [0:0]    enq__rdy
+);
+  // Struct/Array ports in the form of wires
+  logic [32:0]   deq__ret;
+  logic [32:0]   enq__msg;
+
+  // Wire declarations
+  logic [0:0]    entry__type_;
+  logic [31:0]   entry__data;
+  logic [32:0]   entry;
+  logic [0:0]    full;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [0:0]    bypass_mux__in___type_ [0:1];
+  logic [31:0]   bypass_mux__in___data [0:1];
+  logic [32:0]   bypass_mux__in_ [0:1];
+  logic [32:0]   bypass_mux__out;
+
+  // Sub-component declarations
+  logic [0:0]    bypass_mux__clk;
+  logic [0:0]    bypass_mux__in___0__type_;
+  logic [31:0]   bypass_mux__in___0__data;
+  logic [0:0]    bypass_mux__in___1__type_;
+  logic [31:0]   bypass_mux__in___1__data;
+  logic [0:0]    bypass_mux__out__type_;
+  logic [31:0]   bypass_mux__out__data;
+  logic [0:0]    bypass_mux__reset;
+  logic [0:0]    bypass_mux__sel;
+
+  Mux__Type_XcelRespMsg__type__1__data_32__ninputs_2 bypass_mux
+  (
+    .clk            (      bypass_mux__clk      ),
+    .in___0__type_  ( bypass_mux__in___0__type_ ),
+    .in___0__data   (  bypass_mux__in___0__data ),
+    .in___1__type_  ( bypass_mux__in___1__type_ ),
+    .in___1__data   (  bypass_mux__in___1__data ),
+    .out__type_     (   bypass_mux__out__type_  ),
+    .out__data      (   bypass_mux__out__data   ),
+    .reset          (     bypass_mux__reset     ),
+    .sel            (      bypass_mux__sel      )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign bypass_mux__in___0__type_ = bypass_mux__in___type_[0];
+  assign bypass_mux__in___0__data = bypass_mux__in___data[0];
+  assign bypass_mux__in___0__type_ = bypass_mux__in_[0][32:32];
+  assign bypass_mux__in___0__data = bypass_mux__in_[0][31:0];
+  assign bypass_mux__in___1__type_ = bypass_mux__in___type_[1];
+  assign bypass_mux__in___1__data = bypass_mux__in___data[1];
+  assign bypass_mux__in___1__type_ = bypass_mux__in_[1][32:32];
+  assign bypass_mux__in___1__data = bypass_mux__in_[1][31:0];
+  assign bypass_mux__out[32:32] = bypass_mux__out__type_;
+  assign bypass_mux__out[31:0] = bypass_mux__out__data;
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:532
+  // s.deq.rdy //= lambda: ~s.reset & ( s.full | s.enq.en )
+  
+  always_comb begin : _lambda__s_proc_xcelresp_q_q_deq_rdy
+    deq__rdy = ( ~reset ) & ( full | enq__en );
+  end
+
+  // PyMTL Lambda Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:531
+  // s.enq.rdy //= lambda: ~s.reset & ~s.full
+  
+  always_comb begin : _lambda__s_proc_xcelresp_q_q_enq_rdy
+    enq__rdy = ( ~reset ) & ( ~full );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/queues/queues.py:534
+  // @update_ff
+  // def ff_bypass1():
+  //   s.full <<= ~s.reset & ( ~s.deq.en & (s.enq.en | s.full) )
+  // 
+  //   if s.enq.en & ~s.deq.en:
+  //     s.entry <<= s.enq.msg
+  
+  always_ff @(posedge clk) begin : ff_bypass1
+    full <= ( ~reset ) & ( ( ~deq__en ) & ( enq__en | full ) );
+    if ( enq__en & ( ~deq__en ) ) begin
+      entry <= enq__msg;
+    end
+  end
+
+  // Connections
+  assign deq__ret__type_ = deq__ret[32:32];
+  assign deq__ret__data = deq__ret[31:0];
+  assign enq__msg[32:32] = enq__msg__type_;
+  assign enq__msg[31:0] = enq__msg__data;
+  assign bypass_mux__clk = clk;
+  assign bypass_mux__reset = reset;
+  assign bypass_mux__in_[0] = enq__msg;
+  assign bypass_mux__in_[1] = entry;
+  assign deq__ret = bypass_mux__out;
+  assign bypass_mux__sel = full;
+  assign count = full;
+
+endmodule
+
+
+// PyMTL Component BypassQueueRTL Definition
+// Full name: BypassQueueRTL__EntryType_XcelRespMsg__type__1__data_32__num_entries_1
+// At /root/package/pymtl3/stdlib/queues/queues.py
+module BypassQueueRTL__798f6b8687b61c17
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    count,
+  input  logic [0:0]    reset,
+  input  logic [0:0]    deq__en,
+  output logic [0:0]    deq__rdy,
+  output logic [0:0]    deq__ret__type_,
+  output logic [31:0]   deq__ret__data,
+  input  logic [0:0]    enq__en,
+  input  logic [0:0]    enq__msg__type_,
+  input  logic [31:0]   enq__msg__data,
+  output logic [0:0]    enq__rdy
+);
+  // Struct/Array ports in the form of wires
+  logic [32:0]   deq__ret;
+  logic [32:0]   enq__msg;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [32:0]   q__deq__ret;
+  logic [32:0]   q__enq__msg;
+
+  // Sub-component declarations
+  logic [0:0]    q__clk;
+  logic [0:0]    q__count;
+  logic [0:0]    q__reset;
+  logic [0:0]    q__deq__en;
+  logic [0:0]    q__deq__rdy;
+  logic [0:0]    q__deq__ret__type_;
+  logic [31:0]   q__deq__ret__data;
+  logic [0:0]    q__enq__en;
+  logic [0:0]    q__enq__msg__type_;
+  logic [31:0]   q__enq__msg__data;
+  logic [0:0]    q__enq__rdy;
+
+  BypassQueue1EntryRTL__EntryType_XcelRespMsg__type__1__data_32 q
+  (
+    .clk            (           q__clk          ),
+    .count          (          q__count         ),
+    .reset          (          q__reset         ),
+    .deq__en        (         q__deq__en        ),
+    .deq__rdy       (        q__deq__rdy        ),
+    .deq__ret__type_(     q__deq__ret__type_    ),
+    .deq__ret__data (     q__deq__ret__data     ),
+    .enq__en        (         q__enq__en        ),
+    .enq__msg__type_(     q__enq__msg__type_    ),
+    .enq__msg__data (     q__enq__msg__data     ),
+    .enq__rdy       (        q__enq__rdy        )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign q__deq__ret[32:32] = q__deq__ret__type_;
+  assign q__deq__ret[31:0] = q__deq__ret__data;
+  assign q__enq__msg__type_ = q__enq__msg[32:32];
+  assign q__enq__msg__data = q__enq__msg[31:0];
+
+  // Connections
+  assign deq__ret__type_ = deq__ret[32:32];
+  assign deq__ret__data = deq__ret[31:0];
+  assign enq__msg[32:32] = enq__msg__type_;
+  assign enq__msg[31:0] = enq__msg__data;
+  assign q__clk = clk;
+  assign q__reset = reset;
+  assign q__enq__en = enq__en;
+  assign q__enq__msg = enq__msg;
+  assign enq__rdy = q__enq__rdy;
+  assign q__deq__en = deq__en;
+  assign deq__rdy = q__deq__rdy;
+  assign deq__ret = q__deq__ret;
+  assign count = q__count;
+
+endmodule
+
+
+// PyMTL Component ProcRTL Definition
+// At /root/package/examples/ex03_proc/ProcRTL.py
+module ProcRTL_noparam
+(
+  input  logic [0:0]    clk,
+  output logic [0:0]    commit_inst,
+  input  logic [0:0]    reset,
+  output logic [0:0]    dmem__req__en,
+  output logic [3:0]    dmem__req__msg__type_,
+  output logic [7:0]    dmem__req__msg__opaque,
+  output logic [31:0]   dmem__req__msg__addr,
+  output logic [1:0]    dmem__req__msg__len,
+  output logic [31:0]   dmem__req__msg__data,
+  input  logic [0:0]    dmem__req__rdy,
+  input  logic [0:0]    dmem__resp__en,
+  input  logic [3:0]    dmem__resp__msg__type_,
+  input  logic [7:0]    dmem__resp__msg__opaque,
+  input  logic [1:0]    dmem__resp__msg__test,
+  input  logic [1:0]    dmem__resp__msg__len,
+  input  logic [31:0]   dmem__resp__msg__data,
+  output logic [0:0]    dmem__resp__rdy,
+  output logic [0:0]    imem__req__en,
+  output logic [3:0]    imem__req__msg__type_,
+  output logic [7:0]    imem__req__msg__opaque,
+  output logic [31:0]   imem__req__msg__addr,
+  output logic [1:0]    imem__req__msg__len,
+  output logic [31:0]   imem__req__msg__data,
+  input  logic [0:0]    imem__req__rdy,
+  input  logic [0:0]    imem__resp__en,
+  input  logic [3:0]    imem__resp__msg__type_,
+  input  logic [7:0]    imem__resp__msg__opaque,
+  input  logic [1:0]    imem__resp__msg__test,
+  input  logic [1:0]    imem__resp__msg__len,
+  input  logic [31:0]   imem__resp__msg__data,
+  output logic [0:0]    imem__resp__rdy,
+  input  logic [0:0]    mngr2proc__en,
+  input  logic [31:0]   mngr2proc__msg,
+  output logic [0:0]    mngr2proc__rdy,
+  output logic [0:0]    proc2mngr__en,
+  output logic [31:0]   proc2mngr__msg,
+  input  logic [0:0]    proc2mngr__rdy,
+  output logic [0:0]    xcel__req__en,
+  output logic [0:0]    xcel__req__msg__type_,
+  output logic [4:0]    xcel__req__msg__addr,
+  output logic [31:0]   xcel__req__msg__data,
+  input  logic [0:0]    xcel__req__rdy,
+  input  logic [0:0]    xcel__resp__en,
+  input  logic [0:0]    xcel__resp__msg__type_,
+  input  logic [31:0]   xcel__resp__msg__data,
+  output logic [0:0]    xcel__resp__rdy
+);
+  // Struct/Array ports in the form of wires
+  logic [77:0]   dmem__req__msg;
+  logic [47:0]   dmem__resp__msg;
+  logic [77:0]   imem__req__msg;
+  logic [47:0]   imem__resp__msg;
+  logic [37:0]   xcel__req__msg;
+  logic [32:0]   xcel__resp__msg;
+
+  // Struct/Array ports of sub-components in the form of wires
+  logic [47:0]   dmemresp_q__deq__ret;
+  logic [47:0]   dmemresp_q__enq__msg;
+  logic [77:0]   imemreq_q__deq__msg;
+  logic [77:0]   imemreq_q__enq__msg;
+  logic [47:0]   imemresp_q__deq__ret;
+  logic [47:0]   imemresp_q__enq__msg;
+  logic [32:0]   xcelresp_q__deq__ret;
+  logic [32:0]   xcelresp_q__enq__msg;
+
+  // Sub-component declarations
+  logic [3:0]    ctrl__alu_fn_X;
+  logic [0:0]    ctrl__clk;
+  logic [0:0]    ctrl__commit_inst;
+  logic [0:0]    ctrl__dmemreq_en;
+  logic [0:0]    ctrl__dmemreq_rdy;
+  logic [3:0]    ctrl__dmemreq_type;
+  logic [0:0]    ctrl__dmemresp_en;
+  logic [0:0]    ctrl__dmemresp_rdy;
+  logic [0:0]    ctrl__imemreq_en;
+  logic [0:0]    ctrl__imemreq_rdy;
+  logic [0:0]    ctrl__imemresp_drop;
+  logic [0:0]    ctrl__imemresp_en;
+  logic [0:0]    ctrl__imemresp_rdy;
+  logic [2:0]    ctrl__imm_type_D;
+  logic [31:0]   ctrl__inst_D;
+  logic [0:0]    ctrl__mngr2proc_en;
+  logic [0:0]    ctrl__mngr2proc_rdy;
+  logic [0:0]    ctrl__ne_X;
+  logic [1:0]    ctrl__op1_byp_sel_D;
+  logic [1:0]    ctrl__op2_byp_sel_D;
+  logic [1:0]    ctrl__op2_sel_D;
+  logic [0:0]    ctrl__pc_sel_F;
+  logic [0:0]    ctrl__proc2mngr_en;
+  logic [0:0]    ctrl__proc2mngr_rdy;
+  logic [0:0]    ctrl__reg_en_D;
+  logic [0:0]    ctrl__reg_en_F;
+  logic [0:0]    ctrl__reg_en_M;
+  logic [0:0]    ctrl__reg_en_W;
+  logic [0:0]    ctrl__reg_en_X;
+  logic [0:0]    ctrl__reset;
+  logic [4:0]    ctrl__rf_waddr_W;
+  logic [0:0]    ctrl__rf_wen_W;
+  logic [1:0]    ctrl__wb_result_sel_M;
+  logic [0:0]    ctrl__xcelreq_en;
+  logic [0:0]    ctrl__xcelreq_rdy;
+  logic [0:0]    ctrl__xcelreq_type;
+  logic [0:0]    ctrl__xcelresp_en;
+  logic [0:0]    ctrl__xcelresp_rdy;
+
+  ProcCtrl_noparam ctrl
+  (
+    .alu_fn_X       (       ctrl__alu_fn_X      ),
+    .clk            (         ctrl__clk         ),
+    .commit_inst    (     ctrl__commit_inst     ),
+    .dmemreq_en     (      ctrl__dmemreq_en     ),
+    .dmemreq_rdy    (     ctrl__dmemreq_rdy     ),
+    .dmemreq_type   (     ctrl__dmemreq_type    ),
+    .dmemresp_en    (     ctrl__dmemresp_en     ),
+    .dmemresp_rdy   (     ctrl__dmemresp_rdy    ),
+    .imemreq_en     (      ctrl__imemreq_en     ),
+    .imemreq_rdy    (     ctrl__imemreq_rdy     ),
+    .imemresp_drop  (    ctrl__imemresp_drop    ),
+    .imemresp_en    (     ctrl__imemresp_en     ),
+    .imemresp_rdy   (     ctrl__imemresp_rdy    ),
+    .imm_type_D     (      ctrl__imm_type_D     ),
+    .inst_D         (        ctrl__inst_D       ),
+    .mngr2proc_en   (     ctrl__mngr2proc_en    ),
+    .mngr2proc_rdy  (    ctrl__mngr2proc_rdy    ),
+    .ne_X           (         ctrl__ne_X        ),
+    .op1_byp_sel_D  (    ctrl__op1_byp_sel_D    ),
+    .op2_byp_sel_D  (    ctrl__op2_byp_sel_D    ),
+    .op2_sel_D      (      ctrl__op2_sel_D      ),
+    .pc_sel_F       (       ctrl__pc_sel_F      ),
+    .proc2mngr_en   (     ctrl__proc2mngr_en    ),
+    .proc2mngr_rdy  (    ctrl__proc2mngr_rdy    ),
+    .reg_en_D       (       ctrl__reg_en_D      ),
+    .reg_en_F       (       ctrl__reg_en_F      ),
+    .reg_en_M       (       ctrl__reg_en_M      ),
+    .reg_en_W       (       ctrl__reg_en_W      ),
+    .reg_en_X       (       ctrl__reg_en_X      ),
+    .reset          (        ctrl__reset        ),
+    .rf_waddr_W     (      ctrl__rf_waddr_W     ),
+    .rf_wen_W       (       ctrl__rf_wen_W      ),
+    .wb_result_sel_M(   ctrl__wb_result_sel_M   ),
+    .xcelreq_en     (      ctrl__xcelreq_en     ),
+    .xcelreq_rdy    (     ctrl__xcelreq_rdy     ),
+    .xcelreq_type   (     ctrl__xcelreq_type    ),
+    .xcelresp_en    (     ctrl__xcelresp_en     ),
+    .xcelresp_rdy   (     ctrl__xcelresp_rdy    )
+  );
+
+  logic [0:0]    dmemresp_q__clk;
+  logic [0:0]    dmemresp_q__count;
+  logic [0:0]    dmemresp_q__reset;
+  logic [0:0]    dmemresp_q__deq__en;
+  logic [0:0]    dmemresp_q__deq__rdy;
+  logic [3:0]    dmemresp_q__deq__ret__type_;
+  logic [7:0]    dmemresp_q__deq__ret__opaque;
+  logic [1:0]    dmemresp_q__deq__ret__test;
+  logic [1:0]    dmemresp_q__deq__ret__len;
+  logic [31:0]   dmemresp_q__deq__ret__data;
+  logic [0:0]    dmemresp_q__enq__en;
+  logic [3:0]    dmemresp_q__enq__msg__type_;
+  logic [7:0]    dmemresp_q__enq__msg__opaque;
+  logic [1:0]    dmemresp_q__enq__msg__test;
+  logic [1:0]    dmemresp_q__enq__msg__len;
+  logic [31:0]   dmemresp_q__enq__msg__data;
+  logic [0:0]    dmemresp_q__enq__rdy;
+
+  BypassQueueRTL__49a4184f84b04c56 dmemresp_q
+  (
+    .clk            (      dmemresp_q__clk      ),
+    .count          (     dmemresp_q__count     ),
+    .reset          (     dmemresp_q__reset     ),
+    .deq__en        (    dmemresp_q__deq__en    ),
+    .deq__rdy       (    dmemresp_q__deq__rdy   ),
+    .deq__ret__type_( dmemresp_q__deq__ret__type_ ),
+    .deq__ret__opaque( dmemresp_q__deq__ret__opaque ),
+    .deq__ret__test ( dmemresp_q__deq__ret__test ),
+    .deq__ret__len  ( dmemresp_q__deq__ret__len ),
+    .deq__ret__data ( dmemresp_q__deq__ret__data ),
+    .enq__en        (    dmemresp_q__enq__en    ),
+    .enq__msg__type_( dmemresp_q__enq__msg__type_ ),
+    .enq__msg__opaque( dmemresp_q__enq__msg__opaque ),
+    .enq__msg__test ( dmemresp_q__enq__msg__test ),
+    .enq__msg__len  ( dmemresp_q__enq__msg__len ),
+    .enq__msg__data ( dmemresp_q__enq__msg__data ),
+    .enq__rdy       (    dmemresp_q__enq__rdy   )
+  );
+
+  logic [3:0]    dpath__alu_fn_X;
+  logic [0:0]    dpath__clk;
+  logic [31:0]   dpath__dmemreq_addr;
+  logic [31:0]   dpath__dmemreq_data;
+  logic [31:0]   dpath__dmemresp_data;
+  logic [31:0]   dpath__imemreq_addr;
+  logic [31:0]   dpath__imemresp_data;
+  logic [2:0]    dpath__imm_type_D;
+  logic [31:0]   dpath__inst_D;
+  logic [31:0]   dpath__mngr2proc_data;
+  logic [0:0]    dpath__ne_X;
+  logic [1:0]    dpath__op1_byp_sel_D;
+  logic [1:0]    dpath__op2_byp_sel_D;
+  logic [1:0]    dpath__op2_sel_D;
+  logic [0:0]    dpath__pc_sel_F;
+  logic [31:0]   dpath__proc2mngr_data;
+  logic [0:0]    dpath__reg_en_D;
+  logic [0:0]    dpath__reg_en_F;
+  logic [0:0]    dpath__reg_en_M;
+  logic [0:0]    dpath__reg_en_W;
+  logic [0:0]    dpath__reg_en_X;
+  logic [0:0]    dpath__reset;
+  logic [4:0]    dpath__rf_waddr_W;
+  logic [0:0]    dpath__rf_wen_W;
+  logic [1:0]    dpath__wb_result_sel_M;
+  logic [4:0]    dpath__xcelreq_addr;
+  logic [31:0]   dpath__xcelreq_data;
+  logic [31:0]   dpath__xcelresp_data;
+
+  ProcDpath_noparam dpath
+  (
+    .alu_fn_X       (      dpath__alu_fn_X      ),
+    .clk            (         dpath__clk        ),
+    .dmemreq_addr   (    dpath__dmemreq_addr    ),
+    .dmemreq_data   (    dpath__dmemreq_data    ),
+    .dmemresp_data  (    dpath__dmemresp_data   ),
+    .imemreq_addr   (    dpath__imemreq_addr    ),
+    .imemresp_data  (    dpath__imemresp_data   ),
+    .imm_type_D     (     dpath__imm_type_D     ),
+    .inst_D         (       dpath__inst_D       ),
+    .mngr2proc_data (   dpath__mngr2proc_data   ),
+    .ne_X           (        dpath__ne_X        ),
+    .op1_byp_sel_D  (    dpath__op1_byp_sel_D   ),
+    .op2_byp_sel_D  (    dpath__op2_byp_sel_D   ),
+    .op2_sel_D      (      dpath__op2_sel_D     ),
+    .pc_sel_F       (      dpath__pc_sel_F      ),
+    .proc2mngr_data (   dpath__proc2mngr_data   ),
+    .reg_en_D       (      dpath__reg_en_D      ),
+    .reg_en_F       (      dpath__reg_en_F      ),
+    .reg_en_M       (      dpath__reg_en_M      ),
+    .reg_en_W       (      dpath__reg_en_W      ),
+    .reg_en_X       (      dpath__reg_en_X      ),
+    .reset          (        dpath__reset       ),
+    .rf_waddr_W     (     dpath__rf_waddr_W     ),
+    .rf_wen_W       (      dpath__rf_wen_W      ),
+    .wb_result_sel_M(   dpath__wb_result_sel_M  ),
+    .xcelreq_addr   (    dpath__xcelreq_addr    ),
+    .xcelreq_data   (    dpath__xcelreq_data    ),
+    .xcelresp_data  (    dpath__xcelresp_data   )
+  );
+
+  logic [0:0]    imemreq_q__clk;
+  logic [0:0]    imemreq_q__reset;
+  logic [0:0]    imemreq_q__deq__en;
+  logic [3:0]    imemreq_q__deq__msg__type_;
+  logic [7:0]    imemreq_q__deq__msg__opaque;
+  logic [31:0]   imemreq_q__deq__msg__addr;
+  logic [1:0]    imemreq_q__deq__msg__len;
+  logic [31:0]   imemreq_q__deq__msg__data;
+  logic [0:0]    imemreq_q__deq__rdy;
+  logic [0:0]    imemreq_q__enq__en;
+  logic [3:0]    imemreq_q__enq__msg__type_;
+  logic [7:0]    imemreq_q__enq__msg__opaque;
+  logic [31:0]   imemreq_q__enq__msg__addr;
+  logic [1:0]    imemreq_q__enq__msg__len;
+  logic [31:0]   imemreq_q__enq__msg__data;
+  logic [0:0]    imemreq_q__enq__rdy;
+
+  BypassQueue2RTL__d3c025c421424e3e imemreq_q
+  (
+    .clk            (       imemreq_q__clk      ),
+    .reset          (      imemreq_q__reset     ),
+    .deq__en        (     imemreq_q__deq__en    ),
+    .deq__msg__type_( imemreq_q__deq__msg__type_ ),
+    .deq__msg__opaque( imemreq_q__deq__msg__opaque ),
+    .deq__msg__addr ( imemreq_q__deq__msg__addr ),
+    .deq__msg__len  (  imemreq_q__deq__msg__len ),
+    .deq__msg__data ( imemreq_q__deq__msg__data ),
+    .deq__rdy       (    imemreq_q__deq__rdy    ),
+    .enq__en        (     imemreq_q__enq__en    ),
+    .enq__msg__type_( imemreq_q__enq__msg__type_ ),
+    .enq__msg__opaque( imemreq_q__enq__msg__opaque ),
+    .enq__msg__addr ( imemreq_q__enq__msg__addr ),
+    .enq__msg__len  (  imemreq_q__enq__msg__len ),
+    .enq__msg__data ( imemreq_q__enq__msg__data ),
+    .enq__rdy       (    imemreq_q__enq__rdy    )
+  );
+
+  logic [0:0]    imemresp_drop__clk;
+  logic [0:0]    imemresp_drop__drop;
+  logic [0:0]    imemresp_drop__reset;
+  logic [0:0]    imemresp_drop__in___en;
+  logic [0:0]    imemresp_drop__in___rdy;
+  logic [31:0]   imemresp_drop__in___ret;
+  logic [0:0]    imemresp_drop__out__en;
+  logic [0:0]    imemresp_drop__out__rdy;
+  logic [31:0]   imemresp_drop__out__ret;
+
+  DropUnitRTL__dtype_Bits32 imemresp_drop
+  (
+    .clk            (     imemresp_drop__clk    ),
+    .drop           (    imemresp_drop__drop    ),
+    .reset          (    imemresp_drop__reset   ),
+    .in___en        (   imemresp_drop__in___en  ),
+    .in___rdy       (  imemresp_drop__in___rdy  ),
+    .in___ret       (  imemresp_drop__in___ret  ),
+    .out__en        (   imemresp_drop__out__en  ),
+    .out__rdy       (  imemresp_drop__out__rdy  ),
+    .out__ret       (  imemresp_drop__out__ret  )
+  );
+
+  logic [0:0]    imemresp_q__clk;
+  logic [0:0]    imemresp_q__count;
+  logic [0:0]    imemresp_q__reset;
+  logic [0:0]    imemresp_q__deq__en;
+  logic [0:0]    imemresp_q__deq__rdy;
+  logic [3:0]    imemresp_q__deq__ret__type_;
+  logic [7:0]    imemresp_q__deq__ret__opaque;
+  logic [1:0]    imemresp_q__deq__ret__test;
+  logic [1:0]    imemresp_q__deq__ret__len;
+  logic [31:0]   imemresp_q__deq__ret__data;
+  logic [0:0]    imemresp_q__enq__en;
+  logic [3:0]    imemresp_q__enq__msg__type_;
+  logic [7:0]    imemresp_q__enq__msg__opaque;
+  logic [1:0]    imemresp_q__enq__msg__test;
+  logic [1:0]    imemresp_q__enq__msg__len;
+  logic [31:0]   imemresp_q__enq__msg__data;
+  logic [0:0]    imemresp_q__enq__rdy;
+
+  BypassQueueRTL__49a4184f84b04c56 imemresp_q
+  (
+    .clk            (      imemresp_q__clk      ),
+    .count          (     imemresp_q__count     ),
+    .reset          (     imemresp_q__reset     ),
+    .deq__en        (    imemresp_q__deq__en    ),
+    .deq__rdy       (    imemresp_q__deq__rdy   ),
+    .deq__ret__type_( imemresp_q__deq__ret__type_ ),
+    .deq__ret__opaque( imemresp_q__deq__ret__opaque ),
+    .deq__ret__test ( imemresp_q__deq__ret__test ),
+    .deq__ret__len  ( imemresp_q__deq__ret__len ),
+    .deq__ret__data ( imemresp_q__deq__ret__data ),
+    .enq__en        (    imemresp_q__enq__en    ),
+    .enq__msg__type_( imemresp_q__enq__msg__type_ ),
+    .enq__msg__opaque( imemresp_q__enq__msg__opaque ),
+    .enq__msg__test ( imemresp_q__enq__msg__test ),
+    .enq__msg__len  ( imemresp_q__enq__msg__len ),
+    .enq__msg__data ( imemresp_q__enq__msg__data ),
+    .enq__rdy       (    imemresp_q__enq__rdy   )
+  );
+
+  logic [0:0]    mngr2proc_q__clk;
+  logic [0:0]    mngr2proc_q__count;
+  logic [0:0]    mngr2proc_q__reset;
+  logic [0:0]    mngr2proc_q__deq__en;
+  logic [0:0]    mngr2proc_q__deq__rdy;
+  logic [31:0]   mngr2proc_q__deq__ret;
+  logic [0:0]    mngr2proc_q__enq__en;
+  logic [31:0]   mngr2proc_q__enq__msg;
+  logic [0:0]    mngr2proc_q__enq__rdy;
+
+  BypassQueueRTL__EntryType_Bits32__num_entries_1 mngr2proc_q
+  (
+    .clk            (      mngr2proc_q__clk     ),
+    .count          (     mngr2proc_q__count    ),
+    .reset          (     mngr2proc_q__reset    ),
+    .deq__en        (    mngr2proc_q__deq__en   ),
+    .deq__rdy       (   mngr2proc_q__deq__rdy   ),
+    .deq__ret       (   mngr2proc_q__deq__ret   ),
+    .enq__en        (    mngr2proc_q__enq__en   ),
+    .enq__msg       (   mngr2proc_q__enq__msg   ),
+    .enq__rdy       (   mngr2proc_q__enq__rdy   )
+  );
+
+  logic [0:0]    xcelresp_q__clk;
+  logic [0:0]    xcelresp_q__count;
+  logic [0:0]    xcelresp_q__reset;
+  logic [0:0]    xcelresp_q__deq__en;
+  logic [0:0]    xcelresp_q__deq__rdy;
+  logic [0:0]    xcelresp_q__deq__ret__type_;
+  logic [31:0]   xcelresp_q__deq__ret__data;
+  logic [0:0]    xcelresp_q__enq__en;
+  logic [0:0]    xcelresp_q__enq__msg__type_;
+  logic [31:0]   xcelresp_q__enq__msg__data;
+  logic [0:0]    xcelresp_q__enq__rdy;
+
+  BypassQueueRTL__798f6b8687b61c17 xcelresp_q
+  (
+    .clk            (      xcelresp_q__clk      ),
+    .count          (     xcelresp_q__count     ),
+    .reset          (     xcelresp_q__reset     ),
+    .deq__en        (    xcelresp_q__deq__en    ),
+    .deq__rdy       (    xcelresp_q__deq__rdy   ),
+    .deq__ret__type_( xcelresp_q__deq__ret__type_ ),
+    .deq__ret__data ( xcelresp_q__deq__ret__data ),
+    .enq__en        (    xcelresp_q__enq__en    ),
+    .enq__msg__type_( xcelresp_q__enq__msg__type_ ),
+    .enq__msg__data ( xcelresp_q__enq__msg__data ),
+    .enq__rdy       (    xcelresp_q__enq__rdy   )
+  );
+
+  // Connect struct/array ports and their wire forms
+  assign dmemresp_q__deq__ret[47:44] = dmemresp_q__deq__ret__type_;
+  assign dmemresp_q__deq__ret[43:36] = dmemresp_q__deq__ret__opaque;
+  assign dmemresp_q__deq__ret[35:34] = dmemresp_q__deq__ret__test;
+  assign dmemresp_q__deq__ret[33:32] = dmemresp_q__deq__ret__len;
+  assign dmemresp_q__deq__ret[31:0] = dmemresp_q__deq__ret__data;
+  assign dmemresp_q__enq__msg__type_ = dmemresp_q__enq__msg[47:44];
+  assign dmemresp_q__enq__msg__opaque = dmemresp_q__enq__msg[43:36];
+  assign dmemresp_q__enq__msg__test = dmemresp_q__enq__msg[35:34];
+  assign dmemresp_q__enq__msg__len = dmemresp_q__enq__msg[33:32];
+  assign dmemresp_q__enq__msg__data = dmemresp_q__enq__msg[31:0];
+  assign imemreq_q__deq__msg[77:74] = imemreq_q__deq__msg__type_;
+  assign imemreq_q__deq__msg[73:66] = imemreq_q__deq__msg__opaque;
+  assign imemreq_q__deq__msg[65:34] = imemreq_q__deq__msg__addr;
+  assign imemreq_q__deq__msg[33:32] = imemreq_q__deq__msg__len;
+  assign imemreq_q__deq__msg[31:0] = imemreq_q__deq__msg__data;
+  assign imemreq_q__enq__msg__type_ = imemreq_q__enq__msg[77:74];
+  assign imemreq_q__enq__msg__opaque = imemreq_q__enq__msg[73:66];
+  assign imemreq_q__enq__msg__addr = imemreq_q__enq__msg[65:34];
+  assign imemreq_q__enq__msg__len = imemreq_q__enq__msg[33:32];
+  assign imemreq_q__enq__msg__data = imemreq_q__enq__msg[31:0];
+  assign imemresp_q__deq__ret[47:44] = imemresp_q__deq__ret__type_;
+  assign imemresp_q__deq__ret[43:36] = imemresp_q__deq__ret__opaque;
+  assign imemresp_q__deq__ret[35:34] = imemresp_q__deq__ret__test;
+  assign imemresp_q__deq__ret[33:32] = imemresp_q__deq__ret__len;
+  assign imemresp_q__deq__ret[31:0] = imemresp_q__deq__ret__data;
+  assign imemresp_q__enq__msg__type_ = imemresp_q__enq__msg[47:44];
+  assign imemresp_q__enq__msg__opaque = imemresp_q__enq__msg[43:36];
+  assign imemresp_q__enq__msg__test = imemresp_q__enq__msg[35:34];
+  assign imemresp_q__enq__msg__len = imemresp_q__enq__msg[33:32];
+  assign imemresp_q__enq__msg__data = imemresp_q__enq__msg[31:0];
+  assign xcelresp_q__deq__ret[32:32] = xcelresp_q__deq__ret__type_;
+  assign xcelresp_q__deq__ret[31:0] = xcelresp_q__deq__ret__data;
+  assign xcelresp_q__enq__msg__type_ = xcelresp_q__enq__msg[32:32];
+  assign xcelresp_q__enq__msg__data = xcelresp_q__enq__msg[31:0];
+
+  // Connections
+  assign dmem__req__msg__type_ = dmem__req__msg[77:74];
+  assign dmem__req__msg__opaque = dmem__req__msg[73:66];
+  assign dmem__req__msg__addr = dmem__req__msg[65:34];
+  assign dmem__req__msg__len = dmem__req__msg[33:32];
+  assign dmem__req__msg__data = dmem__req__msg[31:0];
+  assign dmem__resp__msg[47:44] = dmem__resp__msg__type_;
+  assign dmem__resp__msg[43:36] = dmem__resp__msg__opaque;
+  assign dmem__resp__msg[35:34] = dmem__resp__msg__test;
+  assign dmem__resp__msg[33:32] = dmem__resp__msg__len;
+  assign dmem__resp__msg[31:0] = dmem__resp__msg__data;
+  assign imem__req__msg__type_ = imem__req__msg[77:74];
+  assign imem__req__msg__opaque = imem__req__msg[73:66];
+  assign imem__req__msg__addr = imem__req__msg[65:34];
+  assign imem__req__msg__len = imem__req__msg[33:32];
+  assign imem__req__msg__data = imem__req__msg[31:0];
+  assign imem__resp__msg[47:44] = imem__resp__msg__type_;
+  assign imem__resp__msg[43:36] = imem__resp__msg__opaque;
+  assign imem__resp__msg[35:34] = imem__resp__msg__test;
+  assign imem__resp__msg[33:32] = imem__resp__msg__len;
+  assign imem__resp__msg[31:0] = imem__resp__msg__data;
+  assign xcel__req__msg__type_ = xcel__req__msg[37:37];
+  assign xcel__req__msg__addr = xcel__req__msg[36:32];
+  assign xcel__req__msg__data = xcel__req__msg[31:0];
+  assign xcel__resp__msg[32:32] = xcel__resp__msg__type_;
+  assign xcel__resp__msg[31:0] = xcel__resp__msg__data;
+  assign imemreq_q__clk = clk;
+  assign imemreq_q__reset = reset;
+  assign imemresp_q__clk = clk;
+  assign imemresp_q__reset = reset;
+  assign dmemresp_q__clk = clk;
+  assign dmemresp_q__reset = reset;
+  assign mngr2proc_q__clk = clk;
+  assign mngr2proc_q__reset = reset;
+  assign xcelresp_q__clk = clk;
+  assign xcelresp_q__reset = reset;
+  assign imemresp_drop__clk = clk;
+  assign imemresp_drop__reset = reset;
+  assign imemresp_q__deq__en = imemresp_drop__in___en;
+  assign imemresp_drop__in___rdy = imemresp_q__deq__rdy;
+  assign imemresp_drop__in___ret = imemresp_q__deq__ret__data;
+  assign imem__req__en = imemreq_q__deq__en;
+  assign imem__req__msg = imemreq_q__deq__msg;
+  assign imemreq_q__deq__rdy = imem__req__rdy;
+  assign imemresp_q__enq__en = imem__resp__en;
+  assign imemresp_q__enq__msg = imem__resp__msg;
+  assign imem__resp__rdy = imemresp_q__enq__rdy;
+  assign dmemresp_q__enq__en = dmem__resp__en;
+  assign dmemresp_q__enq__msg = dmem__resp__msg;
+  assign dmem__resp__rdy = dmemresp_q__enq__rdy;
+  assign mngr2proc_q__enq__en = mngr2proc__en;
+  assign mngr2proc_q__enq__msg = mngr2proc__msg;
+  assign mngr2proc__rdy = mngr2proc_q__enq__rdy;
+  assign xcelresp_q__enq__en = xcel__resp__en;
+  assign xcelresp_q__enq__msg = xcel__resp__msg;
+  assign xcel__resp__rdy = xcelresp_q__enq__rdy;
+  assign ctrl__clk = clk;
+  assign ctrl__reset = reset;
+  assign imemresp_drop__drop = ctrl__imemresp_drop;
+  assign imemreq_q__enq__en = ctrl__imemreq_en;
+  assign ctrl__imemreq_rdy = imemreq_q__enq__rdy;
+  assign imemresp_drop__out__en = ctrl__imemresp_en;
+  assign ctrl__imemresp_rdy = imemresp_drop__out__rdy;
+  assign dmem__req__en = ctrl__dmemreq_en;
+  assign ctrl__dmemreq_rdy = dmem__req__rdy;
+  assign dmem__req__msg__type_ = ctrl__dmemreq_type;
+  assign dmemresp_q__deq__en = ctrl__dmemresp_en;
+  assign ctrl__dmemresp_rdy = dmemresp_q__deq__rdy;
+  assign xcel__req__msg__type_ = ctrl__xcelreq_type;
+  assign xcel__req__en = ctrl__xcelreq_en;
+  assign ctrl__xcelreq_rdy = xcel__req__rdy;
+  assign xcelresp_q__deq__en = ctrl__xcelresp_en;
+  assign ctrl__xcelresp_rdy = xcelresp_q__deq__rdy;
+  assign proc2mngr__en = ctrl__proc2mngr_en;
+  assign ctrl__proc2mngr_rdy = proc2mngr__rdy;
+  assign mngr2proc_q__deq__en = ctrl__mngr2proc_en;
+  assign ctrl__mngr2proc_rdy = mngr2proc_q__deq__rdy;
+  assign commit_inst = ctrl__commit_inst;
+  assign dpath__clk = clk;
+  assign dpath__reset = reset;
+  assign imemreq_q__enq__msg__addr = dpath__imemreq_addr;
+  assign dpath__imemresp_data = imemresp_drop__out__ret;
+  assign dmem__req__msg__addr = dpath__dmemreq_addr;
+  assign dmem__req__msg__data = dpath__dmemreq_data;
+  assign dpath__dmemresp_data = dmemresp_q__deq__ret__data;
+  assign xcel__req__msg__addr = dpath__xcelreq_addr;
+  assign xcel__req__msg__data = dpath__xcelreq_data;
+  assign dpath__xcelresp_data = xcelresp_q__deq__ret__data;
+  assign dpath__mngr2proc_data = mngr2proc_q__deq__ret;
+  assign proc2mngr__msg = dpath__proc2mngr_data;
+  assign dpath__reg_en_F = ctrl__reg_en_F;
+  assign dpath__pc_sel_F = ctrl__pc_sel_F;
+  assign dpath__reg_en_D = ctrl__reg_en_D;
+  assign dpath__op1_byp_sel_D = ctrl__op1_byp_sel_D;
+  assign dpath__op2_byp_sel_D = ctrl__op2_byp_sel_D;
+  assign dpath__op2_sel_D = ctrl__op2_sel_D;
+  assign dpath__imm_type_D = ctrl__imm_type_D;
+  assign dpath__reg_en_X = ctrl__reg_en_X;
+  assign dpath__alu_fn_X = ctrl__alu_fn_X;
+  assign dpath__reg_en_M = ctrl__reg_en_M;
+  assign dpath__wb_result_sel_M = ctrl__wb_result_sel_M;
+  assign dpath__reg_en_W = ctrl__reg_en_W;
+  assign dpath__rf_waddr_W = ctrl__rf_waddr_W;
+  assign dpath__rf_wen_W = ctrl__rf_wen_W;
+  assign ctrl__inst_D = dpath__inst_D;
+  assign ctrl__ne_X = dpath__ne_X;
+
+endmodule
@@ -0,0 +1,168 @@
+//-------------------------------------------------------------------------
+// RoundRobinArbiterEn__nreqs_4.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL yosys-SystemVerilog translation pass.
+
+// PyMTL Component RegEnRst Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/registers.py
+module RegEnRst__Type_Bits4__reset_value_1
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    en,
+  input  logic [3:0]    in_,
+  output logic [3:0]    out,
+  input  logic [0:0]    reset
+);
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/registers.py:55
+  // @update_ff
+  // def up_regenrst():
+  //   if s.reset: s.out <<= reset_value
+  //   elif s.en:  s.out <<= s.in_
+  
+  always_ff @(posedge clk) begin : up_regenrst
+    if ( reset ) begin
+      out <= 4'd1;
+    end
+    else if ( en ) begin
+      out <= in_;
+    end
+  end
+
+endmodule
+
+
+// PyMTL Component RoundRobinArbiterEn Definition
+// At /root/package/pymtl3/stdlib/basic_rtl/arbiters.py
+module RoundRobinArbiterEn__nreqs_4
+(
+  input  logic [0:0]    clk,
+  input  logic [0:0]    en,
+  output logic [3:0]    grants,
+  input  logic [3:0]    reqs,
+  input  logic [0:0]    reset
+);
+  // Wire declarations
+  logic [7:0]    grants_int;
+  logic [8:0]    kills;
+  logic [0:0]    priority_en;
+  logic [7:0]    priority_int;
+  logic [7:0]    reqs_int;
+
+  // Sub-component declarations
+  logic [0:0]    priority_reg__clk;
+  logic [0:0]    priority_reg__en;
+  logic [3:0]    priority_reg__in_;
+  logic [3:0]    priority_reg__out;
+  logic [0:0]    priority_reg__reset;
+
+  RegEnRst__Type_Bits4__reset_value_1 priority_reg
+  (
+    .clk            (     priority_reg__clk     ),
+    .en             (      priority_reg__en     ),
+    .in_            (     priority_reg__in_     ),
+    .out            (     priority_reg__out     ),
+    .reset          (    priority_reg__reset    )
+  );
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arbiters.py:118
+  // @update
+  // def comb_grants():
+  //   for i in range( nreqs ):
+  //     s.grants[i] @= s.grants_int[i] | s.grants_int[nreqs+i]
+  
+  integer __loopvar__comb_grants_i;
+  
+  always_comb begin : comb_grants
+    for ( __loopvar__comb_grants_i = 1'd0; __loopvar__comb_grants_i < 3'd4; __loopvar__comb_grants_i = __loopvar__comb_grants_i + 1'd1 )
+      grants[2'(__loopvar__comb_grants_i)] = grants_int[3'(__loopvar__comb_grants_i)] | grants_int[3'd4 + 3'(__loopvar__comb_grants_i)];
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arbiters.py:141
+  // @update
+  // def comb_grants_int():
+  //   for i in range( nreqsX2 ):
+  //     if s.priority_int[i]:
+  //       s.grants_int[i] @= s.reqs_int[i]
+  //     else:
+  //       s.grants_int[i] @= ~s.kills[i] & s.reqs_int[i]
+  
+  integer __loopvar__comb_grants_int_i;
+  
+  always_comb begin : comb_grants_int
+    for ( __loopvar__comb_grants_int_i = 1'd0; __loopvar__comb_grants_int_i < 4'd8; __loopvar__comb_grants_int_i = __loopvar__comb_grants_int_i + 1'd1 )
+      if ( priority_int[3'(__loopvar__comb_grants_int_i)] ) begin
+        grants_int[3'(__loopvar__comb_grants_int_i)] = reqs_int[3'(__loopvar__comb_grants_int_i)];
+      end
+      else
+        grants_int[3'(__loopvar__comb_grants_int_i)] = ( ~kills[4'(__loopvar__comb_grants_int_i)] ) & reqs_int[3'(__loopvar__comb_grants_int_i)];
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arbiters.py:132
+  // @update
+  // def comb_kills():
+  //   s.kills[0] @= 1
+  //   for i in range( nreqsX2 ):
+  //     if s.priority_int[i]:
+  //       s.kills[i+1] @= s.reqs_int[i]
+  //     else:
+  //       s.kills[i+1] @= s.kills[i] | ( ~s.kills[i] & s.reqs_int[i] )
+  
+  integer __loopvar__comb_kills_i;
+  
+  always_comb begin : comb_kills
+    kills[4'd0] = 1'd1;
+    for ( __loopvar__comb_kills_i = 1'd0; __loopvar__comb_kills_i < 4'd8; __loopvar__comb_kills_i = __loopvar__comb_kills_i + 1'd1 )
+      if ( priority_int[3'(__loopvar__comb_kills_i)] ) begin
+        kills[4'(__loopvar__comb_kills_i) + 4'd1] = reqs_int[3'(__loopvar__comb_kills_i)];
+      end
+      else
+        kills[4'(__loopvar__comb_kills_i) + 4'd1] = kills[4'(__loopvar__comb_kills_i)] | ( ( ~kills[4'(__loopvar__comb_kills_i)] ) & reqs_int[3'(__loopvar__comb_kills_i)] );
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arbiters.py:123
+  // @update
+  // def comb_priority_en():
+  //   s.priority_en @= ( s.grants != 0 ) & s.en
+  
+  always_comb begin : comb_priority_en
+    priority_en = ( grants != 4'd0 ) & en;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arbiters.py:127
+  // @update
+  // def comb_priority_int():
+  //   s.priority_int[    0:nreqs  ] @= s.priority_reg.out
+  //   s.priority_int[nreqs:nreqsX2] @= 0
+  
+  always_comb begin : comb_priority_int
+    priority_int[3'd3:3'd0] = priority_reg__out;
+    priority_int[3'd7:3'd4] = 4'd0;
+  end
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/basic_rtl/arbiters.py:113
+  // @update
+  // def comb_reqs_int():
+  //   s.reqs_int [    0:nreqs  ] @= s.reqs
+  //   s.reqs_int [nreqs:nreqsX2] @= s.reqs
+  
+  always_comb begin : comb_reqs_int
+    reqs_int[3'd3:3'd0] = reqs;
+    reqs_int[3'd7:3'd4] = reqs;
+  end
+
+  // Connections
+  assign priority_reg__clk = clk;
+  assign priority_reg__reset = reset;
+  assign priority_reg__en = priority_en;
+  assign priority_reg__in_[3:1] = grants[2:0];
+  assign priority_reg__in_[0:0] = grants[3:3];
+
+endmodule
@@ -0,0 +1,41 @@
+//-------------------------------------------------------------------------
+// SequentialROMRTL__cc4a6d7581774401.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL SystemVerilog translation pass.
+
+// PyMTL Component SequentialROMRTL Definition
+// Full name: SequentialROMRTL__Type_Bits32__num_entries_8__data_[8, 7, 6, 5, 4, 3, 2, 1]__num_ports_2
+// At /root/package/pymtl3/stdlib/mem/ROMRTL.py
+
+module SequentialROMRTL__cc4a6d7581774401
+(
+  input  logic [0:0] clk ,
+  input  logic [2:0] raddr [0:1],
+  output logic [31:0] rdata [0:1],
+  input  logic [0:0] reset 
+);
+  localparam logic [1:0] __const__num_ports_at_up_read_rom  = 2'd2;
+  logic [31:0] mem [0:7];
+
+  // PyMTL Update Block Source
+  // At /root/package/pymtl3/stdlib/mem/ROMRTL.py:43
+  // @update_ff
+  // def up_read_rom():
+  //   for i in range(num_ports):
+  //     s.rdata[i] <<= s.mem[ s.raddr[i] ]
+  
+  always_ff @(posedge clk) begin : up_read_rom
+    for ( int unsigned i = 1'd0; i < 2'( __const__num_ports_at_up_read_rom ); i += 1'd1 )
+      rdata[1'(i)] <= mem[raddr[1'(i)]];
+  end
+
+  assign mem[0] = 32'd8;
+  assign mem[1] = 32'd7;
+  assign mem[2] = 32'd6;
+  assign mem[3] = 32'd5;
+  assign mem[4] = 32'd4;
+  assign mem[5] = 32'd3;
+  assign mem[6] = 32'd2;
+  assign mem[7] = 32'd1;
+
+endmodule
@@ -0,0 +1,111 @@
+//-------------------------------------------------------------------------
+// Top_noparam.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL SystemVerilog translation pass.
+
+// PyMTL VerilogPlaceholder VReg Definition
+// At /root/package/pymtl3/passes/backends/verilog/import_/test/ImportedObject_test.py
+
+//***********************************************************
+// Pickled source file of placeholder VReg_noparam
+//***********************************************************
+
+//-----------------------------------------------------------
+// Dependency of placeholder VReg
+//-----------------------------------------------------------
+
+`ifndef VREG
+`define VREG
+
+// The source code below are included because they are specified
+// as the v_libs Verilog placeholder option of component VReg_noparam.
+
+// If you get a duplicated def error from files included below, please
+// make sure they are included either through the v_libs option or the
+// explicit `include statement in the Verilog source code -- if they
+// appear in both then they will be included twice!
+
+
+// End of all v_libs files for component VReg_noparam
+
+`line 1 "VReg.v" 0
+module test_VReg(
+  input  logic          clk,
+  input  logic          reset,
+  output logic [32-1:0] q,
+  input  logic [32-1:0] d
+);
+  always_ff @(posedge clk) begin
+    q <= d;
+  end
+
+endmodule
+
+`endif /* VREG */
+
+//-----------------------------------------------------------
+// Wrapper of placeholder VReg_noparam
+//-----------------------------------------------------------
+
+`ifndef VREG_NOPARAM
+`define VREG_NOPARAM
+
+module VReg_noparam
+(
+  input logic [1-1:0] clk ,
+  input logic [32-1:0] d ,
+  output logic [32-1:0] q ,
+  input logic [1-1:0] reset 
+);
+  test_VReg
+  #(
+  ) v
+  (
+    .clk( clk ),
+    .d( d ),
+    .q( q ),
+    .reset( reset )
+  );
+endmodule
+
+`endif /* VREG_NOPARAM */
+
+
+
+// PyMTL Component Top Definition
+// At /root/package/pymtl3/passes/backends/verilog/import_/test/ImportedObject_test.py
+
+module Top_noparam
+(
+  input  logic [0:0] clk ,
+  input  logic [31:0] in_ ,
+  output logic [31:0] out ,
+  input  logic [0:0] reset 
+);
+  //-------------------------------------------------------------
+  // Component v
+  //-------------------------------------------------------------
+
+  logic [0:0] v__clk;
+  logic [31:0] v__in_;
+  logic [31:0] v__out;
+  logic [0:0] v__reset;
+
+  VReg_noparam v
+  (
+    .clk( v__clk ),
+    .d( v__in_ ),
+    .q( v__out ),
+    .reset( v__reset )
+  );
+
+  //-------------------------------------------------------------
+  // End of component v
+  //-------------------------------------------------------------
+
+  assign v__clk = clk;
+  assign v__reset = reset;
+  assign v__in_ = in_;
+  assign out = v__out;
+
+endmodule
@@ -0,0 +1,83 @@
+//-------------------------------------------------------------------------
+// VIncr_noparam.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL SystemVerilog translation pass.
+
+// PyMTL VerilogPlaceholder VIncr Definition
+// At /root/package/pymtl3/passes/backends/verilog/import_/test/ImportedObject_test.py
+
+//***********************************************************
+// Pickled source file of placeholder VIncr_noparam
+//***********************************************************
+
+//-----------------------------------------------------------
+// Dependency of placeholder VIncr
+//-----------------------------------------------------------
+
+`ifndef VINCR
+`define VINCR
+
+// The source code below are included because they are specified
+// as the v_libs Verilog placeholder option of component VIncr_noparam.
+
+// If you get a duplicated def error from files included below, please
+// make sure they are included either through the v_libs option or the
+// explicit `include statement in the Verilog source code -- if they
+// appear in both then they will be included twice!
+
+
+// End of all v_libs files for component VIncr_noparam
+
+`line 1 "VIncr.v" 0
+module child (
+  input [9:0] in_,
+  output logic [9:0] out
+);
+  assign out = in_ + 1;
+endmodule
+
+module test_VIncr (
+  input [9:0] in_,
+  output logic [9:0] out,
+  output logic vcd_en
+);
+  logic [9:0] child_out;
+
+  child c (
+    .in_(in_),
+    .out(child_out)
+  );
+
+  assign out = child_out;
+
+  assign vcd_en = (in_[2:0] >= 4);
+endmodule
+
+`endif /* VINCR */
+//-----------------------------------------------------------
+// Wrapper of placeholder VIncr_noparam
+//-----------------------------------------------------------
+
+`ifndef VINCR_NOPARAM
+`define VINCR_NOPARAM
+
+module VIncr_noparam
+(
+  input logic reset,
+  input logic clk,
+  input logic [10-1:0] in_ ,
+  output logic [10-1:0] out ,
+  output logic [1-1:0] vcd_en 
+);
+  test_VIncr
+  #(
+  ) v
+  (
+    .in_( in_ ),
+    .out( out ),
+    .vcd_en( vcd_en )
+  );
+endmodule
+
+`endif /* VINCR_NOPARAM */
+
@@ -0,0 +1,371 @@
+//-------------------------------------------------------------------------
+// VRegTrace_noparam.v
+//-------------------------------------------------------------------------
+// This file is generated by PyMTL SystemVerilog translation pass.
+
+// PyMTL VerilogPlaceholder VRegTrace Definition
+// At /root/package/pymtl3/passes/backends/verilog/import_/test/ImportedObject_test.py
+
+//***********************************************************
+// Pickled source file of placeholder VRegTrace_noparam
+//***********************************************************
+
+//-----------------------------------------------------------
+// Dependency of placeholder VRegTrace
+//-----------------------------------------------------------
+
+`ifndef VREGTRACE
+`define VREGTRACE
+
+// The source code below are included because they are specified
+// as the v_libs Verilog placeholder option of component VRegTrace_noparam.
+
+// If you get a duplicated def error from files included below, please
+// make sure they are included either through the v_libs option or the
+// explicit `include statement in the Verilog source code -- if they
+// appear in both then they will be included twice!
+
+
+// End of all v_libs files for component VRegTrace_noparam
+
+`line 1 "VRegTrace.v" 0
+`line 1 "trace.v" 0
+//========================================================================
+// Line Tracing
+//========================================================================
+
+`ifndef VC_TRACE_V
+`define VC_TRACE_V
+
+// NOTE: This macro is declared outside of the module to allow some vc
+// modules to see it and use it in their own params. Verilog does not
+// allow other modules to hierarchically reference the nbits localparam
+// inside this module in constant expressions (e.g., localparams).
+
+`define VC_TRACE_NCHARS 512
+`define VC_TRACE_NBITS  512*8
+
+module vc_Trace
+(
+  input logic clk,
+  input logic reset
+);
+
+  integer len0;
+  integer len1;
+  integer idx0;
+  integer idx1;
+
+  // NOTE: If you change these, then you also need to change the
+  // hard-coded constant in the declaration of the trace function at the
+  // bottom of this file.
+  // NOTE: You would also need to change the VC_TRACE_NBITS and
+  // VC_TRACE_NCHARS macro at the top of this file.
+
+  localparam nchars = 512;
+  localparam nbits  = 512*8;
+
+  // This is the actual trace storage used when displaying a trace
+
+  logic [nbits-1:0] storage;
+
+  // Meant to be accesible from outside module
+
+  integer cycles_next = 0;
+  integer cycles      = 0;
+
+  // Get trace level from command line
+
+  logic [3:0] level;
+
+`ifndef VERILATOR
+  initial begin
+    if ( !$value$plusargs( "trace=%d", level ) ) begin
+      level = 0;
+    end
+  end
+`else
+  initial begin
+    level = 1;
+  end
+`endif // !`ifndef VERILATOR
+
+  // Track cycle count
+
+  always_ff @( posedge clk ) begin
+    cycles <= ( reset ) ? 0 : cycles_next;
+  end
+
+  //----------------------------------------------------------------------
+  // append_str
+  //----------------------------------------------------------------------
+  // Appends a string to the trace.
+
+  task append_str
+  (
+    inout logic [nbits-1:0] trace,
+    input logic [nbits-1:0] str
+  );
+  begin
+
+    len0 = 1;
+    while ( str[len0*8+:8] != 0 ) begin
+      len0 = len0 + 1;
+    end
+
+    idx0 = trace[31:0];
+
+    for ( idx1 = len0-1; idx1 >= 0; idx1 = idx1 - 1 )
+    begin
+      trace[ idx0*8 +: 8 ] = str[ idx1*8 +: 8 ];
+      idx0 = idx0 - 1;
+    end
+
+    trace[31:0] = idx0;
+
+  end
+  endtask
+
+  //----------------------------------------------------------------------
+  // append_str_ljust
+  //----------------------------------------------------------------------
+  // Appends a left-justified string to the trace.
+
+  task append_str_ljust
+  (
+    inout logic [nbits-1:0] trace,
+    input logic [nbits-1:0] str
+  );
+  begin
+
+    idx0 = trace[31:0];
+    idx1 = nchars;
+
+    while ( str[ idx1*8-1 -: 8 ] != 0 ) begin
+      trace[ idx0*8 +: 8 ] = str[ idx1*8-1 -: 8 ];
+      idx0 = idx0 - 1;
+      idx1 = idx1 - 1;
+    end
+
+    trace[31:0] = idx0;
+
+  end
+  endtask
+
+  //----------------------------------------------------------------------
+  // append_chars
+  //----------------------------------------------------------------------
+  // Appends the given number of characters to the trace.
+
+  task append_chars
+  (
+    inout logic   [nbits-1:0] trace,
+    input logic         [7:0] char,
+    input integer             num
+  );
+  begin
+
+    idx0 = trace[31:0];
+
+    for ( idx1 = 0;
+          idx1 < num;
+          idx1 = idx1 + 1 )
+    begin
+      trace[idx0*8+:8] = char;
+      idx0 = idx0 - 1;
+    end
+
+    trace[31:0] = idx0;
+
+  end
+  endtask
+
+  //----------------------------------------------------------------------
+  // append_val_str
+  //----------------------------------------------------------------------
+  // Append a string modified by val signal.
+
+  task append_val_str
+  (
+    inout logic [nbits-1:0] trace,
+    input logic             val,
+    input logic [nbits-1:0] str
+  );
+  begin
+
+    len1 = 0;
+    while ( str[len1*8+:8] != 0 ) begin
+      len1 = len1 + 1;
+    end
+
+    if ( val )
+      append_str( trace, str );
+    else if ( !val )
+      append_chars( trace, " ", len1 );
+    else begin
+      append_str( trace, "x" );
+      append_chars( trace, " ", len1-1 );
+    end
+
+  end
+  endtask
+
+  //----------------------------------------------------------------------
+  // val_rdy_str
+  //----------------------------------------------------------------------
+  // Append a string modified by val/rdy signals.
+
+  task append_val_rdy_str
+  (
+    inout logic [nbits-1:0] trace,
+    input logic             val,
+    input logic             rdy,
+    input logic [nbits-1:0] str
+  );
+  begin
+
+    len1 = 0;
+    while ( str[len1*8+:8] != 0 ) begin
+      len1 = len1 + 1;
+    end
+
+    if ( rdy && val ) begin
+      append_str( trace, str );
+    end
+    else if ( rdy && !val ) begin
+      append_chars( trace, " ", len1 );
+    end
+    else if ( !rdy && val ) begin
+      append_str( trace, "#" );
+      append_chars( trace, " ", len1-1 );
+    end
+    else if ( !rdy && !val ) begin
+      append_str( trace, "." );
+      append_chars( trace, " ", len1-1 );
+    end
+    else begin
+      append_str( trace, "x" );
+      append_chars( trace, " ", len1-1 );
+    end
+
+  end
+  endtask
+
+endmodule
+
+//------------------------------------------------------------------------
+// VC_TRACE_NBITS_TO_NCHARS
+//------------------------------------------------------------------------
+// Macro to determine number of characters for a net
+
+`define VC_TRACE_NBITS_TO_NCHARS( nbits_ ) ((nbits_+3)/4)
+
+//------------------------------------------------------------------------
+// VC_TRACE_BEGIN
+//------------------------------------------------------------------------
+
+//`define VC_TRACE_BEGIN                                                  \
+//  export "DPI-C" task line_trace;                                       \
+//  vc_Trace vc_trace(clk,reset);                                         \
+//  task line_trace( inout bit [(512*8)-1:0] trace_str );
+
+`ifndef VERILATOR
+`define VC_TRACE_BEGIN                                                  \
+  vc_Trace vc_trace(clk,reset);                                         \
+                                                                        \
+  task display_trace;                                                   \
+  begin                                                                 \
+                                                                        \
+    if ( vc_trace.level > 0 ) begin                                     \
+      vc_trace.storage[15:0] = vc_trace.nchars-1;                       \
+                                                                        \
+      line_trace( vc_trace.storage );                                   \
+                                                                        \
+      $write( "%4d: ", vc_trace.cycles );                               \
+                                                                        \
+      vc_trace.idx0 = vc_trace.storage[15:0];                           \
+      for ( vc_trace.idx1 = vc_trace.nchars-1;                          \
+            vc_trace.idx1 > vc_trace.idx0;                              \
+            vc_trace.idx1 = vc_trace.idx1 - 1 )                         \
+      begin                                                             \
+        $write( "%s", vc_trace.storage[vc_trace.idx1*8+:8] );           \
+      end                                                               \
+      $write("\n");                                                     \
+                                                                        \
+    end                                                                 \
+                                                                        \
+    vc_trace.cycles_next = vc_trace.cycles + 1;                         \
+                                                                        \
+  end                                                                   \
+  endtask                                                               \
+                                                                        \
+  task line_trace( inout bit [(512*8)-1:0] trace_str );
+`else
+`define VC_TRACE_BEGIN                                                  \
+  export "DPI-C" task line_trace;                                       \
+  vc_Trace vc_trace(clk,reset);                                         \
+  task line_trace( inout bit [(512*8)-1:0] trace_str );
+`endif
+
+//------------------------------------------------------------------------
+// VC_TRACE_END
+//------------------------------------------------------------------------
+
+`define VC_TRACE_END \
+  endtask
+
+`endif /* VC_TRACE_V */
+
+`line 2 "VRegTrace.v" 0
+
+module test_VRegTrace(
+  input  logic          clk,
+  input  logic          reset,
+  output logic [32-1:0] q,
+  input  logic [32-1:0] d
+);
+  always_ff @(posedge clk) begin
+    q <= d;
+  end
+
+  logic [`VC_TRACE_NBITS-1:0] str;
+  logic [512*8-1:0] q_str;
+  `VC_TRACE_BEGIN
+  begin
+    /* $display("q = %d\n", q); */
+    $sformat(q_str, "%d", q);
+    vc_trace.append_str( trace_str, "q = " );
+    vc_trace.append_str( trace_str, q_str );
+  end
+  `VC_TRACE_END
+
+endmodule
+
+`endif /* VREGTRACE */
+//-----------------------------------------------------------
+// Wrapper of placeholder VRegTrace_noparam
+//-----------------------------------------------------------
+
+`ifndef VREGTRACE_NOPARAM
+`define VREGTRACE_NOPARAM
+
+module VRegTrace_noparam
+(
+  input logic [1-1:0] clk ,
+  input logic [32-1:0] d ,
+  output logic [32-1:0] q ,
+  input logic [1-1:0] reset 
+);
+  test_VRegTrace
+  #(
+  ) v
+  (
+    .clk( clk ),
+    .d( d ),
+    .q( q ),
+    .reset( reset )
+  );
+endmodule
+
+`endif /* VREGTRACE_NOPARAM */
+
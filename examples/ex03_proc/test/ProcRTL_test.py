@@ -14,6 +14,9 @@ import pytest
 from examples.ex03_proc.ProcRTL import ProcRTL
 from pymtl3 import *
 
+from . import inst_lw, inst_sw
+from .harness import TestHarness, assemble
+
 random.seed(0xdeadbeef)
 
 
@@ -30,3 +33,37 @@ class ProcRTL_Tests( BaseTests ):
   @classmethod
   def setup_class( cls ):
     cls.ProcType = ProcRTL
+
+#-------------------------------------------------------------------------
+# Fast-forward
+#-------------------------------------------------------------------------
+# With a long memory latency the processor mostly waits for the memory,
+# and sim_fast_forward skips these cycles without changing the outcome.
+
+def _mk_harness( gen_test ):
+  th = TestHarness( ProcRTL, mem_latency=50 )
+  th.elaborate()
+  th.load( assemble( gen_test() ) )
+  th.apply( DefaultPassGroup(linetrace=False) )
+  th.sim_reset()
+  return th
+
+def _state( th ):
+  return ( th.proc.dpath.pc_reg_F.out, [ int(x) for x in th.proc.dpath.rf.regs ],
+           th.sink.idx, th.done(), th.mem.read_mem( 0x2000, 64 ) )
+
+@pytest.mark.parametrize( "gen_test", [ inst_lw.gen_basic_test, inst_sw.gen_basic_test ] )
+def test_fast_forward_mem_latency( gen_test ):
+  ref = _mk_harness( gen_test )
+  th  = _mk_harness( gen_test )
+
+  skipped = 0
+  for ncycles in [ 100, 200, 700, 1000 ]:
+    for i in range(ncycles):
+      ref.sim_tick()
+    skipped += th.sim_fast_forward( ncycles )
+    assert th.sim_cycle_count() == ref.sim_cycle_count()
+    assert _state( th ) == _state( ref )
+
+  assert ref.done()
+  assert skipped > 1000
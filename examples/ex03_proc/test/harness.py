@@ -9,11 +9,10 @@ Author : Shunning Jiang
   Date : June 15, 2019
 """
 
-import struct
-
 from examples.ex03_proc.NullXcel import NullXcelRTL
 from examples.ex03_proc.tinyrv0_encoding import assemble
 from pymtl3 import *
+from pymtl3.datatypes import bits_from_buffer
 from pymtl3.stdlib.mem.MagicMemoryCL import MagicMemoryCL, mk_mem_msg
 from pymtl3.stdlib.connects import connect_pairs
 from pymtl3.stdlib.test_utils import TestSinkCL, TestSrcCL
@@ -95,12 +94,12 @@ class TestHarness(Component):
       # For .mngr2proc sections, copy section into mngr2proc src
 
       if section.name == ".mngr2proc":
-        self.src.msgs.extend(Bits32(bits[0]) for bits in struct.iter_unpack("<I", section.data))
+        self.src.msgs.extend( bits_from_buffer( Bits32, section.data ) )
 
       # For .proc2mngr sections, copy section into proc2mngr_ref src
 
       elif section.name == ".proc2mngr":
-        self.sink.msgs.extend(Bits32(bits[0]) for bits in struct.iter_unpack("<I", section.data))
+        self.sink.msgs.extend( bits_from_buffer( Bits32, section.data ) )
 
       # For all other sections, simply copy them into the memory
 
@@ -1,5 +1,20 @@
-from .datatypes import *
-from .datatypes import _bitwidths
+from . import datatypes
+from .datatypes import (
+    Bits,
+    BitsArray,
+    _bitwidths,
+    bitstruct,
+    clog2,
+    concat,
+    mk_bits,
+    mk_bitstruct,
+    reduce_and,
+    reduce_or,
+    reduce_xor,
+    sext,
+    trunc,
+    zext,
+)
 from .dsl.Component import Component
 from .dsl.ComponentLevel1 import update
 from .dsl.ComponentLevel2 import update_ff
@@ -39,7 +54,17 @@ __all__ = [
   'Component', 'Placeholder', 'MetadataKey',
 
   'trunc', 'sext', 'zext', 'clog2', 'concat', 'reduce_and', 'reduce_or', 'reduce_xor',
-  'mk_bits', 'Bits',
+  'mk_bits', 'Bits', 'BitsArray',
   'mk_bitstruct', 'bitstruct',
 ] + [ "Bits{}".format(x) for x in _bitwidths ] \
   + [ "b{}".format(x) for x in _bitwidths ]
+
+# BitsN/bN are generated on first access, see datatypes/bits_import.py.
+# Note that "from pymtl3 import *" generates all of the BitsN/bN in
+# __all__, which adds about half of the time of the plain import. Run
+# datatypes/test/import_perf_test.py directly to print the import times.
+def __getattr__( name ):
+  try:
+    return getattr( datatypes, name )
+  except AttributeError:
+    raise AttributeError( f"module {__name__!r} has no attribute {name!r}" ) from None
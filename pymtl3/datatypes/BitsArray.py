@@ -0,0 +1,266 @@
+"""
+========================================================================
+BitsArray.py
+========================================================================
+An array of n Bits values of the same bitwidth stored in one flat
+buffer. Values of up to 64 bits are kept in an array.array, wider ones
+in a list of ints. Compared to a list of n Bits objects, a register
+file or a ROM costs one object, and <<= into any of the elements is
+committed for the whole array by a single _flip.
+
+Indexing returns a view of the element (see _ElemView below) which is
+a BitsN object in every respect, so a[i] @= v and a[i] <<= v write
+through to the buffers. Slicing returns a new BitsArray. from_buffer/tobytes convert from and to
+the buffer layout of buffers.py without creating any Bits objects.
+
+For example,
+
+  a = BitsArray( 32, 1024 )
+  a[3] <<= 5
+  a._flip()
+  assert a[3] == 5
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+from array import array
+
+from .bits_import import Bits, mk_bits
+from .buffers import _bytes_to_uints, _check_range, _uints_to_bytes
+
+object_new = object.__new__
+
+#-------------------------------------------------------------------------
+# Element views
+#-------------------------------------------------------------------------
+# A view has the same class as the element type as far as anyone can
+# tell, but reads and writes _uint/_next from the buffers of the parent
+# array, so all the Bits methods work on it unmodified.
+
+class _ElemView:
+  __slots__ = ()
+
+  def _get_uint( self ):
+    return self._parent._data[ self._idx ]
+
+  def _set_uint( self, v ):
+    self._parent._data[ self._idx ] = v
+
+  def _get_next( self ):
+    return self._parent._next[ self._idx ]
+
+  def _set_next( self, v ):
+    self._parent._next[ self._idx ] = v
+
+  _uint = property( _get_uint, _set_uint )
+  _next = property( _get_next, _set_next )
+
+_view_classes = {}
+
+def _mk_view_class( Type ):
+  if Type not in _view_classes:
+    _view_classes[ Type ] = type( Type.__name__, ( _ElemView, Type ), {
+      '__slots__'   : ( '_parent', '_idx' ),
+      '_nbits'      : Type.nbits,
+      '__class__'   : property( lambda self: Type ),
+      '__module__'  : Type.__module__,
+      '__qualname__': Type.__qualname__,
+    })
+  return _view_classes[ Type ]
+
+# The smallest array.array typecode that fits nbits, None for a list
+def _typecode( nbits ):
+  for code in "BHILQ":
+    if array( code ).itemsize * 8 >= nbits:
+      return code
+  return None
+
+#-------------------------------------------------------------------------
+# BitsArray
+#-------------------------------------------------------------------------
+
+class BitsArray:
+  __slots__ = ( "_Type", "_n", "_data", "_next", "_view" )
+
+  def __init__( self, nbits, n, v=0 ):
+    Type = nbits if isinstance( nbits, type ) else mk_bits( nbits )
+    n    = int(n)
+    if n < 1:
+      raise ValueError( f"BitsArray needs at least one element, not {n}" )
+
+    self._Type = Type
+    self._n    = n
+    self._view = _mk_view_class( Type )
+
+    code = _typecode( Type.nbits )
+    if code is None:
+      self._data = [ 0 ] * n
+    else:
+      self._data = array( code, bytes( array( code ).itemsize * n ) )
+
+    if isinstance( v, (int, Bits) ):
+      uint = Type( v )._uint
+      if uint:
+        for i in range(n):
+          self._data[i] = uint
+    else:
+      self @= v
+
+    self._next = self._data[:]
+
+  @property
+  def nbits( self ):
+    return self._Type.nbits
+
+  @property
+  def Type( self ):
+    return self._Type
+
+  def __len__( self ):
+    return self._n
+
+  # Element access
+
+  def _get_view( self, i ):
+    ret = object_new( self._view )
+    ret._parent = self
+    ret._idx    = i
+    return ret
+
+  def _index( self, idx ):
+    i = int(idx)
+    if i < 0 or i >= self._n:
+      raise IndexError( f"Invalid access: [{i}] in a BitsArray of {self._n} elements" )
+    return i
+
+  def __getitem__( self, idx ):
+    if isinstance( idx, slice ):
+      ret = object_new( BitsArray )
+      ret._Type = self._Type
+      ret._view = self._view
+      ret._data = self._data[ idx ]
+      ret._next = self._next[ idx ]
+      ret._n    = len( ret._data )
+      return ret
+    return self._get_view( self._index( idx ) )
+
+  def __setitem__( self, idx, v ):
+    if isinstance( idx, slice ):
+      indices = range( *idx.indices( self._n ) )
+      if len(v) != len(indices):
+        raise ValueError( f"Cannot assign {len(v)} values to a slice of {len(indices)} elements" )
+      for i, x in zip( indices, v ):
+        self._get_view( i ).__imatmul__( x )
+      return
+
+    i = self._index( idx )
+    # a[i] @= v and a[i] <<= v end up here with the view they wrote to
+    if type(v) is self._view and v._parent is self and v._idx == i:
+      return
+    self._get_view( i ).__imatmul__( v )
+
+  def __iter__( self ):
+    for i in range( self._n ):
+      yield self._get_view( i )
+
+  # PyMTL simulation specific. Bulk assignments take another BitsArray
+  # of the same shape or any iterable of n values.
+
+  def _check_shape( self, v, op ):
+    if isinstance( v, BitsArray ):
+      if v._Type.nbits != self._Type.nbits or v._n != self._n:
+        raise ValueError( f"Shape of LHS must be equal to RHS during {op} assignment, but here "
+                          f"LHS is {self._n} x Bits{self.nbits} and RHS is {v._n} x Bits{v.nbits}" )
+      return True
+    if len(v) != self._n:
+      raise ValueError( f"Cannot {op} assign {len(v)} values to a BitsArray of {self._n} elements" )
+    return False
+
+  def __imatmul__( self, v ):
+    if self._check_shape( v, "@=" ):
+      self._data[:] = v._data
+    else:
+      for i, x in enumerate( v ):
+        self._get_view( i ).__imatmul__( x )
+    return self
+
+  def __ilshift__( self, v ):
+    if self._check_shape( v, "<<=" ):
+      self._next[:] = v._data
+    else:
+      for i, x in enumerate( v ):
+        self._get_view( i ).__ilshift__( x )
+    return self
+
+  def _flip( self ):
+    self._data[:] = self._next
+
+  def clone( self ):
+    ret = object_new( BitsArray )
+    ret._Type = self._Type
+    ret._n    = self._n
+    ret._view = self._view
+    ret._data = self._data[:]
+    ret._next = self._next[:]
+    return ret
+
+  def __deepcopy__( self, memo ):
+    return self.clone()
+
+  @classmethod
+  def from_buffer( cls, nbits, buf ):
+    """Create a BitsArray from a buffer in the layout of bits_to_buffer
+    (see buffers.py)."""
+    Type  = nbits if isinstance( nbits, type ) else mk_bits( nbits )
+    uints = _bytes_to_uints( Type.nbits, buf )
+    if not uints:
+      raise ValueError( "BitsArray needs at least one element, not an empty buffer" )
+    _check_range( Type.nbits, uints )
+
+    ret = object_new( BitsArray )
+    ret._Type = Type
+    ret._n    = len(uints)
+    ret._view = _mk_view_class( Type )
+    code = _typecode( Type.nbits )
+    ret._data = uints if code is None else array( code, uints )
+    ret._next = ret._data[:]
+    return ret
+
+  # Export
+
+  def tolist( self ):
+    return list( self._data )
+
+  def tobytes( self ):
+    """Return the current values in the layout of bits_to_buffer."""
+    return _uints_to_bytes( self._Type.nbits, self._data )
+
+  def buffer( self ):
+    """Return a memoryview of the current values without copying them.
+    Only arrays of up to 64-bit values have a buffer."""
+    if isinstance( self._data, list ):
+      raise TypeError( f"BitsArray of Bits{self.nbits} is stored as a list of ints and has no buffer" )
+    return memoryview( self._data )
+
+  # Comparisons
+
+  def __eq__( self, other ):
+    if isinstance( other, BitsArray ):
+      return self._Type.nbits == other._Type.nbits and list(self._data) == list(other._data)
+    try:
+      return len(other) == self._n and all( x == y for x, y in zip( self, other ) )
+    except (TypeError, ValueError):
+      return False
+
+  def __ne__( self, other ):
+    return not self.__eq__( other )
+
+  __hash__ = None
+
+  # Print
+
+  def __repr__( self ):
+    return f"BitsArray({self.nbits}, {self._n}, [{', '.join( str(x) for x in self )}])"
+
+  def __str__( self ):
+    return f"[{', '.join( str(x) for x in self )}]"
@@ -4,6 +4,10 @@ Bits.py
 ========================================================================
 Pure-Python implementation of fixed-bitwidth data type.
 
+Single-bit slices and comparison results are interned, immutable
+ConstBits objects, and const_bits() hands out interned constants of
+small values for every bitwidth, so hot paths don't allocate them.
+
 Author : Shunning Jiang
 Date   : Oct 31, 2017
 """
@@ -139,14 +143,16 @@ class Bits:
 
       # Bypass check
       nbits = stop - start
-      return _new_valid_bits( stop-start, (self._uint >> start) & _upper[nbits] )
+      if nbits == 1:
+        return _b1_consts[ (self._uint >> start) & 1 ]
+      return _new_valid_bits( nbits, (self._uint >> start) & _upper[nbits] )
 
     i = int(idx)
     if i >= self._nbits or i < 0:
       raise IndexError( f"Invalid access: [{i}] in a Bits{self._nbits} instance" )
 
     # Bypass check
-    return _new_valid_bits( 1, (self._uint >> i) & 1 )
+    return _b1_consts[ (self._uint >> i) & 1 ]
 
   def __setitem__( self, idx, v ):
     sv = int(self._uint)
@@ -403,17 +409,17 @@ class Bits:
       if other.nbits != nbits:
         raise ValueError( f"Operands of '==' (eq) operation must have matching bitwidth, "\
                           f"but here Bits{nbits} != Bits{other.nbits}.\n" )
-      return _new_valid_bits( 1, self._uint == other._uint )
+      return _b1_consts[ self._uint == other._uint ]
     except AttributeError:
       try:
         other = int(other)
       except:
-        return _new_valid_bits( 1, 0 )
+        return _b1_consts[ 0 ]
 
       if other < 0 or other > _upper[ nbits ]:
         raise ValueError( f"Integer {hex(other)} is not a valid binop operand with Bits{nbits}!\n"
                           f"Suggestion: 0 <= x <= {hex(_upper[ nbits ])}" )
-      return _new_valid_bits( 1, self._uint == other )
+      return _b1_consts[ self._uint == other ]
 
   def __ne__( self, other ):
     nbits = self._nbits
@@ -421,17 +427,17 @@ class Bits:
       if other.nbits != nbits:
         raise ValueError( f"Operands of '!=' (ne) operation must have matching bitwidth, "\
                           f"but here Bits{nbits} != Bits{other.nbits}.\n" )
-      return _new_valid_bits( 1, self._uint != other._uint )
+      return _b1_consts[ self._uint != other._uint ]
     except AttributeError:
       try:
         other = int(other)
       except:
-        return _new_valid_bits( 1, 1 )
+        return _b1_consts[ 1 ]
 
       if other < 0 or other > _upper[ nbits ]:
         raise ValueError( f"Integer {hex(other)} is not a valid binop operand with Bits{nbits}!\n"
                           f"Suggestion: 0 <= x <= {hex(_upper[ nbits ])}" )
-      return _new_valid_bits( 1, self._uint != other )
+      return _b1_consts[ self._uint != other ]
 
   def __lt__( self, other ):
     nbits = self._nbits
@@ -439,13 +445,13 @@ class Bits:
       if other.nbits != nbits:
         raise ValueError( f"Operands of '<' (lt) operation must have matching bitwidth, "\
                           f"but here Bits{nbits} != Bits{other.nbits}.\n" )
-      return _new_valid_bits( 1, self._uint < other._uint )
+      return _b1_consts[ self._uint < other._uint ]
     except AttributeError:
       other = int(other)
       if other < 0 or other > _upper[ self._nbits ]:
         raise ValueError( f"Integer {hex(other)} is not a valid binop operand with Bits{self._nbits}!\n"
                           f"Suggestion: 0 <= x <= {hex(_upper[ self._nbits ])}" )
-      return _new_valid_bits( 1, self._uint < other )
+      return _b1_consts[ self._uint < other ]
 
   def __le__( self, other ):
     nbits = self._nbits
@@ -453,13 +459,13 @@ class Bits:
       if other.nbits != nbits:
         raise ValueError( f"Operands of '<=' (le) operation must have matching bitwidth, "\
                           f"but here Bits{nbits} != Bits{other.nbits}.\n" )
-      return _new_valid_bits( 1, self._uint <= other._uint )
+      return _b1_consts[ self._uint <= other._uint ]
     except AttributeError:
       other = int(other)
       if other < 0 or other > _upper[ self._nbits ]:
         raise ValueError( f"Integer {hex(other)} is not a valid binop operand with Bits{self._nbits}!\n"
                           f"Suggestion: 0 <= x <= {hex(_upper[ self._nbits ])}" )
-      return _new_valid_bits( 1, self._uint <= other )
+      return _b1_consts[ self._uint <= other ]
 
   def __gt__( self, other ):
     nbits = self._nbits
@@ -467,13 +473,13 @@ class Bits:
       if other.nbits != nbits:
         raise ValueError( f"Operands of '>' (gt) operation must have matching bitwidth, "\
                           f"but here Bits{nbits} != Bits{other.nbits}.\n" )
-      return _new_valid_bits( 1, self._uint > other._uint )
+      return _b1_consts[ self._uint > other._uint ]
     except AttributeError:
       other = int(other)
       if other < 0 or other > _upper[ self._nbits ]:
         raise ValueError( f"Integer {hex(other)} is not a valid binop operand with Bits{self._nbits}!\n"
                           f"Suggestion: 0 <= x <= {hex(_upper[ self._nbits ])}" )
-      return _new_valid_bits( 1, self._uint > other )
+      return _b1_consts[ self._uint > other ]
 
   def __ge__( self, other ):
     nbits = self._nbits
@@ -481,13 +487,13 @@ class Bits:
       if other.nbits != nbits:
         raise ValueError( f"Operands of '>=' (ge) operation must have matching bitwidth, "\
                           f"but here Bits{nbits} != Bits{other.nbits}.\n" )
-      return _new_valid_bits( 1, self._uint >= other._uint )
+      return _b1_consts[ self._uint >= other._uint ]
     except AttributeError:
       other = int(other)
       if other < 0 or other > _upper[ self._nbits ]:
         raise ValueError( f"Integer {hex(other)} is not a valid binop operand with Bits{self._nbits}!\n"
                           f"Suggestion: 0 <= x <= {hex(_upper[ self._nbits ])}" )
-      return _new_valid_bits( 1, self._uint >= other )
+      return _b1_consts[ self._uint >= other ]
 
   def __bool__( self ):
     return self._uint != 0
@@ -529,3 +535,136 @@ class Bits:
   def hex( self ):
     str = "{:x}".format(int(self._uint)).zfill(((self._nbits-1)//4)+1)
     return "0x"+str
+
+#-------------------------------------------------------------------------
+# Immutable constants
+#-------------------------------------------------------------------------
+# ConstBits objects are shared, so they can never be modified in place.
+# @= and <<= return a fresh mutable copy instead, just like += on an int
+# rebinds the name. This keeps `s.x[i] @= v` working, since Python
+# evaluates it as s.x[i] = s.x[i].__imatmul__( v ).
+
+class _ImmutableBits:
+  __slots__ = ()
+
+  def _mutable_copy( self ):
+    ret = object_new( self._mutable_type )
+    ret._nbits = self._nbits
+    ret._uint  = self._uint
+    return ret
+
+  def __ilshift__( self, v ):
+    return self._mutable_copy().__ilshift__( v )
+
+  def __imatmul__( self, v ):
+    return self._mutable_copy().__imatmul__( v )
+
+  def __setitem__( self, idx, v ):
+    raise TypeError( f"Cannot modify the interned constant {self!r}!\n"
+                     f"- Suggestion: use .clone() to get a mutable copy" )
+
+  def _flip( self ):
+    raise TypeError( f"Cannot use the interned constant {self!r} as a signal value!\n"
+                     f"- Suggestion: use .clone() to get a mutable copy" )
+
+class ConstBits( _ImmutableBits, Bits ):
+  __slots__ = ()
+  _mutable_type = Bits
+
+def _new_const_bits( nbits, uint ):
+  ret = object_new( ConstBits )
+  ret._nbits = nbits
+  ret._uint  = uint
+  return ret
+
+_b1_consts = ( _new_const_bits( 1, 0 ), _new_const_bits( 1, 1 ) )
+
+# Constants below this value are interned for every bitwidth
+_CONST_CACHE_LIMIT = 256
+_const_cache = { (1, 0): _b1_consts[0], (1, 1): _b1_consts[1] }
+
+def const_bits( nbits, v ):
+  """Return an immutable Bits of nbits bits holding v. Small values are
+  interned, so the same object is returned for the same nbits and v."""
+  uint = Bits( nbits, v )._uint
+  if uint >= _CONST_CACHE_LIMIT:
+    return _new_const_bits( nbits, uint )
+  key = (nbits, uint)
+  try:
+    return _const_cache[ key ]
+  except KeyError:
+    ret = _const_cache[ key ] = _new_const_bits( nbits, uint )
+    return ret
+
+#-------------------------------------------------------------------------
+# Same-width fast paths
+#-------------------------------------------------------------------------
+# bits_import.py calls _add_fast_paths on every generated BitsN class.
+# The operators of BitsN skip the checks and the try/except dispatch of
+# Bits when the other operand is also a BitsN or an in-range int, and
+# return a BitsN so that the next operation takes the fast path again.
+# Everything else falls back to the generic operators of Bits.
+
+_fast_binops = [ ('add', '+'), ('sub', '-'), ('mul', '*'), ('and', '&'),
+                 ('or', '|'), ('xor', '^'), ('rshift', '>>') ]
+_fast_cmpops = [ ('eq', '=='), ('ne', '!='), ('lt', '<'), ('le', '<='),
+                 ('gt', '>'), ('ge', '>=') ]
+
+def _gen_fast_paths_src():
+  src = [ "def _mk_fast_paths( cls ):",
+          "  nbits = cls.nbits",
+          "  mask  = _upper[ nbits ]" ]
+
+  for name, op in _fast_binops + [ ('lshift', '<<') ]:
+    if name == 'lshift':
+      result = "( self._uint << other ) & mask if other < nbits else 0"
+    elif name in ('add', 'sub', 'mul'):
+      result = f"( self._uint {op} other ) & mask"
+    else:
+      result = f"self._uint {op} other"
+    src += [ f"  def __{name}__( self, other ):",
+             f"    if other.__class__ is cls:",
+             f"      other = other._uint",
+             f"    elif other.__class__ is not int or other < 0 or other > mask:",
+             f"      return Bits.__{name}__( self, other )",
+             f"    ret = object_new( cls )",
+             f"    ret._nbits = nbits",
+             f"    ret._uint  = {result}",
+             f"    return ret" ]
+
+  for name, op in _fast_cmpops:
+    src += [ f"  def __{name}__( self, other ):",
+             f"    if other.__class__ is cls:",
+             f"      return _b1_consts[ self._uint {op} other._uint ]",
+             f"    if other.__class__ is int and 0 <= other <= mask:",
+             f"      return _b1_consts[ self._uint {op} other ]",
+             f"    return Bits.__{name}__( self, other )" ]
+
+  src += [ "  def __invert__( self ):",
+           "    ret = object_new( cls )",
+           "    ret._nbits = nbits",
+           "    ret._uint  = self._uint ^ mask",
+           "    return ret",
+           "  return locals()" ]
+  return "\n".join( src )
+
+exec( compile( _gen_fast_paths_src(), filename="PythonBits.py:_mk_fast_paths", mode="exec" ) )
+
+def _add_fast_paths( cls ):
+  for name, fn in _mk_fast_paths( cls ).items():
+    if name.startswith( "__" ):
+      setattr( cls, name, fn )
+
+def _mk_b1_consts( b1 ):
+  """Return the interned 0/1 of the given Bits1 class. They report b1 as
+  their __class__ so that they take the fast paths of b1."""
+  cls = type( "Bits1", (_ImmutableBits, b1), {
+    "__slots__"    : (),
+    "_mutable_type": b1,
+    "__class__"    : property( lambda self: b1 ),
+  })
+  ret = ( object_new( cls ), object_new( cls ) )
+  for i, x in enumerate( ret ):
+    x._nbits = 1
+    x._uint  = i
+  return ret
@@ -0,0 +1,190 @@
+"""
+========================================================================
+UncheckedBits.py
+========================================================================
+Check-free fast paths of the pure-Python Bits for regression runs of
+designs that already passed a checked simulation. bits_import.py mixes
+UncheckedBits into every BitsN class when PYMTL_BITS_UNCHECKED=1 is set.
+
+The public API is the same as Bits, but bitwidth mismatches and out of
+range integers are not reported. Results are always truncated to the
+bitwidth of the left hand side (or of the slice), so every value still
+fits in its type. Results of the operations are BitsN objects so that
+the unchecked paths are used throughout an expression, except for
+single-bit slices and comparison results which are interned immutable
+Bits1 constants.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+from .PythonBits import Bits, _upper
+
+object_new = object.__new__
+
+# Filled in by bits_import.py
+_bits_types = {}
+_mk_bits    = None
+_b1_consts  = None
+
+def _new_bits( nbits, uint ):
+  try:
+    ret = object_new( _bits_types[ nbits ] )
+  except KeyError:
+    ret = object_new( _mk_bits( nbits ) )
+  ret._nbits = nbits
+  ret._uint  = uint
+  return ret
+
+# Every BitsN class has a _mask class attribute. Results of the same
+# bitwidth are created with object_new( self.__class__ ) which skips
+# __init__ altogether.
+
+class UncheckedBits:
+  __slots__ = ()
+
+  # PyMTL simulation specific
+
+  def __ilshift__( self, v ):
+    if isinstance( v, Bits ):
+      self._next = v._uint & self._mask
+    else:
+      try:
+        self._next = v.to_bits()._uint
+      except AttributeError:
+        self._next = int(v) & self._mask
+    return self
+
+  def __imatmul__( self, v ):
+    if isinstance( v, Bits ):
+      self._uint = v._uint & self._mask
+    else:
+      try:
+        self._uint = v.to_bits()._uint
+      except AttributeError:
+        self._uint = int(v) & self._mask
+    return self
+
+  # Slicing
+
+  def __getitem__( self, idx ):
+    if isinstance( idx, slice ):
+      start = int(idx.start or 0)
+      stop  = self._nbits if idx.stop is None else int(idx.stop)
+      nbits = stop - start
+      if nbits == 1:
+        return _b1_consts[ (self._uint >> start) & 1 ]
+      return _new_bits( nbits, (self._uint >> start) & _upper[nbits] )
+    return _b1_consts[ (self._uint >> int(idx)) & 1 ]
+
+  def __setitem__( self, idx, v ):
+    if isinstance( idx, slice ):
+      start = int(idx.start or 0)
+      stop  = self._nbits if idx.stop is None else int(idx.stop)
+      mask  = _upper[ stop - start ]
+    else:
+      start = int(idx)
+      mask  = 1
+    v = v._uint if isinstance( v, Bits ) else int(v)
+    self._uint = (self._uint & ~(mask << start)) | ((v & mask) << start)
+
+  # Arithmetics
+
+  def __add__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = (self._uint + (other._uint if isinstance( other, Bits ) else int(other))) & self._mask
+    return ret
+
+  __radd__ = __add__
+
+  def __sub__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = (self._uint - (other._uint if isinstance( other, Bits ) else int(other))) & self._mask
+    return ret
+
+  def __rsub__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = (int(other) - self._uint) & self._mask
+    return ret
+
+  def __mul__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = (self._uint * (other._uint if isinstance( other, Bits ) else int(other))) & self._mask
+    return ret
+
+  __rmul__ = __mul__
+
+  def __and__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = self._uint & (other._uint if isinstance( other, Bits ) else int(other)) & self._mask
+    return ret
+
+  __rand__ = __and__
+
+  def __or__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = (self._uint | (other._uint if isinstance( other, Bits ) else int(other))) & self._mask
+    return ret
+
+  __ror__ = __or__
+
+  def __xor__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = (self._uint ^ (other._uint if isinstance( other, Bits ) else int(other))) & self._mask
+    return ret
+
+  __rxor__ = __xor__
+
+  def __invert__( self ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = ~self._uint & self._mask
+    return ret
+
+  def __lshift__( self, other ):
+    other = other._uint if isinstance( other, Bits ) else int(other)
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = (self._uint << other) & self._mask if other < self._nbits else 0
+    return ret
+
+  def __rshift__( self, other ):
+    ret = object_new( self.__class__ )
+    ret._nbits = self._nbits
+    ret._uint  = self._uint >> (other._uint if isinstance( other, Bits ) else int(other))
+    return ret
+
+  # Comparisons return the interned Bits1 constants. Objects that cannot
+  # be converted to int are never equal to Bits.
+
+  def __eq__( self, other ):
+    if isinstance( other, Bits ):
+      return _b1_consts[ self._uint == other._uint ]
+    try:
+      return _b1_consts[ self._uint == (int(other) & self._mask) ]
+    except (TypeError, ValueError):
+      return _b1_consts[ 0 ]
+
+  def __ne__( self, other ):
+    return _b1_consts[ not self.__eq__( other )._uint ]
+
+  def __lt__( self, other ):
+    return _b1_consts[ self._uint < (other._uint if isinstance( other, Bits ) else int(other)) ]
+
+  def __le__( self, other ):
+    return _b1_consts[ self._uint <= (other._uint if isinstance( other, Bits ) else int(other)) ]
+
+  def __gt__( self, other ):
+    return _b1_consts[ self._uint > (other._uint if isinstance( other, Bits ) else int(other)) ]
+
+  def __ge__( self, other ):
+    return _b1_consts[ self._uint >= (other._uint if isinstance( other, Bits ) else int(other)) ]
+
+  # Defining __eq__ resets __hash__
+  __hash__ = Bits.__hash__
@@ -1,4 +1,20 @@
-from .bits_import import *
-from .bits_import import _bitwidths
+from . import bits_import
+from .bits_import import Bits, _bitwidths, const_bits, mk_bits
+from .BitsArray import BitsArray
 from .bitstructs import bitstruct, is_bitstruct_class, is_bitstruct_inst, mk_bitstruct
+from .buffers import bits_from_buffer, bits_from_ints, bits_to_buffer, bits_to_numpy
 from .helpers import clog2, concat, reduce_and, reduce_or, reduce_xor, sext, trunc, zext
+
+__all__ = [
+  'Bits', 'BitsArray', 'mk_bits', 'const_bits',
+  'bitstruct', 'mk_bitstruct', 'is_bitstruct_class', 'is_bitstruct_inst',
+  'bits_from_buffer', 'bits_from_ints', 'bits_to_buffer', 'bits_to_numpy',
+  'clog2', 'concat', 'reduce_and', 'reduce_or', 'reduce_xor', 'sext', 'trunc', 'zext',
+] + [ f"Bits{x}" for x in _bitwidths ] + [ f"b{x}" for x in _bitwidths ]
+
+# BitsN/bN are generated on first access, see bits_import.py
+def __getattr__( name ):
+  try:
+    return getattr( bits_import, name )
+  except AttributeError:
+    raise AttributeError( f"module {__name__!r} has no attribute {name!r}" ) from None
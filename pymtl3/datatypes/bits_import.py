@@ -5,13 +5,27 @@ bits_import.py
 Import RPython Bits from PyPy mamba module if the environment variable
 that forces the use of Python Bits is set, and there is actually an
 importable Bits in mamba module. Otherwise import the Pure-Python
-implementation in Bits.py. Then generate a bunch of fixed-width BitsN
-types for PyMTL use.
+implementation in Bits.py. The fixed-width BitsN types for PyMTL use are
+generated on first access, either through mk_bits or as the module
+attributes BitsN/bN of the predefined bitwidths, so that importing
+pymtl3 does not pay for hundreds of classes a design never uses. A star
+import still generates all of the predefined ones, since every BitsN/bN
+name is in __all__. The pure-Python BitsN types get operators with a
+fast path for operands of the same BitsN type (see PythonBits.py).
+
+If PYMTL_BITS_UNCHECKED=1 is set, the BitsN types are generated on top
+of the pure-Python Bits with the check-free fast paths in
+UncheckedBits.py. This is meant for regression runs of designs that
+already passed a checked simulation.
+
+const_bits( nbits, v ) returns an immutable, interned constant when the
+pure-Python Bits is used, and a regular Bits object otherwise.
 
 Author : Shunning Jiang
 Date   : Aug 23, 2018
 """
 import os
+import re
 
 from pymtl3.extra.pypy import custom_exec
 
@@ -22,8 +36,25 @@ from pymtl3.extra.pypy import custom_exec
   # def __new__( cls, value = 0 ):
     # return Bits( {nbits}, value )
 
-if os.getenv("PYMTL_BITS") == "1":
+_bits_unchecked = os.getenv("PYMTL_BITS_UNCHECKED") == "1"
+
+if _bits_unchecked:
   from .PythonBits import Bits
+  from .UncheckedBits import UncheckedBits as _UncheckedBits
+
+  # print("[env: PYMTL_BITS_UNCHECKED=1] Use unchecked Python Bits")
+  bits_template = """
+class Bits{0}(_UncheckedBits, Bits):
+  __slots__ = ( "_nbits", "_uint", "_next" )
+  nbits = {0}
+  _mask = {1}
+  def __init__( s, v=0, *, trunc_int=False ):
+    s._nbits = {0}
+    s._uint  = int(v) & {1}
+_bits_types[{0}] = b{0} = Bits{0}
+"""
+elif os.getenv("PYMTL_BITS") == "1":
+  from .PythonBits import Bits, _add_fast_paths
 
   # print("[env: PYMTL_BITS=1] Use Python Bits")
   bits_template = """
@@ -32,6 +63,7 @@ class Bits{0}(Bits):
   nbits = {0}
   def __init__( s, v=0, *, trunc_int=False ):
     return super().__init__( {0}, v, trunc_int )
+_add_fast_paths( Bits{0} )
 _bits_types[{0}] = b{0} = Bits{0}
 """
 else:
@@ -47,7 +79,7 @@ class Bits{0}(Bits):
 _bits_types[{0}] = b{0} = Bits{0}
 """
   except ImportError:
-    from .PythonBits import Bits
+    from .PythonBits import Bits, _add_fast_paths
 
     # print("[default w/o Mamba] Use Python Bits")
     # The action of a __slots__ declaration is limited to the class where it is defined.
@@ -58,19 +90,56 @@ class Bits{0}(Bits):
   nbits = {0}
   def __init__( s, v=0, *, trunc_int=False ):
     return super().__init__( {0}, v, trunc_int )
+_add_fast_paths( Bits{0} )
 _bits_types[{0}] = b{0} = Bits{0}
 """
 
 _bitwidths  = list(range(1, 256)) + [ 384, 512 ]
 _bits_types = dict()
 
-custom_exec(compile( "".join([ bits_template.format(nbits) for nbits in _bitwidths ]),
-                     filename="bits_import.py", mode="exec"), globals(), locals() )
-
 def mk_bits( nbits ):
   assert nbits > 0, "We don't allow Bits0"
   # assert nbits < 512, "We don't allow bitwidth to exceed 512."
   if nbits not in _bits_types:
-    custom_exec(compile( bits_template.format(nbits), filename=f"Bits{nbits}", mode="exec" ),
+    custom_exec(compile( bits_template.format(nbits, (1 << nbits) - 1), filename=f"Bits{nbits}", mode="exec" ),
                 globals(), locals() )
   return _bits_types[nbits]
+
+# BitsN/bN of the predefined bitwidths are created on first access. Once
+# created, they are regular module globals and __getattr__ is skipped.
+
+_bits_name    = re.compile( r"(?:Bits|b)([1-9][0-9]*)" )
+_bitwidth_set = set( _bitwidths )
+
+def __getattr__( name ):
+  m = _bits_name.fullmatch( name )
+  if m and int( m.group(1) ) in _bitwidth_set:
+    return mk_bits( int( m.group(1) ) )
+  raise AttributeError( f"module {__name__!r} has no attribute {name!r}" )
+
+# "from pymtl3.datatypes.bits_import import *" still provides all of
+# them, at the cost of generating them all
+__all__ = [ 'Bits', 'mk_bits', 'const_bits' ] + \
+          [ f"Bits{x}" for x in _bitwidths ] + [ f"b{x}" for x in _bitwidths ]
+
+if _bits_unchecked:
+  from . import UncheckedBits as _unchecked
+  from .PythonBits import _mk_b1_consts, const_bits
+
+  _unchecked._bits_types = _bits_types
+  _unchecked._mk_bits    = mk_bits
+  _unchecked._b1_consts  = _mk_b1_consts( mk_bits(1) )
+
+elif Bits.__module__ == "pymtl3.datatypes.PythonBits":
+  from . import PythonBits as _py
+  from .PythonBits import const_bits
+
+  # Comparison results and single-bit slices are b1 so that logic on
+  # them takes the fast paths as well
+  _py._b1_consts = _py._mk_b1_consts( mk_bits(1) )
+  _py._const_cache[ (1, 0) ], _py._const_cache[ (1, 1) ] = _py._b1_consts
+
+else:
+  # Mamba Bits don't have an immutable flavor
+  def const_bits( nbits, v ):
+    return Bits( nbits, v )
@@ -45,6 +45,17 @@ class Pixel:
   def __str__( self ):
     return f'({self.r},{self.g},{self.b})'
 
+@bitstruct( packed=True ) and mk_bitstruct( ..., packed=True ) create a
+bit struct that is backed by a single integer instead of one Bits object
+per field (see _PackedView below).
+
+Point.from_bits( bits, lazy=True ) returns a Point that decodes each
+field from bits only when the field is first accessed (see _LazyField
+below).
+
+Point.pack_many( points ) and Point.unpack_many( buf ) convert a whole
+sequence of points from and to a contiguous buffer (see buffers.py).
+
 Author : Yanghui Ou, Shunning Jiang
   Date : Oct 19, 2019
 """
@@ -58,7 +69,8 @@ import py
 
 from pymtl3.extra.pypy import custom_exec
 
-from .bits_import import *
+from .bits_import import Bits
+from .buffers import bits_from_buffer, bits_to_buffer
 from .helpers import concat
 
 #-------------------------------------------------------------------------
@@ -460,7 +472,9 @@ def _mk_nbits_to_bits_fn( fields ):
 # and instance method _from_bits that copies the value over
 #
 # @staticmethod
-# def from_bits( other ):
+# def from_bits( other, lazy=False ):
+#   if lazy:
+#     return _lazy_new( cls, int(other) )
 #   return self.__class__( other[16:32], other[0:16] )
 
 def _mk_from_bits_fns( fields, total_nbits ):
@@ -513,11 +527,353 @@ def _mk_from_bits_fns( fields, total_nbits ):
   _globals = { y: x for x,y in type_name_mapping.items() }
   assert len(_globals) == len(type_name_mapping)
 
+  _globals['_lazy_new'] = _lazy_new
+
   # TODO add assertion in bits
-  return _create_fn( 'from_bits', [ 'cls', 'other' ],
+  return _create_fn( 'from_bits', [ 'cls', 'other', 'lazy=False' ],
                      [ "assert cls.nbits == other.nbits, f'LHS bitstruct {cls.nbits}-bit <> RHS other {other.nbits}-bit'",
                        "other = other.to_bits()",
+                       "if lazy:",
+                       "  return _lazy_new( cls, int(other) )",
                        f"return cls({','.join(from_bits_strs)})" ], _globals )
+
+#-------------------------------------------------------------------------
+# Lazy from_bits
+#-------------------------------------------------------------------------
+# from_bits( bits, lazy=True ) returns an instance of a subclass of the
+# bitstruct that only keeps the integer value in _lazy_uint. A field is
+# decoded by a _LazyField (a non-data descriptor) on its first access and
+# then cached in the instance __dict__, so later reads and writes of the
+# field are plain attribute accesses. Nested bitstructs are decoded
+# lazily as well. The subclass reports the bitstruct as its __class__,
+# and clone/deepcopy/pickle produce a regular instance.
+
+class _LazyField:
+  __slots__ = ( 'name', 'decode' )
+
+  def __init__( self, name, decode ):
+    self.name   = name
+    self.decode = decode
+
+  def __get__( self, obj, objtype=None ):
+    if obj is None:
+      return self
+    d = obj.__dict__
+    ret = d[ self.name ] = self.decode( d['_lazy_uint'] )
+    return ret
+
+def _mk_lazy_decoder( type_, lo ):
+  if isinstance( type_, list ):
+    n = _packed_nbits( type_[0] )
+    decoders = [ _mk_lazy_decoder( type_[0], lo + i*n ) for i in range(len(type_)) ]
+    return lambda uint: [ f( uint ) for f in decoders ]
+
+  mask = ( 1 << type_.nbits ) - 1
+  if is_bitstruct_class( type_ ):
+    return lambda uint: _lazy_new( type_, ( uint >> lo ) & mask )
+  return lambda uint: type_( ( uint >> lo ) & mask )
+
+def _lazy_reduce_ex( self, protocol ):
+  return self.clone().__reduce_ex__( protocol )
+
+_lazy_classes = {}
+
+def _lazy_new( cls, uint ):
+  try:
+    lazy_cls = _lazy_classes[ cls ]
+  except KeyError:
+    if '_lazy_base' in cls.__dict__:
+      lazy_cls = cls
+    else:
+      ns = {
+        '_lazy_base'   : cls,
+        '__class__'    : property( lambda self: cls ),
+        '__reduce_ex__': _lazy_reduce_ex,
+        '__module__'   : cls.__module__,
+        '__qualname__' : cls.__qualname__,
+      }
+      hi = cls.nbits
+      for name, type_ in getattr( cls, _FIELDS ).items():
+        hi -= _packed_nbits( type_ )
+        ns[ name ] = _LazyField( name, _mk_lazy_decoder( type_, hi ) )
+      lazy_cls = type( cls.__name__, (cls,), ns )
+    _lazy_classes[ cls ] = lazy_cls
+
+  ret = object.__new__( lazy_cls )
+  ret._lazy_uint = uint
+  return ret
+#-------------------------------------------------------------------------
+# Packed bitstructs
+#-------------------------------------------------------------------------
+# A packed bitstruct keeps the whole struct in a single integer _uint
+# (and _next for <<=) laid out exactly like to_bits(). This makes
+# to_bits/from_bits/@=/<<=/_flip/clone single integer operations instead
+# of one operation per field, which pays off for messages that are
+# mostly moved around as a whole.
+#
+# Reading a field returns a view, i.e., an instance of a subclass of the
+# field type whose _uint/_next read and write the corresponding bits of
+# the parent. This is what makes in-place updates such as
+# s.out.x[0:4] @= 1, s.out.y[1] <<= 2, or s.out.pt.x @= 3 work. Views
+# rely on the pure-Python Bits. Views and arrays of views report the
+# field type as their __class__ so that they are indistinguishable from
+# the field values of a regular bitstruct (e.g., when elaborating the
+# field signals of a port). A field of a packed bitstruct can be
+# BitsN, another packed bitstruct, or a (multidimensional) array of them.
+
+class _PackedView:
+  __slots__ = ()
+
+  def _get_uint( self ):
+    return ( self._parent._uint >> self._lo ) & self._mask
+
+  def _set_uint( self, v ):
+    p = self._parent
+    p._uint = ( p._uint & ~( self._mask << self._lo ) ) | ( v << self._lo )
+
+  def _get_next( self ):
+    return ( self._parent._next >> self._lo ) & self._mask
+
+  def _set_next( self, v ):
+    p = self._parent
+    try:
+      cur = p._next
+    except AttributeError:
+      cur = p._uint
+    p._next = ( cur & ~( self._mask << self._lo ) ) | ( v << self._lo )
+
+  _uint = property( _get_uint, _set_uint )
+  _next = property( _get_next, _set_next )
+
+# Arrays are lists of views. Assigning an element writes the value
+# through the view instead of replacing the view in the list.
+
+class _PackedList( list ):
+  __slots__ = ()
+
+  @property
+  def __class__( self ):
+    return list
+
+  def __setitem__( self, idx, v ):
+    if isinstance( idx, slice ):
+      for x, y in zip( self[idx], v ):
+        _assign_view( x, y )
+    else:
+      _assign_view( self[idx], v )
+
+def _assign_view( x, v ):
+  if x is v: # e.g., a.y[0] @= 1 writes back the view itself
+    return
+  if isinstance( x, list ):
+    x[:] = v
+  else:
+    x @= v
+
+_packed_view_classes = {}
+
+def _mk_packed_view_class( type_ ):
+  if type_ not in _packed_view_classes:
+    _packed_view_classes[ type_ ] = type( type_.__name__, ( _PackedView, type_ ), {
+      '__slots__': ( '_parent', '_lo' ),
+      '_mask'    : ( 1 << type_.nbits ) - 1,
+      '__class__'   : property( lambda self: type_ ),
+      '__module__'  : type_.__module__,
+      '__qualname__': type_.__qualname__,
+    })
+  return _packed_view_classes[ type_ ]
+
+def _is_packed_bitstruct_class( type_ ):
+  return is_bitstruct_class( type_ ) and getattr( type_, '_packed', False )
+
+def _get_elem_type( type_ ):
+  while isinstance( type_, list ):
+    type_ = type_[0]
+  return type_
+
+def _packed_nbits( type_ ):
+  if isinstance( type_, list ):
+    return len(type_) * _packed_nbits( type_[0] )
+  return type_.nbits
+
+def _check_packed_field( cls, name, type_ ):
+  elem = _get_elem_type( type_ )
+  if not issubclass( elem, Bits ) and not _is_packed_bitstruct_class( elem ):
+    raise TypeError( "Fields of a packed BitStruct can only be BitsN, packed BitStructs, or arrays of them:\n"
+                    f"- Field '{name}' of BitStruct {cls.__name__} is annotated as {type_}.\n"
+                    f"- Suggestion: declare {elem.__name__} with @bitstruct(packed=True)" )
+
+# Pack a field value into an integer. None is the default value of
+# array and bitstruct fields.
+
+def _pack_field( type_, v ):
+  if isinstance( type_, list ):
+    if v is None:
+      return 0
+    assert len(v) == len(type_), f"Expect a list of {len(type_)} elements, got {len(v)}"
+    elem_nbits = _packed_nbits( type_[0] )
+    ret = 0
+    for i, x in enumerate( v ):
+      ret |= _pack_field( type_[0], x ) << ( i * elem_nbits )
+    return ret
+
+  if issubclass( type_, Bits ):
+    return type_( v )._uint
+
+  if v is None:
+    return 0
+  assert v.nbits == type_.nbits, f"LHS {type_.__name__} {type_.nbits}-bit <> RHS {v.nbits}-bit"
+  return v.to_bits()._uint
+
+#-------------------------------------------------------------------------
+# _mk_packed_fns
+#-------------------------------------------------------------------------
+# Creates the methods and field properties of a packed bitstruct. For
+# example, for fields x (Bits4) and y ([Bits2, Bits2]), the field x
+# occupies bits [4:8] and we generate
+#
+# def __init__( s, x=0, y=None ):
+#   s._uint = ( _type_x(x)._uint << 4 ) | ( _pack_y(y) << 0 )
+#
+# def _get_x( self ):
+#   return _new_view0(self,4)
+#
+# where _new_view0 creates a view of Bits4 like
+#
+# def _new_view0( parent, lo ):
+#   v = _new( _view )
+#   v._nbits  = 4
+#   v._parent = parent
+#   v._lo     = lo
+#   return v
+#
+# def _set_x( self, v ):
+#   if type(v) is _view_x and v._parent is self and v._lo == 4:
+#     return # e.g., self.x @= 1 writes back the view itself
+#   self._uint = ( self._uint & -241 ) | ( _type_x(v)._uint << 4 )
+#
+# def _get_y( self ):
+#   return _PackedList([_new_view1(self,0),_new_view1(self,2)])
+#
+# def __ilshift__( self, other ):
+#   assert other.nbits == 8, ...
+#   self._next = other.to_bits()._uint
+#   return self
+#
+# def _flip( self ):
+#   self._uint = self._next
+
+def _mk_packed_fns( cls, self_name, fields ):
+  total_nbits = sum( _packed_nbits( type_ ) for type_ in fields.values() )
+
+  _globals = { '_cls': cls, '_new': object.__new__, '_Bits': Bits, '_PackedList': _PackedList }
+  init_strs  = []
+  properties = {}
+
+  # Different types may share the same name, so we number them
+  view_fn_names = {}
+
+  def _gen_new_view( elem, lo ):
+    return f"{view_fn_names[ elem ]}(self,{lo})"
+
+  def _gen_list_views( type_, lo ):
+    if isinstance( type_, list ):
+      elem_nbits = _packed_nbits( type_[0] )
+      return "_PackedList([" + ",".join( [ _gen_list_views( type_[0], lo + i * elem_nbits )
+                                           for i in range(len(type_)) ] ) + "])"
+    return _gen_new_view( type_, lo )
+
+  end_bit = total_nbits
+  for name, type_ in fields.items():
+    nbits = _packed_nbits( type_ )
+    lo    = end_bit - nbits
+    nmask = ~( ( ( 1 << nbits ) - 1 ) << lo )
+    end_bit = lo
+
+    elem = _get_elem_type( type_ )
+    view = _mk_packed_view_class( elem )
+    if elem not in view_fn_names:
+      new_view_name = view_fn_names[ elem ] = f"_new_view{len(view_fn_names)}"
+      _globals[ new_view_name ] = _create_fn( new_view_name, [ 'parent', 'lo' ], [
+        'v = _new( _view )' ] +
+        ( [ f'v._nbits = {elem.nbits}' ] if issubclass( elem, Bits ) else [] ) + [
+        'v._parent = parent',
+        'v._lo = lo',
+        'return v',
+      ], { '_new': object.__new__, '_view': view } )
+
+    if isinstance( type_, list ):
+      _globals[ f"_pack_{name}" ] = functools.partial( _pack_field, type_ )
+      init_strs.append( f"( _pack_{name}({name}) << {lo} )" )
+
+      getter = _create_fn( f'_get_{name}', [ 'self' ],
+                           [ f'return {_gen_list_views( type_, lo )}' ], _globals )
+      setter = _create_fn( f'_set_{name}', [ 'self', 'v' ], [
+        f'self._uint = ( self._uint & {nmask} ) | ( _pack_{name}(v) << {lo} )'
+      ], _globals )
+
+    else:
+      _globals[ f"_view_{name}" ] = view
+      if issubclass( type_, Bits ):
+        _globals[ f"_type_{name}" ] = type_
+        init_strs.append( f"( _type_{name}({name})._uint << {lo} )" )
+        pack_v = f"_type_{name}(v)._uint"
+      else:
+        _globals[ f"_pack_{name}" ] = functools.partial( _pack_field, type_ )
+        init_strs.append( f"( _pack_{name}({name}) << {lo} )" )
+        pack_v = f"_pack_{name}(v)"
+
+      getter = _create_fn( f'_get_{name}', [ 'self' ],
+                           [ f'return {_gen_new_view( elem, lo )}' ], _globals )
+      setter = _create_fn( f'_set_{name}', [ 'self', 'v' ], [
+        f'if type(v) is _view_{name} and v._parent is self and v._lo == {lo}:',
+         '  return',
+        f'self._uint = ( self._uint & {nmask} ) | ( {pack_v} << {lo} )',
+      ], _globals )
+
+    properties[ name ] = property( getter, setter )
+
+  assert end_bit == 0
+
+  check_nbits = f"assert other.nbits == {total_nbits}, " \
+                f"f'LHS bitstruct {total_nbits}-bit <> RHS other {{other.nbits}}-bit'"
+
+  fns = dict(
+    __init__ = _create_fn( '__init__',
+      [ self_name ] + [ _mk_init_arg( *field ) for field in fields.items() ],
+      [ f"{self_name}._uint = {' | '.join( init_strs )}" ], _globals ),
+
+    __eq__ = _create_fn( '__eq__', [ 'self', 'other' ],
+      [ 'return isinstance( other, _cls ) and self._uint == other._uint' ], _globals ),
+
+    __hash__ = _create_fn( '__hash__', [ 'self' ],
+      [ 'return hash( (_cls, self._uint) )' ], _globals ),
+
+    __ilshift__ = _create_fn( '__ilshift__', [ 'self', 'other' ],
+      [ check_nbits, 'self._next = other.to_bits()._uint', 'return self' ] ),
+
+    _flip = _create_fn( '_flip', [ 'self' ],
+      [ 'self._uint = self._next' ] ),
+
+    __imatmul__ = _create_fn( '__imatmul__', [ 'self', 'other' ],
+      [ check_nbits, 'self._uint = other.to_bits()._uint', 'return self' ] ),
+
+    clone = _create_fn( 'clone', [ 'self' ],
+      [ 'ret = _new( _cls )', 'ret._uint = self._uint', 'return ret' ], _globals ),
+
+    __deepcopy__ = _create_fn( '__deepcopy__', [ 'self', 'memo' ],
+      [ 'ret = _new( _cls )', 'ret._uint = self._uint', 'return ret' ], _globals ),
+
+    to_bits = _create_fn( 'to_bits', [ 'self' ],
+      [ f'return _Bits( {total_nbits}, self._uint )' ], _globals ),
+
+    # Fields of a packed bitstruct are always decoded on access
+    from_bits = _create_fn( 'from_bits', [ 'cls', 'other', 'lazy=False' ],
+      [ check_nbits, 'ret = _new( _cls )', 'ret._uint = other.to_bits()._uint', 'return ret' ],
+      _globals ),
+  )
+  return total_nbits, fns, properties
+
 #-------------------------------------------------------------------------
 # _check_valid_array
 #-------------------------------------------------------------------------
@@ -590,7 +946,7 @@ def _get_self_name( fields ):
 _bitstruct_hash_cache = {}
 
 def _process_class( cls, add_init=True, add_str=True, add_repr=True,
-                    add_hash=True ):
+                    add_hash=True, packed=False ):
 
   # Get annotations of the class
   cls_annotations = cls.__dict__.get('__annotations__', {})
@@ -622,7 +978,7 @@ def _process_class( cls, add_init=True, add_str=True, add_repr=True,
     hashable_fields[ a_name ] = _convert_list_to_tuple( a_type )
 
   cls._hash = _hash = hash( (cls.__name__, *tuple(hashable_fields.items()),
-                             add_init, add_str, add_repr, add_hash) )
+                             add_init, add_str, add_repr, add_hash, packed) )
 
   if _hash in _bitstruct_hash_cache:
     return _bitstruct_hash_cache[ _hash ]
@@ -633,6 +989,12 @@ def _process_class( cls, add_init=True, add_str=True, add_repr=True,
   # as bit struct.
   setattr( cls, _FIELDS, fields )
 
+  if packed:
+    for name, type_ in fields.items():
+      _check_packed_field( cls, name, type_ )
+    cls._packed = True
+    return _process_packed_class( cls, fields, add_init, add_str, add_repr, add_hash )
+
   # Add methods to the class
 
   # Create __init__. Here I follow the dataclass convention that we only
@@ -702,20 +1064,93 @@ def _process_class( cls, add_init=True, add_str=True, add_repr=True,
 
   cls.get_field_type = classmethod(get_field_type)
 
+  _add_pack_many_fns( cls )
+
   # TODO: maybe add a to_bits and from bits function.
 
   return cls
 
+#-------------------------------------------------------------------------
+# _process_packed_class
+#-------------------------------------------------------------------------
+# Add methods and field properties to a packed bitstruct class. User
+# defined __init__/__str__/__repr__/__eq__/__hash__ are respected just
+# like in _process_class.
+
+def _process_packed_class( cls, fields, add_init, add_str, add_repr, add_hash ):
+
+  reserved = [ '__ilshift__', '_flip', 'clone', '__deepcopy__', '__imatmul__', 'get_field_type' ]
+  for x in reserved:
+    assert x not in cls.__dict__, f"Currently a bitstruct cannot have {x}"
+
+  nbits, fns, properties = _mk_packed_fns( cls, _get_self_name(fields), fields )
+
+  if add_init and '__init__' not in cls.__dict__:
+    cls.__init__ = fns['__init__']
+  if add_str and '__str__' not in cls.__dict__:
+    cls.__str__ = _mk_str_fn( fields )
+  if add_repr and '__repr__' not in cls.__dict__:
+    cls.__repr__ = _mk_repr_fn( fields )
+
+  if '__eq__' not in cls.__dict__:
+    cls.__eq__ = fns['__eq__']
+  else:
+    warnings.warn( f'Overwriting {cls.__qualname__}\'s __eq__ may cause the '
+                    'translated verilog behaves differently from PyMTL '
+                    'simulation.' )
+
+  if add_hash and '__hash__' not in cls.__dict__:
+    cls.__hash__ = fns['__hash__']
+
+  for name in ( '__ilshift__', '_flip', 'clone', '__deepcopy__', '__imatmul__', 'to_bits' ):
+    setattr( cls, name, fns[ name ] )
+  cls.nbits     = nbits
+  cls.from_bits = classmethod( fns['from_bits'] )
+
+  for name, prop in properties.items():
+    setattr( cls, name, prop )
+
+  def get_field_type( cls, name ):
+    if name in cls.__bitstruct_fields__:
+      return cls.__bitstruct_fields__[ name ]
+    raise AttributeError( f"{cls} has no field '{name}'" )
+
+  cls.get_field_type = classmethod(get_field_type)
+
+  _add_pack_many_fns( cls )
+
+  return cls
+
+#-------------------------------------------------------------------------
+# _add_pack_many_fns
+#-------------------------------------------------------------------------
+# Add classmethods pack_many/unpack_many that encode/decode a whole
+# sequence of messages to/from a contiguous buffer (see buffers.py).
+
+def _pack_many( cls, msgs ):
+  return bits_to_buffer( msgs, cls )
+
+def _unpack_many( cls, buf, lazy=False ):
+  return bits_from_buffer( cls, buf, lazy )
+
+def _add_pack_many_fns( cls ):
+  assert 'pack_many' not in cls.__dict__ and 'unpack_many' not in cls.__dict__
+
+  cls.pack_many   = classmethod(_pack_many)
+  cls.unpack_many = classmethod(_unpack_many)
+
 #-------------------------------------------------------------------------
 # bitstruct
 #-------------------------------------------------------------------------
 # The actual class decorator. We add a * in the argument list so that the
-# following argument can only be used as keyword arguments.
+# following argument can only be used as keyword arguments. With
+# packed=True the bitstruct is backed by a single integer (see _PackedView).
 
-def bitstruct( _cls=None, *, add_init=True, add_str=True, add_repr=True, add_hash=True ):
+def bitstruct( _cls=None, *, add_init=True, add_str=True, add_repr=True, add_hash=True,
+               packed=False ):
 
   def wrap( cls ):
-    return _process_class( cls, add_init, add_str, add_repr )
+    return _process_class( cls, add_init, add_str, add_repr, packed=packed )
 
   # Called as @bitstruct(...)
   if _cls is None:
@@ -731,7 +1166,7 @@ def bitstruct( _cls=None, *, add_init=True, add_str=True, add_repr=True, add_has
 # TODO: should we add base parameters to support inheritence?
 
 def mk_bitstruct( cls_name, fields, *, namespace=None, add_init=True,
-                   add_str=True, add_repr=True, add_hash=True ):
+                   add_str=True, add_repr=True, add_hash=True, packed=False ):
 
   # copy namespace since  will mutate it
   namespace = {} if namespace is None else namespace.copy()
@@ -750,4 +1185,4 @@ def mk_bitstruct( cls_name, fields, *, namespace=None, add_init=True,
   namespace['__annotations__'] = annos
   cls = types.new_class( cls_name, (), {}, lambda ns: ns.update( namespace ) )
   return bitstruct( cls, add_init=add_init, add_str=add_str,
-                    add_repr=add_repr, add_hash=add_hash )
+                    add_repr=add_repr, add_hash=add_hash, packed=packed )
@@ -0,0 +1,183 @@
+"""
+========================================================================
+buffers.py
+========================================================================
+Bulk conversion between sequences of Bits/bitstructs and contiguous
+buffers, for stimulus files and golden traces with millions of entries.
+
+Every element takes the same number of bytes, little-endian: 1, 2, 4 or
+8 bytes for up to 64 bits (so the buffer has the layout of a uint8 to
+uint64 NumPy array), and ceil(nbits/8) bytes for wider types. A
+bitstruct is encoded as its to_bits() value.
+
+For example,
+
+  buf  = bits_to_buffer( [ Bits8(1), Bits8(2) ] )    # b'\\x01\\x02'
+  msgs = bits_from_buffer( Bits8, buf )
+  pts  = Point.unpack_many( Point.pack_many( [ Point(1,2) ] ) )
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import sys
+from array import array
+
+from .bits_import import Bits, mk_bits
+
+_python_bits = Bits.__module__ == "pymtl3.datatypes.PythonBits"
+
+object_new = object.__new__
+
+# array.array typecode of each element size
+_typecodes = { array( code ).itemsize: code for code in "QLIHB" }
+
+def elem_nbytes( nbits ):
+  """Return the number of bytes an nbits-wide element takes in a buffer."""
+  for nbytes in ( 1, 2, 4, 8 ):
+    if nbits <= nbytes * 8:
+      return nbytes
+  return ( nbits + 7 ) // 8
+
+def _get_type( Type ):
+  return mk_bits( Type ) if isinstance( Type, int ) else Type
+
+def _infer_type( msgs, Type ):
+  if Type is None:
+    if not msgs:
+      raise ValueError( "Cannot infer the type of an empty sequence, please provide Type" )
+    # Bits( n, v ) and the results of the generic operators are plain
+    # Bits, whose nbits is a property of the instance
+    if isinstance( msgs[0], Bits ):
+      return mk_bits( msgs[0].nbits )
+    return msgs[0].__class__
+  return _get_type( Type )
+
+def _is_bitstruct( Type ):
+  return hasattr( Type, "__bitstruct_fields__" )
+
+#-------------------------------------------------------------------------
+# Integers <-> buffers
+#-------------------------------------------------------------------------
+
+def _uints_to_bytes( nbits, uints ):
+  nbytes = elem_nbytes( nbits )
+  if nbytes <= 8:
+    a = array( _typecodes[ nbytes ], uints )
+    if sys.byteorder == "big":
+      a.byteswap()
+    return a.tobytes()
+  return b"".join( [ x.to_bytes( nbytes, "little" ) for x in uints ] )
+
+def _bytes_to_uints( nbits, buf ):
+  buf    = memoryview( buf ).cast( "B" )
+  nbytes = elem_nbytes( nbits )
+  if len(buf) % nbytes:
+    raise ValueError( f"A buffer of Bits{nbits} must have a multiple of {nbytes} bytes, "
+                      f"not {len(buf)}" )
+  if nbytes <= 8:
+    a = array( _typecodes[ nbytes ] )
+    a.frombytes( buf )
+    if sys.byteorder == "big":
+      a.byteswap()
+    return a.tolist()
+  from_bytes = int.from_bytes
+  return [ from_bytes( buf[i:i+nbytes], "little" ) for i in range( 0, len(buf), nbytes ) ]
+
+#-------------------------------------------------------------------------
+# Objects <-> integers
+#-------------------------------------------------------------------------
+
+def _to_uints( Type, msgs ):
+  nbits = Type.nbits
+
+  if _is_bitstruct( Type ):
+    if getattr( Type, "_packed", False ):
+      return [ x._uint for x in msgs ]
+    return [ int( x.to_bits() ) for x in msgs ]
+
+  # Fast path for a sequence of Bits of the right width. Anything else
+  # goes through the Type constructor for the usual checks.
+  try:
+    uints = [ x._uint for x in msgs if x.nbits == nbits ]
+    if len(uints) == len(msgs):
+      return uints
+  except AttributeError:
+    pass
+
+  # Same for non-negative ints that fit
+  if msgs and all( [ x.__class__ is int for x in msgs ] ):
+    if min( msgs ) >= 0 and max( msgs ) >> nbits == 0:
+      return list( msgs )
+  return [ int( Type( x ) ) for x in msgs ]
+
+def _check_range( nbits, uints ):
+  if uints and max( uints ) >> nbits:
+    raise ValueError( f"Buffer contains a value that is too wide for {nbits} bits" )
+
+def _from_uints( Type, uints, lazy=False ):
+  if _is_bitstruct( Type ):
+    if getattr( Type, "_packed", False ):
+      _check_range( Type.nbits, uints )
+      ret = []
+      append = ret.append
+      for x in uints:
+        v = object_new( Type )
+        v._uint = x
+        append( v )
+      return ret
+    BitsN     = mk_bits( Type.nbits )
+    from_bits = Type.from_bits
+    return [ from_bits( x, lazy ) for x in _from_uints( BitsN, uints ) ]
+
+  # Values are checked for the whole sequence at once so the pure-Python
+  # BitsN objects can be created without __init__
+  if not _python_bits:
+    return list( map( Type, uints ) )
+
+  nbits = Type.nbits
+  _check_range( nbits, uints )
+  ret = []
+  append = ret.append
+  for x in uints:
+    v = object_new( Type )
+    v._nbits = nbits
+    v._uint  = x
+    append( v )
+  return ret
+
+#-------------------------------------------------------------------------
+# Public API
+#-------------------------------------------------------------------------
+
+def bits_to_buffer( msgs, Type=None ):
+  """Encode a sequence of Bits or bitstructs of the same Type (or
+  nbits) into bytes. The Type defaults to the type of the first message."""
+  Type = _infer_type( msgs, Type )
+  return _uints_to_bytes( Type.nbits, _to_uints( Type, msgs ) )
+
+def bits_from_buffer( Type, buf, lazy=False ):
+  """Decode a buffer (bytes, bytearray, memoryview, NumPy array, ...)
+  into a list of Type objects. Type is a BitsN type, a bitwidth or a
+  bitstruct. lazy=True decodes bitstruct fields on first access."""
+  Type = _get_type( Type )
+  return _from_uints( Type, _bytes_to_uints( Type.nbits, buf ), lazy )
+
+def bits_from_ints( Type, values ):
+  """Convert a sequence of ints (or Bits) into a list of Type objects.
+  Values are checked as if they were passed to Type one by one."""
+  Type = _get_type( Type )
+  return _from_uints( Type, _to_uints( Type, values ) )
+
+def bits_to_numpy( msgs, Type=None ):
+  """Encode a sequence of up to 64-bit Bits or bitstructs into a NumPy
+  array of the smallest unsigned integer dtype that fits them."""
+  try:
+    import numpy
+  except ImportError:
+    raise ImportError( "bits_to_numpy requires NumPy which is not installed" )
+
+  Type   = _infer_type( msgs, Type )
+  nbytes = elem_nbytes( Type.nbits )
+  if nbytes > 8:
+    raise TypeError( f"NumPy has no unsigned integer dtype for {Type.nbits}-bit values" )
+  return numpy.frombuffer( bits_to_buffer( msgs, Type ), dtype=f"<u{nbytes}" )
@@ -10,7 +10,9 @@ Date   : Nov 3, 2017
 """
 import math
 
-from .bits_import import *
+from pymtl3.extra.pypy import custom_exec
+
+from .bits_import import Bits, b1, mk_bits
 
 try:
   from mamba import concat
@@ -76,3 +78,73 @@ def reduce_xor( value ):
 
   except AttributeError:
     raise TypeError("Cannot call reduce_xor on int")
+
+#-------------------------------------------------------------------------
+# Width-specific helpers
+#-------------------------------------------------------------------------
+# When the bitwidths of the arguments are known ahead of time (e.g., from
+# the RTLIR type check, see passes/sim/SpecializeHelpersPass.py), these
+# return closures that take the same arguments as the generic helper but
+# only do the shift/mask work, with the result type resolved once. The
+# closures are memoized. Only the pure-Python Bits expose the _uint they
+# work on, so otherwise the generic helpers are returned.
+
+_python_bits = Bits.__module__ == "pymtl3.datatypes.PythonBits"
+
+_specialized = {}
+
+def _mk_specialized( key, name, args, expr, nbits ):
+  if key in _specialized:
+    return _specialized[ key ]
+
+  src = f"""
+def {name}( {', '.join(args)} ):
+  ret = _new( _Type )
+  ret._nbits = {nbits}
+  ret._uint  = {expr}
+  return ret
+"""
+  _globals = { '_new': object.__new__, '_Type': mk_bits( nbits ) }
+  _locals  = {}
+  custom_exec( compile( src, filename=name, mode="exec" ), _globals, _locals )
+  ret = _specialized[ key ] = _locals[ name ]
+  return ret
+
+def mk_concat( *arg_nbits ):
+  if not _python_bits:
+    return concat
+
+  nbits = sum( arg_nbits )
+  args  = [ f"a{i}" for i in range(len(arg_nbits)) ]
+  terms = []
+  for i, x in enumerate( arg_nbits ):
+    nbits -= x
+    terms.append( f"(a{i}._uint << {nbits})" if nbits else f"a{i}._uint" )
+
+  return _mk_specialized( ('concat', *arg_nbits), f"concat_{'_'.join(map(str, arg_nbits))}",
+                          args, " | ".join( terms ), sum( arg_nbits ) )
+
+def mk_zext( nbits, new_nbits ):
+  if not _python_bits:
+    return zext
+  assert new_nbits >= nbits
+  return _mk_specialized( ('zext', nbits, new_nbits), f"zext_{nbits}_{new_nbits}",
+                          [ 'value', '_' ], "value._uint", new_nbits )
+
+def mk_sext( nbits, new_nbits ):
+  if not _python_bits:
+    return sext
+  assert new_nbits >= nbits
+  expr = "value._uint"
+  if new_nbits > nbits:
+    ext  = ( (1 << new_nbits) - 1 ) ^ ( (1 << nbits) - 1 )
+    expr = f"value._uint | {ext} if value._uint >> {nbits-1} else value._uint"
+  return _mk_specialized( ('sext', nbits, new_nbits), f"sext_{nbits}_{new_nbits}",
+                          [ 'value', '_' ], expr, new_nbits )
+
+def mk_trunc( nbits, new_nbits ):
+  if not _python_bits:
+    return trunc
+  assert new_nbits <= nbits
+  return _mk_specialized( ('trunc', nbits, new_nbits), f"trunc_{nbits}_{new_nbits}",
+                          [ 'value', '_' ], f"value._uint & {(1 << new_nbits) - 1}", new_nbits )
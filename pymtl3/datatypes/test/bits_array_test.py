@@ -0,0 +1,104 @@
+#=======================================================================
+# bits_array_test.py
+#=======================================================================
+# Tests for BitsArray.
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+from copy import deepcopy
+
+import pytest
+
+from ..bits_import import Bits, Bits8, Bits32, Bits100
+from ..BitsArray import BitsArray
+
+
+def test_init():
+  a = BitsArray( 8, 4 )
+  assert len(a) == 4 and a.nbits == 8 and a.Type is Bits8
+  assert a.tolist() == [ 0, 0, 0, 0 ]
+  assert BitsArray( Bits8, 3, 5 ).tolist() == [ 5, 5, 5 ]
+  assert BitsArray( 8, 3, [ 1, Bits8(2), 3 ] ).tolist() == [ 1, 2, 3 ]
+
+  with pytest.raises( ValueError ):
+    BitsArray( 8, 2, 256 )
+  with pytest.raises( ValueError ):
+    BitsArray( 8, 2, [ 1, 2, 3 ] )
+  with pytest.raises( ValueError ):
+    BitsArray( 8, 0 )
+
+def test_elements():
+  a = BitsArray( 8, 4, [ 1, 2, 3, 4 ] )
+  x = a[1]
+  assert isinstance( x, Bits8 ) and x.__class__ is Bits8
+  assert x == 2 and x + 1 == 3 and x[0:4] == 2
+
+  x @= 7
+  assert a[1] == 7
+  a[2] @= Bits8(9)
+  a[3] = 10
+  assert a.tolist() == [ 1, 7, 9, 10 ]
+
+  with pytest.raises( ValueError ):
+    a[0] @= Bits32(1)
+  with pytest.raises( ValueError ):
+    a[0] = 256
+  with pytest.raises( IndexError ):
+    a[4]
+
+def test_ilshift_flip():
+  a = BitsArray( 8, 4, [ 1, 2, 3, 4 ] )
+  a[0] <<= 5
+  a[3] <<= 6
+  assert a.tolist() == [ 1, 2, 3, 4 ]
+  a._flip()
+  assert a.tolist() == [ 5, 2, 3, 6 ]
+
+  a <<= [ 7, 7, 7, 7 ]
+  assert a.tolist() == [ 5, 2, 3, 6 ]
+  a._flip()
+  assert a.tolist() == [ 7, 7, 7, 7 ]
+
+def test_bulk_assign():
+  a = BitsArray( 8, 3 )
+  b = BitsArray( 8, 3, [ 4, 5, 6 ] )
+  a @= b
+  assert a == b and a is not b
+  a @= [ 1, 2, 3 ]
+  assert a == [ 1, 2, 3 ]
+  a[0:2] = [ 8, 9 ]
+  assert a.tolist() == [ 8, 9, 3 ]
+
+  with pytest.raises( ValueError ):
+    a @= BitsArray( 16, 3 )
+  with pytest.raises( ValueError ):
+    a <<= BitsArray( 8, 4 )
+
+def test_slice_clone():
+  a = BitsArray( 8, 4, [ 1, 2, 3, 4 ] )
+  b = a[1:3]
+  assert isinstance( b, BitsArray ) and b.tolist() == [ 2, 3 ]
+  b[0] @= 0
+  assert a[1] == 2
+
+  c = a.clone()
+  d = deepcopy( a )
+  a[0] @= 0
+  assert c[0] == 1 and d[0] == 1
+
+def test_buffer():
+  a = BitsArray( 32, 4, [ 1, 2, 3, 4 ] )
+  m = a.buffer()
+  assert m.itemsize * 8 >= 32 and m.tolist() == [ 1, 2, 3, 4 ]
+  a[2] @= 7
+  assert m[2] == 7
+
+  w = BitsArray( 100, 2, [ 1, Bits100(1) << 99 ] )
+  assert w[1] == Bits100(1) << 99
+  with pytest.raises( TypeError ):
+    w.buffer()
+
+def test_repr():
+  assert repr( BitsArray( 8, 2, [ 1, 2 ] ) ) == "BitsArray(8, 2, [01, 02])"
+  assert str( BitsArray( 8, 2, [ 1, 2 ] ) ) == "[01, 02]"
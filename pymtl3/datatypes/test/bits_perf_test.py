@@ -0,0 +1,82 @@
+#=======================================================================
+# bits_perf_test.py
+#=======================================================================
+# Micro-benchmark of the most frequent Bits operations in update blocks.
+# The test makes sure every operation of the mix takes the same-width
+# fast paths of BitsN and computes the same values as the generic Bits
+# operators. Timing is not checked because it depends on the machine.
+# Run this file directly to print the time of each operation:
+#
+#   python -m pymtl3.datatypes.test.bits_perf_test
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import timeit
+
+import pytest
+
+from .. import PythonBits
+from ..bits_import import Bits, mk_bits
+
+# Operation mix: adders/counters, masks, comparisons against signals and
+# literals, shifts, and logic on the comparison results
+_op_mix = [
+  "a + b",
+  "a + 1",
+  "a - b",
+  "a & b",
+  "a | b",
+  "a ^ b",
+  "~a",
+  "a >> 1",
+  "a << 1",
+  "a == b",
+  "a != 0",
+  "a < b",
+  "(a == b) & (a < b)",
+  "(a + b) & c",
+]
+
+def _time( stmt, a, b, c, number, repeat ):
+  g = { 'a': a, 'b': b, 'c': c }
+  return min( timeit.repeat( stmt, globals=g, number=number, repeat=repeat ) )
+
+def _operands( nbits, generic ):
+  values = [ x & ((1 << nbits) - 1) for x in ( 3, 5, 6 ) ]
+  if generic:
+    return [ Bits( nbits, x ) for x in values ]
+  BitsN = mk_bits( nbits )
+  return [ BitsN( x ) for x in values ]
+
+def run_op_mix( nbits=32, number=20000, repeat=3 ):
+  """Return { stmt: (fast, generic) } seconds for each operation."""
+  fast    = _operands( nbits, False )
+  generic = _operands( nbits, True )
+  return { stmt: ( _time( stmt, *fast, number, repeat ), _time( stmt, *generic, number, repeat ) )
+           for stmt in _op_mix }
+
+@pytest.mark.skipif( Bits is not PythonBits.Bits or hasattr( mk_bits(8), '_mask' ),
+                     reason="Only the checked Python Bits has the fast paths" )
+@pytest.mark.parametrize( "nbits", [ 1, 8, 32, 64, 128 ] )
+def test_op_mix_takes_fast_paths( nbits ):
+  BitsN = mk_bits( nbits )
+  for name in [ '__add__', '__sub__', '__and__', '__or__', '__xor__', '__invert__',
+                '__rshift__', '__lshift__', '__eq__', '__ne__', '__lt__' ]:
+    assert name in BitsN.__dict__, name
+
+  fast    = dict( zip( 'abc', _operands( nbits, False ) ) )
+  generic = dict( zip( 'abc', _operands( nbits, True ) ) )
+  for stmt in _op_mix:
+    x = eval( stmt, fast )
+    y = eval( stmt, generic )
+    assert x == y and x.nbits == y.nbits, stmt
+    assert x.__class__ is mk_bits( x.nbits ), stmt
+
+if __name__ == "__main__":
+  for nbits in [ 1, 8, 32, 64, 128 ]:
+    print( f"\nBits{nbits}" )
+    print( f"  {'operation':20} {'fast (us)':>10} {'generic (us)':>13} {'speedup':>8}" )
+    n = 50000
+    for stmt, (fast, generic) in run_op_mix( nbits, number=n ).items():
+      print( f"  {stmt:20} {fast/n*1e6:10.3f} {generic/n*1e6:13.3f} {generic/fast:7.2f}x" )
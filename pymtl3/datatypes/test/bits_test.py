@@ -760,3 +760,89 @@ def test_bin_oct_hex():
   assert Bits(15,35).bin() == "0b000000000100011"
   assert Bits(15,35).oct() == "0o00043"
   assert Bits(15,35).hex() == "0x0023"
+
+#-----------------------------------------------------------------------
+# Interned constants
+#-----------------------------------------------------------------------
+
+from .. import PythonBits
+from ..bits_import import Bits1, Bits4, Bits8, Bits16, const_bits
+
+pure_python_only = pytest.mark.skipif( Bits is not PythonBits.Bits,
+                                       reason="Only the Python Bits interns constants" )
+
+@pure_python_only
+def test_interned_single_bits():
+  a = Bits( 8, 0b1010 )
+  assert a[1] is a[3] is a[1:2] is (a == 10) is (a != 3)
+  assert a[0] is a[2] is (a > 10) is (a < a)
+  assert a[1] == 1 and a[0] == 0
+
+@pure_python_only
+def test_const_bits():
+  assert const_bits( 8, 3 ) is const_bits( 8, 3 )
+  assert const_bits( 8, 3 ) is not const_bits( 16, 3 )
+  assert const_bits( 4, -1 ) == Bits( 4, 15 )
+  assert const_bits( 16, 1000 ) == 1000
+  with pytest.raises( ValueError ):
+    const_bits( 4, 16 )
+
+@pure_python_only
+def test_const_bits_immutable():
+  c = const_bits( 8, 3 )
+  with pytest.raises( TypeError ):
+    c[0] = 0
+  with pytest.raises( TypeError ):
+    c._flip()
+
+  # In-place assignments give back a mutable copy
+  x = c
+  x @= 5
+  assert x == 5 and c == 3 and type(x) is Bits
+  x = c
+  x <<= 7
+  x._flip()
+  assert x == 7 and c == 3
+
+  # a[i] @= v goes through the interned a[i]
+  a = Bits( 8, 0 )
+  a[3] @= 1
+  a[0:1] @= 1
+  assert a == 0b1001
+  assert const_bits( 1, 1 ) is a[3]
+  assert c.clone() == 3 and type( deepcopy( c ) ) is Bits
+
+#-------------------------------------------------------------------------
+# Same-width fast paths
+#-------------------------------------------------------------------------
+
+@pure_python_only
+def test_fast_paths_same_width():
+  a, b = Bits8( 200 ), Bits8( 100 )
+  assert type( a + b ) is Bits8 and a + b == 44
+  assert type( a - b ) is Bits8 and b - a == 156
+  assert type( a * b ) is Bits8 and a * b == (200 * 100) & 0xff
+  assert (a & b) == 64 and (a | b) == 236 and (a ^ b) == 172
+  assert type( ~a ) is Bits8 and ~a == 55
+  assert a >> Bits8( 3 ) == 25 and a << Bits8( 1 ) == 144 and a << Bits8( 9 ) == 0
+  assert isinstance( a == b, Bits1 ) and (a != b) is a[3] and (a == b) is a[0]
+  assert (a > b) and (a >= a) and (b < a) and (b <= b) and not (a < b)
+  assert { a: 1 }[ Bits8( 200 ) ] == 1
+
+  # int operands in range are also on the fast path
+  assert type( a + 1 ) is Bits8 and a + 100 == 44 and a >> 4 == 12
+  assert (a == 200) and (a != 0) and (a > 10)
+
+@pure_python_only
+def test_fast_paths_fall_back():
+  a = Bits8( 200 )
+  # Different widths and out-of-range ints still go through Bits checks
+  with pytest.raises( ValueError ):
+    a + Bits16( 1 )
+  with pytest.raises( ValueError ):
+    a & 256
+  with pytest.raises( ValueError ):
+    a == Bits4( 1 )
+  assert a + Bits( 8, 1 ) == 201 and 1 + a == 201
+  assert a != None and not (a == "x")
+  assert (Bits1( 1 ) & (a == 200)) == 1
@@ -604,3 +604,167 @@ def test_imatmul_ilshift():
   assert c == B(0x1234567890abcd0f,[A(2),A(3),A(4)], A(5) )
   c._flip()
   assert c.to_bits() == Bits164(0xf0dcba09876543210005000400030002)
+
+#-------------------------------------------------------------------------
+# Packed bitstructs
+#-------------------------------------------------------------------------
+
+@bitstruct( packed=True )
+class PackedPoint:
+  x : Bits4
+  y : [ Bits2, Bits2 ]
+
+PackedMsg = mk_bitstruct( 'PackedMsg', {
+  'a'  : Bits8,
+  'pt' : PackedPoint,
+  'pts': [ PackedPoint ] * 2,
+}, packed=True )
+
+@bitstruct
+class UnpackedPoint:
+  x : Bits4
+  y : [ Bits2, Bits2 ]
+
+UnpackedMsg = mk_bitstruct( 'UnpackedMsg', {
+  'a'  : Bits8,
+  'pt' : UnpackedPoint,
+  'pts': [ UnpackedPoint ] * 2,
+})
+
+def test_packed_same_layout():
+  a = PackedMsg( 0x12, PackedPoint( 3, [ 1, 2 ] ), [ PackedPoint( 1 ), PackedPoint( 2, [ 3, 0 ] ) ] )
+  b = UnpackedMsg( 0x12, UnpackedPoint( b4(3), [ b2(1), b2(2) ] ),
+                   [ UnpackedPoint( b4(1), [ b2(0), b2(0) ] ), UnpackedPoint( b4(2), [ b2(3), b2(0) ] ) ] )
+
+  assert PackedMsg.nbits == UnpackedMsg.nbits == 32
+  assert a.to_bits() == b.to_bits()
+  assert str(a) == str(b).replace( 'Unpacked', 'Packed' )
+  assert PackedMsg.from_bits( b.to_bits() ) == a
+  assert UnpackedMsg.from_bits( a.to_bits() ) == b
+  assert a.pt.y[1] == 2 and a.pts[1].x == 2
+
+def test_packed_field_views():
+  a = PackedMsg()
+  a.a[0:4] @= 0xf
+  a.pt.x @= 7
+  a.pts[1].y[0] @= 1
+  a.pts[0] = PackedPoint( 5, [ 1, 1 ] )
+  a.a = 0x3f
+  assert a == PackedMsg( 0x3f, PackedPoint( 7 ), [ PackedPoint( 5, [ 1, 1 ] ), PackedPoint( 0, [ 1, 0 ] ) ] )
+
+  # Views are live, clones are not
+  x = a.pt.x
+  c = a.clone()
+  a.pt = PackedPoint( 1 )
+  assert x == 1
+  assert c.pt.x == 7
+  assert c != a
+
+  with pytest.raises( ValueError ):
+    a.pt.x = 16
+
+def test_packed_ilshift_flip():
+  a = PackedMsg( 1 )
+  a <<= a
+  a.pt.x <<= 3
+  a.pts[1].y[1] <<= 2
+  assert a == PackedMsg( 1 )
+  a._flip()
+  assert a == PackedMsg( 1, PackedPoint( 3 ), [ PackedPoint(), PackedPoint( 0, [ 0, 2 ] ) ] )
+
+  a <<= Bits32( 0xdeadbeef )
+  a._flip()
+  assert a.to_bits() == 0xdeadbeef
+  assert hash( a ) == hash( PackedMsg.from_bits( Bits32( 0xdeadbeef ) ) )
+
+def test_packed_field_must_be_packed():
+  with pytest.raises( TypeError ):
+    mk_bitstruct( 'BadPacked', { 'pt': UnpackedPoint }, packed=True )
+
+def test_packed_component():
+  class A( Component ):
+    def construct( s ):
+      s.in_ = InPort( PackedMsg )
+      s.out = OutPort( PackedMsg )
+
+      @update
+      def up_packed():
+        s.out @= s.in_
+        s.out.pt.x @= s.in_.pts[0].x + 1
+        s.out.pts[1].y[1] @= 3
+
+  dut = A()
+  dut.elaborate()
+  dut.apply( simple_sim_pass )
+  dut.in_ @= PackedMsg( 1, PackedPoint( 2 ), [ PackedPoint( 4 ), PackedPoint( 5 ) ] )
+  dut.tick()
+  assert dut.out == PackedMsg( 1, PackedPoint( 5 ), [ PackedPoint( 4 ), PackedPoint( 5, [ 0, 3 ] ) ] )
+
+def test_packed_component_ff():
+  from pymtl3.dsl import update_ff
+
+  class B( Component ):
+    def construct( s ):
+      s.in_ = InPort( PackedMsg )
+      s.out = OutPort( PackedMsg )
+      s.x   = OutPort( Bits4 )
+      s.x //= s.out.pt.x
+
+      @update_ff
+      def up_packed_ff():
+        s.out <<= s.in_
+
+  dut = B()
+  dut.elaborate()
+  dut.apply( simple_sim_pass )
+  dut.in_ @= PackedMsg( 1, PackedPoint( 2 ), [ PackedPoint( 4 ), PackedPoint( 5 ) ] )
+  dut.tick()
+  assert dut.out == PackedMsg( 1, PackedPoint( 2 ), [ PackedPoint( 4 ), PackedPoint( 5 ) ] )
+  dut.tick()
+  assert dut.x == 2
+
+#-------------------------------------------------------------------------
+# Lazy from_bits
+#-------------------------------------------------------------------------
+
+def test_lazy_from_bits():
+  import copy
+  import pickle
+
+  msg  = UnpackedMsg( b8(0x12), UnpackedPoint( b4(3), [ b2(1), b2(2) ] ),
+                      [ UnpackedPoint( b4(1), [ b2(0), b2(0) ] ), UnpackedPoint( b4(2), [ b2(3), b2(0) ] ) ] )
+  bits = msg.to_bits()
+
+  lazy = UnpackedMsg.from_bits( bits, lazy=True )
+  assert lazy.__class__ is UnpackedMsg and isinstance( lazy, UnpackedMsg )
+  assert is_bitstruct_inst( lazy )
+
+  # Only the accessed fields are decoded
+  assert 'a' not in vars( lazy ) and 'pt' not in vars( lazy )
+  assert lazy.a == 0x12
+  assert 'a' in vars( lazy ) and 'pt' not in vars( lazy )
+  assert lazy.pts[1].y[0] == 3
+
+  assert lazy == msg and msg == lazy
+  assert lazy.to_bits() == bits
+  assert repr( lazy ) == repr( msg )
+
+  # Decoded fields are cached and writable
+  assert lazy.a is lazy.a
+  lazy.a @= 0x34
+  lazy.pt = UnpackedPoint( b4(5), [ b2(0), b2(1) ] )
+  assert lazy.to_bits() == UnpackedMsg( b8(0x34), UnpackedPoint( b4(5), [ b2(0), b2(1) ] ), msg.pts ).to_bits()
+
+  # Copies are regular bitstructs
+  lazy = UnpackedMsg.from_bits( bits, lazy=True )
+  for x in [ lazy.clone(), copy.deepcopy( lazy ) ]:
+    assert type( x ) is UnpackedMsg and x == msg
+  pt = pickle.loads( pickle.dumps( UnpackedPoint.from_bits( msg.pt.to_bits(), lazy=True ) ) )
+  assert type( pt ) is UnpackedPoint and pt == msg.pt
+
+  x = UnpackedMsg()
+  x @= UnpackedMsg.from_bits( bits, lazy=True )
+  assert x == msg
+
+  # Packed bitstructs always decode on access
+  assert PackedMsg.from_bits( bits, lazy=True ).to_bits() == bits
@@ -0,0 +1,105 @@
+#=======================================================================
+# buffers_test.py
+#=======================================================================
+# Tests for bulk conversion between Bits/bitstruct sequences and buffers.
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import pytest
+
+from ..bits_import import *
+from ..BitsArray import BitsArray
+from ..bitstructs import bitstruct
+from ..buffers import bits_from_buffer, bits_from_ints, bits_to_buffer, bits_to_numpy, elem_nbytes
+
+@bitstruct
+class Point:
+  x : Bits4
+  y : Bits12
+
+@bitstruct( packed=True )
+class PackedPoint:
+  x : Bits4
+  y : Bits12
+
+def test_elem_nbytes():
+  assert [ elem_nbytes(n) for n in ( 1, 8, 9, 17, 33, 64, 65, 100, 128 ) ] == \
+         [ 1, 1, 2, 4, 8, 8, 9, 13, 16 ]
+
+@pytest.mark.parametrize( "nbits", [ 1, 5, 8, 16, 24, 32, 64, 100, 128 ] )
+def test_round_trip( nbits ):
+  msgs = [ mk_bits(nbits)(x & ((1 << nbits) - 1)) for x in ( 0, 1, 0x5a5a5a5a5a5a5a5a5a5a5a, -1 ) ]
+  buf  = bits_to_buffer( msgs )
+  assert len(buf) == 4 * elem_nbytes( nbits )
+  ret  = bits_from_buffer( nbits, buf )
+  assert ret == msgs and all( type(x) is mk_bits(nbits) for x in ret )
+  assert bits_from_buffer( mk_bits(nbits), memoryview( bytearray( buf ) ) ) == msgs
+
+def test_layout():
+  assert bits_to_buffer( [ Bits16( 0x1234 ), Bits16( 0xabcd ) ] ) == b'\x34\x12\xcd\xab'
+  assert bits_to_buffer( [ 1, 2, 255 ], Bits8 ) == b'\x01\x02\xff'
+  assert bits_to_buffer( [ -1 ], Bits12 ) == b'\xff\x0f'
+  assert bits_from_buffer( Bits24, b'\x01\x02\x03\x00' ) == [ 0x030201 ]
+
+def test_generic_bits():
+  # Bits( n, v ) and the generic operators return plain Bits
+  msgs = [ Bits( 8, 1 ), Bits( 8, 2 ), Bits( 4, 1 ) + Bits( 4, 2 ) ]
+  assert bits_to_buffer( msgs[:2] ) == b'\x01\x02'
+  assert bits_to_buffer( [ Bits( 16, 0x1234 ), Bits16( 0xabcd ) ] ) == b'\x34\x12\xcd\xab'
+  assert bits_from_buffer( Bits8, bits_to_buffer( msgs[:2] ) ) == msgs[:2]
+
+def test_checks():
+  # Values too wide for the type
+  with pytest.raises( ValueError ):
+    bits_from_buffer( Bits5, b'\x20' )
+  with pytest.raises( ValueError ):
+    bits_to_buffer( [ 256 ], Bits8 )
+  with pytest.raises( ValueError ):
+    bits_to_buffer( [ Bits8( 1 ), Bits16( 0x100 ) ] )
+  # Incomplete element
+  with pytest.raises( ValueError ):
+    bits_from_buffer( Bits16, b'\x01\x02\x03' )
+  with pytest.raises( ValueError ):
+    bits_to_buffer( [] )
+  assert bits_to_buffer( [], Bits8 ) == b'' and bits_from_buffer( Bits8, b'' ) == []
+
+def test_bits_from_ints():
+  ret = bits_from_ints( Bits8, [ 1, Bits8( 2 ), -1 ] )
+  assert ret == [ 1, 2, 255 ] and all( type(x) is Bits8 for x in ret )
+  with pytest.raises( ValueError ):
+    bits_from_ints( Bits8, [ 1, 300 ] )
+
+@pytest.mark.parametrize( "Type", [ Point, PackedPoint ] )
+def test_pack_many( Type ):
+  msgs = [ Type( 1, 2 ), Type( 0xf, 0xfff ) ]
+  buf  = Type.pack_many( msgs )
+  assert buf == b'\x02\x10\xff\xff'
+  assert buf == bits_to_buffer( msgs )
+  assert Type.unpack_many( buf ) == msgs
+  lazy = Type.unpack_many( buf, lazy=True )
+  assert lazy[1].y == 0xfff and lazy == msgs
+
+def test_bits_array_buffer():
+  a = BitsArray.from_buffer( 16, b'\x01\x00\x02\x00\xff\xff' )
+  assert len(a) == 3 and a.tolist() == [ 1, 2, 0xffff ]
+  assert a.tobytes() == b'\x01\x00\x02\x00\xff\xff'
+  a[1] <<= 7
+  a._flip()
+  assert a.tobytes() == bits_to_buffer( [ Bits16(1), Bits16(7), Bits16(-1) ] )
+
+  b = BitsArray.from_buffer( Bits100, bits_to_buffer( [ Bits100( -1 ) ] * 2 ) )
+  assert b.tolist() == [ (1 << 100) - 1 ] * 2
+
+  with pytest.raises( ValueError ):
+    BitsArray.from_buffer( 4, b'\x10' )
+  with pytest.raises( ValueError ):
+    BitsArray.from_buffer( 4, b'' )
+
+def test_to_numpy():
+  numpy = pytest.importorskip( "numpy" )
+  a = bits_to_numpy( [ Bits12( 1 ), Bits12( 0xfff ) ] )
+  assert a.dtype == numpy.dtype( "<u2" ) and a.tolist() == [ 1, 0xfff ]
+  assert bits_from_buffer( Bits12, a ) == [ 1, 0xfff ]
+  with pytest.raises( TypeError ):
+    bits_to_numpy( [ Bits65( 1 ) ] )
@@ -43,3 +43,16 @@ def test_reduce_or():
 def test_reduce_xor():
   assert reduce_xor( b8(0b10101011) ) == 1
   assert reduce_xor( b8(0b10101010) ) == 0
+
+def test_specialized_helpers():
+  from pymtl3.datatypes.helpers import mk_concat, mk_sext, mk_trunc, mk_zext
+
+  a, b = Bits12(0x800), Bits20(0x12345)
+  assert mk_concat( 12, 20 )( a, b ) == concat( a, b ) == 0x80012345
+  assert mk_concat( 12, 20 ) is mk_concat( 12, 20 )
+  assert mk_zext( 12, 32 )( a, 32 ) == zext( a, 32 )
+  assert mk_sext( 12, 32 )( a, 32 ) == sext( a, 32 ) == 0xfffff800
+  assert mk_sext( 12, 32 )( Bits12(0x7ff), 32 ) == 0x7ff
+  assert mk_sext( 12, 12 )( a, 12 ) == a
+  assert mk_trunc( 20, 8 )( b, 8 ) == trunc( b, 8 ) == 0x45
+  assert mk_concat( 1, 1 )( b1(1), b12(0)[3] ).nbits == 2
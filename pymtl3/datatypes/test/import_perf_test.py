@@ -0,0 +1,98 @@
+#=======================================================================
+# import_perf_test.py
+#=======================================================================
+# Checks that "import pymtl3" stays cheap: BitsN types are generated on
+# first access and the simulation passes are imported when a pass group
+# is applied, and a star import only generates the predefined BitsN.
+# Run this file directly to print the import times and the slowest
+# modules:
+#
+#   python -m pymtl3.datatypes.test.import_perf_test
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from .. import bits_import
+from ..bits_import import mk_bits
+
+# Run from the repo root so that a plain checkout imports the same pymtl3
+_root = os.path.dirname( os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) ) )
+
+def _run( code, *args ):
+  return subprocess.run( [ sys.executable, *args, "-c", code ], check=True, cwd=_root,
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                         universal_newlines=True )
+
+def time_import( stmt="import pymtl3", repeat=5 ):
+  """Return the best wall time in seconds of stmt in a fresh
+  interpreter."""
+  code = f"import time; t = time.perf_counter(); {stmt}; print(time.perf_counter() - t)"
+  return min( float( _run( code ).stdout ) for _ in range( repeat ) )
+
+def test_import_is_lazy():
+  ret = _run( "import sys, pymtl3\n"
+              "print(len(pymtl3.datatypes.bits_import._bits_types))\n"
+              "print(sorted(x for x in sys.modules if x.startswith('pymtl3.passes.')))" )
+  num_types, modules = ret.stdout.splitlines()
+  assert int( num_types ) < 4
+  assert "pymtl3.passes.backends" not in modules
+  assert "pymtl3.passes.sim.GenDAGPass" not in modules
+
+def test_lazy_bits_names():
+  import pymtl3
+  from pymtl3 import Bits77, b78
+
+  assert Bits77 is mk_bits( 77 ) is bits_import.Bits77
+  assert b78 is pymtl3.datatypes.Bits78 is pymtl3.b78
+  assert Bits77( 3 ).nbits == 77
+
+  # Only the predefined bitwidths have module attributes
+  for name in [ 'Bits0', 'Bits600', 'Bits01', 'bits8' ]:
+    with pytest.raises( AttributeError ):
+      getattr( pymtl3, name )
+
+def test_star_import_has_all_bits_names():
+  ns = {}
+  exec( "from pymtl3 import *", ns )
+  assert ns['Bits255'] is mk_bits( 255 )
+  assert ns['b512'] is mk_bits( 512 )
+
+def test_star_import_is_lazy():
+  # The star import generates the BitsN/bN names in __all__, but no other
+  # types, and still does not import the simulation passes
+  ret = _run( "import sys\n"
+              "from pymtl3 import *\n"
+              "from pymtl3.datatypes import bits_import\n"
+              "print(sorted(bits_import._bits_types) == sorted(bits_import._bitwidths))\n"
+              "print(sorted(x for x in sys.modules if x.startswith('pymtl3.passes.')))" )
+  same_types, modules = ret.stdout.splitlines()
+  assert same_types == "True"
+  assert "pymtl3.passes.backends" not in modules
+  assert "pymtl3.passes.sim.GenDAGPass" not in modules
+
+def test_pass_names():
+  from pymtl3.passes import DefaultPassGroup, GenDAGPass
+  from pymtl3.passes.sim.GenDAGPass import GenDAGPass as _GenDAGPass
+  assert GenDAGPass is _GenDAGPass
+
+  import pymtl3.passes
+  with pytest.raises( AttributeError ):
+    pymtl3.passes.NoSuchPass
+
+if __name__ == "__main__":
+  print( f"import pymtl3: {time_import()*1e3:.1f} ms" )
+  print( f"from pymtl3 import *: {time_import( 'from pymtl3 import *' )*1e3:.1f} ms" )
+
+  # -X importtime prints "self | cumulative | module" in microseconds
+  lines = _run( "import pymtl3", "-X", "importtime" ).stderr.splitlines()[1:]
+  rows  = [ [ x.strip() for x in line.split( ":", 1 )[1].split( "|" ) ] for line in lines ]
+  rows  = sorted( rows, key=lambda x: -int( x[1] ) )[:15]
+  print( f"\n  {'cumulative (ms)':>15} {'self (ms)':>10}  module" )
+  for self_us, cumul_us, module in rows:
+    print( f"  {int(cumul_us)/1e3:15.1f} {int(self_us)/1e3:10.1f}  {module.strip()}" )
@@ -0,0 +1,91 @@
+#=======================================================================
+# unchecked_bits_test.py
+#=======================================================================
+# The Bits mode is selected when pymtl3 is imported, so the tests run
+# in a separate process with PYMTL_BITS_UNCHECKED=1.
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import os
+import subprocess
+import sys
+import textwrap
+
+_ops_src = """
+from pymtl3 import *
+from pymtl3.datatypes.UncheckedBits import UncheckedBits
+
+assert issubclass( Bits8, UncheckedBits ) and issubclass( Bits8, Bits )
+
+a = Bits8( 0x1ff )          # truncated instead of raising
+assert a == 0xff and a.nbits == 8
+assert type( a + 1 ) is Bits8 and a + 1 == 0
+assert 3 - Bits4( 4 ) == 0xf
+assert ~Bits4( 5 ) == 0xa
+assert Bits4( 3 ) << 2 == 12 and Bits4( 3 ) << 4 == 0
+assert Bits8( 0x34 ) >> Bits8( 4 ) == 3
+assert Bits8( 0x34 )[4:8] == 3 and type( Bits8( 0x34 )[4:8] ) is Bits4
+assert Bits8( 0x34 )[2] == 1
+assert Bits8( 0x34 )[2] is Bits8( 0x34 )[4] is ( Bits8( 3 ) == 3 )
+assert Bits8( 0x34 ) != None
+assert ( Bits8( 3 ) < 4 ) and ( Bits8( 3 ) >= Bits8( 3 ) )
+assert { Bits8( 3 ): 1 }[ Bits8( 3 ) ] == 1
+
+a = Bits8()
+a[0:4] = 0x1f
+a[7] = 1
+assert a == 0x8f
+a[6] @= 1
+a[7] @= 0
+assert a == 0x4f and Bits8( 0x80 )[7] == 1
+a @= Bits16( 0x1234 )       # width mismatch is not reported
+assert a == 0x34
+a <<= -1
+a._flip()
+assert a == 0xff
+
+@bitstruct
+class Point:
+  x : Bits4
+  y : Bits4
+
+b = Bits8()
+b @= Point( 1, 2 )
+assert b == 0x12
+
+class Acc( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits8 )
+    s.out = OutPort( Bits8 )
+
+    @update_ff
+    def up_acc():
+      if s.reset:
+        s.out <<= 0
+      else:
+        s.out <<= s.out + s.in_
+
+top = Acc()
+top.apply( DefaultPassGroup() )
+top.sim_reset()
+for i in range( 100 ):
+  top.in_ @= i
+  top.sim_tick()
+assert top.out == sum( range( 100 ) ) & 0xff
+"""
+
+def test_unchecked_bits( tmpdir ):
+  # Update blocks need a source file
+  src = tmpdir.join( "unchecked_bits.py" )
+  src.write( textwrap.dedent( _ops_src ) )
+
+  # The script runs from tmpdir, so point it at the tree under test
+  root = os.path.dirname( os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) ) )
+  path = os.environ.get( "PYTHONPATH" )
+  env  = dict( os.environ, PYMTL_BITS_UNCHECKED="1",
+               PYTHONPATH=root + os.pathsep + path if path else root )
+  ret = subprocess.run( [ sys.executable, str(src) ], env=env,
+                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                        universal_newlines=True )
+  assert ret.returncode == 0, ret.stdout
@@ -108,7 +108,14 @@ class Component( ComponentLevel7 ):
 
   def _flush_pending_value_connections( s ):
     if s._dsl._has_pending_value_connections:
-      s._dsl.all_value_nets = s._resolve_value_connections()
+      # Only re-resolve the nets touched by the mutations since the last
+      # flush. None means we don't know, so resolve everything.
+      dirty = s._dsl._dirty_value_signals
+      if dirty is None:
+        s._dsl.all_value_nets = s._resolve_value_connections()
+      else:
+        s._dsl.all_value_nets = s._resolve_value_connections_incremental( dirty )
+      s._dsl._dirty_value_signals = set()
       s._dsl._has_pending_value_connections = False
 
   def _flush_pending_method_connections( s ):
@@ -215,6 +222,9 @@ class Component( ComponentLevel7 ):
     for c in added_components:
       top._collect_vars( c )
 
+    if added_signals:
+      top._mark_dirty_value_signals( added_signals )
+
     # Lazy -- to avoid resolve_connection call which takes non-trivial
     # time upon adding any connect, I just mark pending here. Whenever you
     # call the right API which is get_all_value_nets()/get_method_nets(),
@@ -414,6 +424,11 @@ class Component( ComponentLevel7 ):
       for y in removed_consts:
         del y._dsl.parent_obj
 
+      # The nets of the removed signals and their outside neighbors have
+      # to be re-resolved
+      top._mark_dirty_value_signals( removed_signals )
+      top._mark_dirty_value_signals( [ x for x, _ in saved_connections if isinstance( x, Signal ) ] )
+
       # We don't break nets anymore. Instead, we set the flags to true so
       # that the next get_xxx_net will immediately recollect nets.
       top._dsl._has_pending_value_connections = True
@@ -829,7 +844,7 @@ class Component( ComponentLevel7 ):
 
       top._dsl.all_adjacency[o1].add(o2)
       top._dsl.all_adjacency[o2].add(o1)
-      top._dsl._has_pending_value_connections = True
+      top._mark_dirty_value_signals( (o1, o2) )
 
   def add_connections( s, *args ):
     try:
@@ -848,7 +863,20 @@ class Component( ComponentLevel7 ):
               .format( (i<<1)+1, (i<<1)+2 , e ) )
 
     for x, adjs in s._dsl.adjacency.items():
-      top._dsl.all_adjacency[x].update( adjs )
+      new_adjs = adjs - top._dsl.all_adjacency[x]
+      if new_adjs:
+        top._dsl.all_adjacency[x].update( new_adjs )
+        if isinstance( x, Signal ):
+          top._mark_dirty_value_signals( [ x ] )
+          top._mark_dirty_value_signals( [ y for y in new_adjs if isinstance( y, Signal ) ] )
+
+  def _mark_dirty_value_signals( top, signals ):
+    # Record the signals whose connections changed so that the next flush
+    # only needs to re-resolve their nets
+    top._dsl._has_pending_value_connections = True
+    dirty = top._dsl._dirty_value_signals
+    if dirty is not None:
+      dirty.update( signals )
 
   # TODO implement everything below and test them
 
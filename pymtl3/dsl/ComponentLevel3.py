@@ -398,7 +398,68 @@ class ComponentLevel3( ComponentLevel2 ):
 
     nets = s._floodfill_nets( s._dsl.all_signals, s._dsl.all_adjacency )
 
-    # Then figure out writers: all writes in upblks and their nest objects
+    return s._resolve_net_writers( nets )
+
+  def _resolve_value_connections_incremental( s, dirty ):
+    """ Only re-resolve the nets that contain a signal in dirty, i.e., a
+    signal whose connections changed since the last resolution.
+
+    The writer of a net only depends on the writers of signals that share
+    the same top level signal (ancestors, descendants and overlapping
+    slices), so we keep expanding the set of re-resolved nets until no
+    untouched net shares a top level signal with them. Untouched nets are
+    kept as they are. """
+
+    adjacency = s._dsl.all_adjacency
+
+    def alive( x ):
+      if isinstance( x, Const ):
+        return x in adjacency and hasattr( x._dsl, 'parent_obj' )
+      return x in s._dsl.all_signals
+
+    old_nets = s._dsl.all_value_nets
+
+    # Nets that contain a dirty or deleted signal are always re-resolved.
+    # The others are indexed by the top level signals of their members.
+
+    affected = set()
+    tls_nets = defaultdict(list)
+    for i, (_, net) in enumerate( old_nets ):
+      for x in net:
+        if x in dirty or not alive( x ):
+          affected.add( i )
+        elif not isinstance( x, Const ):
+          tls_nets[ x.get_top_level_signal() ].append( i )
+
+    seeds = { x for x in dirty if alive( x ) }
+    for i in affected:
+      seeds.update( [ x for x in old_nets[i][1] if alive( x ) ] )
+
+    while True:
+      nets = s._floodfill_nets( seeds, adjacency )
+
+      # Pull in untouched nets that share a top level signal with the new
+      # nets and floodfill again
+      expanded = False
+      for net in nets:
+        for x in net:
+          if not isinstance( x, Const ):
+            for i in tls_nets.get( x.get_top_level_signal(), () ):
+              if i not in affected:
+                affected.add( i )
+                seeds.update( old_nets[i][1] )
+                expanded = True
+      if not expanded:
+        break
+
+    return [ x for i, x in enumerate( old_nets ) if i not in affected ] + \
+           s._resolve_net_writers( nets )
+
+  def _resolve_net_writers( s, nets ):
+    """ Figure out the writer of each net. Return a list of tuples of
+    ( writer, net ). """
+
+    # Figure out writers: all writes in upblks and their nest objects
 
     writer_prop = {}
 
@@ -775,6 +836,9 @@ class ComponentLevel3( ComponentLevel2 ):
   def _elaborate_declare_vars( s ):
     super()._elaborate_declare_vars()
     s._dsl.all_adjacency = defaultdict(set)
+    # Signals whose connections changed after elaboration, None means
+    # all nets need to be resolved again
+    s._dsl._dirty_value_signals = set()
 
   # Override
   def _elaborate_collect_all_vars( s ):
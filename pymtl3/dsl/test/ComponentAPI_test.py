@@ -405,6 +405,85 @@ def test_connect_upblk_orders():
   assert u[1].__name__ == "up_ff"
   assert u[2].__name__ == "up_out2"
 
+# Test incremental net resolution after mutations
+
+def _nets_to_str( nets ):
+  return sorted( [ (repr(writer), sorted( [ repr(x) for x in net ] ))
+                   for writer, net in nets ] )
+
+def test_replace_component_incremental_nets():
+
+  @bitstruct
+  class Pair:
+    a: Bits16
+    b: Bits16
+
+  class Wrap( Component ):
+    def construct( s ):
+      s.in_ = InPort( Pair )
+      s.out = OutPort( Bits32 )
+      s.w   = Wire( Bits32 )
+
+      s.inner = [ Real_shamt( i ) for i in range(3) ]
+      s.inner[0].in_[0:16]  //= s.in_.a
+      s.inner[0].in_[16:32] //= s.in_.b
+      for i in range(2):
+        s.inner[i].out //= s.inner[i+1].in_
+      s.inner[2].out //= s.w
+      s.w[0:16]  //= s.out[0:16]
+      s.w[16:32] //= s.out[16:32]
+
+  a = Wrap()
+  a.elaborate()
+  for i in range(3):
+    a.replace_component( a.inner[i], Real_shamt2 )
+    assert _nets_to_str( a.get_all_value_nets() ) == \
+           _nets_to_str( a._resolve_value_connections() )
+
+  simple_sim_pass( a )
+  a.in_ = Pair( 1, 0 )
+  a.tick()
+  assert a.out == 1 + 0 + 1 + 2
+
+def test_add_connection_incremental_nets():
+
+  class Inner( Component ):
+    def construct( s ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( Bits32 )
+      @update
+      def up_inner():
+        s.out @= s.in_ + 1
+
+  class Top( Component ):
+    def construct( s ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( Bits32 )
+      s.inner = Inner()
+      s.inner.in_ //= s.in_
+      s.inner.out //= s.out
+
+  a = Top()
+  a.elaborate()
+  nets = a.get_all_value_nets()
+
+  a.add_value_port( a, 'debug', OutPort( Bits32 ) )
+  a.add_value_port( a.inner, 'debug', OutPort( Bits32 ) )
+  a.add_connection( a.inner.debug, a.debug )
+  a.add_connection( a.inner.debug, a.inner.in_ )
+
+  new_nets = a.get_all_value_nets()
+  assert _nets_to_str( new_nets ) == _nets_to_str( a._resolve_value_connections() )
+  # The untouched net (top.out) is not resolved again
+  out_net = [ x for x in nets if a.out in x[1] ][0]
+  assert any( x is out_net for x in new_nets )
+
+  simple_sim_pass( a )
+  a.in_ = Bits32(7)
+  a.tick()
+  assert a.out == 8
+  assert a.debug == 7
+
 # def test_garbage_collection():
 
   # class X( Component ):
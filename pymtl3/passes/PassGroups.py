@@ -1,20 +1,52 @@
-from .autotick.OpenLoopCLPass import OpenLoopCLPass
+"""
+========================================================================
+PassGroups.py
+========================================================================
+The pass groups that make a component simulatable. The passes are
+imported when a pass group is applied rather than when pymtl3 is
+imported, because some of them pull in the translation backends.
+"""
+import importlib
+
 from .BasePass import BasePass
-from .sim.DynamicSchedulePass import DynamicSchedulePass
-from .sim.GenDAGPass import GenDAGPass
-from .sim.PrepareSimPass import PrepareSimPass
-from .sim.SimpleSchedulePass import SimpleSchedulePass
-from .sim.SimpleTickPass import SimpleTickPass
-from .sim.WrapGreenletPass import WrapGreenletPass
-from .tracing.CLLineTracePass import CLLineTracePass
-from .tracing.LineTraceParamPass import LineTraceParamPass
-from .tracing.PrintTextWavePass import PrintTextWavePass
-from .tracing.VcdGenerationPass import VcdGenerationPass
+
+# Where to find the passes that used to be importable from this module
+_pass_modules = {
+  'OpenLoopCLPass'        : '.autotick.OpenLoopCLPass',
+  'DynamicSchedulePass'   : '.sim.DynamicSchedulePass',
+  'GenDAGPass'            : '.sim.GenDAGPass',
+  'PrepareSimPass'        : '.sim.PrepareSimPass',
+  'ScheduleCache'         : '.sim.ScheduleCache',
+  'SimpleSchedulePass'    : '.sim.SimpleSchedulePass',
+  'SimpleTickPass'        : '.sim.SimpleTickPass',
+  'SpecializeHelpersPass' : '.sim.SpecializeHelpersPass',
+  'WrapGreenletPass'      : '.sim.WrapGreenletPass',
+  'CLLineTracePass'       : '.tracing.CLLineTracePass',
+  'LineTraceParamPass'    : '.tracing.LineTraceParamPass',
+  'PrintTextWavePass'     : '.tracing.PrintTextWavePass',
+  'ProfileSimPass'        : '.tracing.ProfileSimPass',
+  'VcdGenerationPass'     : '.tracing.VcdGenerationPass',
+}
+
+def __getattr__( name ):
+  if name in _pass_modules:
+    module = importlib.import_module( _pass_modules[ name ], __package__ )
+    return getattr( module, name )
+  raise AttributeError( f"module {__name__!r} has no attribute {name!r}" )
 
 
 # SimpleSim can be used when the UDG is a DAG
 class SimpleSimPass( BasePass ):
   def __call__( s, top ):
+    from .sim.GenDAGPass import GenDAGPass
+    from .sim.PrepareSimPass import PrepareSimPass
+    from .sim.SimpleSchedulePass import SimpleSchedulePass
+    from .sim.WrapGreenletPass import WrapGreenletPass
+    from .tracing.CLLineTracePass import CLLineTracePass
+    from .tracing.LineTraceParamPass import LineTraceParamPass
+    from .tracing.PrintTextWavePass import PrintTextWavePass
+    from .tracing.VcdGenerationPass import VcdGenerationPass
+
     LineTraceParamPass()( top )
     GenDAGPass()( top )
     WrapGreenletPass()( top )
@@ -26,38 +58,96 @@ class SimpleSimPass( BasePass ):
     PrepareSimPass(print_line_trace=False)( top )
 
 class DefaultPassGroup( BasePass ):
-  def __init__( s, *, vcdwave=None, textwave=False,
-                      linetrace=False, reset_active_high=True ):
+  def __init__( s, *, vcdwave=None, vcdwave_async=False, binwave=None, textwave=False,
+                      linetrace=False, linetrace_file=None, reset_active_high=True,
+                      schedule_cache=None, profile=False, pack_arrays=False,
+                      specialize_helpers=False ):
 
     s.vcdwave = vcdwave
+    # Write the vcd file in a background thread, see AsyncWaveWriter
+    s.vcdwave_async = vcdwave_async
+    # Binary waveform file name, see BinaryWaveGenerationPass
+    s.binwave = binwave
     s.textwave = textwave
     s.linetrace = linetrace
+    # Record the line trace for later rendering, see LineTraceRecordPass
+    s.linetrace_file = linetrace_file
     s.reset_active_high = reset_active_high
+    # ScheduleCache instance, otherwise $PYMTL_SCHEDULE_CACHE is used
+    s.schedule_cache = schedule_cache
+    s.profile = profile
+    s.pack_arrays = pack_arrays
+    s.specialize_helpers = specialize_helpers
 
   def __call__( s, top ):
+    from .sim.DynamicSchedulePass import DynamicSchedulePass
+    from .sim.GenDAGPass import GenDAGPass
+    from .sim.PrepareSimPass import PrepareSimPass
+    from .sim.ScheduleCache import ScheduleCache
+    from .sim.SpecializeHelpersPass import SpecializeHelpersPass
+    from .sim.WrapGreenletPass import WrapGreenletPass
+    from .tracing.BinaryWaveGenerationPass import BinaryWaveGenerationPass
+    from .tracing.CLLineTracePass import CLLineTracePass
+    from .tracing.LineTraceParamPass import LineTraceParamPass
+    from .tracing.LineTraceRecordPass import LineTraceRecordPass
+    from .tracing.PrintTextWavePass import PrintTextWavePass
+    from .tracing.ProfileSimPass import ProfileSimPass
+    from .tracing.TraceTriggerPass import TraceTriggerPass
+    from .tracing.VcdGenerationPass import VcdGenerationPass
 
     if s.vcdwave:
       top.set_metadata( VcdGenerationPass.vcd_file_name, s.vcdwave )
+      top.set_metadata( VcdGenerationPass.vcd_async, s.vcdwave_async )
+
+    if s.binwave:
+      top.set_metadata( BinaryWaveGenerationPass.wave_file_name, s.binwave )
 
     if s.textwave:
       top.set_metadata( PrintTextWavePass.enable, True )
 
+    if s.linetrace_file is not None:
+      top.set_metadata( LineTraceRecordPass.trace_file_name, s.linetrace_file )
+
+    if s.profile:
+      top.set_metadata( ProfileSimPass.enable, True )
+
+    cache = s.schedule_cache or ScheduleCache.from_env()
+    if cache is not None:
+      cache.load( top )
+
+    if s.specialize_helpers:
+      SpecializeHelpersPass()( top )
+
     LineTraceParamPass()( top )
     GenDAGPass()( top )
     WrapGreenletPass()( top )
     CLLineTracePass()( top )
     DynamicSchedulePass()( top )
+
+    if cache is not None:
+      cache.store( top )
+
+    # Wrap the blocks after the schedule is cached
+    ProfileSimPass()( top )
+    TraceTriggerPass()( top )
     VcdGenerationPass()( top )
+    BinaryWaveGenerationPass()( top )
     PrintTextWavePass()( top )
+    LineTraceRecordPass()( top )
 
     PrepareSimPass(print_line_trace=s.linetrace,
-                   reset_active_high=s.reset_active_high)( top )
+                   reset_active_high=s.reset_active_high,
+                   pack_signal_arrays=s.pack_arrays)( top )
 
 class AutoTickSimPass( BasePass ):
   def __init__( s, print_line_trace=True ):
     s.print_line_trace = print_line_trace
 
   def __call__( s, top ):
+    from .autotick.OpenLoopCLPass import OpenLoopCLPass
+    from .sim.GenDAGPass import GenDAGPass
+    from .sim.WrapGreenletPass import WrapGreenletPass
+
     top.elaborate()
     GenDAGPass()( top )
     WrapGreenletPass()( top )
@@ -1 +1,2 @@
 from .PassGroups import *
+from .PassGroups import __getattr__
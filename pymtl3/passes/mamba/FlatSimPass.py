@@ -0,0 +1,437 @@
+"""
+========================================================================
+FlatSimPass.py
+========================================================================
+Generate sim_tick and sim_eval_combinational as single flat functions.
+Instead of calling one closure per update block, the bodies of update
+blocks, net blocks, and the posedge flip function are inlined into one
+Python source for the whole design. Components (and interfaces) that are
+reached through s.x.y are looked up once at code generation time and
+bound to variables of the generated closure.
+
+Globals and closure variables that the update blocks read are bound by
+value when the code is generated, like the components. If a block reads
+a global or closure variable that is rebound later, the flat functions
+keep using the old object; mutating that object in place is fine.
+
+The generated source is written to disk under a content-addressed name
+and imported through importlib, so later runs that generate the same
+source directly reuse the cached bytecode. The files go to src_dir,
+$PYMTL_FLAT_SIM_DIR if that is not given, or a per-user directory in
+the system temp directory.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import ast
+import hashlib
+import importlib.util
+import io
+import os
+import re
+import tempfile
+import textwrap
+import tokenize
+
+from pymtl3.dsl.Component import Component
+from pymtl3.dsl.Connectable import Interface, MethodPort
+
+from ..sim.PrepareSimPass import PrepareSimPass
+
+# Constructs that cannot be pasted into another function body as-is
+_UNSUPPORTED_NODES = (
+  ast.Return, ast.Yield, ast.YieldFrom, ast.Await, ast.Global, ast.Nonlocal,
+  ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda,
+  ast.Import, ast.ImportFrom, ast.JoinedStr,
+)
+
+_valid_id = re.compile(r'[^0-9a-zA-Z_]')
+
+def default_src_dir():
+  """Return $PYMTL_FLAT_SIM_DIR, or a directory of the current user in
+  the system temp directory."""
+  path = os.environ.get( 'PYMTL_FLAT_SIM_DIR' )
+  if path:
+    return os.path.abspath( os.path.expanduser( path ) )
+  user = os.getuid() if hasattr( os, 'getuid' ) else os.getlogin()
+  return os.path.join( tempfile.gettempdir(), f"pymtl3_flat_sim_{user}" )
+
+class FlatSimPass( PrepareSimPass ):
+
+  def __init__( self, print_line_trace=True, reset_active_high=True,
+                src_dir=None ):
+    super().__init__( print_line_trace, reset_active_high )
+    self.src_dir = src_dir
+
+  # Override
+  def __call__( self, top ):
+    self.gen = _FlatCodeGen( top )
+    super().__call__( top )
+
+    top._sim.flat_src_file = self.gen.finalize( top, self.src_dir )
+
+  # Override
+  def create_sim_eval_comb( self, top ):
+    if len( top.get_all_object_filter( lambda x: isinstance( x, MethodPort ) ) ) == 0 and \
+       len( top.get_all_update_once() ) == 0:
+      top.sim_eval_combinational = self.gen.add_function( 'sim_eval_combinational',
+        [top._sim.check_top_level_inports] + top._sched.update_schedule )
+    else:
+      super().create_sim_eval_comb( top )
+
+  # Override
+  def create_sim_tick( self, top ):
+    final_schedule = []
+
+    # Pure RTL -- tick update blocks first
+    if len( top.get_all_object_filter( lambda x: isinstance( x, MethodPort ) ) ) == 0 and \
+       len( top.get_all_update_once() ) == 0:
+      final_schedule = top._sched.update_schedule[::]
+
+    if self.print_line_trace and hasattr( top, 'line_trace' ):
+      final_schedule.append( top.print_line_trace )
+    final_schedule += self.collect_ff_funcs( top )
+    final_schedule += top._sched.update_schedule
+    final_schedule.append( top._sim.check_top_level_inports )
+    top.sim_tick = self.gen.add_function( 'sim_tick', final_schedule )
+
+#-------------------------------------------------------------------------
+# _FlatCodeGen
+#-------------------------------------------------------------------------
+# Functions added by add_function are only placeholders until finalize()
+# compiles the whole module. The placeholders then dispatch to the
+# compiled functions.
+
+class _FlatCodeGen:
+
+  def __init__( self, top ):
+    self.top = top
+
+    self.bound_names  = {} # id(obj) -> name
+    self.bound_list   = [] # (name, obj), in binding order
+
+    self.inline_cache = {}
+    self.functions    = []
+    self.compiled     = {}
+
+    self.upblks  = top.get_all_update_blocks()
+    self.genblks = top._dag.genblks
+    self.flip_src = getattr( top._sched, 'schedule_posedge_flip_src', None )
+    self.flips    = set( top._sched.schedule_posedge_flip )
+
+  def bind( self, obj, hint ):
+    key = id(obj)
+    if key not in self.bound_names:
+      name = f"_v{len(self.bound_list)}_{_valid_id.sub('_', hint)}"
+      self.bound_names[ key ] = name
+      self.bound_list.append( (name, obj) )
+    return self.bound_names[ key ]
+
+  def add_function( self, name, schedule ):
+    lines = []
+    for f in schedule:
+      body = self.inline( f )
+      if body is None:
+        lines.append( f"{self.bind( f, f.__name__ )}()" )
+      else:
+        lines.append( f"# {f.__name__}" )
+        lines.extend( body )
+
+    self.functions.append( (name, lines) )
+
+    compiled = self.compiled
+    def placeholder():
+      compiled[ name ]()
+    placeholder.__name__ = name
+    return placeholder
+
+  #-----------------------------------------------------------------------
+  # finalize
+  #-----------------------------------------------------------------------
+
+  def finalize( self, top, src_dir ):
+    src = [ f"# Flat simulation functions of {top.__class__.__name__}",
+            f"# Generated by FlatSimPass, do not edit",
+            "",
+            "def compile_flat_sim( _bound ):" ]
+
+    if self.bound_list:
+      src.append( f"  {', '.join( [ x for x, _ in self.bound_list ] )}, = _bound" )
+
+    for name, lines in self.functions:
+      src.append( f"  def {name}():" )
+      src.append( "    pass" )
+      src.extend( [ f"    {x}" for x in lines ] )
+
+    src.append( f"  return {{ {', '.join( [ f'{x!r}: {x}' for x, _ in self.functions ] )} }}" )
+    src = "\n".join( src ) + "\n"
+
+    digest = hashlib.sha1( src.encode() ).hexdigest()[:16]
+
+    if src_dir is None:
+      src_dir = default_src_dir()
+    os.makedirs( src_dir, exist_ok=True )
+    filename = os.path.join( src_dir, f"{top.__class__.__name__}__flat_sim_{digest}.py" )
+
+    # Content-addressed file: if it is there with exactly this source,
+    # Python's bytecode cache can be reused. Otherwise (re)write it
+    # atomically so that concurrent runs never import a partial file.
+    try:
+      with open( filename ) as f:
+        up_to_date = f.read() == src
+    except OSError:
+      up_to_date = False
+
+    if not up_to_date:
+      tmp = f"{filename}.{os.getpid()}.tmp"
+      with open( tmp, 'w' ) as f:
+        f.write( src )
+      os.replace( tmp, filename )
+
+    spec   = importlib.util.spec_from_file_location( f"_pymtl_flat_sim_{digest}", filename )
+    module = importlib.util.module_from_spec( spec )
+    spec.loader.exec_module( module )
+
+    self.compiled.update( module.compile_flat_sim( tuple( [ y for _, y in self.bound_list ] ) ) )
+
+    # Directly expose the compiled functions to the user
+    for name, _ in self.functions:
+      setattr( top, name, self.compiled[ name ] )
+
+    return filename
+
+  #-----------------------------------------------------------------------
+  # inline
+  #-----------------------------------------------------------------------
+  # Return a list of source lines that can replace a call to f, or None if
+  # f cannot be inlined.
+
+  def inline( self, f ):
+    if f in self.inline_cache:
+      return self.inline_cache[ f ]
+
+    ret = None
+    src = self.get_source( f )
+    if src is not None:
+      try:
+        ret = self.rewrite( f, src )
+      except (SyntaxError, tokenize.TokenError):
+        ret = None
+
+    self.inline_cache[ f ] = ret
+    return ret
+
+  def get_source( self, f ):
+    if f in self.upblks:
+      host = self.top.get_update_block_host_component( f )
+      info = host.get_update_block_info( f )
+      # Skip lambdas and generated blocks
+      if info is None or info[0]:
+        return None
+      return textwrap.dedent( info[1] )
+
+    if f in self.genblks:
+      return self.top._dag.genblk_src.get( f )
+
+    if f in self.flips:
+      return self.flip_src
+
+    return None
+
+  def rewrite( self, f, src ):
+    if any( ord(c) > 127 for c in src ):
+      return None
+
+    code = f.__code__
+    if code.co_argcount or code.co_kwonlyargcount:
+      return None
+
+    tree = ast.parse( src )
+    fdef = None
+    for node in ast.walk( tree ):
+      if isinstance( node, ast.FunctionDef ) and node.name == f.__name__:
+        fdef = node
+        break
+    if fdef is None:
+      return None
+
+    # An all-pass body can simply vanish
+    if all( isinstance( x, ast.Pass ) for x in fdef.body ):
+      return []
+
+    if fdef.body[0].lineno == fdef.lineno:
+      return None
+
+    comp_vars = set()
+    for node in ast.walk( fdef ):
+      if node is not fdef and isinstance( node, _UNSUPPORTED_NODES ):
+        return None
+      if isinstance( node, ast.comprehension ):
+        comp_vars.update( x.id for x in ast.walk( node.target ) if isinstance( x, ast.Name ) )
+
+    # Resolve each name to a local, a bound object, or a builtin
+
+    free_vals = {}
+    if f.__closure__:
+      for name, cell in zip( code.co_freevars, f.__closure__ ):
+        try:
+          free_vals[ name ] = cell.cell_contents
+        except ValueError:
+          pass
+
+    # Comprehension variables are left untouched, so they must not shadow
+    # anything that is renamed
+    if any( x in code.co_varnames or x in free_vals or x in f.__globals__
+            for x in comp_vars ):
+      return None
+
+    blk_id = len( self.inline_cache )
+    local_names = set( code.co_varnames )
+
+    def resolve( name ):
+      if name in local_names:
+        return f"_l{blk_id}_{name}", None
+      if name in free_vals:
+        return self.bind( free_vals[ name ], name ), free_vals[ name ]
+      if name in f.__globals__:
+        return self.bind( f.__globals__[ name ], name ), f.__globals__[ name ]
+      # builtins and comprehension variables stay as they are
+      return name, None
+
+    # Collect replacements: (lineno, col) of a name token -> (number of
+    # tokens to consume, new text)
+
+    replace = {}
+
+    for node in ast.walk( fdef ):
+      if node is fdef:
+        continue
+
+      if isinstance( node, (ast.Attribute, ast.Subscript) ):
+        chain = self.collapse_chain( node, resolve )
+        if chain is not None:
+          base, ntokens, text = chain
+          key = (base.lineno, base.col_offset)
+          if key not in replace or replace[ key ][0] < ntokens:
+            replace[ key ] = (ntokens, text)
+
+      elif isinstance( node, ast.Name ):
+        key = (node.lineno, node.col_offset)
+        if key not in replace:
+          new_name, _ = resolve( node.id )
+          if new_name != node.id:
+            replace[ key ] = (1, new_name)
+
+    # Find the line range of the function body
+
+    lines = src.splitlines()
+    first = fdef.body[0].lineno
+    last  = getattr( fdef, 'end_lineno', None )
+    if last is None:
+      last = first
+      indent = fdef.col_offset
+      for i in range( first, len(lines) ):
+        stripped = lines[i].lstrip()
+        if stripped and len(lines[i]) - len(stripped) <= indent:
+          break
+        last = i + 1
+
+    # Tokenize the body and apply the replacements, right to left
+
+    body_src = "\n".join( lines[first-1:last] ) + "\n"
+    tokens = list( tokenize.generate_tokens( io.StringIO( body_src ).readline ) )
+
+    edits = []
+    i = 0
+    while i < len(tokens):
+      tok = tokens[i]
+      if tok.type == tokenize.STRING and tok.start[0] != tok.end[0]:
+        return None
+      if tok.type == tokenize.NAME:
+        key = (tok.start[0] + first - 1, tok.start[1])
+        if key in replace:
+          ntokens, text = replace[ key ]
+          end = tokens[ i + ntokens - 1 ].end
+          if end[0] != tok.start[0]:
+            return None
+          edits.append( (tok.start[0], tok.start[1], end[1], text) )
+          i += ntokens
+          continue
+      i += 1
+
+    body_lines = body_src.splitlines()
+    for lineno, start, end, text in reversed( edits ):
+      line = body_lines[ lineno-1 ]
+      body_lines[ lineno-1 ] = line[:start] + text + line[end:]
+
+    indent = fdef.body[0].col_offset
+    ret = []
+    for line in body_lines:
+      if not line.strip():
+        continue
+      if line[:indent].strip():
+        return None
+      ret.append( line[indent:] )
+    return ret
+
+  #-----------------------------------------------------------------------
+  # collapse_chain
+  #-----------------------------------------------------------------------
+  # For s.x.y[2].z where s.x.y[2] is a component, interface or list, bind
+  # the object once and return (base_name_node, number_of_tokens, text)
+  # to replace "s.x.y[2]" with the bound variable.
+
+  def collapse_chain( self, node, resolve ):
+    ops = []
+    x = node
+    while True:
+      if isinstance( x, ast.Attribute ):
+        ops.append( ('attr', x.attr) )
+      elif isinstance( x, ast.Subscript ):
+        idx = x.slice
+        if isinstance( idx, ast.Index ): # Python < 3.9
+          idx = idx.value
+        if isinstance( idx, ast.Num ) and isinstance( idx.n, int ):
+          ops.append( ('idx', idx.n) )
+        else:
+          return None
+      elif isinstance( x, ast.Name ):
+        break
+      else:
+        return None
+      x = x.value
+
+    base = x
+    name, obj = resolve( base.id )
+    if obj is None:
+      return None
+
+    ops.reverse()
+
+    depth = 0
+    ntokens = 1
+    cur_tokens = 1
+    hint = base.id
+    cur = obj
+    for kind, v in ops:
+      try:
+        if kind == 'attr':
+          nxt = getattr( cur, v )
+          cur_tokens += 2
+          hint += f"_{v}"
+        else:
+          nxt = cur[ v ]
+          cur_tokens += 3
+          hint += f"_{v}"
+      except Exception:
+        break
+      if not isinstance( nxt, (Component, Interface, list) ):
+        break
+      cur = nxt
+      depth += 1
+      ntokens = cur_tokens
+
+    if depth == 0:
+      return None
+
+    return base, ntokens, self.bind( cur, hint )
@@ -120,6 +120,9 @@ class HeuristicTopoPass( UnrollSimPass ):
     self.create_sim_eval_comb( top )
     self.create_sim_tick( top )
     self.create_sim_reset( top )
+    self.create_sim_checkpoint( top )
+    self.create_sim_fork( top )
+    self.create_sim_fast_forward( top )
 
   def schedule_intra_cycle( self, top ):
 
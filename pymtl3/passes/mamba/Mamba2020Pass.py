@@ -80,6 +80,9 @@ class Mamba2020Pass( UnrollSimPass ):
     self.create_sim_eval_comb( top )
     self.create_sim_tick( top )
     self.create_sim_reset( top )
+    self.create_sim_checkpoint( top )
+    self.create_sim_fork( top )
+    self.create_sim_fast_forward( top )
 
   #-----------------------------------------------------------------------
   # compile_meta_block
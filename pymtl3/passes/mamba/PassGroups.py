@@ -1,10 +1,12 @@
 from ..BasePass import BasePass
+from ..sim.DynamicSchedulePass import DynamicSchedulePass
 from ..sim.GenDAGPass import GenDAGPass
 from ..sim.PrepareSimPass import PrepareSimPass
 from ..sim.SimpleSchedulePass import SimpleSchedulePass
 from ..sim.WrapGreenletPass import WrapGreenletPass
 from ..tracing.CLLineTracePass import CLLineTracePass
 from ..tracing.LineTraceParamPass import LineTraceParamPass
+from .FlatSimPass import FlatSimPass
 from .HeuristicTopoPass import HeuristicTopoPass
 from .Mamba2020Pass import Mamba2020Pass
 from .UnrollSimPass import UnrollSimPass
@@ -52,3 +54,23 @@ class Mamba2020( BasePass ):
       LineTraceParamPass()( top )
     Mamba2020Pass(print_line_trace=s.print_line_trace,
                   reset_active_high=s.reset_active_high)( top )
+
+class FlatSim( BasePass ):
+  def __init__( s, *, waveform=None, print_line_trace=True, reset_active_high=True,
+                src_dir=None ):
+    s.waveform = waveform
+    s.print_line_trace = print_line_trace
+    s.reset_active_high = reset_active_high
+    s.src_dir = src_dir
+
+  def __call__( s, top ):
+    top.elaborate()
+    GenDAGPass()( top )
+    WrapGreenletPass()( top )
+    if s.print_line_trace:
+      CLLineTracePass()( top )
+      LineTraceParamPass()( top )
+    DynamicSchedulePass()( top )
+    FlatSimPass(print_line_trace=s.print_line_trace,
+                reset_active_high=s.reset_active_high,
+                src_dir=s.src_dir)( top )
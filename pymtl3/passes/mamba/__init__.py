@@ -1 +1 @@
-from .PassGroups import HeuTopoUnrollSim, Mamba2020, UnrollSim
+from .PassGroups import FlatSim, HeuTopoUnrollSim, Mamba2020, UnrollSim
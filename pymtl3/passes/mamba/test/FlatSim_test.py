@@ -0,0 +1,173 @@
+import os
+
+from pymtl3.datatypes import Bits8, Bits32, bitstruct, zext
+from pymtl3.dsl import *
+
+from ...sim.DynamicSchedulePass import DynamicSchedulePass
+from ...sim.GenDAGPass import GenDAGPass
+from ...sim.PrepareSimPass import PrepareSimPass
+from ..PassGroups import FlatSim
+
+
+def test_very_deep_dag( tmpdir ):
+
+  class Inner(Component):
+    def construct( s ):
+      s.in_ = InPort(Bits32)
+      s.out = OutPort(Bits32)
+
+      @update
+      def up():
+        s.out @= s.in_ + 1
+
+  class Top(Component):
+    def construct( s, N=2000 ):
+      s.inners = [ Inner() for i in range(N) ]
+      for i in range(N-1):
+        s.inners[i].out //= s.inners[i+1].in_
+
+      s.out = OutPort(Bits32)
+      @update_ff
+      def ff():
+        if s.reset:
+          s.out <<= 0
+        else:
+          s.out <<= s.out + s.inners[N-1].out
+
+    def line_trace( s ):
+      return str(s.inners[-1].out) + " " + str(s.out)
+
+  N = 2000
+  A = Top( N )
+
+  A.apply( FlatSim(src_dir=str(tmpdir)) )
+  A.sim_reset()
+
+  T = 0
+  while T < 5:
+    assert A.out == T * N
+    A.sim_tick()
+    T += 1
+
+  # The generated source is on disk
+  assert os.path.exists( A._sim.flat_src_file )
+  assert os.path.dirname( A._sim.flat_src_file ) == str(tmpdir)
+
+def test_equal_top_level( tmpdir ):
+  class A(Component):
+    def construct( s ):
+      @update
+      def up():
+        print(1)
+
+  a = A()
+  a.apply( FlatSim(src_dir=str(tmpdir)) )
+  a.sim_reset()
+
+  try:
+    a.reset = 0
+    a.sim_tick()
+  except AssertionError as e:
+    print(e)
+    assert str(e).startswith("Please use @= to assign top level InPort")
+    return
+  raise Exception("Should have thrown a invalid assignment error")
+
+def test_same_as_dynamic_schedule( tmpdir ):
+
+  @bitstruct
+  class SomeMsg:
+    a: Bits8
+    b: Bits32
+
+  class Sub(Component):
+    def construct( s ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( Bits32 )
+      s.tmp = Wire( Bits32 )
+
+      @update
+      def up_sub():
+        s.tmp @= 0
+        for i in range(4):
+          s.tmp @= s.tmp + zext( s.in_[i*8:i*8+8], 32 )
+        s.out @= s.tmp
+
+  class Top(Component):
+    def construct( s ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( SomeMsg )
+      s.reg = Wire( Bits32 )
+      s.msg = Wire( SomeMsg )
+      s.sub = [ Sub() for _ in range(2) ]
+
+      s.sub[0].in_ //= s.reg
+      s.sub[1].in_ //= s.sub[0].out
+
+      @update_ff
+      def up_reg():
+        if s.reset:
+          s.reg <<= 0
+        else:
+          s.reg <<= s.reg + s.in_
+
+      @update
+      def up_msg():
+        s.msg.a @= s.sub[1].out[0:8]
+        s.msg.b @= s.sub[1].out if s.reg[0] else s.reg
+
+      @update
+      def up_out():
+        s.out @= s.msg
+
+  A = Top()
+  A.elaborate()
+  A.apply( GenDAGPass() )
+  A.apply( DynamicSchedulePass() )
+  A.apply( PrepareSimPass(print_line_trace=False) )
+  A.sim_reset()
+
+  B = Top()
+  B.apply( FlatSim(src_dir=str(tmpdir), print_line_trace=False) )
+  B.sim_reset()
+
+  for v in [ 1, 0x0102, 0x3, 0xff00ff, 0, 7, 0x10000, 9 ]:
+    A.in_ @= v
+    B.in_ @= v
+    A.sim_eval_combinational()
+    B.sim_eval_combinational()
+    assert A.out == B.out
+    A.sim_tick()
+    B.sim_tick()
+    assert A.out == B.out
+
+def test_default_src_dir( tmpdir, monkeypatch ):
+  import tempfile
+
+  from ..FlatSimPass import default_src_dir
+
+  class A(Component):
+    def construct( s ):
+      s.out = OutPort(Bits8)
+      @update_ff
+      def ff():
+        s.out <<= s.out + 1
+
+  monkeypatch.delenv( "PYMTL_FLAT_SIM_DIR", raising=False )
+  assert os.path.dirname( default_src_dir() ) == tempfile.gettempdir()
+
+  monkeypatch.setenv( "PYMTL_FLAT_SIM_DIR", str(tmpdir) )
+  a = A()
+  a.apply( FlatSim() )
+  filename = a._sim.flat_src_file
+  assert os.path.dirname( filename ) == str(tmpdir)
+
+  # A file with the same name but another content is rewritten
+  with open( filename, 'w' ) as f:
+    f.write( "garbage" )
+  a = A()
+  a.apply( FlatSim() )
+  assert a._sim.flat_src_file == filename
+  a.sim_reset()
+  a.sim_tick()
+  assert a.out == 4
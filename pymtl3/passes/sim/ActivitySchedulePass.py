@@ -0,0 +1,297 @@
+"""
+========================================================================
+ActivitySchedulePass.py
+========================================================================
+An activity-driven (event-sensitive) variant of DynamicSchedulePass.
+The static schedule is kept, but every update block or net block whose
+inputs are all signals is wrapped into a guard that only calls the
+block when one of the signals it reads has changed since its last
+execution. Non-trivial SCCs either fall back to the static schedule or
+are guarded as a whole.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+from copy import deepcopy
+from types import BuiltinFunctionType, CodeType, FunctionType, ModuleType
+
+from pymtl3.datatypes import Bits, is_bitstruct_class
+from pymtl3.dsl import MetadataKey, Signal
+from pymtl3.dsl.NamedObject import NamedObject
+from pymtl3.extra.pypy import custom_exec
+from pymtl3.passes.BasePass import PassMetadata
+
+from .DynamicSchedulePass import DynamicSchedulePass
+
+
+_constant_types = ( int, float, complex, str, bytes, type(None), type )
+
+# Modules whose functions only depend on their arguments. Other modules,
+# e.g., random or time, return a different value on every call.
+_pure_modules = { "math", "cmath", "operator", "_operator" }
+
+def _is_pure_module( name ):
+  return name in _pure_modules or name == "pymtl3.datatypes" or \
+         name.startswith( "pymtl3.datatypes." )
+
+def _is_constant( obj ):
+  """Return True if obj is immutable and cannot hide state that the
+  block reads, e.g., numbers, classes like BitsN, math, and the helper
+  functions of pymtl3.datatypes."""
+  if isinstance( obj, _constant_types ):
+    return True
+  if isinstance( obj, tuple ):
+    return all( _is_constant( x ) for x in obj )
+  if isinstance( obj, ModuleType ):
+    return _is_pure_module( obj.__name__ )
+  if isinstance( obj, ( FunctionType, BuiltinFunctionType ) ):
+    return _is_pure_module( obj.__module__ or "" )
+  return False
+
+class ActivitySchedulePass( DynamicSchedulePass ):
+
+  # ActivitySchedulePass public pass data
+
+  #: Always execute all update blocks hosted in this component (and its
+  #: subcomponents) every cycle
+  #:
+  #: Type: ``bool``; input
+  #:
+  #: Default value: False
+  static = MetadataKey(bool)
+
+  def __init__( self, scc_fallback=True ):
+    self.scc_fallback = scc_fallback
+
+  def __call__( self, top ):
+    super().__call__( top )
+
+    top._sched.activity = PassMetadata()
+    top._sched.activity.guarded_blks = guarded = {}
+    top._sched.activity.static_blks  = static  = []
+
+    reads = self._collect_block_reads( top )
+
+    new_schedule = []
+    for blk in top._sched.update_schedule:
+      if blk in top._sched.scc_members:
+        members = top._sched.scc_members[ blk ]
+        if self.scc_fallback or any( x not in reads for x in members ):
+          static.append( blk )
+          new_schedule.append( blk )
+          continue
+        blk_reads = set()
+        for x in members:
+          blk_reads |= reads[ x ]
+        # Signals written inside the SCC are iterated to a fixed point by
+        # the wrapped SCC block, so only external inputs trigger it.
+        for x in members:
+          blk_reads -= self._get_block_writes( top, x )
+
+        if not blk_reads:
+          static.append( blk )
+          new_schedule.append( blk )
+          continue
+
+      elif blk in reads:
+        blk_reads = reads[ blk ]
+
+      else:
+        static.append( blk )
+        new_schedule.append( blk )
+        continue
+
+      wrapped = self._gen_guarded_blk( top, blk, blk_reads )
+      guarded[ wrapped ] = blk
+      new_schedule.append( wrapped )
+
+    top._sched.update_schedule = new_schedule
+
+  #-----------------------------------------------------------------------
+  # _collect_block_reads
+  #-----------------------------------------------------------------------
+  # Return a dict that maps every block eligible for activity-driven
+  # execution to the set of signals it reads. A block is eligible only if
+  # its behavior is fully determined by the values of the signals it
+  # reads, i.e., it doesn't touch any Python-level state of a component
+  # and doesn't call any method.
+
+  def _collect_block_reads( self, top ):
+    upblk_reads, _, upblk_calls = top.get_all_upblk_metadata()
+
+    ineligible = top.get_all_update_ff() | top.get_all_update_once() | \
+                 top._dag.greenlet_upblks
+
+    ret = {}
+
+    for blk in top.get_all_update_blocks():
+      if blk in ineligible or upblk_calls.get( blk ):
+        continue
+
+      host = top.get_update_block_host_component( blk )
+      if self._is_static_host( host ):
+        continue
+
+      if not upblk_reads[ blk ] or \
+         not self._only_reads_signals( host, blk ):
+        continue
+
+      ret[ blk ] = { x for x in upblk_reads[ blk ] if isinstance( x, Signal ) }
+
+    for blk in top._dag.genblks:
+      # Only the nets with a real writer signal have something to react
+      # to. Const nets are cheap and always executed.
+      if blk in top._dag.genblk_reads:
+        writer = top._dag.genblk_reads[ blk ][0]
+        if not self._is_static_host( writer.get_host_component() ):
+          ret[ blk ] = { writer }
+
+    return ret
+
+  def _is_static_host( self, host ):
+    while host is not None:
+      if host.has_metadata( self.static ) and host.get_metadata( self.static ):
+        return True
+      host = host.get_parent_object()
+    return False
+
+  @staticmethod
+  def _only_reads_signals( host, blk ):
+    cls = host.__class__
+    name = blk.__name__
+
+    # The guard only sees signals, so every other global or closure
+    # variable the block uses must be a constant, e.g., counter[0] += 1
+    # on a closure list must not be skipped
+    if not ActivitySchedulePass._only_uses_constants( blk ):
+      return False
+
+    # Calling anything through s.x means possible hidden state
+    for obj_name, _, _ in cls._name_fc[ name ]:
+      if obj_name[0][0] == 's':
+        return False
+
+    for obj_name, _, _ in cls._name_rd[ name ]:
+      if obj_name[0][0] != 's':
+        continue
+      if len(obj_name) == 1:
+        return False
+
+      obj = host
+      for field, idx in obj_name[1:]:
+        obj = getattr( obj, field, None )
+        for _ in idx:
+          if not isinstance( obj, list ):
+            break
+          if not obj:
+            return False
+          obj = obj[0]
+
+        if isinstance( obj, Signal ):
+          continue
+        if not isinstance( obj, NamedObject ):
+          return False
+
+      if not isinstance( obj, Signal ):
+        return False
+
+    return True
+
+  @staticmethod
+  def _only_uses_constants( blk ):
+    code = getattr( blk, '__code__', None )
+    if code is None:
+      return False
+
+    closure = {}
+    for var, cell in zip( code.co_freevars, blk.__closure__ or () ):
+      try:
+        closure[ var ] = cell.cell_contents
+      except ValueError:
+        return False
+
+    # Names of nested code objects, e.g., comprehensions, too. Names that
+    # are neither globals nor closure variables are locals, attributes,
+    # or builtins.
+    codes = [ code ]
+    while codes:
+      c = codes.pop()
+      codes.extend( x for x in c.co_consts if isinstance( x, CodeType ) )
+      for var in c.co_names + c.co_freevars:
+        if var == 's':
+          continue
+        if var in closure:
+          if not _is_constant( closure[ var ] ):
+            return False
+        elif var in blk.__globals__:
+          if not _is_constant( blk.__globals__[ var ] ):
+            return False
+
+    return True
+
+  @staticmethod
+  def _get_block_writes( top, blk ):
+    if blk in top._dag.genblk_writes:
+      return set( top._dag.genblk_writes[ blk ] )
+    return top.get_all_upblk_metadata()[1].get( blk, set() )
+
+  #-----------------------------------------------------------------------
+  # _gen_guarded_blk
+  #-----------------------------------------------------------------------
+  # Generate a wrapper that looks like the following:
+  #
+  # def activity_up():
+  #   nonlocal first, t1, t2
+  #   if first or s.x._uint != t1 or s.y.z != t2:
+  #     first = False
+  #     t1 = s.x._uint; t2 = s.y.z.clone()
+  #     blk()
+
+  def _gen_guarded_blk( self, top, blk, reads ):
+
+    # Same as DynamicSchedulePass, for slices of Bits we directly use the
+    # top level wide Bits, for bitstruct fields we use the field.
+
+    final_variables = set()
+    for x in reads:
+      w = x.get_top_level_signal()
+      if w is x or issubclass( w._dsl.Type, Bits ):
+        final_variables.add( w )
+      else:
+        final_variables.add( x )
+
+    var_names = []
+    copy_srcs = []
+    check_srcs = []
+
+    for i, var in enumerate( sorted( final_variables, key=repr ) ):
+      name = f"t{i}"
+      var_names.append( name )
+      if   issubclass( var._dsl.Type, Bits ):
+        copy_srcs.append( f"{name} = {var!r}._uint" )
+        check_srcs.append( f"{var!r}._uint != {name}" )
+      elif is_bitstruct_class( var._dsl.Type ):
+        copy_srcs.append( f"{name} = {var!r}.clone()" )
+        check_srcs.append( f"{var!r} != {name}" )
+      else:
+        copy_srcs.append( f"{name} = deepcopy({var!r})" )
+        check_srcs.append( f"{var!r} != {name}" )
+
+    src = """
+def gen_activity_blk( s, blk ):
+  first = True
+  {0} = None
+  def activity_{1}():
+    nonlocal first, {2}
+    if first or {3}:
+      first = False
+      {4}
+      blk()
+  return activity_{1}
+""".format( " = ".join( var_names ), blk.__name__, ", ".join( var_names ),
+            " or ".join( check_srcs ), "\n      ".join( copy_srcs ) )
+
+    _globals = { 'deepcopy': deepcopy }
+    _locals  = {}
+    custom_exec( compile( src, filename=f"activity_{blk.__name__}", mode="exec" ), _globals, _locals )
+    return _locals['gen_activity_blk']( top, blk )
@@ -9,14 +9,13 @@ import os
 from collections import defaultdict, deque
 from copy import deepcopy
 
-import py
-
 from pymtl3.datatypes import Bits, is_bitstruct_class
 from pymtl3.dsl.errors import UpblkCyclicError
 from pymtl3.extra.pypy import custom_exec
 from pymtl3.passes.BasePass import BasePass, PassMetadata
 from pymtl3.passes.errors import PassOrderError
 
+from .ScheduleCache import ScheduleCache, compile_cached, get_block_id
 from .SimpleSchedulePass import SimpleSchedulePass, dump_dag
 from .SimpleTickPass import SimpleTickPass
 
@@ -31,7 +30,9 @@ class DynamicSchedulePass( BasePass ):
 
     top._sched = PassMetadata()
 
-    self.schedule_intra_cycle( top )
+    if not top.has_metadata( ScheduleCache.schedule ) or \
+       not self.restore_intra_cycle( top, top.get_metadata( ScheduleCache.schedule ) ):
+      self.schedule_intra_cycle( top )
 
     # Reuse simple's ff and flip schedule
     simple = SimpleSchedulePass()
@@ -95,6 +96,9 @@ class DynamicSchedulePass( BasePass ):
 
     # Put the graph schedule to _sched
     top._sched.update_schedule = schedule = []
+    # Record the member blocks of each generated SCC block
+    top._sched.scc_members = {}
+    scc_srcs = {}
 
     scc_id = 0
     for i in scc_schedule:
@@ -169,17 +173,6 @@ class DynamicSchedulePass( BasePass ):
         # Shunning: we just simply loop over the whole SCC block
         # TODO performance optimizations using Mamba techniques within a SCC block
 
-        def gen_wrapped_SCCblk( s, scc, src ):
-
-          # TODO mamba?
-          scc_tick_func = SimpleTickPass.gen_tick_function( scc )
-          _globals = { 's': s, 'scc_tick_func': scc_tick_func, 'deepcopy': deepcopy,
-                       'UpblkCyclicError': UpblkCyclicError }
-          _locals  = {}
-
-          custom_exec(py.code.Source( src ).compile(), _globals, _locals)
-          return _locals[ 'generated_block' ]
-
         template = """
 def wrapped_SCC_{0}():
   N = 0
@@ -252,7 +245,63 @@ generated_block = wrapped_SCC_{0}
                                          ", ".join( [ x.__name__ for x in scc] ) )
 
         # print(scc_block_src)
-        schedule.append( gen_wrapped_SCCblk( top, tmp_schedule, scc_block_src ) )
+        scc_blk = self.gen_wrapped_SCCblk( top, tmp_schedule, scc_block_src )
+        top._sched.scc_members[ scc_blk ] = tmp_schedule
+        scc_srcs[ scc_blk ] = scc_block_src
+        schedule.append( scc_blk )
+
+    # Record the schedule in a form that survives re-elaboration
+    if top.has_metadata( ScheduleCache.codes ):
+      top._sched.schedule_ids = [
+        ( "scc", [ get_block_id( top, y ) for y in top._sched.scc_members[x] ], scc_srcs[x] )
+        if x in scc_srcs else get_block_id( top, x ) for x in schedule ]
+
+  def gen_wrapped_SCCblk( self, top, scc, src ):
+
+    # TODO mamba?
+    scc_tick_func = SimpleTickPass.gen_tick_function( scc )
+    _globals = { 's': top, 'scc_tick_func': scc_tick_func, 'deepcopy': deepcopy,
+                 'UpblkCyclicError': UpblkCyclicError }
+    _locals  = {}
+
+    fname = f"SCC ({', '.join( [ x.__name__ for x in scc ] )})"
+    custom_exec( compile_cached( top, src, fname ), _globals, _locals )
+    return _locals[ 'generated_block' ]
+
+  def restore_intra_cycle( self, top, schedule_ids ):
+    """ Rebuild the update schedule from the block ids recorded by a
+    previous run of the same design. Return False if any block is
+    missing. """
+
+    blks = {}
+    for blk in top._dag.final_upblks - top.get_all_update_ff():
+      blks[ get_block_id( top, blk ) ] = blk
+
+    top._sched.update_schedule = schedule = []
+    top._sched.scc_members = {}
+
+    for x in schedule_ids:
+      if isinstance( x, str ):
+        if x not in blks:
+          return False
+        schedule.append( blks[x] )
+      else:
+        _, members, src = x
+        if any( y not in blks for y in members ):
+          return False
+        tmp_schedule = [ blks[y] for y in members ]
+        scc_blk = self.gen_wrapped_SCCblk( top, tmp_schedule, src )
+        top._sched.scc_members[ scc_blk ] = tmp_schedule
+        schedule.append( scc_blk )
+
+    scheduled = set( schedule ) - set( top._sched.scc_members )
+    for v in top._sched.scc_members.values():
+      scheduled.update( v )
+    if scheduled != set( blks.values() ):
+      return False
+
+    top._sched.schedule_ids = schedule_ids
+    return True
 
 def kosaraju_scc( G, G_T ):
 
@@ -9,7 +9,6 @@ Author : Shunning Jiang
 Date   : Jan 18, 2018
 """
 from collections import defaultdict, deque
-from linecache import cache as line_cache
 
 from pymtl3.datatypes import *
 from pymtl3.datatypes.bitstructs import get_bitstruct_inst_all_classes
@@ -18,12 +17,23 @@ from pymtl3.dsl.errors import LeftoverPlaceholderError
 from pymtl3.extra.pypy import custom_exec
 from pymtl3.passes.BasePass import BasePass, PassMetadata
 
+from .ScheduleCache import compile_cached
+
 
 class GenDAGPass( BasePass ):
 
   def __call__( self, top ):
     top.check()
+
+    # Keep the net blocks of the last run so that re-running the pass
+    # after mutating the design (e.g., replace_component) only compiles
+    # the blocks of the nets that actually changed
+    genblk_cache = {}
+    if hasattr( top, '_dag' ):
+      genblk_cache = getattr( top._dag, 'genblk_cache', {} )
+
     top._dag = PassMetadata()
+    top._dag.genblk_cache = {}
 
     placeholders = [ x for x in top._dsl.all_named_objects
                      if isinstance( x, Placeholder ) ]
@@ -31,11 +41,11 @@ class GenDAGPass( BasePass ):
     if placeholders:
       raise LeftoverPlaceholderError( placeholders )
 
-    self._generate_net_blocks( top )
+    self._generate_net_blocks( top, genblk_cache )
     self._process_value_constraints( top )
     self._process_methods( top )
 
-  def _generate_net_blocks( self, top ):
+  def _generate_net_blocks( self, top, old_genblk_cache ):
     """ _generate_net_blocks:
     Each net is an update block. Readers are actually "written" here.
       >>> s.net_reader1 = s.net_writer
@@ -45,7 +55,17 @@ class GenDAGPass( BasePass ):
     top._dag.genblk_hostobj = {}
     top._dag.genblk_reads   = {}
     top._dag.genblk_writes  = {}
-    # top._dag.genblk_src     = {}
+    top._dag.genblk_src     = {}
+
+    genblk_cache = top._dag.genblk_cache
+
+    # Reuse the constants of the last run so that their ids, and hence the
+    # cache keys of the constant net blocks, stay the same
+    consts = {}
+    for _, _globals in old_genblk_cache.values():
+      const = _globals.get( '_const' )
+      if const is not None:
+        consts[ (const.nbits, int(const)) ] = const
 
     # Fall back to compiling one block at a time
     # This is currently because there might be different structs with
@@ -55,11 +75,22 @@ class GenDAGPass( BasePass ):
 
     # TODO see if directly compiling AST instead of source can be faster
     def compile_net_blk( _globals, src, writer ):
-      _locals = {}
-      fname = f"Net (writer is {writer!r}"
-      custom_exec( compile( src, filename=fname, mode="exec"), _globals, _locals )
-      line_cache[ fname ] = (len(src), None, src.splitlines(), fname )
-      return list(_locals.values())[0]
+      # The block only depends on the source and the objects it closes
+      # over, so we can reuse the one compiled in the last run
+      key = ( src, tuple( (k, id(v)) for k, v in _globals.items() ) )
+      entry = old_genblk_cache.get( key )
+      # Two nets may generate the same block (e.g., constant writers)
+      if entry is not None and key not in genblk_cache:
+        blk = entry[0]
+      else:
+        _locals = {}
+        fname = f"Net (writer is {writer!r}"
+        custom_exec( compile_cached( top, src, fname ), _globals, _locals )
+        blk = list(_locals.values())[0]
+      # Also keep _globals alive so that the ids in the key stay valid
+      genblk_cache[ key ] = ( blk, _globals )
+      top._dag.genblk_src[ blk ] = src
+      return blk
 
     for writer, signals in top.get_all_value_nets():
       if len(signals) == 1:
@@ -167,7 +198,17 @@ class GenDAGPass( BasePass ):
       lca_len = len( repr(wr_lca) )
       _globals = {'s': wr_lca }
 
-      if isinstance( writer, Const ) and type(writer._dsl.const) is not int:
+      if isinstance( writer, Const ) and isinstance( writer._dsl.const, Bits ):
+        # Close over an immutable constant instead of constructing a new
+        # Bits object from its repr every time the block is called
+        const = writer._dsl.const
+        key   = ( const.nbits, int(const) )
+        if key not in consts:
+          consts[ key ] = const_bits( *key )
+        _globals['_const'] = consts[ key ]
+        wstr = "_const"
+
+      elif isinstance( writer, Const ) and type(writer._dsl.const) is not int:
         types = get_bitstruct_inst_all_classes( writer._dsl.const )
 
         for t in types:
@@ -7,30 +7,41 @@ Author : Shunning Jiang
 Date   : Jan 26, 2020
 """
 
+import sys
+
 import py
 
-from pymtl3.datatypes import Bits, b1
+from pymtl3.datatypes import Bits, BitsArray, const_bits
 from pymtl3.dsl.Component import Component
-from pymtl3.dsl.Connectable import Const, Interface, MethodPort, Signal
+from pymtl3.dsl.Connectable import Const, Interface, MethodPort, Signal, Wire
 from pymtl3.dsl.NamedObject import NamedObject
 from pymtl3.extra.pypy import custom_exec
-from pymtl3.passes.backends.verilog import VerilogTBGenPass
 from pymtl3.passes.BasePass import BasePass, PassMetadata
 from pymtl3.passes.errors import PassOrderError
+from pymtl3.passes.tracing.BinaryWaveGenerationPass import BinaryWaveGenerationPass
 from pymtl3.passes.tracing.CLLineTracePass import CLLineTracePass
 from pymtl3.passes.tracing.LineTraceParamPass import LineTraceParamPass
+from pymtl3.passes.tracing.LineTraceRecordPass import LineTraceRecordPass
 from pymtl3.passes.tracing.PrintTextWavePass import PrintTextWavePass
+from pymtl3.passes.tracing.TraceTriggerPass import TraceTriggerPass
 from pymtl3.passes.tracing.VcdGenerationPass import VcdGenerationPass
 
+from .SimCheckpoint import sim_checkpoint, sim_restore
+from .SimFastForward import sim_fast_forward
+from .SimFork import sim_fork
 from .SimpleTickPass import SimpleTickPass
 
 
 class PrepareSimPass( BasePass ):
-  def __init__( self, print_line_trace=True, reset_active_high=True ):
+  def __init__( self, print_line_trace=True, reset_active_high=True,
+                pack_signal_arrays=False ):
     assert reset_active_high in [ True, False ]
 
-    self.print_line_trace  = print_line_trace
-    self.reset_active_high = reset_active_high
+    self.print_line_trace   = print_line_trace
+    self.reset_active_high  = reset_active_high
+    # Store lists of standalone Bits wires (register files, ROMs) in a
+    # BitsArray each, see find_packable_arrays
+    self.pack_signal_arrays = pack_signal_arrays
 
   def __call__( self, top ):
     if hasattr(top, "sim_reset"):
@@ -50,14 +61,17 @@ class PrepareSimPass( BasePass ):
 
     self.create_print_line_trace( top )
     self.create_sim_cycle_count( top )
-    self.create_lock_unlock_simulation( top )
+    self.create_lock_unlock_simulation( top, self.pack_signal_arrays )
 
     top.lock_in_simulation()
 
     self.create_sim_eval_comb( top )
     self.create_sim_tick( top )
     self.create_sim_reset( top )
-
+    self.create_sim_checkpoint( top )
+    self.create_sim_fork( top )
+    self.create_sim_fast_forward( top )
+    self.create_sim_finalize( top )
 
   def create_sim_eval_comb( self, top ):
     # Pure RTL design, add eval_combinational
@@ -92,11 +106,20 @@ class PrepareSimPass( BasePass ):
     if top.has_metadata( VcdGenerationPass.vcd_func ):
       ret.append( top.get_metadata( VcdGenerationPass.vcd_func ) )
 
+    if top.has_metadata( BinaryWaveGenerationPass.wave_func ):
+      ret.append( top.get_metadata( BinaryWaveGenerationPass.wave_func ) )
+
     if top.has_metadata( PrintTextWavePass.textwave_func ):
       ret.append( top.get_metadata( PrintTextWavePass.textwave_func ) )
 
-    if top.has_metadata( VerilogTBGenPass.vtbgen_hooks ):
-      ret.extend( top.get_metadata( VerilogTBGenPass.vtbgen_hooks ) )
+    if top.has_metadata( LineTraceRecordPass.record_func ):
+      ret.append( top.get_metadata( LineTraceRecordPass.record_func ) )
+
+    # The hooks can only be there if VerilogTBGenPass was imported, so
+    # the Verilog backend is not imported just to look up the key
+    tbgen = sys.modules.get( "pymtl3.passes.backends.verilog.tbgen.VerilogTBGenPass" )
+    if tbgen is not None and top.has_metadata( tbgen.VerilogTBGenPass.vtbgen_hooks ):
+      ret.extend( top.get_metadata( tbgen.VerilogTBGenPass.vtbgen_hooks ) )
 
     ret.extend( top._sched.schedule_ff )
     ret.extend( top._sched.schedule_posedge_flip )
@@ -114,39 +137,101 @@ class PrepareSimPass( BasePass ):
     up = SimpleTickPass.gen_tick_function( top._sched.update_schedule )
 
     print_line_trace = self.print_line_trace and hasattr( top, 'line_trace' )
-    active_high      = self.reset_active_high
+    reset_on         = const_bits( 1, self.reset_active_high )
+    reset_off        = const_bits( 1, not self.reset_active_high )
 
     def sim_reset():
       if print_line_trace:
         print()
       # cycle 0
-      top.reset @= b1( active_high )
+      top.reset @= reset_on
       up()
 
       ff()
       # cycle 1
       up()
       if print_line_trace:
-        print( f"{top._sim.simulated_cycles:3}r {top.line_trace()}" )
+        top._sim.print_reset_line_trace()
 
       ff()
       # cycle 2
       up()
       if print_line_trace:
-        print( f"{top._sim.simulated_cycles:3}r {top.line_trace()}" )
+        top._sim.print_reset_line_trace()
 
       ff()
       # cycle 3
-      top.reset @= b1( not active_high )
+      top.reset @= reset_off
       up()
 
     top.sim_reset = sim_reset
 
+  @staticmethod
+  def create_sim_checkpoint( top ):
+    def _sim_checkpoint( path ):
+      sim_checkpoint( top, path )
+    def _sim_restore( path ):
+      sim_restore( top, path )
+
+    top.sim_checkpoint = _sim_checkpoint
+    top.sim_restore    = _sim_restore
+
+  @staticmethod
+  def create_sim_fork( top ):
+    def _sim_fork( n, func, seed=None ):
+      return sim_fork( top, n, func, seed )
+
+    top.sim_fork = _sim_fork
+
+  @staticmethod
+  def create_sim_fast_forward( top ):
+    def _sim_fast_forward( max_cycles ):
+      return sim_fast_forward( top, max_cycles )
+
+    top.sim_fast_forward = _sim_fast_forward
+
+  @staticmethod
+  def create_sim_finalize( top ):
+    # Write out and close whatever the tracing passes buffered
+    funcs = []
+    if top.has_metadata( VcdGenerationPass.vcd_finalize_func ):
+      funcs.append( top.get_metadata( VcdGenerationPass.vcd_finalize_func ) )
+    if top.has_metadata( BinaryWaveGenerationPass.wave_finalize_func ):
+      funcs.append( top.get_metadata( BinaryWaveGenerationPass.wave_finalize_func ) )
+    if top.has_metadata( LineTraceRecordPass.record_finalize_func ):
+      funcs.append( top.get_metadata( LineTraceRecordPass.record_finalize_func ) )
+
+    def sim_finalize():
+      for func in funcs:
+        func()
+
+    top.sim_finalize = sim_finalize
+
   def create_print_line_trace( self, top ):
     if self.print_line_trace and hasattr( top, 'line_trace' ):
-      def print_line_trace():
-        print( f"{top._sim.simulated_cycles:3}: {top.line_trace()}" )
+
+      # Only print the cycles around the triggers
+      if top.has_metadata( TraceTriggerPass.trace_window ):
+        window = top.get_metadata( TraceTriggerPass.trace_window )
+        mark   = [ ':' ]
+        print_line_trace = window.gate(
+          lambda: f"{top._sim.simulated_cycles:3}{mark[0]} {top.line_trace()}",
+          lambda cycle, line: print( line ) )
+
+        def print_reset_line_trace():
+          mark[0] = 'r'
+          print_line_trace()
+          mark[0] = ':'
+
+      else:
+        def print_line_trace():
+          print( f"{top._sim.simulated_cycles:3}: {top.line_trace()}" )
+
+        def print_reset_line_trace():
+          print( f"{top._sim.simulated_cycles:3}r {top.line_trace()}" )
+
       top.print_line_trace = print_line_trace
+      top._sim.print_reset_line_trace = print_reset_line_trace
 
   @staticmethod
   def create_advance_sim_cycle( top ):
@@ -162,11 +247,42 @@ class PrepareSimPass( BasePass ):
     top.sim_cycle_count = sim_cycle_count
 
   @staticmethod
-  def create_lock_unlock_simulation( top ):
+  def find_packable_arrays( top ):
+    """Return ( host, name ) of the lists of Bits wires that are not
+    connected to anything other than a constant and are not sliced, so
+    their values can be stored in a BitsArray."""
+    connected = set()
+    for writer, signals in top.get_all_value_nets():
+      if not ( isinstance( writer, Const ) and len(signals) == 2 ):
+        connected.update( signals )
+
+    ret = []
+    for c in sorted( top._dsl.all_components, key=repr ):
+      for name, obj in c.__dict__.items():
+        if name[0] == '_' or not isinstance( obj, list ) or len(obj) < 2:
+          continue
+        if not isinstance( obj[0], Wire ):
+          continue
+        Type = obj[0]._dsl.Type
+        if not ( isinstance( Type, type ) and issubclass( Type, Bits ) ):
+          continue
+        double = obj[0]._dsl.needs_double_buffer
+        if all( isinstance( x, Wire ) and x._dsl.Type is Type and not x._dsl.slices and
+                x._dsl.needs_double_buffer == double and x not in connected for x in obj ):
+          ret.append( (c, name) )
+    return ret
+
+  @staticmethod
+  def create_lock_unlock_simulation( top, pack_signal_arrays=False ):
 
     def lock_in_simulation():
       top._check_called_at_elaborate_top( "lock_in_simulation" )
 
+      packable = []
+      if pack_signal_arrays:
+        packable = [ (host, name, list( getattr( host, name ) ))
+                     for host, name in PrepareSimPass.find_packable_arrays( top ) ]
+
       # Basically we want to avoid @= between elements in the same net since
       # we now use @=.
       # - First pass creates whole bunch of signals
@@ -255,6 +371,20 @@ class PrepareSimPass( BasePass ):
             else:
               setattr( current_obj, i, residence_value )
 
+      # Move the values of the packable lists into BitsArrays. The lists
+      # keep a view of each element in case some update block closes over
+      # the list instead of accessing it through the component.
+      packed_arrays = []
+      for host, name, signals in packable:
+        values = getattr( host, name )
+        array  = BitsArray( signals[0]._dsl.Type, len(values), values )
+        for i, x in enumerate( signals ):
+          values[i] = array[i]
+          signal_object_mapping[ x ] = (values, i, True, values[i])
+        setattr( host, name, array )
+        packed_arrays.append( (host, name, values) )
+
+      top._sim.packed_arrays = packed_arrays
       top._sim.signal_object_mapping = signal_object_mapping
       top._sim.locked_simulation = True
 
@@ -295,5 +425,8 @@ def check_top_level_inports():
         if is_list: current_obj[i] = obj
         else:       setattr( current_obj, i, obj )
 
+      for host, name, signals in top._sim.packed_arrays:
+        setattr( host, name, signals )
+
     top.lock_in_simulation = lock_in_simulation
     top.unlock_simulation  = unlock_simulation
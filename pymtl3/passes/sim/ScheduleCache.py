@@ -0,0 +1,285 @@
+"""
+========================================================================
+ScheduleCache.py
+========================================================================
+A persistent on-disk cache for the results of scheduling a design. Each
+entry is keyed on a structural hash of the elaborated hierarchy and
+stores the bytecode of the generated net/flip/SCC blocks and the
+schedule order, so that a later run of the same design can reuse them
+instead of compiling and sorting everything again.
+
+The cache is exchanged with the scheduling passes through metadata on
+the top component:
+
+  - ScheduleCache.codes   : dict of (source, filename) -> code object.
+                            compile_cached looks up and fills this
+                            dictionary.
+  - ScheduleCache.schedule: the cached update schedule that
+                            DynamicSchedulePass restores instead of
+                            scheduling from scratch.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import hashlib
+import marshal
+import os
+import pickle
+import sys
+from linecache import cache as line_cache
+
+from pymtl3.dsl import MetadataKey, Signal
+from pymtl3.version import __version__
+
+# Bump this whenever the format of a cache entry or the generated code
+# changes
+_CACHE_FORMAT = 1
+
+def compile_cached( top, src, filename ):
+  """Compile src, reusing the code object from the schedule cache of top
+  if there is one."""
+
+  line_cache[ filename ] = (len(src), None, src.splitlines(), filename)
+
+  if not top.has_metadata( ScheduleCache.codes ):
+    return compile( src, filename=filename, mode="exec" )
+
+  codes = top.get_metadata( ScheduleCache.codes )
+  code  = codes.get( (src, filename) )
+  if code is None:
+    code = codes[ (src, filename) ] = compile( src, filename=filename, mode="exec" )
+  return code
+
+def get_block_id( top, blk ):
+  """Return a name that identifies blk across different elaborations of
+  the same design."""
+
+  if blk in top._dag.genblks:
+    return blk.__name__
+
+  # Greenlet wrappers share the name with the original update block
+  for orig, wrapped in getattr( top._dag, 'blk_greenlet_mapping', {} ).items():
+    if wrapped is blk:
+      blk = orig
+      break
+
+  return f"{top.get_update_block_host_component( blk )!r}.{blk.__name__}"
+
+class ScheduleCache:
+
+  #: Compiled code objects of generated blocks, keyed by (source, filename)
+  #:
+  #: Type: ``dict``; input/output
+  codes = MetadataKey(dict)
+
+  #: Cached update schedule. Each element is either a block id (see
+  #: get_block_id) or a tuple of ( "scc", member block ids, source ) for
+  #: a wrapped SCC block.
+  #:
+  #: Type: ``list``; input
+  schedule = MetadataKey(list)
+
+  #: Structural hash of the design
+  #:
+  #: Type: ``str``; output
+  key = MetadataKey(str)
+
+  _instances = {}
+
+  def __init__( self, path, max_size=256*1024*1024 ):
+    self.path     = os.path.abspath( os.path.expanduser( path ) )
+    self.max_size = max_size
+
+    self.hits      = 0
+    self.misses    = 0
+    self.evictions = 0
+
+  @classmethod
+  def from_env( cls ):
+    """Return the shared cache in $PYMTL_SCHEDULE_CACHE, or None if the
+    environment variable is not set."""
+
+    path = os.environ.get( 'PYMTL_SCHEDULE_CACHE' )
+    if not path:
+      return None
+
+    if path not in cls._instances:
+      max_size = os.environ.get( 'PYMTL_SCHEDULE_CACHE_SIZE' )
+      if max_size:
+        cls._instances[ path ] = cls( path, int(max_size) )
+      else:
+        cls._instances[ path ] = cls( path )
+    return cls._instances[ path ]
+
+  def stats( self ):
+    total = self.hits + self.misses
+    return {
+      'hits'     : self.hits,
+      'misses'   : self.misses,
+      'evictions': self.evictions,
+      'hit_rate' : self.hits / total if total else 0.0,
+    }
+
+  def __repr__( self ):
+    return f"ScheduleCache({self.path!r}, hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+  #-----------------------------------------------------------------------
+  # load
+  #-----------------------------------------------------------------------
+  # Should be called on an elaborated top before GenDAGPass.
+
+  def load( self, top ):
+    key = self.structural_hash( top )
+    top.set_metadata( ScheduleCache.key, key )
+
+    entry = None
+    filename = self._entry_path( key )
+    try:
+      with open( filename, 'rb' ) as f:
+        entry = pickle.load( f )
+      if entry.get( 'format' ) != _CACHE_FORMAT:
+        entry = None
+    except FileNotFoundError:
+      pass
+    except Exception:
+      # A corrupted entry is just a miss
+      entry = None
+
+    if entry is None:
+      self.misses += 1
+      top.set_metadata( ScheduleCache.codes, {} )
+      return False
+
+    self.hits += 1
+    # Bump the modification time for least-recently-used eviction
+    try:
+      os.utime( filename )
+    except OSError:
+      pass
+
+    top.set_metadata( ScheduleCache.codes,
+                      { k: marshal.loads( v ) for k, v in entry['codes'].items() } )
+    top.set_metadata( ScheduleCache.schedule, entry['schedule'] )
+    return True
+
+  #-----------------------------------------------------------------------
+  # store
+  #-----------------------------------------------------------------------
+  # Should be called after the scheduling passes have been applied.
+
+  def store( self, top ):
+    if top.has_metadata( ScheduleCache.schedule ) or \
+       not hasattr( top, "_sched" ) or not hasattr( top._sched, "schedule_ids" ):
+      return
+
+    entry = {
+      'format'  : _CACHE_FORMAT,
+      'codes'   : { k: marshal.dumps( v ) for k, v in top.get_metadata( ScheduleCache.codes ).items() },
+      'schedule': top._sched.schedule_ids,
+    }
+
+    os.makedirs( self.path, exist_ok=True )
+    filename = self._entry_path( top.get_metadata( ScheduleCache.key ) )
+
+    # Write to a temporary file first so concurrent runs never read a
+    # partially written entry
+    tmp = f"{filename}.{os.getpid()}.tmp"
+    with open( tmp, 'wb' ) as f:
+      pickle.dump( entry, f, protocol=pickle.HIGHEST_PROTOCOL )
+    os.replace( tmp, filename )
+
+    self.evict( keep=filename )
+
+  def evict( self, keep=None ):
+    """Remove the least recently used entries until the cache fits in
+    max_size bytes."""
+
+    entries = []
+    total   = 0
+    for name in os.listdir( self.path ):
+      if not name.endswith( '.pkl' ):
+        continue
+      filename = os.path.join( self.path, name )
+      try:
+        st = os.stat( filename )
+      except OSError:
+        continue
+      entries.append( (st.st_mtime, st.st_size, filename) )
+      total += st.st_size
+
+    for _, size, filename in sorted( entries ):
+      if total <= self.max_size:
+        break
+      if filename == keep:
+        continue
+      try:
+        os.remove( filename )
+      except OSError:
+        continue
+      total -= size
+      self.evictions += 1
+
+  def _entry_path( self, key ):
+    return os.path.join( self.path, f"{key}.pkl" )
+
+  #-----------------------------------------------------------------------
+  # structural_hash
+  #-----------------------------------------------------------------------
+  # Everything that affects the generated blocks and the schedule goes
+  # into the hash: the hierarchy (classes, parameters, signal types), the
+  # update blocks and their source code, the connections, and the
+  # explicit constraints. Parameters with address-based reprs simply make
+  # the design uncacheable across runs.
+
+  @staticmethod
+  def structural_hash( top ):
+    h = hashlib.sha1()
+
+    def feed( *args ):
+      for x in args:
+        h.update( str(x).encode() )
+        h.update( b'\0' )
+
+    feed( _CACHE_FORMAT, __version__, sys.implementation.cache_tag )
+
+    for obj in sorted( top._dsl.all_named_objects, key=repr ):
+      cls = obj.__class__
+      feed( repr(obj), cls.__module__, cls.__qualname__ )
+      if isinstance( obj, Signal ):
+        Type = obj._dsl.Type
+        feed( getattr( Type, '__module__', '' ), getattr( Type, '__qualname__', repr(Type) ),
+              getattr( Type, '__bitstruct_fields__', '' ) )
+      elif obj.is_component():
+        feed( obj._dsl.args, sorted( obj._dsl.kwargs.items() ) )
+
+    def blk_id( blk ):
+      return f"{top.get_update_block_host_component( blk )!r}.{blk.__name__}"
+
+    update_ff   = top.get_all_update_ff()
+    update_once = top.get_all_update_once()
+
+    upblks = sorted( top.get_all_update_blocks(), key=blk_id )
+    for blk in upblks:
+      host = top.get_update_block_host_component( blk )
+      feed( blk_id( blk ), blk in update_ff, blk in update_once,
+            host.get_update_block_info( blk )[1] )
+
+    nets = [ (repr(writer), sorted( [ repr(x) for x in signals ] ) )
+             for writer, signals in top.get_all_value_nets() ]
+    feed( sorted( nets ) )
+
+    nets = [ (repr(writer), sorted( [ repr(x) for x in net ] ) )
+             for writer, net in top.get_all_method_nets() ]
+    feed( sorted( nets ) )
+
+    U_U, RD_U, WR_U, U_M = top.get_all_explicit_constraints()
+    feed( sorted( [ (blk_id(x), blk_id(y)) for x, y in U_U ] ) )
+    for constraints in [ RD_U, WR_U ]:
+      feed( sorted( [ (repr(obj), sorted( [ (sign, blk_id(blk)) for sign, blk in v ] ))
+                      for obj, v in constraints.items() ] ) )
+    all_upblks = top.get_all_update_blocks()
+    def m_id( x ):
+      return blk_id( x ) if x in all_upblks else repr(x)
+    feed( sorted( [ (m_id(x), m_id(y), eq) for x, y, eq in U_M ] ) )
+
+    return h.hexdigest()
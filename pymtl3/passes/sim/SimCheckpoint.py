@@ -0,0 +1,249 @@
+"""
+========================================================================
+SimCheckpoint.py
+========================================================================
+Save the state of a simulation to a binary snapshot and restore it
+later, e.g., to simulate a long warm-up once and start many short
+experiments from the snapshot. PrepareSimPass exposes these functions as
+top.sim_checkpoint( path ) and top.sim_restore( path ).
+
+A snapshot consists of three parts:
+
+  - a fixed-size header with the format, a signature of the signal
+    layout, the offsets/sizes of the two sections below, and the
+    simulated cycle count
+  - the values of all signals as raw little-endian bytes in a fixed
+    order, which is read in place from a memory-mapped file on restore
+  - a pickle of the Python-level state of the components, i.e., every
+    non-structural attribute (queues, memories, counters, ...)
+
+Components whose state lives outside of Python (e.g., Verilator-imported
+components) can provide _sim_checkpoint_state() and
+_sim_restore_state( state ) hooks; whatever the former returns goes into
+the pickle instead of the attributes of the component.
+
+The snapshot can only be restored into the same design, which is checked
+using the layout signature.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import hashlib
+import io
+import mmap
+import pickle
+import struct
+from collections import deque
+
+from pymtl3.datatypes import Bits
+from pymtl3.dsl.NamedObject import NamedObject
+
+_MAGIC  = b'PYMTLCKP'
+_FORMAT = 1
+
+# magic, format, signature, signal offset/size, state offset/size, cycles
+_header = struct.Struct( '<8sI20sQQQQQ' )
+
+#-------------------------------------------------------------------------
+# Signal layout
+#-------------------------------------------------------------------------
+
+class _Layout:
+  def __init__( self, values, leaves, nbytes, signature ):
+    self.values    = values    # list of Bits/bitstruct objects
+    self.value_ids = { id(v): i for i, v in enumerate(values) }
+    self.leaves    = leaves    # list of ( Bits, nbytes, double_buffered )
+    self.nbytes    = nbytes
+    self.signature = signature
+
+def collect_leaves( value, leaves ):
+  if isinstance( value, Bits ):
+    leaves.append( value )
+  elif isinstance( value, list ):
+    for x in value:
+      collect_leaves( x, leaves )
+  else:
+    for name in value.__bitstruct_fields__:
+      collect_leaves( getattr( value, name ), leaves )
+
+def _get_layout( top ):
+  try:
+    return top._sim.checkpoint_layout
+  except AttributeError:
+    pass
+
+  # Signals in the same net share one value object, so we dedup them and
+  # save every value object once. Integer constants are immutable.
+
+  values = {}
+  names  = {}
+  for obj, (_, _, _, value) in sorted( top._sim.signal_object_mapping.items(),
+                                       key=lambda x: repr(x[0]) ):
+    if isinstance( value, int ):
+      continue
+    key = id(value)
+    if key not in values:
+      values[ key ] = [ value, False ]
+      names [ key ] = repr(obj)
+    values[ key ][1] |= bool( obj._dsl.needs_double_buffer )
+
+  h      = hashlib.sha1()
+  leaves = []
+  nbytes = 0
+  for key, (value, double) in values.items():
+    h.update( f"{names[key]}:{double}".encode() )
+    tmp = []
+    collect_leaves( value, tmp )
+    for leaf in tmp:
+      n = ( leaf._nbits + 7 ) >> 3
+      h.update( n.to_bytes( 2, 'little' ) )
+      leaves.append( (leaf, n, double) )
+      nbytes += n * 2 if double else n
+
+  layout = _Layout( [ v for v, _ in values.values() ], leaves, nbytes, h.digest() )
+  top._sim.checkpoint_layout = layout
+  return layout
+
+#-------------------------------------------------------------------------
+# Python-level state
+#-------------------------------------------------------------------------
+
+def _is_structural( v, value_ids ):
+  # Signal values are saved separately, and the hierarchy itself and
+  # functions are not state
+  if id(v) in value_ids or isinstance( v, NamedObject ) or callable( v ):
+    return True
+  if isinstance( v, list ):
+    return any( _is_structural( x, value_ids ) for x in v )
+  return False
+
+def _collect_state( top, value_ids ):
+  # The values of packed signal arrays are saved through their elements
+  packed = { id( getattr( host, name ) ) for host, name, _ in getattr( top._sim, 'packed_arrays', () ) }
+
+  state = {}
+  for c in sorted( top._dsl.all_components, key=repr ):
+    if hasattr( c, '_sim_checkpoint_state' ):
+      state[ repr(c) ] = ( True, c._sim_checkpoint_state() )
+      continue
+
+    if hasattr( c, '_ffi_m' ):
+      raise NotImplementedError( f"Cannot checkpoint {c!r} whose state is in a foreign model. "
+                                 "Please implement _sim_checkpoint_state/_sim_restore_state for it." )
+
+    attrs = { name: v for name, v in c.__dict__.items()
+              if name[0] != '_' and id(v) not in packed and not _is_structural( v, value_ids ) }
+    if attrs:
+      state[ repr(c) ] = ( False, attrs )
+
+  return state
+
+def _restore_attr( c, name, v ):
+  # Update mutable containers in place in case someone else holds a
+  # reference to them
+  cur = c.__dict__.get( name )
+  if type(cur) is type(v):
+    if isinstance( cur, (list, bytearray) ):
+      cur[:] = v
+      return
+    if isinstance( cur, (dict, set) ):
+      cur.clear()
+      cur.update( v )
+      return
+    if isinstance( cur, deque ):
+      cur.clear()
+      cur.extend( v )
+      return
+  setattr( c, name, v )
+
+class _Pickler( pickle.Pickler ):
+  def __init__( self, f, value_ids ):
+    super().__init__( f, protocol=pickle.HIGHEST_PROTOCOL )
+    self.value_ids = value_ids
+
+  def persistent_id( self, obj ):
+    i = self.value_ids.get( id(obj) )
+    if i is not None:
+      return ( 'value', i )
+    if isinstance( obj, NamedObject ):
+      return ( 'obj', repr(obj) )
+    return None
+
+class _Unpickler( pickle.Unpickler ):
+  def __init__( self, f, values, named_objects ):
+    super().__init__( f )
+    self.values        = values
+    self.named_objects = named_objects
+
+  def persistent_load( self, pid ):
+    kind, x = pid
+    if kind == 'value':
+      return self.values[ x ]
+    return self.named_objects[ x ]
+
+#-------------------------------------------------------------------------
+# sim_checkpoint/sim_restore
+#-------------------------------------------------------------------------
+
+def sim_checkpoint( top, path ):
+  layout = _get_layout( top )
+
+  buf = bytearray( layout.nbytes )
+  ofs = 0
+  for leaf, n, double in layout.leaves:
+    buf[ ofs:ofs+n ] = leaf._uint.to_bytes( n, 'little' )
+    ofs += n
+    if double:
+      buf[ ofs:ofs+n ] = getattr( leaf, '_next', leaf._uint ).to_bytes( n, 'little' )
+      ofs += n
+
+  f = io.BytesIO()
+  _Pickler( f, layout.value_ids ).dump( _collect_state( top, layout.value_ids ) )
+  state = f.getvalue()
+
+  sig_ofs   = _header.size
+  state_ofs = sig_ofs + len(buf)
+
+  with open( path, 'wb' ) as f:
+    f.write( _header.pack( _MAGIC, _FORMAT, layout.signature, sig_ofs, len(buf),
+                           state_ofs, len(state), top._sim.simulated_cycles ) )
+    f.write( buf )
+    f.write( state )
+
+def sim_restore( top, path ):
+  layout = _get_layout( top )
+
+  with open( path, 'rb' ) as f, \
+       mmap.mmap( f.fileno(), 0, access=mmap.ACCESS_READ ) as m:
+
+    magic, fmt, signature, sig_ofs, sig_len, state_ofs, state_len, cycles = \
+      _header.unpack_from( m, 0 )
+
+    if magic != _MAGIC or fmt != _FORMAT:
+      raise ValueError( f"{path} is not a simulation snapshot of this PyMTL version" )
+    if signature != layout.signature or sig_len != layout.nbytes:
+      raise ValueError( f"{path} is a snapshot of a different design" )
+
+    ofs = sig_ofs
+    for leaf, n, double in layout.leaves:
+      leaf._uint = int.from_bytes( m[ ofs:ofs+n ], 'little' )
+      ofs += n
+      if double:
+        leaf._next = int.from_bytes( m[ ofs:ofs+n ], 'little' )
+        ofs += n
+
+    named_objects = { repr(x): x for x in top._dsl.all_named_objects }
+    state = _Unpickler( io.BytesIO( m[ state_ofs:state_ofs+state_len ] ),
+                        layout.values, named_objects ).load()
+
+  for c in top._dsl.all_components:
+    if repr(c) not in state:
+      continue
+    is_hook, s = state[ repr(c) ]
+    if is_hook:
+      c._sim_restore_state( s )
+    else:
+      for name, v in s.items():
+        _restore_attr( c, name, v )
+
+  top._sim.simulated_cycles = cycles
@@ -0,0 +1,95 @@
+"""
+========================================================================
+SimFastForward.py
+========================================================================
+Advance the simulation by a number of cycles, jumping over the cycles
+in which the design is provably idle. PrepareSimPass exposes this as
+top.sim_fast_forward( max_cycles ).
+
+After every cycle we check whether the design reached a fixed point:
+
+  - no signal changed its value in the last cycle, and
+  - every component with Python-level behavior (update_once blocks,
+    method ports, or a foreign model) reports how many upcoming cycles
+    it stays idle through _sim_idle_cycles(). 0 means it may do
+    something in the next cycle, None means it is idle until someone
+    else wakes it up.
+
+If so, we skip the minimum number of idle cycles in one step: every such
+component advances its own timers through _sim_skip_cycles( n ) and the
+cycle count jumps ahead. RTL components are assumed to keep all of
+their state in signals. A component with Python-level behavior but
+without the hooks is never considered idle, so designs that use them
+are simply ticked cycle by cycle.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+from operator import attrgetter
+
+from pymtl3.dsl.Connectable import MethodPort
+from pymtl3.passes.tracing.CLLineTracePass import CLLineTracePass
+
+from .SimCheckpoint import _get_layout
+
+_get_uint = attrgetter( '_uint' )
+
+def _get_timers( top ):
+  try:
+    return top._sim.fast_forward_timers
+  except AttributeError:
+    pass
+
+  comps = { top.get_update_block_host_component( blk ) for blk in top.get_all_update_once() }
+  comps |= { x.get_host_component() for x in top.get_all_object_filter(
+                                                 lambda x: isinstance( x, MethodPort ) ) }
+  comps |= { x for x in top._dsl.all_components if hasattr( x, '_ffi_m' ) }
+
+  timers = sorted( comps, key=repr )
+  if not all( hasattr( x, '_sim_idle_cycles' ) for x in timers ):
+    timers = None
+
+  top._sim.fast_forward_timers = timers
+  return timers
+
+def sim_fast_forward( top, max_cycles ):
+  """Advance the simulation by max_cycles cycles and return the number
+  of cycles that were skipped instead of simulated."""
+
+  leaves = [ x for x, _, _ in _get_layout( top ).leaves ]
+  timers = _get_timers( top )
+
+  # The method calls of the last simulated cycle are not in the line
+  # trace of the skipped cycles
+  clear_cl_trace = None
+  if top.has_metadata( CLLineTracePass.clear_cl_trace_func ):
+    clear_cl_trace = top.get_metadata( CLLineTracePass.clear_cl_trace_func )
+
+  end     = top._sim.simulated_cycles + max_cycles
+  skipped = 0
+
+  prev = list( map( _get_uint, leaves ) )
+  while top._sim.simulated_cycles < end:
+    top.sim_tick()
+
+    cur = list( map( _get_uint, leaves ) )
+    if cur == prev and timers is not None:
+      n = end - top._sim.simulated_cycles
+      for x in timers:
+        idle = x._sim_idle_cycles()
+        if idle is not None and idle < n:
+          n = idle
+          if n == 0:
+            break
+
+      if n > 0:
+        for x in timers:
+          x._sim_skip_cycles( n )
+        top._sim.simulated_cycles += n
+        skipped += n
+        if clear_cl_trace is not None:
+          clear_cl_trace()
+
+    prev = cur
+
+  return skipped
@@ -0,0 +1,113 @@
+"""
+========================================================================
+SimFork.py
+========================================================================
+Fork a warmed-up simulator into child processes that continue the
+simulation independently, e.g., with different stimuli or random seeds
+for sampled simulation. PrepareSimPass exposes this as
+top.sim_fork( n, func ).
+
+Each child inherits the whole simulator copy-on-write, so nothing is
+elaborated, scheduled, or simulated again. Child i calls func( top, i )
+and sends the (picklable) return value back to the parent over a pipe.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import os
+import pickle
+import random
+import signal
+import sys
+import traceback
+
+
+def sim_fork( top, n, func, seed=None ):
+  """Run func( top, i ) for i in range(n), each in a forked copy of the
+  current simulator, and return the list of return values. If seed is
+  given, child i seeds the random module with seed+i."""
+
+  if not hasattr( os, 'fork' ):
+    raise NotImplementedError( "sim_fork requires os.fork()" )
+
+  # Otherwise the children would print whatever is still buffered again
+  sys.stdout.flush()
+  sys.stderr.flush()
+
+  children = []
+  try:
+    for i in range(n):
+      r, w = os.pipe()
+      pid = os.fork()
+
+      if pid == 0:
+        # Child: never return to the caller
+        os.close( r )
+        status = 0
+        try:
+          if seed is not None:
+            random.seed( seed + i )
+          ret = ( True, func( top, i ) )
+        except BaseException:
+          ret = ( False, traceback.format_exc() )
+        # Pickle before writing so that the parent never gets a partial
+        # result if the return value cannot be pickled
+        try:
+          data = pickle.dumps( ret, protocol=pickle.HIGHEST_PROTOCOL )
+        except BaseException:
+          data = pickle.dumps( ( False, traceback.format_exc() ) )
+        try:
+          with os.fdopen( w, 'wb' ) as f:
+            f.write( data )
+        except BaseException:
+          status = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit( status )
+
+      os.close( w )
+      children.append( (pid, r) )
+
+  finally:
+    # Collect everything we have spawned even if a later fork failed
+    results, errors = _collect( children )
+
+  if errors:
+    raise RuntimeError( "Forked simulation failed:\n" + "\n".join( errors ) )
+
+  return results
+
+def _collect( children ):
+  """Read the result of every child and reap all of them, even if a
+  result cannot be read or the parent is interrupted."""
+
+  files   = [ ( pid, os.fdopen( r, 'rb' ) ) for pid, r in children ]
+  results = []
+  errors  = []
+  nreaped = 0
+  try:
+    for i, (pid, f) in enumerate( files ):
+      try:
+        ok, ret = pickle.load( f )
+      # EOFError or UnpicklingError if the child died while writing, or
+      # whatever the unpickled objects raise
+      except Exception as e:
+        ok, ret = False, f"The child process did not send a valid result: {e!r}"
+      finally:
+        f.close()
+        _, status = os.waitpid( pid, 0 )
+        nreaped = i + 1
+
+      results.append( ret if ok else None )
+      if not ok:
+        errors.append( f"- sim_fork child {i} (exit status {status}):\n{ret}" )
+
+  finally:
+    # Only if the parent is interrupted: do not leave the other children
+    # running or as zombies
+    for pid, f in files[ nreaped: ]:
+      f.close()
+      os.kill( pid, signal.SIGKILL )
+      os.waitpid( pid, 0 )
+
+  return results, errors
@@ -8,7 +8,6 @@ DAG generated by some previous pass.
 Author : Shunning Jiang
 Date   : Dec 26, 2018
 """
-import linecache
 from collections import defaultdict
 
 from pymtl3.dsl.errors import UpblkCyclicError
@@ -16,6 +15,17 @@ from pymtl3.extra.pypy import custom_exec
 from pymtl3.passes.BasePass import BasePass, PassMetadata
 from pymtl3.passes.errors import PassOrderError
 
+from .ScheduleCache import compile_cached
+
+
+def _flip_array( l ):
+  # PrepareSimPass( pack_signal_arrays=True ) may have packed the list
+  # into a BitsArray, which flips all elements at once
+  if type(l) is list:
+    for x in l:
+      x._flip()
+  else:
+    l._flip()
 
 class SimpleSchedulePass( BasePass ):
   def __call__( self, top ):
@@ -88,10 +98,27 @@ class SimpleSchedulePass( BasePass ):
     #   x.z._flip()
     #   x.zz._flip()
 
+    # A whole list of double-buffered signals (e.g., the registers of a
+    # register file) is flipped by a single _flip_array call
+    #   _flip_array( s.x.regs )
+
+    list_signals = defaultdict(list)
+    for x in top._dsl.all_signals:
+      if x._dsl.needs_double_buffer and x.is_top_level_signal() and \
+         x._dsl._my_indices is not None and len(x._dsl._my_indices) == 1:
+        list_signals[ (x.get_parent_object(), x._dsl._my_name) ].append( x )
+
+    array_strs = []
+    in_array   = set()
+    for (parent, name), y in list_signals.items():
+      if len(y) > 1 and len( getattr( parent, name ) ) == len(y):
+        array_strs.append( f"    _flip_array( {repr(parent)}.{name} )" )
+        in_array.update( y )
+
     hostobj_signals = defaultdict(list)
     for x in reversed(sorted( top._dsl.all_signals, \
         key=lambda x: x.get_host_component().get_component_level() )):
-      if x._dsl.needs_double_buffer:
+      if x._dsl.needs_double_buffer and x not in in_array:
         hostobj_signals[ x.get_host_component() ].append( x )
 
     done = False
@@ -110,7 +137,7 @@ class SimpleSchedulePass( BasePass ):
           done = False
       hostobj_signals = next_hostobj_signals
 
-    strs = []
+    strs = sorted( array_strs )
     for x,y in hostobj_signals.items():
       if len(y) == 1:
         strs.append( f"    {repr(y[0])}._flip()" )
@@ -142,9 +169,10 @@ class SimpleSchedulePass( BasePass ):
       # when the source code is huge. For some designs with 10K+ flip-flops
       # the performance overhead becomes huge.
       l = locals()
-      custom_exec( compile( '\n'.join(lines), filename='ff_flips', mode='exec' ), globals(), l)
-      linecache.cache['ff_flips'] = (1, None, lines, 'ff_flips')
+      custom_exec( compile_cached( top, '\n'.join(lines), 'ff_flips' ), globals(), l)
       top._sched.schedule_posedge_flip = [ l['compile_double_buffer']( top ) ]
+      # Keep the source around for passes that generate code out of it
+      top._sched.schedule_posedge_flip_src = '\n'.join(lines)
 
 def dump_dag( top, V, E ):
   from graphviz import Digraph
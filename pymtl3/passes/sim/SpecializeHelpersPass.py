@@ -0,0 +1,176 @@
+"""
+========================================================================
+SpecializeHelpersPass.py
+========================================================================
+Replace calls to concat/zext/sext/trunc in update blocks with
+width-specific closures (see mk_concat and friends in helpers.py) so that
+the hot path only does the shift/mask work.
+
+The bitwidths come from the behavioral RTLIR type check that translation
+uses. Components that do not pass it, e.g., CL/FL components, are left
+alone. For every other update block, the call sites are rewritten to
+call keyword-only arguments bound to the closures, and the new code
+object replaces blk.__code__. The function object, its closure and the
+source kept for translation stay the same, so the pass can be applied
+at any point before the simulation starts.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import ast
+import copy
+
+from pymtl3.datatypes import Bits
+from pymtl3.datatypes.helpers import mk_concat, mk_sext, mk_trunc, mk_zext
+from pymtl3.dsl import MetadataKey
+from pymtl3.passes.BasePass import BasePass
+
+_python_bits = Bits.__module__ == "pymtl3.datatypes.PythonBits"
+
+class SpecializeHelpersPass( BasePass ):
+
+  #: Number of call sites that were specialized
+  #:
+  #: Type: ``int``; output
+  num_specialized = MetadataKey( int )
+
+  def __call__( self, top ):
+    count = 0
+    if _python_bits:
+      for m in sorted( top.get_all_components(), key=repr ):
+        count += self.specialize_component( top, m )
+    top.set_metadata( self.num_specialized, count )
+
+  def specialize_component( self, top, m ):
+    from pymtl3.passes.rtlir.behavioral.BehavioralRTLIRGenL5Pass import (
+        BehavioralRTLIRGenL5Pass,
+    )
+    from pymtl3.passes.rtlir.behavioral.BehavioralRTLIRTypeCheckL5Pass import (
+        BehavioralRTLIRTypeCheckL5Pass,
+    )
+
+    if not m.get_update_blocks():
+      return 0
+
+    # Anything that is not translatable is simulated as is
+    try:
+      m.apply( BehavioralRTLIRGenL5Pass( top ) )
+      m.apply( BehavioralRTLIRTypeCheckL5Pass( top ) )
+    except Exception:
+      return 0
+
+    count = 0
+    for blk, rtlir in m.get_metadata( BehavioralRTLIRGenL5Pass.rtlir_upblks ).items():
+      sites = {}
+      _collect_call_sites( rtlir, sites )
+      if sites:
+        count += self.specialize_block( m, blk, sites )
+    return count
+
+  def specialize_block( self, m, blk, sites ):
+    is_lambda, _, lineno, filename, tree = m.get_update_block_info( blk )
+    code = blk.__code__
+    if is_lambda or code.co_argcount or code.co_kwonlyargcount:
+      return 0
+
+    tree = copy.deepcopy( tree )
+    fdef = tree.body[0]
+    if not isinstance( fdef, ast.FunctionDef ) or fdef.name != blk.__name__:
+      return 0
+
+    rewriter = _CallRewriter( sites )
+    rewriter.visit( fdef )
+    if not rewriter.bound:
+      return 0
+
+    # The block is compiled inside a function whose arguments are the
+    # free variables of the original block, so that the new code object
+    # uses the same closure cells.
+    fdef.decorator_list = []
+    fdef.args = ast.arguments( posonlyargs=[], args=[], vararg=None,
+                               kwonlyargs=[ ast.arg( arg=x, annotation=None ) for x in rewriter.bound ],
+                               kw_defaults=[ None ] * len(rewriter.bound), kwarg=None, defaults=[] )
+    wrapper = ast.FunctionDef( name='_wrapper',
+      args=ast.arguments( posonlyargs=[], args=[ ast.arg( arg=x, annotation=None ) for x in code.co_freevars ],
+                          vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[] ),
+      body=[ fdef ], decorator_list=[], returns=None )
+    module = ast.Module( body=[ wrapper ], type_ignores=[] )
+    ast.fix_missing_locations( module )
+    ast.increment_lineno( module, lineno - 1 )
+
+    new_code = _find_code( compile( module, filename, "exec" ), blk.__name__ )
+    if new_code is None or new_code.co_freevars != code.co_freevars:
+      return 0
+
+    blk.__code__       = new_code
+    blk.__kwdefaults__ = rewriter.bound
+    return len(rewriter.bound)
+
+#-------------------------------------------------------------------------
+# Call sites
+#-------------------------------------------------------------------------
+# Map (lineno, col_offset) of the Python call to a width-specific
+# closure. Only Bits arguments (vectors and comparison results) qualify.
+
+def _nbits( node ):
+  from pymtl3.passes.rtlir.rtype import RTLIRDataType as rdt
+
+  try:
+    dtype = node.Type.get_dtype()
+  except AttributeError:
+    return None
+  if isinstance( dtype, (rdt.Vector, rdt.Bool) ):
+    return dtype.get_length()
+  return None
+
+def _collect_call_sites( node, sites ):
+  from pymtl3.passes.rtlir.behavioral import BehavioralRTLIR as bir
+
+  fn = None
+  if isinstance( node, bir.Concat ):
+    widths = [ _nbits( x ) for x in node.values ]
+    if None not in widths:
+      fn = mk_concat( *widths )
+  elif isinstance( node, (bir.ZeroExt, bir.SignExt, bir.Truncate) ):
+    width = _nbits( node.value )
+    if width is not None:
+      mk = { bir.ZeroExt: mk_zext, bir.SignExt: mk_sext, bir.Truncate: mk_trunc }[ type(node) ]
+      fn = mk( width, node.nbits )
+
+  if fn is not None and isinstance( getattr( node, 'ast', None ), ast.Call ):
+    sites[ (node.ast.lineno, node.ast.col_offset) ] = fn
+
+  for name, value in vars( node ).items():
+    if name in ( 'ast', 'Type' ):
+      continue
+    if isinstance( value, bir.BaseBehavioralRTLIR ):
+      _collect_call_sites( value, sites )
+    elif isinstance( value, list ):
+      for x in value:
+        if isinstance( x, bir.BaseBehavioralRTLIR ):
+          _collect_call_sites( x, sites )
+
+class _CallRewriter( ast.NodeTransformer ):
+
+  def __init__( self, sites ):
+    self.sites = sites
+    self.bound = {}
+
+  def visit_Call( self, node ):
+    self.generic_visit( node )
+    fn = self.sites.get( (node.lineno, node.col_offset) )
+    if fn is not None:
+      name = f"_spec{len(self.bound)}_{fn.__name__}"
+      self.bound[ name ] = fn
+      node.func = ast.copy_location( ast.Name( id=name, ctx=ast.Load() ), node.func )
+    return node
+
+def _find_code( code, name ):
+  for const in code.co_consts:
+    if hasattr( const, 'co_consts' ):
+      if const.co_name == name:
+        return const
+      ret = _find_code( const, name )
+      if ret is not None:
+        return ret
+  return None
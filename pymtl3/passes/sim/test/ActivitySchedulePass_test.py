@@ -0,0 +1,273 @@
+#=========================================================================
+# ActivitySchedulePass_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import math
+import random
+import sys
+from contextlib import contextmanager
+
+from pymtl3.datatypes import Bits8, Bits32, bitstruct, zext
+from pymtl3.dsl import *
+
+from ..ActivitySchedulePass import ActivitySchedulePass
+from ..DynamicSchedulePass import DynamicSchedulePass
+from ..GenDAGPass import GenDAGPass
+from ..PrepareSimPass import PrepareSimPass
+
+
+def _build( cls, sched_pass, *args ):
+  A = cls( *args )
+  A.elaborate()
+  A.apply( GenDAGPass() )
+  A.apply( sched_pass )
+  A.apply( PrepareSimPass(print_line_trace=False) )
+  A.sim_reset()
+  return A
+
+@contextmanager
+def count_calls( name ):
+  # Count the executions of the functions called name without touching
+  # them, a block that updates a counter itself cannot be guarded
+  count = [0]
+  def profile( frame, event, arg ):
+    if event == 'call' and frame.f_code.co_name == name:
+      count[0] += 1
+  sys.setprofile( profile )
+  try:
+    yield count
+  finally:
+    sys.setprofile( None )
+
+class Incr( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits32 )
+    s.out = OutPort( Bits32 )
+
+    @update
+    def up_incr():
+      s.out @= s.in_ + 1
+
+class Chain( Component ):
+  def construct( s, N=4 ):
+    s.in_ = InPort( Bits32 )
+    s.out = OutPort( Bits32 )
+    s.incrs = [ Incr() for _ in range(N) ]
+
+    s.incrs[0].in_ //= s.in_
+    for i in range(N-1):
+      s.incrs[i].out //= s.incrs[i+1].in_
+    s.incrs[-1].out //= s.out
+
+def test_idle_blocks_are_skipped():
+  A = _build( Chain, ActivitySchedulePass() )
+
+  A.in_ @= 10
+  A.sim_eval_combinational()
+  assert A.out == 14
+
+  with count_calls( 'up_incr' ) as count:
+    for i in range(10):
+      A.sim_tick()
+  assert count[0] == 0
+  assert A.out == 14
+
+  A.in_ @= 20
+  with count_calls( 'up_incr' ) as count:
+    A.sim_tick()
+  assert count[0] == 4
+  assert A.out == 24
+
+def test_static_metadata():
+  A = Chain()
+  A.elaborate()
+  A.incrs[1].set_metadata( ActivitySchedulePass.static, True )
+  A.apply( GenDAGPass() )
+  A.apply( ActivitySchedulePass() )
+  A.apply( PrepareSimPass(print_line_trace=False) )
+  A.sim_reset()
+
+  A.in_ @= 10
+  A.sim_tick()
+  with count_calls( 'up_incr' ) as count:
+    A.sim_tick()
+  # Pure RTL sim_tick executes the update schedule twice
+  assert count[0] == 2
+  assert A.out == 14
+
+def test_python_state_is_not_guarded():
+
+  class Top( Component ):
+    def construct( s ):
+      s.out = OutPort( Bits32 )
+      s.count = 0
+
+      @update
+      def up_py():
+        s.out @= s.count
+
+      @update_ff
+      def up_ff():
+        s.count += 1
+
+  A = _build( Top, ActivitySchedulePass() )
+  assert len(A._sched.activity.guarded_blks) == 0
+  for i in range(5):
+    A.sim_tick()
+  assert A.out == A.count
+
+def test_closure_state_is_not_guarded():
+
+  class Top( Component ):
+    def construct( s, counter, N=3 ):
+      s.in_  = InPort( Bits32 )
+      s.out  = OutPort( Bits32 )
+      s.out2 = OutPort( Bits32 )
+
+      @update
+      def up_closure():
+        s.out @= s.in_ + counter[0]
+
+      # Constants in closures and globals are fine
+      @update
+      def up_const():
+        s.out2 @= zext( s.in_[0:8], 32 ) + Bits32( N )
+
+  counter = [0]
+  A = _build( Top, ActivitySchedulePass(), counter )
+  guarded = { x.__name__ for x in A._sched.activity.guarded_blks }
+  assert 'activity_up_closure' not in guarded
+  assert 'activity_up_const' in guarded
+
+  A.in_ @= 1
+  for i in range(5):
+    counter[0] = i
+    A.sim_tick()
+    assert A.out == 1 + i
+    assert A.out2 == 4
+
+def test_impure_calls_are_not_guarded():
+
+  class Top( Component ):
+    def construct( s ):
+      s.in_  = InPort( Bits8 )
+      s.out  = OutPort( Bits8 )
+      s.out2 = OutPort( Bits8 )
+
+      @update
+      def up_random():
+        s.out @= s.in_ + int( random.random() * 100 )
+
+      @update
+      def up_math():
+        s.out2 @= s.in_ + math.floor( 2.5 )
+
+  random.seed( 0xdeadbeef )
+  A = _build( Top, ActivitySchedulePass() )
+  guarded = { x.__name__ for x in A._sched.activity.guarded_blks }
+  assert 'activity_up_random' not in guarded
+  assert 'activity_up_math' in guarded
+
+  A.in_ @= 1
+  outs = set()
+  for i in range(10):
+    A.sim_tick()
+    outs.add( int(A.out) )
+    assert A.out2 == 3
+  assert len(outs) > 1
+
+def test_same_as_dynamic_schedule():
+
+  @bitstruct
+  class SomeMsg:
+    a: Bits8
+    b: Bits32
+
+  class Top( Component ):
+    def construct( s ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( SomeMsg )
+      s.reg = Wire( Bits32 )
+      s.msg = Wire( SomeMsg )
+      s.lo  = Wire( Bits8 )
+
+      s.lo //= s.reg[0:8]
+
+      @update_ff
+      def up_reg():
+        if s.reset:
+          s.reg <<= 0
+        elif s.in_[0]:
+          s.reg <<= s.reg + s.in_
+
+      @update
+      def up_msg():
+        s.msg.a @= s.lo
+        s.msg.b @= s.reg
+
+      @update
+      def up_out():
+        s.out @= s.msg
+
+  A = _build( Top, DynamicSchedulePass() )
+  B = _build( Top, ActivitySchedulePass() )
+  assert len(B._sched.activity.guarded_blks) > 0
+
+  for v in [ 1, 1, 2, 2, 2, 5, 0, 0, 7, 8, 8, 8 ]:
+    A.in_ @= v
+    B.in_ @= v
+    A.sim_tick()
+    B.sim_tick()
+    assert A.out == B.out
+
+def _false_cyclic_top():
+
+  class Top(Component):
+
+    def construct( s ):
+      s.in_ = InPort(32)
+      s.a = Wire(32)
+      s.b = Wire(32)
+      s.c = Wire(32)
+      s.d = Wire(32)
+      s.out = OutPort(32)
+
+      @update
+      def up1():
+        s.a @= s.in_ + 1
+        s.b @= s.d + 1
+
+      @update
+      def up2():
+        s.c @= s.a + 1
+
+      @update
+      def up3():
+        s.d @= s.c + 1
+
+      @update
+      def up4():
+        s.out @= s.b + 1
+
+  return Top
+
+def test_scc_fallback():
+  Top = _false_cyclic_top()
+
+  for scc_fallback in [ True, False ]:
+    A = _build( Top, ActivitySchedulePass( scc_fallback=scc_fallback ) )
+    scc_blks = list(A._sched.scc_members.keys())
+    assert len(scc_blks) == 1
+
+    if scc_fallback:
+      assert scc_blks[0] in A._sched.activity.static_blks
+    else:
+      assert scc_blks[0] in A._sched.activity.guarded_blks.values()
+
+    for v in [ 1, 1, 3, 3, 9 ]:
+      A.in_ @= v
+      A.sim_tick()
+      assert A.out == v + 5
@@ -315,3 +315,55 @@ def test_update_once():
     print(e)
     return
   raise Exception("Should've thrown UpblkCyclicError")
+
+def test_gen_dag_reuse_net_blocks_after_replace():
+
+  class Inc( Component ):
+    def construct( s, n=1 ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( Bits32 )
+      @update
+      def up_inc():
+        s.out @= s.in_ + n
+
+  class Dec( Inc ):
+    def construct( s, n=1 ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( Bits32 )
+      @update
+      def up_dec():
+        s.out @= s.in_ - n
+
+  class Top( Component ):
+    def construct( s ):
+      s.in_ = InPort( Bits32 )
+      s.out = OutPort( Bits32 )
+      s.w   = Wire( Bits32 )
+      s.a = Inc( 1 )
+      s.b = Inc( 2 )
+      s.a.in_ //= s.in_
+      s.a.out //= s.w
+      s.b.in_ //= s.w
+      s.b.out //= s.out
+
+  t = Top()
+  t.elaborate()
+  t.apply( GenDAGPass() )
+  old_genblks = dict( [ (src, blk) for blk, src in t._dag.genblk_src.items() ] )
+
+  t.replace_component( t.b, Dec )
+  t.apply( GenDAGPass() )
+
+  # Only the nets connected to t.b get new blocks
+  for blk, src in t._dag.genblk_src.items():
+    if "s.b." in src:
+      assert all( blk is not x for x in old_genblks.values() )
+    else:
+      assert old_genblks[ src ] is blk
+
+  t.apply( DynamicSchedulePass() )
+  t.apply( PrepareSimPass() )
+  t.sim_reset()
+  t.in_ @= 10
+  t.sim_eval_combinational()
+  assert t.out == 9
@@ -0,0 +1,86 @@
+#=========================================================================
+# PrepareSimPass_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+from pymtl3 import *
+from pymtl3.stdlib.basic_rtl.register_files import RegisterFile
+from pymtl3.stdlib.mem.ROMRTL import SequentialROMRTL
+
+from ..PrepareSimPass import PrepareSimPass
+
+
+def _write_and_read( m ):
+  m.sim_reset()
+  for i in range(16):
+    m.wen[0]   @= 1
+    m.waddr[0] @= i
+    m.wdata[0] @= i * 3
+    m.sim_tick()
+  m.wen[0] @= 0
+  for i in range(16):
+    m.raddr[0] @= i
+    m.sim_eval_combinational()
+    assert m.rdata[0] == i * 3
+
+def test_register_file_flip_array():
+  m = RegisterFile( Bits32, 16 )
+  m.apply( DefaultPassGroup() )
+  assert "_flip_array( s.regs )" in m._sched.schedule_posedge_flip_src
+  assert isinstance( m.regs, list )
+  _write_and_read( m )
+
+def test_pack_register_file( tmpdir ):
+  m = RegisterFile( Bits32, 16 )
+  m.apply( DefaultPassGroup( pack_arrays=True ) )
+  assert isinstance( m.regs, BitsArray ) and len( m.regs ) == 16
+  _write_and_read( m )
+  assert m.regs.tolist() == [ i * 3 for i in range(16) ]
+
+  # Element values are checkpointed through the views
+  m.sim_checkpoint( str( tmpdir.join("rf.ckpt") ) )
+  m.regs[5] @= 0
+  m.sim_restore( str( tmpdir.join("rf.ckpt") ) )
+  assert m.regs[5] == 15
+
+  m.unlock_simulation()
+  assert isinstance( m.regs, list ) and isinstance( m.regs[0], Wire )
+
+def test_pack_rom():
+  m = SequentialROMRTL( Bits8, 4, [ b8(1), b8(2), b8(3), b8(4) ] )
+  m.apply( DefaultPassGroup( pack_arrays=True ) )
+  assert isinstance( m.mem, BitsArray ) and m.mem.tolist() == [ 1, 2, 3, 4 ]
+  m.sim_reset()
+  for i in range(4):
+    m.raddr[0] @= i
+    m.sim_tick()
+    assert m.rdata[0] == i + 1
+
+def test_connected_list_not_packed():
+
+  class Top( Component ):
+    def construct( s ):
+      s.in_ = InPort( Bits8 )
+      s.out = OutPort( Bits8 )
+      s.w   = [ Wire( Bits8 ) for _ in range(2) ]
+      s.v   = [ Wire( Bits8 ) for _ in range(2) ]
+      s.w[0] //= s.in_
+
+      @update
+      def up():
+        s.w[1] @= s.w[0] + 1
+        s.v[0] @= s.w[1]
+        s.v[1] @= s.v[0] + 1
+        s.out  @= s.v[1]
+
+  top = Top()
+  top.elaborate()
+  assert PrepareSimPass.find_packable_arrays( top ) == [ (top, 'v') ]
+
+  top.apply( DefaultPassGroup( pack_arrays=True ) )
+  assert isinstance( top.w, list ) and isinstance( top.v, BitsArray )
+  top.in_ @= 3
+  top.sim_eval_combinational()
+  assert top.out == 5
@@ -0,0 +1,129 @@
+#=========================================================================
+# ScheduleCache_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import os
+
+from pymtl3.datatypes import Bits32
+from pymtl3.dsl import *
+
+from ...PassGroups import DefaultPassGroup
+from ..ScheduleCache import ScheduleCache
+
+
+class Incr( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits32 )
+    s.out = OutPort( Bits32 )
+
+    @update
+    def up_incr():
+      s.out @= s.in_ + 1
+
+class Top( Component ):
+  def construct( s, N=4 ):
+    s.in_ = InPort( Bits32 )
+    s.out = OutPort( Bits32 )
+    s.incrs = [ Incr() for _ in range(N) ]
+
+    s.incrs[0].in_ //= s.in_
+    for i in range(N-1):
+      s.incrs[i].out //= s.incrs[i+1].in_
+
+    # A false combinational loop to exercise SCC caching
+    s.a = Wire( Bits32 )
+    s.b = Wire( Bits32 )
+    s.c = Wire( Bits32 )
+
+    @update
+    def up1():
+      s.a @= s.incrs[-1].out
+      s.b @= s.c + 1
+
+    @update
+    def up2():
+      s.c @= s.a + 1
+
+    @update
+    def up3():
+      s.out @= s.b
+
+    s.r = Wire( Bits32 )
+    @update_ff
+    def up_ff():
+      s.r <<= s.r + 1
+
+def _run( top, cache ):
+  top.elaborate()
+  top.apply( DefaultPassGroup( schedule_cache=cache ) )
+  top.sim_reset()
+  outs = []
+  for i in range(4):
+    top.in_ @= i
+    top.sim_tick()
+    outs.append( int(top.out) )
+  return outs
+
+def test_hit_and_miss( tmpdir ):
+  cache = ScheduleCache( str(tmpdir) )
+
+  A = Top()
+  ref = _run( A, cache )
+  assert cache.stats()['misses'] == 1
+  assert cache.stats()['hits'] == 0
+  assert len(tmpdir.listdir()) == 1
+
+  B = Top()
+  assert _run( B, cache ) == ref
+  assert cache.stats()['hits'] == 1
+  # The schedule is restored instead of recomputed
+  assert B._sched.schedule_ids is B.get_metadata( ScheduleCache.schedule )
+  assert len(B._sched.scc_members) == 1
+  assert [ x.__name__ for x in B._sched.update_schedule ] == \
+         [ x.__name__ for x in A._sched.update_schedule ]
+
+  # A different structure misses
+  C = Top( 5 )
+  _run( C, cache )
+  assert cache.stats()['misses'] == 2
+
+def test_same_hash_for_same_structure():
+  A = Top()
+  A.elaborate()
+  B = Top()
+  B.elaborate()
+  C = Top( 3 )
+  C.elaborate()
+  assert ScheduleCache.structural_hash( A ) == ScheduleCache.structural_hash( B )
+  assert ScheduleCache.structural_hash( A ) != ScheduleCache.structural_hash( C )
+
+def test_eviction( tmpdir ):
+  cache = ScheduleCache( str(tmpdir), max_size=1 )
+
+  _run( Top( 2 ), cache )
+  _run( Top( 3 ), cache )
+  # Only the latest entry is kept
+  assert len(tmpdir.listdir()) == 1
+  assert cache.stats()['evictions'] == 1
+  assert cache.load( _elaborated( Top( 3 ) ) )
+  assert not cache.load( _elaborated( Top( 2 ) ) )
+
+def _elaborated( top ):
+  top.elaborate()
+  return top
+
+def test_from_env( tmpdir, monkeypatch ):
+  monkeypatch.delenv( 'PYMTL_SCHEDULE_CACHE', raising=False )
+  assert ScheduleCache.from_env() is None
+
+  monkeypatch.setenv( 'PYMTL_SCHEDULE_CACHE', str(tmpdir) )
+  cache = ScheduleCache.from_env()
+  assert cache is ScheduleCache.from_env()
+
+  _run( Top(), None )
+  _run( Top(), None )
+  assert cache.stats()['hits'] == 1
+  assert os.path.exists( str(tmpdir) )
@@ -0,0 +1,103 @@
+#=========================================================================
+# SimCheckpoint_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+from collections import deque
+
+import pytest
+
+from pymtl3.datatypes import Bits8, bitstruct
+from pymtl3.dsl import *
+
+from ...PassGroups import DefaultPassGroup
+
+
+@bitstruct
+class Point:
+  x: Bits8
+  y: Bits8
+
+class Acc( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits8 )
+    s.out = OutPort( Point )
+    s.r   = Wire( Point )
+
+    # Python-level state
+    s.hist  = deque( maxlen=4 )
+    s.mem   = bytearray( 8 )
+    s.count = 0
+
+    @update_ff
+    def up_r():
+      if s.reset:
+        s.r <<= Point( 0, 0 )
+      else:
+        s.r <<= Point( s.r.x + s.in_, s.r.y + 1 )
+
+    @update
+    def up_out():
+      s.out @= s.r
+
+    @update_ff
+    def up_py():
+      s.hist.append( int(s.r.x) )
+      s.mem[ int(s.r.y) % 8 ] = ( s.mem[ int(s.r.y) % 8 ] + 1 ) & 255
+      s.count += 1
+
+class Top( Component ):
+  def construct( s, N=2 ):
+    s.in_  = InPort( Bits8 )
+    s.accs = [ Acc() for _ in range(N) ]
+    for x in s.accs:
+      x.in_ //= s.in_
+
+def _run( top, ncycles ):
+  trace = []
+  for i in range( ncycles ):
+    top.in_ @= i
+    top.sim_tick()
+    trace.append( ( top.sim_cycle_count(), [ (int(x.out.x), int(x.out.y), list(x.hist),
+                                               bytes(x.mem), x.count) for x in top.accs ] ) )
+  return trace
+
+def _make_top( N=2 ):
+  top = Top( N )
+  top.apply( DefaultPassGroup() )
+  top.sim_reset()
+  return top
+
+def test_checkpoint_restore( tmpdir ):
+  path = str( tmpdir.join( "ckpt.bin" ) )
+
+  top = _make_top()
+  _run( top, 10 )
+  top.sim_checkpoint( path )
+
+  trace = _run( top, 10 )
+
+  top.sim_restore( path )
+  assert top.sim_cycle_count() == trace[0][0] - 1
+  assert _run( top, 10 ) == trace
+
+  # Restore into another instance of the same design
+  other = _make_top()
+  hist  = other.accs[0].hist
+  other.sim_restore( path )
+  assert _run( other, 10 ) == trace
+  # Containers are restored in place
+  assert other.accs[0].hist is hist
+
+def test_restore_different_design( tmpdir ):
+  path = str( tmpdir.join( "ckpt.bin" ) )
+
+  top = _make_top( 2 )
+  _run( top, 3 )
+  top.sim_checkpoint( path )
+
+  other = _make_top( 3 )
+  with pytest.raises( ValueError ):
+    other.sim_restore( path )
@@ -0,0 +1,95 @@
+#=========================================================================
+# SimFastForward_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+from pymtl3.datatypes import Bits32
+from pymtl3.dsl import *
+
+from ...PassGroups import DefaultPassGroup
+
+
+class Countdown( Component ):
+  def construct( s, start=10 ):
+    s.out = OutPort( Bits32 )
+
+    @update_ff
+    def up_count():
+      if s.reset:
+        s.out <<= start
+      elif s.out > 0:
+        s.out <<= s.out - 1
+
+class Timer( Component ):
+  # A Python-level component that wakes up every interval cycles
+
+  def construct( s, interval=100 ):
+    s.interval = interval
+    s.count    = interval
+    s.fired    = 0
+
+    @update_once
+    def up_timer():
+      s.count -= 1
+      if s.count == 0:
+        s.fired += 1
+        s.count  = s.interval
+
+  def _sim_idle_cycles( s ):
+    return s.count - 1
+
+  def _sim_skip_cycles( s, n ):
+    s.count -= n
+
+class NoHook( Component ):
+  def construct( s ):
+    @update_once
+    def up_nothing():
+      pass
+
+class Top( Component ):
+  def construct( s, Other ):
+    s.cnt   = Countdown()
+    s.other = Other()
+
+def _make_top( Other ):
+  top = Top( Other )
+  top.apply( DefaultPassGroup(linetrace=False) )
+  top.sim_reset()
+  return top
+
+def test_fast_forward_rtl():
+  top = Countdown()
+  top.apply( DefaultPassGroup(linetrace=False) )
+  top.sim_reset()
+  start = top.sim_cycle_count()
+
+  skipped = top.sim_fast_forward( 1000 )
+  assert top.out == 0
+  assert top.sim_cycle_count() == start + 1000
+  assert skipped > 900
+
+def test_fast_forward_timer():
+  ref = _make_top( Timer )
+  top = _make_top( Timer )
+
+  skipped = 0
+  for i in range(10):
+    for j in range(99):
+      ref.sim_tick()
+    skipped += top.sim_fast_forward( 99 )
+
+    assert top.sim_cycle_count() == ref.sim_cycle_count()
+    assert top.cnt.out == ref.cnt.out
+    assert ( top.other.count, top.other.fired ) == ( ref.other.count, ref.other.fired )
+
+  assert skipped > 800
+
+def test_fast_forward_no_hook():
+  top = _make_top( NoHook )
+  start = top.sim_cycle_count()
+
+  assert top.sim_fast_forward( 100 ) == 0
+  assert top.sim_cycle_count() == start + 100
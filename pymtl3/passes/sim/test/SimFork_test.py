@@ -0,0 +1,106 @@
+#=========================================================================
+# SimFork_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import os
+import random
+
+import pytest
+
+from pymtl3.datatypes import Bits32
+from pymtl3.dsl import *
+
+from ...PassGroups import DefaultPassGroup
+
+pytestmark = pytest.mark.skipif( not hasattr( os, 'fork' ), reason="requires os.fork()" )
+
+class Acc( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits32 )
+    s.out = OutPort( Bits32 )
+
+    @update_ff
+    def up_acc():
+      if s.reset:
+        s.out <<= 0
+      else:
+        s.out <<= s.out + s.in_
+
+def _make_top():
+  top = Acc()
+  top.apply( DefaultPassGroup() )
+  top.sim_reset()
+  return top
+
+def _run( top, stimulus ):
+  for x in stimulus:
+    top.in_ @= x
+    top.sim_tick()
+  return int(top.out), top.sim_cycle_count()
+
+def test_sim_fork():
+  top = _make_top()
+  _run( top, range(100) )   # warm up
+
+  stimuli = [ [ i ] * 10 for i in range(4) ]
+  results = top.sim_fork( 4, lambda t, i: _run( t, stimuli[i] ) )
+
+  # The parent is untouched by the children
+  assert int(top.out) == sum( range(100) )
+
+  for i in range(4):
+    ref = _make_top()
+    _run( ref, range(100) )
+    assert results[i] == _run( ref, stimuli[i] )
+
+def test_sim_fork_seed():
+  top = _make_top()
+
+  def sample( t, i ):
+    return _run( t, [ random.randint( 0, 100 ) for _ in range(10) ] )
+
+  a = top.sim_fork( 3, sample, seed=42 )
+  b = top.sim_fork( 3, sample, seed=42 )
+  assert a == b
+  assert len( set(a) ) > 1
+
+def test_sim_fork_error():
+  top = _make_top()
+
+  def fail( t, i ):
+    if i == 1:
+      raise ValueError( "child failure" )
+    return i
+
+  with pytest.raises( RuntimeError ) as e:
+    top.sim_fork( 2, fail )
+  assert "child failure" in str( e.value )
+
+def _raise_in_parent():
+  raise ValueError( "cannot unpickle" )
+
+class _BadResult:
+  def __reduce__( self ):
+    return ( _raise_in_parent, () )
+
+def test_sim_fork_bad_result():
+  top = _make_top()
+
+  def bad( t, i ):
+    if i == 0:
+      return _BadResult()
+    if i == 1:
+      return lambda: None   # cannot be pickled
+    return i
+
+  with pytest.raises( RuntimeError ) as e:
+    top.sim_fork( 3, bad )
+  assert "child 0" in str( e.value ) and "cannot unpickle" in str( e.value )
+  assert "child 1" in str( e.value ) and "child 2" not in str( e.value )
+
+  # Every child was reaped
+  with pytest.raises( ChildProcessError ):
+    os.waitpid( -1, os.WNOHANG )
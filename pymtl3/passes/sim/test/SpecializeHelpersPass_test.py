@@ -0,0 +1,95 @@
+#=========================================================================
+# SpecializeHelpersPass_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import random
+
+import pytest
+
+from pymtl3 import *
+from pymtl3.datatypes import PythonBits
+from pymtl3.stdlib.test_utils import TestSrcCL
+
+from ..SpecializeHelpersPass import SpecializeHelpersPass
+
+pure_python_only = pytest.mark.skipif( Bits is not PythonBits.Bits,
+                                       reason="Only the pure-Python Bits are specialized" )
+
+class ImmGen( Component ):
+  def construct( s ):
+    s.inst = InPort( 32 )
+    s.sel  = InPort( 2 )
+    s.imm  = OutPort( 32 )
+    s.acc  = OutPort( 16 )
+
+    @update
+    def up_imm():
+      if   s.sel == 0: s.imm @= sext( s.inst[20:32], 32 )
+      elif s.sel == 1: s.imm @= concat( sext( s.inst[31], 20 ), s.inst[7], s.inst[25:31],
+                                        s.inst[8:12], Bits1(0) )
+      elif s.sel == 2: s.imm @= zext( s.inst[0:5], Bits32 )
+      else:            s.imm @= concat( s.inst[0:16], trunc( s.inst, 16 ) )
+
+    @update_ff
+    def up_acc():
+      s.acc <<= trunc( s.imm, 16 ) + zext( s.sel == 3, 16 )
+
+def _run( spec ):
+  m = ImmGen()
+  m.apply( DefaultPassGroup( specialize_helpers=spec ) )
+  m.sim_reset()
+
+  rng = random.Random( 0 )
+  trace = []
+  for i in range( 200 ):
+    m.inst @= rng.getrandbits( 32 )
+    m.sel  @= i % 4
+    m.sim_eval_combinational()
+    trace.append( ( int(m.imm), int(m.acc) ) )
+    m.sim_tick()
+  return m, trace
+
+@pure_python_only
+def test_specialized_same_results():
+  m, trace = _run( True )
+  assert m.get_metadata( SpecializeHelpersPass.num_specialized ) == 8
+  up_imm = m.get_update_block( 'up_imm' )
+  assert len( up_imm.__kwdefaults__ ) == 6
+  assert trace == _run( False )[1]
+
+@pure_python_only
+def test_translation_source_unchanged():
+  m, _ = _run( True )
+  src = m.get_update_block_info( m.get_update_block( 'up_imm' ) )[1]
+  assert "sext( s.inst[20:32], 32 )" in src
+
+@pure_python_only
+def test_cl_component_untouched():
+  m = TestSrcCL( Bits8, [ Bits8(1) ] )
+  m.apply( DefaultPassGroup( specialize_helpers=True ) )
+  assert m.get_metadata( SpecializeHelpersPass.num_specialized ) == 0
+
+class Faulty( Component ):
+  def construct( s ):
+    s.in_ = InPort( 2 )
+    s.arr = [ Wire( 8 ) for _ in range(3) ]
+    s.out = OutPort( 16 )
+
+    @update
+    def up_faulty():
+      s.out @= zext( s.in_, 16 )
+      s.out @= zext( s.arr[ s.in_ ], 16 )
+
+@pure_python_only
+def test_line_numbers_preserved():
+  m = Faulty()
+  m.apply( DefaultPassGroup( specialize_helpers=True ) )
+  assert m.get_metadata( SpecializeHelpersPass.num_specialized ) == 2
+  m.in_ @= 3
+  with pytest.raises( IndexError ) as e:
+    m.sim_eval_combinational()
+  frame = [ x for x in e.traceback if x.name == 'up_faulty' ][0]
+  assert str( frame.statement ).strip() == "s.out @= zext( s.arr[ s.in_ ], 16 )"
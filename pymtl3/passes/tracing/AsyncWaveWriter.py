@@ -0,0 +1,131 @@
+"""
+========================================================================
+AsyncWaveWriter.py
+========================================================================
+Move waveform formatting and file I/O off the simulation thread.
+
+The simulation thread only records what changed in a cycle and calls
+put( record ). Records are grouped into chunks of chunk_cycles cycles,
+and the chunks go through a ring buffer with a fixed number of slots to
+a writer thread, which calls write_chunk( chunk ) and flushes the file
+every flush_interval cycles. When the writer falls behind and the ring
+buffer is full, put blocks until a slot is free, so the memory stays
+bounded.
+
+close() hands over the last partial chunk, waits for the writer thread
+to write everything and closes the file. An exception in the writer
+thread is raised again by the next put or close.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import os
+import threading
+
+
+class RingBuffer:
+  """A bounded FIFO with preallocated slots. get blocks while the buffer
+  is empty and put blocks while it is full."""
+
+  def __init__( s, capacity ):
+    assert capacity > 0
+    s.slots    = [ None ] * capacity
+    s.capacity = capacity
+    s.head     = 0 # next slot to get
+    s.count    = 0
+    s.cv       = threading.Condition()
+
+  def put( s, item ):
+    with s.cv:
+      while s.count == s.capacity:
+        s.cv.wait()
+      s.slots[ (s.head + s.count) % s.capacity ] = item
+      s.count += 1
+      s.cv.notify_all()
+
+  def get( s ):
+    with s.cv:
+      while s.count == 0:
+        s.cv.wait()
+      item = s.slots[ s.head ]
+      s.slots[ s.head ] = None
+      s.head   = (s.head + 1) % s.capacity
+      s.count -= 1
+      s.cv.notify_all()
+      return item
+
+  def __len__( s ):
+    return s.count
+
+class AsyncWaveWriter:
+
+  def __init__( s, write_chunk, file, *, chunk_cycles=256, capacity=64,
+                flush_interval=10000, name="wave-writer" ):
+    s.write_chunk    = write_chunk
+    s.file           = file
+    s.chunk_cycles   = chunk_cycles
+    s.flush_interval = flush_interval
+    s.ring           = RingBuffer( capacity )
+
+    s.chunk  = []
+    s.error  = None
+    s.closed = False
+
+    # A forked child (see sim_fork) has no writer thread
+    s.pid    = os.getpid()
+    s.thread = threading.Thread( target=s._run, name=name, daemon=True )
+    s.thread.start()
+
+  # Simulation thread
+
+  def put( s, record ):
+    chunk = s.chunk
+    chunk.append( record )
+    if len(chunk) >= s.chunk_cycles:
+      s._push()
+
+  def _push( s ):
+    if s.error is not None:
+      raise s.error
+    if s.closed:
+      raise ValueError( "The wave writer is already closed" )
+    if s.pid == os.getpid():
+      s.ring.put( s.chunk )
+    s.chunk = []
+
+  def close( s ):
+    if s.closed or s.pid != os.getpid():
+      return
+    if s.thread.is_alive():
+      if s.error is None:
+        s._push()
+      s.ring.put( None )
+      s.thread.join()
+    s.closed = True
+    s.file.close()
+    if s.error is not None:
+      raise s.error
+
+  # Writer thread
+
+  def _run( s ):
+    ncycles = 0
+    try:
+      while True:
+        chunk = s.ring.get()
+        if chunk is None:
+          break
+        s.write_chunk( chunk )
+
+        ncycles += len(chunk)
+        if ncycles >= s.flush_interval:
+          s.file.flush()
+          ncycles = 0
+
+      s.file.flush()
+
+    except BaseException as e:
+      s.error = e
+      # Keep draining so that the simulation thread never blocks forever
+      while s.ring.get() is not None:
+        pass
@@ -0,0 +1,442 @@
+"""
+========================================================================
+BinaryWave.py
+========================================================================
+A compact, block-compressed binary waveform format (.pwave) for long
+simulations, in the spirit of FST. BinaryWaveGenerationPass writes it,
+BinaryWaveReader extracts the history of single signals without
+decompressing the whole file, and binary_wave_to_vcd converts it to VCD
+for waveform viewers.
+
+The value changes are grouped into blocks of at most block_cycles
+cycles. Every block stores the values of all signals at its first cycle
+plus one zlib stream per signal that changed, so a reader only has to
+decompress the streams of the signals it wants, and the index at the end
+of the file locates the blocks of a time window.
+
+File layout, all integers are little-endian:
+
+  header  b"PYMTLWAV" | u32 version | u32 n | n bytes of UTF-8 JSON
+          { "signals": [ { "names": [ [ scope, name ], ... ],
+                           "nbits": nbits }, ... ], ... }
+  blocks  u32 nstreams | nstreams * ( u32 id, u32 offset, u32 size ) |
+          the streams, offsets count from the end of the table
+  index   u32 nblocks | nblocks * ( u64 first_cycle, u64 last_cycle,
+                                    u64 offset, u64 size )
+  footer  u64 offset of the index | b"PYMTLEND"
+
+Stream SNAPSHOT holds the value of every signal at first_cycle. Stream i
+holds the changes of signal i: u32 count | count * u32 cycle offset from
+first_cycle | count values. A value takes elem_nbytes( nbits ) bytes as
+in pymtl3.datatypes.buffers. If some cycles of a block were not dumped,
+e.g., outside of a trigger window, stream GAPS lists them as pairs of
+u32 cycle offsets ( last dumped cycle, next dumped cycle ).
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import bisect
+import json
+import struct
+import time
+import zlib
+from itertools import islice
+
+from pymtl3.datatypes.buffers import _bytes_to_uints, _uints_to_bytes, elem_nbytes
+
+from .VcdGenerationPass import gen_vcd_symbol, vcd_mangle_name
+
+MAGIC        = b"PYMTLWAV"
+FOOTER_MAGIC = b"PYMTLEND"
+VERSION      = 1
+SNAPSHOT     = 0xffffffff
+GAPS         = 0xfffffffe
+
+_u32       = struct.Struct( "<I" )
+_u64       = struct.Struct( "<Q" )
+_table_row = struct.Struct( "<III" )
+_index_row = struct.Struct( "<QQQQ" )
+
+#-------------------------------------------------------------------------
+# BinaryWaveWriter
+#-------------------------------------------------------------------------
+
+class BinaryWaveWriter:
+  """Write value changes to a .pwave file. signals is a list of
+  ( names, nbits ) where names is a list of ( scope, name ) aliases of
+  the same net, and init_values are the values before the first cycle.
+  put( cycle, record ) takes the changes of one cycle as a flat list
+  [ index, value, index, value, ... ]; cycles must increase."""
+
+  def __init__( s, file_name, signals, init_values, *, block_cycles=4096,
+                compress_level=6, timescale="10ps" ):
+    assert block_cycles > 0
+    s.nbits          = [ nbits for _, nbits in signals ]
+    s.values         = list( init_values )
+    s.block_cycles   = block_cycles
+    s.compress_level = compress_level
+
+    s.index       = []
+    s.changes     = {}
+    s.gaps        = []
+    s.snapshot    = None
+    s.block_first = 0
+    s.block_last  = 0
+
+    header = json.dumps( {
+      "signals"      : [ { "names": [ list(x) for x in names ], "nbits": nbits }
+                         for names, nbits in signals ],
+      "timescale"    : timescale,
+      "date"         : time.asctime(),
+      "block_cycles" : block_cycles,
+    } ).encode()
+
+    s.file = open( file_name, "wb" )
+    s.file.write( MAGIC + _u32.pack( VERSION ) + _u32.pack( len(header) ) + header )
+
+  def put( s, cycle, record ):
+    if s.snapshot is None:
+      s.snapshot    = s.values[:]
+      s.block_first = cycle
+    elif cycle - s.block_first >= s.block_cycles:
+      s.write_block()
+      s.snapshot    = s.values[:]
+      s.block_first = cycle
+    elif cycle != s.block_last + 1:
+      s.gaps.append( ( s.block_last, cycle ) )
+    s.block_last = cycle
+
+    values  = s.values
+    changes = s.changes
+    it = iter( record )
+    for i, v in zip( it, it ):
+      values[i] = v
+      if i in changes:
+        cycles, vs = changes[i]
+        cycles.append( cycle )
+        vs.append( v )
+      else:
+        changes[i] = ( [ cycle ], [ v ] )
+
+  def write_chunk( s, chunk ):
+    """Write a list of ( cycle, record ), for AsyncWaveWriter."""
+    put = s.put
+    for cycle, record in chunk:
+      put( cycle, record )
+
+  def write_block( s ):
+    if s.snapshot is None:
+      return
+
+    level   = s.compress_level
+    first   = s.block_first
+    streams = [ ( SNAPSHOT, zlib.compress( b"".join( [ _uints_to_bytes( nbits, [ v ] )
+                for nbits, v in zip( s.nbits, s.snapshot ) ] ), level ) ) ]
+
+    for i in sorted( s.changes ):
+      cycles, vs = s.changes[i]
+      data = _u32.pack( len(cycles) ) + \
+             _uints_to_bytes( 32, [ c - first for c in cycles ] ) + \
+             _uints_to_bytes( s.nbits[i], vs )
+      streams.append( ( i, zlib.compress( data, level ) ) )
+
+    if s.gaps:
+      data = _uints_to_bytes( 32, [ c - first for gap in s.gaps for c in gap ] )
+      streams.append( ( GAPS, zlib.compress( data, level ) ) )
+
+    table  = [ _u32.pack( len(streams) ) ]
+    offset = 0
+    for i, data in streams:
+      table.append( _table_row.pack( i, offset, len(data) ) )
+      offset += len(data)
+
+    block = b"".join( table + [ data for _, data in streams ] )
+    s.index.append( ( first, s.block_last, s.file.tell(), len(block) ) )
+    s.file.write( block )
+
+    s.changes  = {}
+    s.gaps     = []
+    s.snapshot = None
+
+  def flush( s ):
+    s.file.flush()
+
+  def _write_index( s ):
+    offset = s.file.tell()
+    s.file.write( _u32.pack( len(s.index) ) )
+    s.file.write( b"".join( [ _index_row.pack( *x ) for x in s.index ] ) )
+    s.file.write( _u64.pack( offset ) + FOOTER_MAGIC )
+
+  def sync( s ):
+    """Write the current block and an index after it so that a reader can
+    open the file in the middle of the simulation. The next block
+    overwrites this index."""
+    if s.file.closed:
+      return
+    s.write_block()
+    end = s.file.tell()
+    s._write_index()
+    s.file.flush()
+    s.file.seek( end )
+
+  def close( s ):
+    if s.file.closed:
+      return
+    s.write_block()
+    s._write_index()
+    s.file.truncate()
+    s.file.close()
+
+#-------------------------------------------------------------------------
+# BinaryWaveReader
+#-------------------------------------------------------------------------
+
+class BinaryWaveReader:
+  """Random access to a .pwave file. Signals are looked up by their full
+  name, e.g., "top.sub.in_", or by any alias in the same net."""
+
+  def __init__( s, file_name ):
+    s.file = open( file_name, "rb" )
+
+    magic = s.file.read( len(MAGIC) )
+    if magic != MAGIC:
+      raise ValueError( f"{file_name} is not a PyMTL binary waveform" )
+    version, n = struct.unpack( "<II", s.file.read( 8 ) )
+    if version != VERSION:
+      raise ValueError( f"{file_name} has version {version}, only {VERSION} is supported" )
+    s.header = json.loads( s.file.read( n ).decode() )
+
+    s.signals = [ ( [ tuple(x) for x in sig["names"] ], sig["nbits"] )
+                  for sig in s.header["signals"] ]
+    s.ids = {}
+    for i, (names, _) in enumerate( s.signals ):
+      for scope, name in names:
+        s.ids[ f"{scope}.{name}" ] = i
+
+    # Where each value is in the snapshot stream
+    s.snapshot_offsets = [ 0 ]
+    for _, nbits in s.signals:
+      s.snapshot_offsets.append( s.snapshot_offsets[-1] + elem_nbytes( nbits ) )
+
+    s.file.seek( -_u64.size - len(FOOTER_MAGIC), 2 )
+    footer = s.file.read()
+    if footer[ _u64.size: ] != FOOTER_MAGIC:
+      raise ValueError( f"{file_name} is incomplete, was the simulation finalized?" )
+    s.file.seek( _u64.unpack( footer[ :_u64.size ] )[0] )
+    nblocks, = _u32.unpack( s.file.read( _u32.size ) )
+    data     = s.file.read( nblocks * _index_row.size )
+    s.blocks = [ _index_row.unpack_from( data, i * _index_row.size ) for i in range( nblocks ) ]
+    s.block_firsts = [ x[0] for x in s.blocks ]
+
+  def close( s ):
+    s.file.close()
+
+  def __enter__( s ):
+    return s
+
+  def __exit__( s, *args ):
+    s.close()
+
+  def signal_id( s, name ):
+    try:
+      return s.ids[ name ]
+    except KeyError:
+      raise KeyError( f"{name} is not in the waveform" ) from None
+
+  # Blocks
+
+  def _read_table( s, b ):
+    _, _, offset, _ = s.blocks[b]
+    s.file.seek( offset )
+    n, = _u32.unpack( s.file.read( _u32.size ) )
+    data  = s.file.read( n * _table_row.size )
+    table = {}
+    for k in range( n ):
+      i, off, size = _table_row.unpack_from( data, k * _table_row.size )
+      table[i] = ( off, size )
+    return offset + _u32.size + n * _table_row.size, table
+
+  def _read_stream( s, base, entry ):
+    off, size = entry
+    s.file.seek( base + off )
+    return zlib.decompress( s.file.read( size ) )
+
+  def _decode_changes( s, i, data ):
+    count, = _u32.unpack_from( data )
+    split  = _u32.size + 4 * count
+    return _bytes_to_uints( 32, data[ _u32.size:split ] ), _bytes_to_uints( s.signals[i][1], data[ split: ] )
+
+  def _snapshot_value( s, i, snapshot ):
+    lo, hi = s.snapshot_offsets[i], s.snapshot_offsets[i+1]
+    return _bytes_to_uints( s.signals[i][1], snapshot[ lo:hi ] )[0]
+
+  def blocks_in( s, start=None, stop=None ):
+    """Return the indices of the blocks with cycles in [start, stop)."""
+    lo = 0 if start is None else max( 0, bisect.bisect_right( s.block_firsts, start ) - 1 )
+    hi = len(s.blocks) if stop is None else bisect.bisect_left( s.block_firsts, stop )
+    return [ b for b in range( lo, hi ) if start is None or s.blocks[b][1] >= start ]
+
+  def read_block( s, b ):
+    """Decode the whole block b into ( first_cycle, last_cycle, values at
+    first_cycle, { index: ( absolute cycles, values ) } )."""
+    first, last, _, _ = s.blocks[b]
+    base, table = s._read_table( b )
+    snapshot = s._read_stream( base, table.pop( SNAPSHOT ) )
+    table.pop( GAPS, None )
+    values   = [ s._snapshot_value( i, snapshot ) for i in range( len(s.signals) ) ]
+    changes  = {}
+    for i, entry in table.items():
+      cycles, vs = s._decode_changes( i, s._read_stream( base, entry ) )
+      changes[i] = ( [ first + c for c in cycles ], vs )
+    return first, last, values, changes
+
+  def dumped_cycles( s, b ):
+    """Return the cycles that were dumped in block b."""
+    first, last, _, _ = s.blocks[b]
+    base, table = s._read_table( b )
+    if GAPS not in table:
+      return range( first, last + 1 )
+
+    gaps = _bytes_to_uints( 32, s._read_stream( base, table[ GAPS ] ) )
+    ret  = []
+    lo   = first
+    for k in range( 0, len(gaps), 2 ):
+      ret.extend( range( lo, first + gaps[k] + 1 ) )
+      lo = first + gaps[k+1]
+    ret.extend( range( lo, last + 1 ) )
+    return ret
+
+  def cycles( s, start=None, stop=None ):
+    """Yield ( cycle, values ) for the dumped cycles in [start, stop),
+    where values are the values of all signals. The list is updated in
+    place, copy it to keep it."""
+    for b in s.blocks_in( start, stop ):
+      first, last, values, changes = s.read_block( b )
+
+      by_cycle = {}
+      for i, (cycles, vs) in changes.items():
+        for c, v in zip( cycles, vs ):
+          by_cycle.setdefault( c, [] ).append( ( i, v ) )
+
+      for c in s.dumped_cycles( b ):
+        for i, v in by_cycle.get( c, () ):
+          values[i] = v
+        if stop is not None and c >= stop:
+          return
+        if start is None or c >= start:
+          yield c, values
+
+  # Signals
+
+  def history( s, name, start=None, stop=None ):
+    """Return the [ ( cycle, value ) ] of signal name for the dumped
+    cycles in [start, stop): its value at the first dumped cycle and then
+    every change. Only the blocks in the window are read, and only the
+    streams of this signal are decompressed."""
+    i   = s.signal_id( name )
+    ret = []
+    for b in s.blocks_in( start, stop ):
+      first, _, _, _ = s.blocks[b]
+      base, table = s._read_table( b )
+      value  = s._snapshot_value( i, s._read_stream( base, table[ SNAPSHOT ] ) )
+      cycles, vs = s._decode_changes( i, s._read_stream( base, table[i] ) ) if i in table else ( [], [] )
+
+      # Value at the beginning of the window in this block
+      t = first if start is None else max( first, start )
+      k = 0
+      while k < len(cycles) and first + cycles[k] <= t:
+        value = vs[k]
+        k += 1
+      if not ret or ret[-1][1] != value:
+        ret.append( ( t, value ) )
+
+      for c, v in zip( cycles[k:], vs[k:] ):
+        if stop is not None and first + c >= stop:
+          break
+        ret.append( ( first + c, v ) )
+    return ret
+
+  def value_at( s, name, cycle ):
+    """Return the value of signal name at a dumped cycle."""
+    hist = s.history( name, cycle, cycle + 1 )
+    if not hist:
+      raise ValueError( f"Cycle {cycle} is not in the waveform" )
+    return hist[-1][1]
+
+#-------------------------------------------------------------------------
+# binary_wave_to_vcd
+#-------------------------------------------------------------------------
+
+def binary_wave_to_vcd( file_name, vcd_file_name, clock="top.clk" ):
+  """Convert a .pwave file into a VCD file. The clock signal, if it is in
+  the waveform, toggles every dumped cycle like in VcdGenerationPass,
+  with the value changes of cycle n at time 100*n."""
+
+  with BinaryWaveReader( file_name ) as reader, open( vcd_file_name, "w" ) as out:
+    w = out.write
+    w( f"$date\n  {reader.header.get('date', '')}\n$end\n$version\n  PyMTL 3 (Mamba)\n$end\n"
+       f"$timescale\n {reader.header.get('timescale', '10ps')}\n$end\n\n" )
+
+    symbols = list( islice( gen_vcd_symbol(), len(reader.signals) ) )
+    nbits   = [ n for _, n in reader.signals ]
+    clk     = reader.ids.get( clock )
+
+    # Scope tree: { name: ( subtree, [ ( var name, id ) ] ) }
+    tree = {}
+    for i, (names, _) in enumerate( reader.signals ):
+      for scope, name in names:
+        node = ( tree, None )
+        for x in scope.split( "." ):
+          node = node[0].setdefault( x, ( {}, [] ) )
+        node[1].append( ( name, i ) )
+
+    def dump_scope( children, spaces ):
+      for scope_name, (subtree, variables) in children.items():
+        w( f"{spaces}$scope module {vcd_mangle_name(scope_name)} $end\n" )
+        for name, i in variables:
+          w( f"{spaces}  $var reg {nbits[i]} {symbols[i]} {vcd_mangle_name(name)} $end\n" )
+        dump_scope( subtree, spaces + "  " )
+        w( f"{spaces}$upscope $end\n" )
+
+    dump_scope( tree, "" )
+    w( "$enddefinitions $end\n" )
+
+    # Symbols can contain { and }, which have to be escaped in the format
+    fmt = [ f"b{{:0{n}b}} {sym.replace('{', '{{').replace('}', '}}')}\n".format
+            for n, sym in zip( nbits, symbols ) ]
+    current = None
+
+    for b in range( len(reader.blocks) ):
+      first, last, values, changes = reader.read_block( b )
+
+      by_cycle = {}
+      for i, (cycles, vs) in changes.items():
+        if i == clk:
+          continue
+        for c, v in zip( cycles, vs ):
+          by_cycle.setdefault( c, [] ).append( ( i, v ) )
+
+      # The values at the beginning of the block that are not what the
+      # previous block left behind, e.g., after a gap in the dump
+      if current is None:
+        diff = [ fmt[i]( v ) for i, v in enumerate( values ) if i != clk ]
+      else:
+        diff = [ fmt[i]( v ) for i, v in enumerate( values ) if i != clk and v != current[i] ]
+      current = values
+
+      for c in reader.dumped_cycles( b ):
+        text = [ f"#{c * 100}\n" ]
+        if clk is not None:
+          text.append( fmt[clk]( 1 ) )
+        if c == first:
+          text.extend( diff )
+        for i, v in by_cycle.get( c, () ):
+          current[i] = v
+          text.append( fmt[i]( v ) )
+        if clk is not None:
+          text.append( f"#{c * 100 + 50}\n" + fmt[clk]( 0 ) )
+        w( "".join( text ) )
+
+    # The rising edge that ends the last dumped cycle
+    if clk is not None and reader.blocks:
+      w( f"#{(reader.blocks[-1][1] + 1) * 100}\n" + fmt[clk]( 1 ) )
@@ -0,0 +1,192 @@
+"""
+========================================================================
+BinaryWaveGenerationPass.py
+========================================================================
+Dump the waveform into the block-compressed binary format of
+BinaryWave.py instead of VCD. The dump can be limited to the subtree of
+one component and to a window of cycles, given as start/stop cycles or
+as a trigger signal that enables the dump while it is nonzero (similar
+to Verilator's vl_trace_on_demand).
+
+Use binary_wave_to_vcd to look at the result in a waveform viewer, or
+BinaryWaveReader to extract the history of a few signals.
+
+With a TraceTriggerPass window, only the cycles in the window are
+dumped, including the pre-trigger cycles.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import weakref
+
+from pymtl3.dsl import MetadataKey
+from pymtl3.passes.BasePass import BasePass
+
+from .AsyncWaveWriter import AsyncWaveWriter
+from .BinaryWave import BinaryWaveWriter
+from .TraceTriggerPass import TraceTriggerPass
+from .WaveCapture import collect_nets, gen_capture_func, gen_value_getter
+
+
+class BinaryWaveGenerationPass( BasePass ):
+
+  #: Dump the waveform into <wave_file_name>.pwave
+  #:
+  #: Type: ``str``; input
+  wave_file_name = MetadataKey(str)
+
+  #: Only dump the signals in the subtree of this component
+  #:
+  #: Type: ``Component``; input
+  #:
+  #: Default value: top
+  scope = MetadataKey()
+
+  #: Only dump the cycles in [start_cycle, stop_cycle)
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: 0 and None (no limit)
+  start_cycle = MetadataKey(int)
+  stop_cycle  = MetadataKey(int)
+
+  #: Only dump the cycles in which this 1-bit signal is nonzero
+  #:
+  #: Type: ``Signal``; input
+  trigger = MetadataKey()
+
+  #: Maximum number of cycles in a block
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: 4096
+  block_cycles = MetadataKey(int)
+
+  #: zlib compression level of the blocks
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: 6
+  compress_level = MetadataKey(int)
+
+  #: Compress and write the blocks in a background thread
+  #:
+  #: Type: ``bool``; input
+  #:
+  #: Default value: False
+  async_write = MetadataKey(bool)
+
+  wave_func = MetadataKey()
+
+  #: Write the last block and the index and close the file, called by
+  #: top.sim_finalize(), when top is garbage collected, or at exit
+  #:
+  #: Type: callable; output
+  wave_finalize_func = MetadataKey()
+
+  def __call__( self, top ):
+    if top.has_metadata( self.wave_file_name ):
+      wave_file_name = top.get_metadata( self.wave_file_name )
+
+      if wave_file_name is not None:
+        assert not top.has_metadata( self.wave_func )
+        top.set_metadata( self.wave_func, self.make_wave_func( top, wave_file_name ) )
+
+  def _get( self, top, key, default ):
+    return top.get_metadata( key ) if top.has_metadata( key ) else default
+
+  def make_wave_func( self, top, wave_file_name ):
+    if wave_file_name == "":
+      wave_file_name = top.__class__.__name__
+    wave_file_name = str(wave_file_name) + ".pwave"
+
+    scope   = self._get( top, self.scope, top )
+    start   = self._get( top, self.start_cycle, 0 )
+    stop    = self._get( top, self.stop_cycle, None )
+    trigger = self._get( top, self.trigger, None )
+    window  = self._get( top, TraceTriggerPass.trace_window, None )
+
+    if window is not None and ( trigger is not None or start != 0 or stop is not None ):
+      raise ValueError( "Please use either the trigger and start/stop cycles of "
+                        "BinaryWaveGenerationPass or TraceTriggerPass, not both" )
+
+    try:                    timescale = top.vcd_timescale
+    except AttributeError:  timescale = "10ps"
+
+    nets        = collect_nets( top, scope )
+    signals     = [ net[0] for net in nets ]
+    init_values = [ int( x._dsl.Type().to_bits() ) for x in signals ]
+
+    # Names are ( scope, name ) like in a VCD file, e.g., the signal
+    # s.sub.enq.msg is ( "top.sub", "enq.msg" )
+    def name_of( x ):
+      host = x.get_host_component()
+      return ( "top" + repr(host)[1:], repr(x)[ len(repr(host))+1: ] )
+
+    writer = BinaryWaveWriter( wave_file_name,
+                               [ ( [ name_of(x) for x in net ], net[0]._dsl.Type.nbits ) for net in nets ],
+                               init_values,
+                               block_cycles   = self._get( top, self.block_cycles, 4096 ),
+                               compress_level = self._get( top, self.compress_level, 6 ),
+                               timescale      = timescale )
+
+    if window is not None:
+      return self.gen_triggered_dump_wave( top, window, writer, signals, init_values )
+
+    cycle = [ 0 ]
+
+    if self._get( top, self.async_write, False ):
+      async_writer = AsyncWaveWriter( writer.write_chunk, writer, name="wave-writer" )
+      capture  = gen_capture_func( top, signals, init_values, lambda i, x: f"_a( {i} ); _a( _v )",
+                                   "  _put( ( _c[0], _o ) )", { '_put': async_writer.put, '_c': cycle },
+                                   name="capture_wave" )
+      finalize = async_writer.close
+    else:
+      capture  = gen_capture_func( top, signals, init_values, lambda i, x: f"_a( {i} ); _a( _v )",
+                                   "  _put( _c[0], _o )", { '_put': writer.put, '_c': cycle },
+                                   name="capture_wave" )
+      finalize = writer.close
+
+    # Close the file when top goes away or at exit, without keeping top
+    # or the writer alive until then
+    top.set_metadata( self.wave_finalize_func, weakref.finalize( top, finalize ) )
+
+    # Nothing is captured outside of the window. The capture function
+    # compares against the last captured values, so the first captured
+    # cycle after a gap still records everything that changed.
+
+    if trigger is None and start == 0 and stop is None:
+      def dump_wave():
+        capture()
+        cycle[0] += 1
+      return dump_wave
+
+    stop = float('inf') if stop is None else stop
+    trigger_value = gen_value_getter( trigger ) if trigger is not None else None
+
+    def dump_wave():
+      n = cycle[0]
+      if start <= n < stop and ( trigger_value is None or trigger_value() ):
+        capture()
+      cycle[0] = n + 1
+
+    return dump_wave
+
+  def gen_triggered_dump_wave( self, top, window, writer, signals, init_values ):
+    capture = gen_capture_func( top, signals, init_values, lambda i, x: f"_a( {i} ); _a( _v )",
+                                "  return _o", name="capture_wave" )
+
+    if self._get( top, self.async_write, False ):
+      async_writer = AsyncWaveWriter( writer.write_chunk, writer, name="wave-writer" )
+      put      = async_writer.put
+      emit     = lambda cycle, record: put( ( cycle, record ) )
+      finalize = async_writer.close
+    else:
+      emit     = writer.put
+      finalize = writer.close
+
+    # Close the file when top goes away or at exit, without keeping top
+    # or the writer alive until then
+    top.set_metadata( self.wave_finalize_func, weakref.finalize( top, finalize ) )
+
+    return window.gate( capture, emit, changes=True )
@@ -0,0 +1,136 @@
+"""
+========================================================================
+LineTraceRecordPass.py
+========================================================================
+Record what the line traces need instead of printing them every cycle.
+
+Line traces are rendered from signal values, so the pass records the
+value changes of every net into a .ltrace file in the binary format of
+BinaryWave.py, which costs a few integer comparisons per net per cycle.
+The text is only produced on demand:
+
+  top.render_line_trace( start, stop )
+
+returns the line traces of the cycles in [start, stop), rendered by
+writing the recorded values back into the model and calling the usual
+line_trace methods. The current values are restored afterwards. To
+render a finished recording later, build and simulate-prepare the same
+design and call render_line_trace( top, file_name, start, stop ).
+
+Line traces that depend on state other than signals, e.g., the queues of
+CL components or which methods were called, are rendered with the
+current value of that state.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import weakref
+
+from pymtl3.dsl import MetadataKey
+from pymtl3.passes.BasePass import BasePass
+
+from .BinaryWave import BinaryWaveReader, BinaryWaveWriter
+from .WaveCapture import (
+    collect_nets,
+    gen_capture_func,
+    gen_value_getter,
+    gen_value_setter,
+)
+
+
+def render_line_trace( top, file_name, start=None, stop=None ):
+  """Return the line traces of the cycles in [start, stop) recorded in
+  file_name, formatted like the printed line trace."""
+
+  nets = collect_nets( top )
+
+  with BinaryWaveReader( file_name ) as reader:
+    replay = []
+    for net in nets:
+      i = reader.ids.get( "top" + repr(net[0])[1:] )
+      if i is not None:
+        replay.append( ( i, gen_value_getter( net[0] ), gen_value_setter( net[0] ) ) )
+
+    saved = [ get() for _, get, _ in replay ]
+    last  = saved[:]
+    lines = []
+    try:
+      for cycle, values in reader.cycles( start, stop ):
+        for k, (i, _, set_value) in enumerate( replay ):
+          v = values[i]
+          if v != last[k]:
+            set_value( v )
+            last[k] = v
+        lines.append( f"{cycle:3}: {top.line_trace()}" )
+
+    finally:
+      for (_, _, set_value), v in zip( replay, saved ):
+        set_value( v )
+
+  return lines
+
+class LineTraceRecordPass( BasePass ):
+
+  #: Record the values that the line traces need into
+  #: <trace_file_name>.ltrace
+  #:
+  #: Type: ``str``; input
+  trace_file_name = MetadataKey(str)
+
+  #: Maximum number of cycles in a block of the file
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: 4096
+  block_cycles = MetadataKey(int)
+
+  record_func = MetadataKey()
+
+  #: Write the last block and close the file, called by
+  #: top.sim_finalize(), when top is garbage collected, or at exit
+  #:
+  #: Type: callable; output
+  record_finalize_func = MetadataKey()
+
+  def __call__( self, top ):
+    if top.has_metadata( self.trace_file_name ):
+      trace_file_name = top.get_metadata( self.trace_file_name )
+
+      if trace_file_name is not None and hasattr( top, 'line_trace' ):
+        assert not top.has_metadata( self.record_func )
+        top.set_metadata( self.record_func, self.make_record_func( top, trace_file_name ) )
+
+  def make_record_func( self, top, trace_file_name ):
+    if trace_file_name == "":
+      trace_file_name = top.__class__.__name__
+    trace_file_name = str(trace_file_name) + ".ltrace"
+
+    block_cycles = 4096
+    if top.has_metadata( self.block_cycles ):
+      block_cycles = top.get_metadata( self.block_cycles )
+
+    nets        = collect_nets( top )
+    signals     = [ net[0] for net in nets ]
+    init_values = [ int( x._dsl.Type().to_bits() ) for x in signals ]
+
+    def name_of( x ):
+      host = x.get_host_component()
+      return ( "top" + repr(host)[1:], repr(x)[ len(repr(host))+1: ] )
+
+    writer = BinaryWaveWriter( trace_file_name,
+                               [ ( [ name_of(x) for x in net ], net[0]._dsl.Type.nbits ) for net in nets ],
+                               init_values, block_cycles=block_cycles )
+
+    cycle   = [ 0 ]
+    capture = gen_capture_func( top, signals, init_values, lambda i, x: f"_a( {i} ); _a( _v )",
+                                "  _put( _c[0], _o )\n  _c[0] += 1",
+                                { '_put': writer.put, '_c': cycle }, name="record_line_trace" )
+
+    top.set_metadata( self.record_finalize_func, weakref.finalize( top, writer.close ) )
+
+    def _render_line_trace( start=None, stop=None ):
+      writer.sync()
+      return render_line_trace( top, trace_file_name, start, stop )
+
+    top.render_line_trace = _render_line_trace
+    return capture
@@ -5,7 +5,13 @@ PrintWavePass.py
 Print single bit signal in wave form and multi-bit signal by showing
 least significant bits.
 
-To use, call top.print_wave()
+To use, call top.print_textwave(), or top.print_textwave( start, stop )
+to only print the cycles in [start, stop).
+
+The values are captured once per net as run-length encoded integers,
+i.e., a new run only starts when the value changes, and are formatted
+only when printed. signal_filter limits the capture to the signals that
+match some glob patterns and max_cycles only keeps the last few cycles.
 
 Inspired by PyRTL's state machine screenshot, which shows the change of signal
 values along ticks of the clock.
@@ -16,11 +22,80 @@ Author : Kaishuo Cheng, Shunning Jiang
 Date   : Nov 9, 2019
 """
 
-import py
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
 
-from pymtl3.dsl import Const, MetadataKey
+from pymtl3.dsl import MetadataKey
 from pymtl3.passes.BasePass import BasePass
-from pymtl3.passes.errors import PassOrderError
+
+from .WaveCapture import collect_nets, gen_capture_func
+
+
+class TextWaveHistory( Mapping ):
+  """The captured values, which map the name of each signal, e.g., s.in0,
+  to the list of its values as binary strings, one per retained cycle.
+
+  Each net keeps the cycles at which its runs start and the values of the
+  runs in two arrays (plain lists for nets wider than 64 bits)."""
+
+  def __init__( s, names, nbits, max_cycles=None ):
+    s.names      = names # { name: net index }
+    s.nbits      = nbits
+    s.starts     = [ array('Q') for _ in nbits ]
+    s.values     = [ array('Q') if n <= 64 else [] for n in nbits ]
+    s.ncycles    = 0 # number of captured cycles
+    s.first      = 0 # first retained cycle
+    s.max_cycles = max_cycles
+
+  def trim( s ):
+    """Drop the runs that end before the last max_cycles cycles."""
+    s.first = max( s.first, s.ncycles - s.max_cycles )
+    for starts, values in zip( s.starts, s.values ):
+      k = bisect_right( starts, s.first ) - 1
+      if k > 0:
+        del starts[:k]
+        del values[:k]
+
+  def cycle_range( s, start=None, stop=None ):
+    lo = s.first   if start is None else max( start, s.first )
+    hi = s.ncycles if stop  is None else min( stop, s.ncycles )
+    if s.max_cycles is not None and start is None:
+      lo = max( lo, hi - s.max_cycles )
+    return lo, max( lo, hi )
+
+  def int_values( s, name, start=None, stop=None ):
+    """Return the integer values of a signal in the cycles [start, stop)."""
+    lo, hi = s.cycle_range( start, stop )
+    i      = s.names[ name ]
+    starts = s.starts[i]
+    values = s.values[i]
+
+    ret = []
+    k   = bisect_right( starts, lo ) - 1
+    while lo < hi:
+      end = min( starts[k+1], hi ) if k+1 < len(starts) else hi
+      ret.extend( [ values[k] ] * (end - lo) )
+      lo = end
+      k += 1
+    return ret
+
+  def bin_values( s, name, start=None, stop=None ):
+    fmt = f"0b{{:0{s.nbits[ s.names[name] ]}b}}".format
+    return [ fmt( v ) for v in s.int_values( name, start, stop ) ]
+
+  def __getitem__( s, name ):
+    return s.bin_values( name )
+
+  def __iter__( s ):
+    return iter( s.names )
+
+  def __len__( s ):
+    return len( s.names )
+
+  def __repr__( s ):
+    return f"TextWaveHistory({ {name: s[name] for name in s} })"
 
 
 class PrintTextWavePass( BasePass ):
@@ -41,6 +116,21 @@ class PrintTextWavePass( BasePass ):
   #: Default value: False
   enable = MetadataKey(bool)
 
+  #: Only capture the signals whose names match one of these glob
+  #: patterns, e.g., "s.sub.*". s.reset is always captured.
+  #:
+  #: Type: ``str`` or ``list`` of ``str``; input
+  #:
+  #: Default value: None (all signals)
+  signal_filter = MetadataKey()
+
+  #: Only keep the values of the last max_cycles cycles
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: None (no limit)
+  max_cycles = MetadataKey(int)
+
   textwave_func = MetadataKey()
   textwave_dict = MetadataKey()
 
@@ -85,7 +175,7 @@ class PrintTextWavePass( BasePass ):
 
   def _gen_print_wave( self, top, sigs_dict ):
 
-    def print_wave():
+    def print_wave( start=None, stop=None ):
       if top.has_metadata( self.chars_per_cycle ):
         char_length = top.get_metadata( self.chars_per_cycle )
       else:
@@ -101,7 +191,10 @@ class PrintTextWavePass( BasePass ):
       light_gray = '\033[47m'
       back='\033[0m'  #back to normal printing
 
-      all_signal_values = text_sigs
+      lo, hi = sigs_dict.cycle_range( start, stop )
+      all_signal_values = { sig: sigs_dict.bin_values( sig, lo, hi ) for sig in sigs_dict }
+      if lo == hi:
+        return
       #spaces before cycle number
       max_length = 5
       for sig in all_signal_values:
@@ -119,7 +212,7 @@ class PrintTextWavePass( BasePass ):
       #-----------------------------------------------------------------------
       # handles clock tick symbol
 
-      for i in range(len(all_signal_values["s.reset"])):
+      for i in range(lo, hi):
         # insert a space every 5 cycles
         print(f"{tick}{str(i).ljust(char_length-1)}",end="")
       print("")
@@ -214,27 +307,47 @@ class PrintTextWavePass( BasePass ):
 
   def _collect_sig_func( self, top ):
 
-    # TODO use actual nets to reduce the amount of saved signals
-
-    # Give all ' and " characters a preceding backslash for .format
-    wav_srcs = []
-    text_sigs = {}
-
-    # Now we create per-cycle signal value collect functions
-    signal_names = []
-    for x in top._dsl.all_signals:
-      if x.is_top_level_signal() and x.get_field_name() != "clk" and x.get_field_name() != "reset":
-        signal_names.append( (x._dsl.level, repr(x)) )
-
-    for _, x in [(0, 's.reset')] + sorted(signal_names):
-      text_sigs[x] = []
-      wav_srcs.append(f"text_sigs['{x}'].append( {x}.to_bits().bin() )")
-
-    # TODO use integer index instead of dict, should be easy
-    src =  """
-def dump_wav():
-  {}
-""".format( "\n  ".join(wav_srcs) )
-    s, l_dict = top, {}
-    exec(compile( src, filename="temp", mode="exec"), globals().update(locals()), l_dict)
-    return l_dict['dump_wav'], text_sigs
+    patterns = None
+    if top.has_metadata( self.signal_filter ):
+      patterns = top.get_metadata( self.signal_filter )
+      if isinstance( patterns, str ):
+        patterns = [ patterns ]
+
+    def is_captured( x ):
+      if repr(x) == "s.reset":
+        return True
+      if x.get_field_name() in ( "clk", "reset" ):
+        return False
+      return patterns is None or any( fnmatchcase( repr(x), p ) for p in patterns )
+
+    # Capture each net once and give every signal in it the net's index
+
+    signals, nbits, names = [], [], []
+    for net in collect_nets( top ):
+      captured = [ x for x in net if is_captured( x ) ]
+      if captured:
+        for x in captured:
+          names.append( ( 0 if repr(x) == "s.reset" else 1, x._dsl.level, repr(x), len(signals) ) )
+        signals.append( net[0] )
+        nbits.append( net[0]._dsl.Type.nbits )
+
+    max_cycles = top.get_metadata( self.max_cycles ) if top.has_metadata( self.max_cycles ) else None
+    text_sigs  = TextWaveHistory( { name: i for _, _, name, i in sorted( names ) }, nbits, max_cycles )
+
+    _globals = {
+      '_s': [ x.append for x in text_sigs.starts ],
+      '_x': [ x.append for x in text_sigs.values ],
+      '_h': text_sigs,
+    }
+
+    # A run starts at the current cycle whenever a net changes. -1 never
+    # matches a value, so every net starts a run in the first cycle.
+    epilogue = "  _h.ncycles += 1"
+    if max_cycles is not None:
+      # Trimming after every max_cycles cycles keeps at most twice that
+      epilogue += "\n  if _h.ncycles - _h.first >= 2 * _h.max_cycles:\n    _h.trim()"
+
+    func = gen_capture_func( top, signals, [ -1 ] * len(signals),
+                             lambda i, x: f"_s[{i}]( _h.ncycles ); _x[{i}]( _v )",
+                             epilogue, _globals, name="dump_wav" )
+    return func, text_sigs
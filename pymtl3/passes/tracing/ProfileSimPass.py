@@ -0,0 +1,252 @@
+"""
+========================================================================
+ProfileSimPass.py
+========================================================================
+Profile the simulation at the granularity of scheduled blocks. When
+enabled, every entry of update_schedule, schedule_ff and
+schedule_posedge_flip is wrapped with counters for the number of calls,
+the cumulative time in nanoseconds, and (for combinational blocks) the
+number of calls that changed the value of a signal the block writes.
+
+The pass has to be applied after scheduling and before PrepareSimPass.
+The results are collected in a SimProfile object:
+
+  top.set_metadata( ProfileSimPass.enable, True )
+  ... apply the passes, simulate ...
+  prof = top.get_metadata( ProfileSimPass.profile )
+  prof.report()
+  prof.dump_collapsed( "prof.folded" )   # for flamegraph.pl
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import sys
+import time
+from collections import defaultdict
+
+from pymtl3.dsl import MetadataKey
+from pymtl3.passes.BasePass import BasePass
+from pymtl3.passes.errors import PassOrderError
+from pymtl3.passes.sim.SimCheckpoint import collect_leaves
+
+_perf_counter_ns = time.perf_counter_ns
+
+class _BlockRecord:
+  __slots__ = ( 'name', 'host', 'kind', 'calls', 'ns', 'changes', 'writes', 'leaves' )
+
+  def __init__( self, name, host, kind, writes ):
+    self.name    = name
+    self.host    = host
+    self.kind    = kind
+    self.calls   = 0
+    self.ns      = 0
+    self.changes = 0 if writes is not None else None
+    self.writes  = writes # top level signals written by the block
+    self.leaves  = None   # Bits objects of these signals in simulation
+
+class SimProfile:
+
+  def __init__( self, top, records ):
+    self.top     = top
+    self.records = records
+
+  def reset( self ):
+    """Clear all counters, e.g., to exclude the warm-up phase."""
+    for r in self.records:
+      r.calls = 0
+      r.ns    = 0
+      if r.changes is not None:
+        r.changes = 0
+
+  def total_ns( self ):
+    return sum( r.ns for r in self.records )
+
+  def by_block( self ):
+    return sorted( self.records, key=lambda r: -r.ns )
+
+  def by_instance( self ):
+    return self._group( lambda r: repr(r.host) )
+
+  def by_class( self ):
+    return self._group( lambda r: r.host.__class__.__name__ )
+
+  def _group( self, key ):
+    groups = defaultdict( lambda: [ 0, 0 ] )
+    for r in self.records:
+      g = groups[ key(r) ]
+      g[0] += r.calls
+      g[1] += r.ns
+    return sorted( [ (k, calls, ns) for k, (calls, ns) in groups.items() ],
+                   key=lambda x: -x[2] )
+
+  #-----------------------------------------------------------------------
+  # report
+  #-----------------------------------------------------------------------
+
+  def report( self, file=None, top_n=20 ):
+    file  = file or sys.stdout
+    total = self.total_ns() or 1
+
+    def pct( ns ):
+      return 100.0 * ns / total
+
+    print( f"Simulation profile: {self.top._sim.simulated_cycles} cycles, "
+           f"{total/1e6:.3f} ms in scheduled blocks", file=file )
+
+    for title, rows in [ ( "component class", self.by_class() ),
+                         ( "component instance", self.by_instance() ) ]:
+      print( f"\nBy {title}:", file=file )
+      print( f"  {'time(ms)':>10} {'%':>6} {'calls':>10}  name", file=file )
+      for name, calls, ns in rows[:top_n]:
+        print( f"  {ns/1e6:10.3f} {pct(ns):6.2f} {calls:10}  {name}", file=file )
+
+    print( "\nBy block:", file=file )
+    print( f"  {'time(ms)':>10} {'%':>6} {'calls':>10} {'changed':>10}  name", file=file )
+    for r in self.by_block()[:top_n]:
+      changes = '-' if r.changes is None else r.changes
+      print( f"  {r.ns/1e6:10.3f} {pct(r.ns):6.2f} {r.calls:10} {changes:>10}  "
+             f"{r.host!r}.{r.name} ({r.kind})", file=file )
+
+  #-----------------------------------------------------------------------
+  # dump_collapsed
+  #-----------------------------------------------------------------------
+  # One line per block in the collapsed stack format of flamegraph.pl,
+  # where the stack is the component hierarchy.
+
+  def dump_collapsed( self, path ):
+    lines = defaultdict(int)
+    for r in self.records:
+      if r.ns == 0:
+        continue
+      frames = repr(r.host).split('.')
+      frames[0] = self.top.__class__.__name__
+      frames.append( r.name )
+      lines[ ';'.join( frames ) ] += r.ns
+
+    with open( path, 'w' ) as f:
+      for stack, ns in sorted( lines.items() ):
+        f.write( f"{stack} {ns}\n" )
+
+class ProfileSimPass( BasePass ):
+
+  #: Wrap the scheduled blocks with profiling counters
+  #:
+  #: Type: ``bool``; input
+  #:
+  #: Default value: False
+  enable = MetadataKey(bool)
+
+  #: Count the calls that change the signals a block writes. This is the
+  #: most expensive part of profiling.
+  #:
+  #: Type: ``bool``; input
+  #:
+  #: Default value: True
+  track_changes = MetadataKey(bool)
+
+  #: The SimProfile object with the counters
+  #:
+  #: Type: ``SimProfile``; output
+  profile = MetadataKey()
+
+  def __call__( self, top ):
+    if not top.has_metadata( self.enable ) or not top.get_metadata( self.enable ):
+      return
+
+    if not hasattr( top, "_sched" ):
+      raise PassOrderError( "_sched" )
+    if hasattr( top, "_sim" ):
+      raise PassOrderError( "ProfileSimPass should be applied before PrepareSimPass" )
+
+    track_changes = True
+    if top.has_metadata( self.track_changes ):
+      track_changes = top.get_metadata( self.track_changes )
+
+    records = []
+
+    def wrap( blks, kind, track ):
+      ret = []
+      for blk in blks:
+        name, host, k, writes = self._block_info( top, blk, kind )
+        r = _BlockRecord( name, host, k, writes if track else None )
+        records.append( r )
+        ret.append( self._wrap( top, blk, r ) )
+      return ret
+
+    sched = top._sched
+    sched.update_schedule[:]       = wrap( sched.update_schedule, 'update', track_changes )
+    sched.schedule_ff[:]           = wrap( sched.schedule_ff, 'update_ff', False )
+    sched.schedule_posedge_flip[:] = wrap( sched.schedule_posedge_flip, 'flip', False )
+
+    top.set_metadata( self.profile, SimProfile( top, records ) )
+
+  @staticmethod
+  def _block_info( top, blk, kind ):
+    """ Return the name, host component, kind, and written top level
+    signals of a scheduled block. """
+
+    if kind == 'flip':
+      return "posedge_flip", top, kind, None
+
+    _, upblk_writes, _ = top.get_all_upblk_metadata()
+
+    def writes_of( blk ):
+      if blk in top._dag.genblks:
+        objs = top._dag.genblk_writes.get( blk, [] )
+      else:
+        objs = upblk_writes.get( blk, [] )
+      return { x.get_top_level_signal() for x in objs }
+
+    scc_members = getattr( top._sched, 'scc_members', {} )
+    if blk in scc_members:
+      members = scc_members[ blk ]
+      writes = set()
+      for x in members:
+        writes |= writes_of( x )
+      return f"scc[{','.join( x.__name__ for x in members )}]", top, 'scc', writes
+
+    if blk in top._dag.genblks:
+      writer = top._dag.genblk_reads.get( blk ) or top._dag.genblk_writes[ blk ]
+      return blk.__name__, writer[0].get_host_component(), 'net', writes_of( blk )
+
+    # Greenlet wrappers share the name with the original update block
+    for orig, wrapped in getattr( top._dag, 'blk_greenlet_mapping', {} ).items():
+      if wrapped is blk:
+        blk = orig
+        break
+
+    return blk.__name__, top.get_update_block_host_component( blk ), kind, writes_of( blk )
+
+  @staticmethod
+  def _wrap( top, blk, r ):
+    if r.writes is None:
+      def profiled():
+        t = _perf_counter_ns()
+        blk()
+        r.ns += _perf_counter_ns() - t
+        r.calls += 1
+      return profiled
+
+    def get_leaves():
+      # Signals are replaced by their values in lock_in_simulation, so
+      # we can only look them up when the simulation runs
+      mapping = top._sim.signal_object_mapping
+      leaves = []
+      for x in r.writes:
+        # Signals driven by integer constants never change
+        if x in mapping and not isinstance( mapping[x][-1], int ):
+          collect_leaves( mapping[x][-1], leaves )
+      return leaves
+
+    def profiled_with_changes():
+      leaves = r.leaves
+      if leaves is None:
+        leaves = r.leaves = get_leaves()
+      before = [ x._uint for x in leaves ]
+      t = _perf_counter_ns()
+      blk()
+      r.ns += _perf_counter_ns() - t
+      r.calls += 1
+      if before != [ x._uint for x in leaves ]:
+        r.changes += 1
+    return profiled_with_changes
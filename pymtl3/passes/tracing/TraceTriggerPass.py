@@ -0,0 +1,165 @@
+"""
+========================================================================
+TraceTriggerPass.py
+========================================================================
+Arm the tracing passes and only write out the cycles around a trigger,
+like a logic analyzer.
+
+A trigger is a condition that is checked once per cycle:
+
+  - a string that is evaluated with s bound to the top component, e.g.,
+    "s.proc.commit_pc == 0x200"
+  - a signal, which triggers while it is nonzero
+  - a callable that takes no arguments
+
+Every cycle in which some trigger holds opens a window from pre_cycles
+cycles before it to post_cycles cycles after it. The tracing passes
+(VcdGenerationPass, BinaryWaveGenerationPass and the printed line trace)
+only write the cycles in a window. To be able to write the cycles before
+a trigger, they keep the records of the last pre_cycles cycles in
+memory. With pre_cycles = 0 nothing is even recorded outside of the
+windows.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+from collections import deque
+
+from pymtl3.dsl import MetadataKey
+from pymtl3.dsl.Connectable import Signal
+from pymtl3.passes.BasePass import BasePass
+
+from .WaveCapture import gen_value_getter
+
+
+class TraceWindow:
+  """Decide which cycles are traced. check() returns whether the current
+  cycle is in a window and evaluates the triggers at most once per
+  cycle, so any number of tracing functions can share a window."""
+
+  def __init__( s, top, conditions, pre_cycles=0, post_cycles=0 ):
+    assert pre_cycles >= 0 and post_cycles >= 0
+    s.top         = top
+    s.conditions  = conditions
+    s.pre_cycles  = pre_cycles
+    s.post_cycles = post_cycles
+
+    s.cycle     = -1    # the cycle of the last check
+    s.stop      = 0     # the current window ends before this cycle
+    s.active    = False
+    s.ntriggers = 0     # number of cycles in which a trigger held
+    s.last_trigger = None
+
+  def check( s ):
+    cycle = s.top._sim.simulated_cycles
+    if cycle != s.cycle:
+      s.cycle = cycle
+      for cond in s.conditions:
+        if cond():
+          s.ntriggers   += 1
+          s.last_trigger = cycle
+          s.stop         = cycle + s.post_cycles + 1
+          break
+      s.active = cycle < s.stop
+    return s.active
+
+  def gate( s, capture, emit, changes=False ):
+    """Return a function to call once per cycle instead of
+    emit( cycle, capture() ), which only emits the cycles in a window.
+    The records of the last pre_cycles cycles are buffered and emitted
+    when a window opens. If changes is set, records are change lists
+    [ index, value, index, value, ... ] and the changes of the dropped
+    records are merged into the first record that is emitted."""
+
+    check = s.check
+    pre   = s.pre_cycles
+
+    if pre == 0:
+      def traced():
+        if check():
+          emit( s.cycle, capture() )
+      return traced
+
+    buf  = deque()
+    base = {}
+
+    def flush():
+      cycle, record = buf.popleft()
+      if base:
+        it = iter( record )
+        base.update( zip( it, it ) )
+        record = [ x for pair in base.items() for x in pair ]
+        base.clear()
+      emit( cycle, record )
+      while buf:
+        emit( *buf.popleft() )
+
+    def traced():
+      record = capture()
+      if check():
+        if buf:
+          flush()
+        emit( s.cycle, record )
+      else:
+        if len(buf) == pre:
+          _, old = buf.popleft()
+          if changes:
+            it = iter( old )
+            base.update( zip( it, it ) )
+        buf.append( ( s.cycle, record ) )
+
+    return traced
+
+class TraceTriggerPass( BasePass ):
+
+  #: Trigger conditions, a condition or a list of them
+  #:
+  #: Type: ``str``, ``Signal``, callable, or a ``list`` of them; input
+  triggers = MetadataKey()
+
+  #: Number of cycles to trace before a trigger
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: 0
+  pre_cycles = MetadataKey(int)
+
+  #: Number of cycles to trace after a trigger
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: 0
+  post_cycles = MetadataKey(int)
+
+  #: The window that the tracing passes consult
+  #:
+  #: Type: ``TraceWindow``; output
+  trace_window = MetadataKey()
+
+  def __call__( self, top ):
+    if top.has_metadata( self.triggers ):
+      triggers = top.get_metadata( self.triggers )
+
+      if triggers is not None:
+        assert not top.has_metadata( self.trace_window )
+        if not isinstance( triggers, (list, tuple) ):
+          triggers = [ triggers ]
+
+        pre  = top.get_metadata( self.pre_cycles )  if top.has_metadata( self.pre_cycles )  else 0
+        post = top.get_metadata( self.post_cycles ) if top.has_metadata( self.post_cycles ) else 0
+
+        conditions = [ self.compile_condition( top, x ) for x in triggers ]
+        top.set_metadata( self.trace_window, TraceWindow( top, conditions, pre, post ) )
+
+  @staticmethod
+  def compile_condition( top, cond ):
+    if isinstance( cond, str ):
+      try:
+        return eval( compile( f"lambda: bool( {cond} )", f"<trigger {cond}>", "eval" ), { 's': top } )
+      except SyntaxError as e:
+        raise SyntaxError( f"Invalid trigger condition {cond!r}: {e}" ) from e
+    if isinstance( cond, Signal ):
+      return gen_value_getter( cond )
+    if callable( cond ):
+      return cond
+    raise TypeError( f"A trigger must be a string, a signal or a callable, not {cond!r}" )
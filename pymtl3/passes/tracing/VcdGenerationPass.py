@@ -8,6 +8,7 @@ Date   : Sep 8, 2019
 """
 
 import time
+import weakref
 from collections import defaultdict
 
 from pymtl3.datatypes import Bits, concat
@@ -15,6 +16,36 @@ from pymtl3.dsl import Const, MetadataKey
 from pymtl3.passes.BasePass import BasePass
 from pymtl3.passes.errors import PassOrderError
 
+from .AsyncWaveWriter import AsyncWaveWriter
+from .TraceTriggerPass import TraceTriggerPass
+from .WaveCapture import gen_capture_func
+
+# Utility generator to create new symbols for each VCD signal.
+# Code inspired by MyHDL 0.7.
+# Shunning: I just reuse it from pymtl v2
+
+def gen_vcd_symbol():
+
+  # Generate a string containing all valid vcd symbol characters
+  _codechars = ''.join([chr(i) for i in range(33, 127)])
+  _mod       = len(_codechars)
+
+  # Generator logic
+  n = 0
+  while True:
+    q, r = divmod(n, _mod)
+    code = _codechars[r]
+    while q > 0:
+      q, r = divmod(q, _mod)
+      code = _codechars[r] + code
+    yield code
+    n += 1
+
+# Vcd file takes a(0) instead of a[0]
+def vcd_mangle_name( name ):
+  # signal names with colons in it silently fail gtkwave
+  return name.replace('[','(').replace(']',')').replace(':', '__')
+
 
 class VcdGenerationPass( BasePass ):
 
@@ -29,6 +60,34 @@ class VcdGenerationPass( BasePass ):
 
   vcd_func = MetadataKey()
 
+  #: Format and write the waveform in a background thread, so that the
+  #: simulation only records the values that changed in each cycle
+  #:
+  #: Type: ``bool``; input
+  #:
+  #: Default value: False
+  vcd_async = MetadataKey(bool)
+
+  #: In async mode, flush the vcd file every this many cycles
+  #:
+  #: Type: ``int``; input
+  #:
+  #: Default value: 10000
+  vcd_flush_interval = MetadataKey(int)
+
+  #: The open vcd file. Value changes are buffered, so flush it to read
+  #: the waveform in the middle of a simulation. Do not touch it in async
+  #: mode, call top.sim_finalize() instead.
+  #:
+  #: Type: file object; output
+  vcd_file = MetadataKey()
+
+  #: Write out everything and close the vcd file, called by
+  #: top.sim_finalize(), when top is garbage collected, or at exit
+  #:
+  #: Type: callable; output
+  vcd_finalize_func = MetadataKey()
+
   def __call__( self, top ):
     if top.has_metadata( self.vcd_file_name ):
       vcd_file_name = top.get_metadata( self.vcd_file_name )
@@ -44,7 +103,9 @@ class VcdGenerationPass( BasePass ):
     else:
       vcd_file_name = str(top.__class__.__name__) + ".vcd"
 
-    vcd_file = open( vcd_file_name, "w" )
+    # A large buffer because every cycle writes a few short lines
+    vcd_file = open( vcd_file_name, "w", buffering=1 << 20 )
+    top.set_metadata( self.vcd_file, vcd_file )
 
     # Get vcd timescale
 
@@ -57,28 +118,7 @@ class VcdGenerationPass( BasePass ):
            "$timescale\n {}\n$end\n".format( time.asctime(), vcd_timescale ),
            file=vcd_file )
 
-    # Utility generator to create new symbols for each VCD signal.
-    # Code inspired by MyHDL 0.7.
-    # Shunning: I just reuse it from pymtl v2
-
-    def _gen_vcd_symbol():
-
-      # Generate a string containing all valid vcd symbol characters
-      _codechars = ''.join([chr(i) for i in range(33, 127)])
-      _mod       = len(_codechars)
-
-      # Generator logic
-      n = 0
-      while True:
-        q, r = divmod(n, _mod)
-        code = _codechars[r]
-        while q > 0:
-          q, r = divmod(q, _mod)
-          code = _codechars[r] + code
-        yield code
-        n += 1
-
-    vcd_symbols = _gen_vcd_symbol()
+    vcd_symbols = gen_vcd_symbol()
 
     # Preprocess some metadata
 
@@ -125,13 +165,8 @@ class VcdGenerationPass( BasePass ):
     # Inner utility function to perform recursive descent of the model.
     # Shunning: I mostly follow v2's implementation
 
-    # Vcd file takes a(0) instead of a[0]
-    def vcd_mangle_name( name ):
-      # signal names with colons in it silently fail gtkwave
-      return name.replace('[','(').replace(']',')').replace(':', '__')
-
     def recurse_models( m, spaces ):
-      nonlocal vcd_clock_net_idx, vcd_sim_ncycles
+      nonlocal vcd_clock_net_idx
 
       # Special case the top level "s" to "top"
 
@@ -195,74 +230,138 @@ class VcdGenerationPass( BasePass ):
     # nets in the design.
     print( "$enddefinitions $end\n", file=vcd_file )
 
-    # last_values is an array of values from the previous cycle
+    # Dump the default value of every net as the first cycle
 
-    last_values = [0 for _ in range(len(trimmed_value_nets))]
+    init_values = []
 
     for i, net in enumerate(trimmed_value_nets):
       # Convert everything to Bits to get around lack of bit struct support.
-      # The first cycle VCD contains the default value
-      bin_str = net[0]._dsl.Type().to_bits().bin()
-
-      print( f"b{bin_str} {net_symbol_mapping[i]}", file=vcd_file )
-
-      # Set this to be the last cycle value str
-      last_values[i] = bin_str
+      init_bits = net[0]._dsl.Type().to_bits()
+      init_values.append( int(init_bits) )
 
-    # Now we create per-cycle signal value collect functions
-
-    vcd_sim_ncycles = 0
+      print( f"b{init_bits.bin()} {net_symbol_mapping[i]}", file=vcd_file )
 
     # Separate clock net from normal nets ahead of time
     clock_symbol = net_symbol_mapping[ vcd_clock_net_idx ]
 
-    net_details = [ ( trimmed_value_nets[i][0], net_symbol_mapping[i] )
+    net_details = [ ( trimmed_value_nets[i][0], net_symbol_mapping[i], init_values[i] )
                     for i in range(len(trimmed_value_nets))
                       if i != vcd_clock_net_idx ]
 
     # Flip clock for the first cycle
     print( '\n#0\nb0b1 {}\n'.format( clock_symbol ), file=vcd_file, flush=True )
 
-    # Returns a dump_vcd function that is ready to be appended to _sched.
-    # TODO: type check?
-
-    # Adding this 's' argument is for eval to correctly evaluate 's.x'...
-    # Python 3 destroys a lot of our hacks .. sigh
-
-    def dump_vcd_inner( s ):
-      nonlocal vcd_sim_ncycles
-
-      for i, (signal, symbol) in enumerate( net_details ):
+    if top.has_metadata( self.vcd_async ) and top.get_metadata( self.vcd_async ):
+      flush_interval = 10000
+      if top.has_metadata( self.vcd_flush_interval ):
+        flush_interval = top.get_metadata( self.vcd_flush_interval )
 
-        # If we encounter a BitStruct then dump it as a concatenation of
-        # all fields.
-        # TODO: treat each field in a BitStruct as a separate signal?
-
-        try:
-          net_bits_bin = eval(repr(signal)).to_bits()
-        except Exception as e:
-          raise TypeError(f'{e}\n - {signal} becomes another type. Please check your code.')
-
-        net_bits_bin_str = net_bits_bin.bin()
-        # `last_value` is the string form of a Bits object in binary
-        # e.g. '0b000' == Bits3(0).bin()
-        # We store strings instead of values ...
-        if last_values[i] != net_bits_bin_str:
-          last_values[i] = net_bits_bin_str
-          print( f'b{net_bits_bin_str} {symbol}', file=vcd_file )
-
-      # Flop clock at the end of cycle
-      next_neg_edge = 100 * vcd_sim_ncycles + 50
-      print( f'\n#{next_neg_edge}\nb0b0 {clock_symbol}', file=vcd_file )
-
-      # Flip clock of the next cycle
-      next_pos_edge = next_neg_edge + 50
-      print( f'#{next_pos_edge}\nb0b1 {clock_symbol}\n', file=vcd_file, flush=True )
-      vcd_sim_ncycles += 1
-
-    def gen_dump_vcd( s ):
-      def dump_vcd():
-        dump_vcd_inner( s )
-      return dump_vcd
-
-    return gen_dump_vcd( top )
+      writer = AsyncWaveWriter( self.gen_write_chunk( net_details, clock_symbol, vcd_file ),
+                                vcd_file, flush_interval=flush_interval, name="vcd-writer" )
+      finalize = writer.close
+    else:
+      writer   = None
+      finalize = vcd_file.close
+
+    # Close the file when top goes away or at exit, without keeping top
+    # or the file alive until then
+    top.set_metadata( self.vcd_finalize_func, weakref.finalize( top, finalize ) )
+
+    if top.has_metadata( TraceTriggerPass.trace_window ):
+      return self.gen_triggered_dump_vcd( top, top.get_metadata( TraceTriggerPass.trace_window ),
+                                          net_details, clock_symbol, vcd_file, writer )
+
+    return self.gen_dump_vcd( top, net_details, clock_symbol, vcd_file, writer )
+
+  def gen_dump_vcd( self, top, net_details, clock_symbol, vcd_file, writer=None ):
+    """Return a dump_vcd function that is ready to be appended to _sched.
+
+    Instead of evaluating the repr of every net each cycle, the generated
+    function reads each net from its host component, which is bound once,
+    compares the integer value against the last dumped one, and formats
+    the value only if it changed. The text of a cycle goes to the file in
+    one write, and the file is only flushed when its buffer is full.
+
+    With an AsyncWaveWriter, the function only records the index and the
+    value of the nets that changed and leaves the rest to the writer."""
+
+    signals     = [ signal for signal, _, _ in net_details ]
+    init_values = [ init_value for _, _, init_value in net_details ]
+
+    if writer is not None:
+      return gen_capture_func( top, signals, init_values, lambda i, signal: f"_a( {i} ); _a( _v )",
+                               "  _put( ( _c[0], _o ) )\n  _c[0] += 1",
+                               { '_put': writer.put, '_c': [ 0 ] }, name="dump_vcd" )
+
+    def emit( i, signal ):
+      symbol = net_details[i][1]
+      return f"_a( 'b0b' + format( _v, '0{signal._dsl.Type.nbits}b' ) + {' '+symbol+chr(10)!r} )"
+
+    # Flop clock at the end of cycle, and flip clock of the next cycle
+    epilogue = """\
+  _n = _cycle[0] * 100
+  _cycle[0] += 1
+  _a( '\\n#' + str( _n + 50 ) + _neg + '#' + str( _n + 100 ) + _pos )
+  _w( ''.join( _o ) )"""
+
+    return gen_capture_func( top, signals, init_values, emit, epilogue,
+                             { '_w': vcd_file.write, '_cycle': [ 0 ],
+                               '_neg': f"\nb0b0 {clock_symbol}\n",
+                               '_pos': f"\nb0b1 {clock_symbol}\n\n" }, name="dump_vcd" )
+
+  def gen_triggered_dump_vcd( self, top, window, net_details, clock_symbol, vcd_file, writer=None ):
+    """Return a dump_vcd function that only dumps the cycles in the
+    windows of a TraceTriggerPass. The nets are captured like in async
+    mode and the cycles in a window are formatted by write_chunk, in the
+    writer thread if there is one."""
+
+    signals     = [ signal for signal, _, _ in net_details ]
+    init_values = [ init_value for _, _, init_value in net_details ]
+
+    capture = gen_capture_func( top, signals, init_values, lambda i, signal: f"_a( {i} ); _a( _v )",
+                                "  return _o", name="capture_vcd" )
+
+    if writer is not None:
+      put  = writer.put
+      emit = lambda cycle, record: put( ( cycle, record ) )
+    else:
+      write_chunk = self.gen_write_chunk( net_details, clock_symbol, vcd_file )
+      emit = lambda cycle, record: write_chunk( [ ( cycle, record ) ] )
+
+    return window.gate( capture, emit, changes=True )
+
+  @staticmethod
+  def gen_write_chunk( net_details, clock_symbol, vcd_file ):
+    """Return the function that turns a list of ( cycle, changes ) into
+    the same text dump_vcd writes, e.g., in the writer thread. When some
+    cycles are skipped, the clock stays high until the next cycle."""
+
+    # One str.format per net, so escape the braces in the symbols
+    fmts = []
+    for signal, symbol, _ in net_details:
+      symbol = symbol.replace( '{', '{{' ).replace( '}', '}}' )
+      fmts.append( f"b0b{{:0{signal._dsl.Type.nbits}b}} {symbol}\n".format )
+
+    neg = f"\nb0b0 {clock_symbol}\n"
+    pos = f"\nb0b1 {clock_symbol}\n\n"
+    next_cycle = 0
+
+    def write_chunk( chunk ):
+      nonlocal next_cycle
+      out = []
+      for cycle, record in chunk:
+        if cycle != next_cycle:
+          out.append( f"#{cycle * 100}\n" )
+
+        # record is [ index, value, index, value, ... ]
+        it = iter( record )
+        for i, v in zip( it, it ):
+          out.append( fmts[i]( v ) )
+
+        # Flop clock at the end of cycle, and flip clock of the next cycle
+        n = cycle * 100
+        out.append( f"\n#{n + 50}{neg}#{n + 100}{pos}" )
+        next_cycle = cycle + 1
+      vcd_file.write( ''.join( out ) )
+
+    return write_chunk
@@ -0,0 +1,153 @@
+"""
+========================================================================
+WaveCapture.py
+========================================================================
+Helpers shared by the waveform passes to find the nets to dump and to
+generate the per-cycle function that detects which of them changed.
+
+gen_capture_func( top, signals, init_values, emit, epilogue ) generates
+
+  def capture():
+    _o = []
+    _a = _o.append
+    _v = _h0.in0._uint     # net 0, read through its host component
+    if _v != _l[0]:
+      _l[0] = _v
+      <emit( 0, signal )>
+    ...
+    <epilogue>
+
+so every net is read with a few attribute lookups and compared as an
+integer, and only the nets that changed reach the emit code.
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+from pymtl3.datatypes import Bits, mk_bits
+from pymtl3.dsl import Const
+from pymtl3.extra.pypy import custom_exec
+
+_python_bits = Bits.__module__ == "pymtl3.datatypes.PythonBits"
+
+def collect_nets( top, scope=None ):
+  """Return a list of nets, each a list of top level signals that share a
+  value, covering every top level signal in the subtree rooted at scope
+  (top by default). The first signal of each net is the one to read."""
+
+  if scope is None or scope is top:
+    in_scope = lambda x: True
+  else:
+    prefix   = repr(scope)
+    in_scope = lambda x: repr(x) == prefix or repr(x).startswith( prefix + "." ) or \
+                                               repr(x).startswith( prefix + "[" )
+
+  nets     = []
+  assigned = set()
+
+  for writer, net in top.get_all_value_nets():
+    new_net = [ x for x in net if not isinstance( x, Const ) and x.is_top_level_signal()
+                                  and in_scope( x ) ]
+    if new_net:
+      nets.append( new_net )
+      assigned.update( new_net )
+
+  # Signals whose connection is not captured by the global net data
+  # structure, e.g., a signal only updated in an upblk
+  for x in sorted( top._dsl.all_signals, key=repr ):
+    if x.is_top_level_signal() and x not in assigned and in_scope( x ):
+      nets.append( [ x ] )
+      assigned.add( x )
+
+  return nets
+
+def signal_value_expr( host_name, host, signal ):
+  """Return the expression that reads the integer value of signal through
+  host, which is bound to host_name."""
+
+  value = host_name + repr(signal)[ len(repr(host)): ]
+
+  # Bits and packed bitstructs keep their value in _uint. Any other
+  # bitstruct is read as the concatenation of all fields.
+  Type = signal._dsl.Type
+  if ( _python_bits and issubclass( Type, Bits ) ) or getattr( Type, '_packed', False ):
+    return f"{value}._uint"
+  if not issubclass( Type, Bits ):
+    return f"int( {value}.to_bits() )"
+  return f"int( {value} )"
+
+def gen_value_getter( signal ):
+  """Return a function that returns the integer value of signal."""
+  host = signal.get_host_component()
+  return eval( f"lambda: {signal_value_expr( '_h', host, signal )}", { '_h': host } )
+
+def gen_value_setter( signal ):
+  """Return a function that writes an integer value into signal, e.g., to
+  replay recorded values."""
+  host = signal.get_host_component()
+  get  = eval( f"lambda: _h{repr(signal)[ len(repr(host)): ]}", { '_h': host } )
+  Type = signal._dsl.Type
+  B    = mk_bits( Type.nbits )
+
+  if issubclass( Type, Bits ):
+    convert = B
+  else:
+    convert = lambda v: Type.from_bits( B( v ) )
+
+  def set_value( v ):
+    x = get()
+    x @= convert( v )
+
+  return set_value
+
+def gen_capture_func( top, signals, init_values, emit, epilogue, _globals=None,
+                      name="capture" ):
+  """Generate a function that compares each signal against its last value
+  (starting from init_values) and runs emit( i, signal ), a line of code
+  that sees the new value as _v and the output list append as _a, for
+  the signals that changed. epilogue is the code after the comparison."""
+
+  _globals    = dict( _globals or {} )
+  last_values = list( init_values )
+  host_names  = {}
+  _globals['_l'] = last_values
+  src = []
+
+  for i, signal in enumerate( signals ):
+    host = signal.get_host_component()
+    if host not in host_names:
+      host_names[ host ] = f"_h{len(host_names)}"
+      _globals[ host_names[ host ] ] = host
+
+    src.append( f"    _v = {signal_value_expr( host_names[ host ], host, signal )}\n"
+                f"    if _v != _l[{i}]:\n"
+                f"      _l[{i}] = _v\n"
+                f"      {emit( i, signal )}" )
+
+  # If a net can no longer be read as Bits, point at the signal the
+  # same way the old eval-based vcd dumper did
+  def check_types():
+    s = top
+    for signal in signals:
+      try:
+        eval(repr(signal)).to_bits()
+      except Exception as e:
+        raise TypeError(f'{e}\n - {signal} becomes another type. Please check your code.')
+
+  _globals['_check_types'] = check_types
+
+  body = "\n".join( src ) if src else "    pass"
+  gen_src = f"""
+def {name}():
+  _o = []
+  _a = _o.append
+  try:
+{body}
+  except Exception:
+    _check_types()
+    raise
+{epilogue}
+"""
+  _locals = {}
+  custom_exec( compile( gen_src, filename=f"<{name}:{top.__class__.__name__}>", mode="exec" ),
+               _globals, _locals )
+  return _locals[ name ]
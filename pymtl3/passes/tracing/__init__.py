@@ -1,2 +1,6 @@
+from .BinaryWaveGenerationPass import BinaryWaveGenerationPass
+from .LineTraceRecordPass import LineTraceRecordPass
 from .PrintTextWavePass import PrintTextWavePass
+from .ProfileSimPass import ProfileSimPass
+from .TraceTriggerPass import TraceTriggerPass
 from .VcdGenerationPass import VcdGenerationPass
@@ -0,0 +1,90 @@
+#=========================================================================
+# AsyncWaveWriter_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import io
+import threading
+import time
+
+import pytest
+
+from ..AsyncWaveWriter import AsyncWaveWriter, RingBuffer
+
+
+def test_ring_buffer_fifo():
+  ring = RingBuffer( 3 )
+  for i in range(10):
+    ring.put( i )
+    ring.put( i + 100 )
+    assert ring.get() == i
+    assert ring.get() == i + 100
+  assert len(ring) == 0
+
+def test_ring_buffer_backpressure():
+  ring = RingBuffer( 2 )
+  ring.put( 0 )
+  ring.put( 1 )
+
+  done = threading.Event()
+  def producer():
+    ring.put( 2 )
+    done.set()
+
+  t = threading.Thread( target=producer )
+  t.start()
+  # The buffer is full, so the producer waits for a free slot
+  assert not done.wait( 0.1 )
+  assert ring.get() == 0
+  assert done.wait( 5 )
+  t.join()
+  assert [ ring.get(), ring.get() ] == [ 1, 2 ]
+
+class _File( io.StringIO ):
+  def __init__( s ):
+    super().__init__()
+    s.nflushes = 0
+  def flush( s ):
+    s.nflushes += 1
+  def close( s ):
+    s.text = s.getvalue()
+    super().close()
+
+def test_writer_keeps_order():
+  f = _File()
+  def write_chunk( chunk ):
+    f.write( "".join( f"{x}," for x in chunk ) )
+
+  w = AsyncWaveWriter( write_chunk, f, chunk_cycles=4, capacity=2, flush_interval=8 )
+  for i in range(100):
+    w.put( i )
+  w.close()
+  w.close()
+
+  assert f.text == "".join( f"{i}," for i in range(100) )
+  # Every 8 cycles and once more at the end
+  assert f.nflushes == 100 // 8 + 1
+
+  with pytest.raises( ValueError ):
+    for i in range(4):
+      w.put( i )
+
+def test_writer_error():
+  f = _File()
+  def write_chunk( chunk ):
+    raise RuntimeError( "disk full" )
+
+  w = AsyncWaveWriter( write_chunk, f, chunk_cycles=1 )
+  w.put( 0 )
+  # Give the writer thread some time to fail
+  for _ in range(100):
+    if w.error is not None:
+      break
+    time.sleep( 0.01 )
+
+  with pytest.raises( RuntimeError, match="disk full" ):
+    w.put( 1 )
+  with pytest.raises( RuntimeError, match="disk full" ):
+    w.close()
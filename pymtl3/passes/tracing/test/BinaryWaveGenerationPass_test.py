@@ -0,0 +1,234 @@
+#=========================================================================
+# BinaryWaveGenerationPass_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+from collections import defaultdict
+
+import pytest
+
+from pymtl3 import *
+from pymtl3.passes.PassGroups import DefaultPassGroup
+
+from ..BinaryWave import BinaryWaveReader, binary_wave_to_vcd
+from ..BinaryWaveGenerationPass import BinaryWaveGenerationPass
+
+
+class Counter( Component ):
+  def construct( s ):
+    s.en  = InPort()
+    s.cnt = OutPort( Bits8 )
+
+    @update_ff
+    def up_cnt():
+      if s.en:
+        s.cnt <<= s.cnt + 1
+
+class Top( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits8 )
+    s.en  = InPort()
+    s.out = OutPort( Bits8 )
+    s.counter = Counter()
+    s.counter.en //= s.en
+
+    @update
+    def up_out():
+      s.out @= s.in_ ^ s.counter.cnt
+
+def run( name, ncycles=200, **metadata ):
+  dut = Top()
+  dut.elaborate()
+  for key, value in metadata.items():
+    dut.set_metadata( getattr( BinaryWaveGenerationPass, key ), value )
+  dut.apply( DefaultPassGroup( binwave=name, vcdwave=name ) )
+  dut.sim_reset()
+  for i in range(ncycles):
+    dut.in_ @= i // 5 % 256
+    dut.en  @= i % 3 != 0
+    dut.sim_tick()
+  dut.sim_finalize()
+  return dut
+
+def _vcd_waves( vcd_file_name ):
+  # { name: [ (time, value) ] } with the initial values at time 0
+  with open( vcd_file_name ) as fd:
+    lines = fd.read().splitlines()
+  scopes, symbols, waves = [], defaultdict( list ), defaultdict( dict )
+  time = 0
+  for line in lines:
+    words = line.split()
+    if not words:
+      continue
+    if words[0] == "$scope":
+      scopes.append( words[2] )
+    elif words[0] == "$upscope":
+      scopes.pop()
+    elif words[0] == "$var":
+      symbols[ words[3] ].append( ".".join( scopes + [ words[4] ] ) )
+    elif line.startswith( "#" ):
+      time = int( line[1:] )
+    elif line.startswith( "b" ) and len(words) == 2:
+      v = words[0][1:]
+      for name in symbols[ words[1] ]:
+        waves[ name ][ time ] = int( v, 0 ) if v.startswith( "0b" ) else int( v, 2 )
+  ret = {}
+  for name, values in waves.items():
+    ret[ name ] = []
+    for t in sorted( values ):
+      if not ret[ name ] or ret[ name ][-1][1] != values[t]:
+        ret[ name ].append( ( t, values[t] ) )
+  return ret
+
+def test_same_as_vcd():
+  run( "Top_bin_same" )
+
+  binary_wave_to_vcd( "Top_bin_same.pwave", "Top_bin_same_converted.vcd" )
+  expected = _vcd_waves( "Top_bin_same.vcd" )
+  actual   = _vcd_waves( "Top_bin_same_converted.vcd" )
+  assert len( expected['top.counter.cnt'] ) > 100
+  assert actual == expected
+
+class Wide( Component ):
+  def construct( s ):
+    s.en  = InPort()
+    s.out = OutPort( Bits8 )
+    s.counters = [ Counter() for _ in range(120) ]
+    for c in s.counters:
+      c.en //= s.en
+
+    @update
+    def up_out():
+      s.out @= s.counters[0].cnt ^ s.counters[119].cnt
+
+def test_many_signals_same_as_vcd():
+  # More than 94 signals, so some VCD symbols contain { and }
+  dut = Wide()
+  dut.elaborate()
+  dut.apply( DefaultPassGroup( binwave="Wide_bin", vcdwave="Wide_bin" ) )
+  dut.sim_reset()
+  for i in range(20):
+    dut.en @= i % 2
+    dut.sim_tick()
+  dut.sim_finalize()
+
+  binary_wave_to_vcd( "Wide_bin.pwave", "Wide_bin_converted.vcd" )
+  expected = _vcd_waves( "Wide_bin.vcd" )
+  actual   = _vcd_waves( "Wide_bin_converted.vcd" )
+  with BinaryWaveReader( "Wide_bin.pwave" ) as reader:
+    assert len( reader.signals ) > 100
+  assert actual == expected
+
+def test_random_access():
+  run( "Top_bin_blocks", block_cycles=16 )
+
+  with BinaryWaveReader( "Top_bin_blocks.pwave" ) as reader:
+    # 3 reset cycles + 200 cycles
+    assert len( reader.blocks ) == 13
+    assert reader.blocks[0][:2] == ( 0, 15 )
+    assert reader.blocks[-1][:2] == ( 192, 202 )
+
+    full = reader.history( "top.counter.cnt" )
+    # Aliases in the same net give the same history
+    assert reader.history( "top.counter.cnt" ) == full
+    assert full[0] == ( 0, 0 )
+    assert [ v for _, v in full ] == list( range( len(full) ) )
+
+    window = reader.history( "top.counter.cnt", 50, 90 )
+    value  = [ v for c, v in full if c <= 50 ][-1]
+    assert window == [ ( 50, value ) ] + [ (c, v) for c, v in full if 50 < c < 90 ]
+    assert reader.value_at( "top.counter.cnt", 90 ) == [ v for c, v in full if c <= 90 ][-1]
+
+    assert reader.blocks_in( 50, 90 ) == [ 3, 4, 5 ]
+
+    with pytest.raises( KeyError ):
+      reader.history( "top.nothing" )
+
+def test_cycle_window():
+  run( "Top_bin_window", start_cycle=20, stop_cycle=60 )
+  run( "Top_bin_full" )
+
+  with BinaryWaveReader( "Top_bin_window.pwave" ) as reader, \
+       BinaryWaveReader( "Top_bin_full.pwave" ) as full:
+    assert reader.blocks[0][:2] == ( 20, 59 )
+    # The first dumped cycle records the values at that cycle
+    assert reader.history( "top.out" ) == full.history( "top.out", 20, 60 )
+
+def test_scope():
+  dut = Top()
+  dut.elaborate()
+  dut.set_metadata( BinaryWaveGenerationPass.wave_file_name, "Top_bin_scope" )
+  dut.set_metadata( BinaryWaveGenerationPass.scope, dut.counter )
+  dut.apply( DefaultPassGroup() )
+  dut.sim_reset()
+  dut.en @= 1
+  for i in range(5):
+    dut.sim_tick()
+  dut.sim_finalize()
+
+  with BinaryWaveReader( "Top_bin_scope.pwave" ) as reader:
+    assert sorted( reader.ids ) == [ "top.counter.clk", "top.counter.cnt",
+                                     "top.counter.en", "top.counter.reset" ]
+    assert reader.history( "top.counter.cnt" )[-1] == ( 7, 4 )
+
+def test_trigger():
+  dut = Top()
+  dut.elaborate()
+  dut.set_metadata( BinaryWaveGenerationPass.wave_file_name, "Top_bin_trigger" )
+  dut.set_metadata( BinaryWaveGenerationPass.trigger, dut.en )
+  dut.apply( DefaultPassGroup() )
+  dut.sim_reset()
+  for i in range(20):
+    dut.en  @= i >= 10
+    dut.in_ @= i
+    dut.sim_tick()
+  dut.sim_finalize()
+
+  with BinaryWaveReader( "Top_bin_trigger.pwave" ) as reader:
+    # The first dumped cycle records the values at that cycle
+    assert reader.history( "top.in_" ) == [ ( 13, 10 ) ] + [ ( 3+i, i ) for i in range(11, 20) ]
+
+def test_async_write():
+  run( "Top_bin_async", async_write=True, block_cycles=16 )
+  run( "Top_bin_sync", block_cycles=16 )
+
+  with BinaryWaveReader( "Top_bin_async.pwave" ) as a, \
+       BinaryWaveReader( "Top_bin_sync.pwave" ) as b:
+    assert a.blocks == b.blocks
+    for name in [ "top.in_", "top.out", "top.counter.cnt" ]:
+      assert a.history( name ) == b.history( name )
+
+def test_incomplete_file():
+  dut = Top()
+  dut.elaborate()
+  dut.apply( DefaultPassGroup( binwave="Top_bin_incomplete" ) )
+  dut.sim_reset()
+  with pytest.raises( ValueError, match="incomplete" ):
+    BinaryWaveReader( "Top_bin_incomplete.pwave" )
+  dut.sim_finalize()
+  BinaryWaveReader( "Top_bin_incomplete.pwave" ).close()
+
+def test_file_closed_with_model():
+  import gc
+  import weakref
+
+  for async_write in [ False, True ]:
+    dut = Top()
+    dut.elaborate()
+    dut.set_metadata( BinaryWaveGenerationPass.async_write, async_write )
+    dut.apply( DefaultPassGroup( binwave=f"Top_bin_gc_{async_write}" ) )
+    dut.sim_reset()
+    for i in range(10):
+      dut.en @= 1
+      dut.sim_tick()
+
+    # Without sim_finalize, the file is completed when the model goes away
+    ref = weakref.ref( dut )
+    del dut
+    gc.collect()
+    assert ref() is None
+
+    with BinaryWaveReader( f"Top_bin_gc_{async_write}.pwave" ) as reader:
+      assert reader.history( "top.counter.cnt" )[-1][1] == 9
@@ -0,0 +1,130 @@
+#=========================================================================
+# LineTraceRecordPass_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import io
+from contextlib import redirect_stdout
+
+from pymtl3 import *
+from pymtl3.passes.PassGroups import DefaultPassGroup
+
+from ..LineTraceRecordPass import LineTraceRecordPass, render_line_trace
+
+
+@bitstruct
+class Pair:
+  lo: Bits8
+  hi: Bits8
+
+class Counter( Component ):
+  def construct( s ):
+    s.en  = InPort()
+    s.cnt = OutPort( Bits8 )
+
+    @update_ff
+    def up_cnt():
+      if s.en:
+        s.cnt <<= s.cnt + 1
+
+  def line_trace( s ):
+    return f"{s.cnt}{'+' if s.en else ' '}"
+
+class Top( Component ):
+  def construct( s ):
+    s.in_  = InPort( Bits8 )
+    s.en   = InPort()
+    s.out  = OutPort( Pair )
+    s.wide = OutPort( Bits128 )
+    s.counter = Counter()
+    s.counter.en //= s.en
+
+    @update
+    def up_out():
+      s.out.lo @= s.in_
+      s.out.hi @= s.counter.cnt
+      s.wide   @= concat( s.in_, Bits120(0) )
+
+  def line_trace( s ):
+    return f"{s.in_} > {s.counter.line_trace()} > {s.out} {s.wide[120:128]}"
+
+def run( dut, ncycles ):
+  for i in range(ncycles):
+    dut.in_ @= i * 7 % 256
+    dut.en  @= i % 3 != 0
+    dut.sim_tick()
+
+def test_render_same_as_print():
+  dut = Top()
+  dut.elaborate()
+  dut.apply( DefaultPassGroup( linetrace=True, linetrace_file="Top_record" ) )
+
+  f = io.StringIO()
+  with redirect_stdout( f ):
+    dut.sim_reset()
+    run( dut, 50 )
+  printed = [ x for x in f.getvalue().splitlines() if x[3:4] == ":" ]
+  assert len( printed ) == 50
+
+  # Render in the middle of the simulation without changing it
+  assert dut.render_line_trace( 3, 53 ) == printed
+  assert dut.render_line_trace( 10, 20 ) == printed[7:17]
+  assert dut.out == Pair( 49*7 % 256, dut.counter.cnt )
+
+  with redirect_stdout( f ):
+    run( dut, 10 )
+  printed = [ x for x in f.getvalue().splitlines() if x[3:4] == ":" ]
+  assert dut.render_line_trace( 3 ) == printed
+
+  dut.sim_finalize()
+  assert dut.render_line_trace( 55, 58 ) == printed[52:55]
+
+  # Render the recording with another instance of the design
+  dut2 = Top()
+  dut2.elaborate()
+  dut2.apply( DefaultPassGroup() )
+  dut2.sim_reset()
+  assert render_line_trace( dut2, "Top_record.ltrace", 3 ) == printed
+  assert dut2.out == Pair( 0, 0 )
+
+def test_no_printing():
+  dut = Top()
+  dut.elaborate()
+  dut.set_metadata( LineTraceRecordPass.trace_file_name, "Top_record_quiet" )
+  dut.set_metadata( LineTraceRecordPass.block_cycles, 8 )
+  dut.apply( DefaultPassGroup() )
+
+  f = io.StringIO()
+  with redirect_stdout( f ):
+    dut.sim_reset()
+    run( dut, 30 )
+    dut.sim_finalize()
+  assert f.getvalue() == ""
+
+  lines = dut.render_line_trace()
+  assert len( lines ) == 33
+  assert lines[5] == f"  5: {b8(14)} > {b8(1)}+ > {Pair( 14, 1 )} {b8(14)}"
+
+def test_file_closed_with_model():
+  import gc
+  import weakref
+
+  from ..BinaryWave import BinaryWaveReader
+
+  dut = Top()
+  dut.elaborate()
+  dut.set_metadata( LineTraceRecordPass.trace_file_name, "Top_record_gc" )
+  dut.apply( DefaultPassGroup() )
+  dut.sim_reset()
+  run( dut, 10 )
+
+  # Without sim_finalize, the file is completed when the model goes away
+  ref = weakref.ref( dut )
+  del dut
+  gc.collect()
+  assert ref() is None
+
+  with BinaryWaveReader( "Top_record_gc.ltrace" ) as reader:
+    assert len( list( reader.cycles() ) ) == 13
@@ -306,3 +306,82 @@ def test_bitstruct():
     sliced = i[dot+1:]
     if sliced != "reset" and sliced != "clk":
       assert i[dot+1:] in out
+
+class Sub( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits16 )
+    s.out = OutPort( Bits16 )
+
+    @update
+    def up_sub():
+      s.out @= s.in_ + 1
+
+class Wrap( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits16 )
+    s.out = OutPort( Bits16 )
+    s.sub = Sub()
+    s.sub.in_ //= s.in_
+    s.sub.out //= s.out
+
+def run_wrap( ncycles, **metadata ):
+  dut = Wrap()
+  dut.elaborate()
+  dut.set_metadata( PrintTextWavePass.enable, True )
+  for key, value in metadata.items():
+    dut.set_metadata( getattr( PrintTextWavePass, key ), value )
+  dut.apply( DefaultPassGroup() )
+  dut.sim_reset()
+  for i in range(ncycles):
+    dut.in_ @= i // 4
+    dut.sim_tick()
+  return dut
+
+def test_run_length_encoding():
+  dut  = run_wrap( 100 )
+  sigs = dut.get_metadata( PrintTextWavePass.textwave_dict )
+
+  assert list( sigs ) == [ "s.reset", "s.in_", "s.out", "s.sub.in_", "s.sub.out" ]
+  # s.in_ and s.sub.in_ are one net and a run only starts on a change
+  assert sigs.names[ "s.in_" ] == sigs.names[ "s.sub.in_" ]
+  assert len( sigs.starts ) == 3
+  assert len( sigs.starts[ sigs.names[ "s.in_" ] ] ) == 25
+
+  # 3 reset cycles
+  values = sigs.int_values( "s.out" )
+  assert len( values ) == 103
+  assert values[3:] == [ i // 4 + 1 for i in range(100) ]
+  assert sigs[ "s.out" ][5] == "0b0000000000000001"
+  assert sigs.int_values( "s.in_", 50, 60 ) == [ ( i-3 ) // 4 for i in range(50, 60) ]
+
+  f = io.StringIO()
+  with redirect_stdout(f):
+    dut.print_textwave( 50, 60 )
+  out = f.getvalue()
+  assert "|50" in out and "|59" in out
+  assert "|49" not in out and "|60" not in out
+
+def test_signal_filter():
+  dut  = run_wrap( 10, signal_filter="s.sub.*" )
+  sigs = dut.get_metadata( PrintTextWavePass.textwave_dict )
+  assert list( sigs ) == [ "s.reset", "s.sub.in_", "s.sub.out" ]
+
+  dut  = run_wrap( 10, signal_filter=[ "s.in_", "s.out" ] )
+  sigs = dut.get_metadata( PrintTextWavePass.textwave_dict )
+  assert list( sigs ) == [ "s.reset", "s.in_", "s.out" ]
+
+def test_max_cycles():
+  dut  = run_wrap( 1000, max_cycles=20 )
+  sigs = dut.get_metadata( PrintTextWavePass.textwave_dict )
+
+  assert sigs.ncycles == 1003
+  assert sigs.int_values( "s.in_" ) == [ ( i-3 ) // 4 for i in range(983, 1003) ]
+  assert len( sigs[ "s.reset" ] ) == 20
+  # Only the runs of the last 2*max_cycles cycles are kept
+  assert all( len(x) <= 11 for x in sigs.starts )
+
+  f = io.StringIO()
+  with redirect_stdout(f):
+    dut.print_textwave()
+  out = f.getvalue()
+  assert "|983" in out and "|1002" in out and "|982" not in out
@@ -0,0 +1,89 @@
+#=========================================================================
+# ProfileSimPass_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import io
+
+from pymtl3.datatypes import Bits32
+from pymtl3.dsl import *
+from pymtl3.passes.PassGroups import DefaultPassGroup
+
+from ..ProfileSimPass import ProfileSimPass
+
+
+class Reg( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits32 )
+    s.out = OutPort( Bits32 )
+
+    @update_ff
+    def up_reg():
+      s.out <<= s.in_
+
+class Incr( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits32 )
+    s.out = OutPort( Bits32 )
+
+    @update
+    def up_incr():
+      s.out @= s.in_ + 1
+
+class Top( Component ):
+  def construct( s ):
+    s.in_  = InPort( Bits32 )
+    s.out  = OutPort( Bits32 )
+    s.reg  = Reg()
+    s.incr = Incr()
+
+    s.reg.in_  //= s.in_
+    s.incr.in_ //= s.reg.out
+    s.incr.out //= s.out
+
+def _find( prof, name ):
+  return [ r for r in prof.records if r.name == name ][0]
+
+def test_profile_counts( tmpdir ):
+  top = Top()
+  top.apply( DefaultPassGroup(profile=True) )
+  top.sim_reset()
+
+  prof = top.get_metadata( ProfileSimPass.profile )
+  prof.reset()
+
+  for i in range(10):
+    top.in_ @= i // 2
+    top.sim_tick()
+
+  incr = _find( prof, 'up_incr' )
+  reg  = _find( prof, 'up_reg' )
+  assert incr.host is top.incr and incr.kind == 'update'
+  assert reg.host is top.reg and reg.kind == 'update_ff'
+  # Pure RTL designs evaluate the combinational blocks before and after
+  # the clock edge
+  assert reg.calls == 10
+  assert incr.calls == 20
+  # The register only changes every other cycle
+  assert 0 < incr.changes <= 6
+  assert reg.changes is None
+
+  f = io.StringIO()
+  prof.report( file=f )
+  assert "By component class" in f.getvalue()
+  assert "up_incr" in f.getvalue()
+
+  path = str( tmpdir.join( "prof.folded" ) )
+  prof.dump_collapsed( path )
+  stacks = dict( line.rsplit( ' ', 1 ) for line in open( path ).read().splitlines() )
+  assert "Top;incr;up_incr" in stacks
+  assert "Top;reg;up_reg" in stacks
+  assert all( int(ns) > 0 for ns in stacks.values() )
+
+def test_profile_disabled():
+  top = Top()
+  top.apply( DefaultPassGroup() )
+  assert not top.has_metadata( ProfileSimPass.profile )
+  assert all( blk.__name__ != 'profiled_with_changes' for blk in top._sched.update_schedule )
@@ -0,0 +1,149 @@
+#=========================================================================
+# TraceTriggerPass_test.py
+#=========================================================================
+#
+# Author : Shunning Jiang
+# Date   : Oct 18, 2026
+
+import io
+from contextlib import redirect_stdout
+
+import pytest
+
+from pymtl3 import *
+from pymtl3.passes.BasePass import PassMetadata
+from pymtl3.passes.PassGroups import DefaultPassGroup
+
+from ..BinaryWave import BinaryWaveReader
+from ..BinaryWaveGenerationPass import BinaryWaveGenerationPass
+from ..TraceTriggerPass import TraceTriggerPass, TraceWindow
+from .BinaryWaveGenerationPass_test import _vcd_waves
+
+
+class Counter( Component ):
+  def construct( s ):
+    s.in_ = InPort( Bits8 )
+    s.cnt = OutPort( Bits8 )
+    s.out = OutPort( Bits8 )
+
+    @update_ff
+    def up_cnt():
+      s.cnt <<= s.cnt + 1
+
+    @update
+    def up_out():
+      s.out @= s.in_ + s.cnt
+
+  def line_trace( s ):
+    return f"{s.in_} {s.cnt} {s.out}"
+
+def run( ncycles=40, linetrace=False, **metadata ):
+  dut = Counter()
+  dut.elaborate()
+  for key, value in metadata.items():
+    dut.set_metadata( getattr( TraceTriggerPass, key ), value )
+  dut.apply( DefaultPassGroup( linetrace=linetrace, vcdwave="Counter_trigger", binwave="Counter_trigger" ) )
+
+  f = io.StringIO()
+  with redirect_stdout( f ):
+    dut.sim_reset()
+    for i in range(ncycles):
+      dut.in_ @= i // 3
+      dut.sim_tick()
+  dut.sim_finalize()
+  return dut, [ x for x in f.getvalue().splitlines() if x ]
+
+def test_gate():
+  top = PassMetadata()
+  top._sim = PassMetadata()
+  top._sim.simulated_cycles = 0
+
+  window = TraceWindow( top, [ lambda: top._sim.simulated_cycles in ( 5, 6, 12 ) ],
+                        pre_cycles=2, post_cycles=1 )
+  emitted = []
+  # The record of cycle c says signal c % 3 changed to c
+  traced = window.gate( lambda: [ top._sim.simulated_cycles % 3, top._sim.simulated_cycles ],
+                        lambda cycle, record: emitted.append( ( cycle, record ) ), changes=True )
+  for i in range(20):
+    traced()
+    top._sim.simulated_cycles += 1
+
+  assert [ c for c, _ in emitted ] == [ 3, 4, 5, 6, 7, 10, 11, 12, 13 ]
+  # The first record has the changes of the cycles that were dropped
+  assert dict( zip( emitted[0][1][::2], emitted[0][1][1::2] ) ) == { 0: 3, 1: 1, 2: 2 }
+  assert emitted[1] == ( 4, [ 1, 4 ] )
+  assert dict( zip( emitted[5][1][::2], emitted[5][1][1::2] ) ) == { 0: 9, 1: 10, 2: 8 }
+  assert window.ntriggers == 3 and window.last_trigger == 12
+
+def test_line_trace():
+  _, lines = run( linetrace=True, triggers="s.cnt == 20", pre_cycles=2, post_cycles=3 )
+  assert [ int( x[:3] ) for x in lines ] == list( range(18, 24) )
+
+  _, all_lines = run( linetrace=True )
+  assert lines == [ x for x in all_lines if 18 <= int( x[:3] ) < 24 ]
+
+  # Triggers during reset are printed with the reset marker
+  _, lines = run( linetrace=True, triggers="s.reset", post_cycles=1 )
+  assert [ x[:4] for x in lines ] == [ "  1r", "  2r", "  3:" ]
+
+def test_waveforms():
+  run()
+  full = _vcd_waves( "Counter_trigger.vcd" )
+  with BinaryWaveReader( "Counter_trigger.pwave" ) as reader:
+    full_out = reader.history( "top.out" )
+
+  dut, _ = run( triggers=[ lambda: False, "s.cnt == 20", "s.cnt == 30" ],
+                pre_cycles=4, post_cycles=1 )
+  window = dut.get_metadata( TraceTriggerPass.trace_window )
+  assert window.ntriggers == 2 and window.last_trigger == 30
+
+  cycles = set( range(16, 22) ) | set( range(26, 32) )
+
+  # Every dumped cycle has the same values as in the full waveform
+  waves = _vcd_waves( "Counter_trigger.vcd" )
+  for name in [ "top.in_", "top.cnt", "top.out" ]:
+    def value_at( wave, t ):
+      return [ v for x, v in wave if x <= t ][-1]
+    times = { t for t, _ in waves[ name ] if t > 0 }
+    assert { t // 100 for t in times } <= cycles
+    for c in cycles:
+      assert value_at( waves[ name ], c*100 ) == value_at( full[ name ], c*100 )
+
+  with BinaryWaveReader( "Counter_trigger.pwave" ) as reader:
+    assert [ c for c, _ in reader.cycles() ] == sorted( cycles )
+    assert reader.history( "top.out", 16, 22 ) == \
+           [ ( 16, [ v for c, v in full_out if c <= 16 ][-1] ) ] + \
+           [ ( c, v ) for c, v in full_out if 16 < c < 22 ]
+
+def test_signal_trigger():
+  dut = Counter()
+  dut.elaborate()
+  dut.set_metadata( TraceTriggerPass.triggers, dut.reset )
+  dut.apply( DefaultPassGroup( binwave="Counter_reset" ) )
+  dut.sim_reset()
+  for i in range(10):
+    dut.sim_tick()
+  dut.sim_finalize()
+
+  with BinaryWaveReader( "Counter_reset.pwave" ) as reader:
+    assert [ c for c, _ in reader.cycles() ] == [ 0, 1, 2 ]
+
+def test_invalid_trigger():
+  dut = Counter()
+  dut.elaborate()
+  dut.set_metadata( TraceTriggerPass.triggers, 42 )
+  with pytest.raises( TypeError ):
+    dut.apply( DefaultPassGroup() )
+
+  dut = Counter()
+  dut.elaborate()
+  dut.set_metadata( TraceTriggerPass.triggers, "s.cnt ==" )
+  with pytest.raises( SyntaxError ):
+    dut.apply( DefaultPassGroup() )
+
+  dut = Counter()
+  dut.elaborate()
+  dut.set_metadata( TraceTriggerPass.triggers, "s.cnt == 3" )
+  dut.set_metadata( BinaryWaveGenerationPass.start_cycle, 3 )
+  with pytest.raises( ValueError ):
+    dut.apply( DefaultPassGroup( binwave="Counter_both" ) )
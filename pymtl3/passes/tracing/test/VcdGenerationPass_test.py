@@ -11,6 +11,10 @@
 # Author: Peitian Pan
 # Date:   Nov 1, 2019
 
+from collections import defaultdict
+
+import pytest
+
 from pymtl3.datatypes import *
 from pymtl3.dsl import *
 from pymtl3.passes.PassGroups import DefaultPassGroup
@@ -89,3 +93,146 @@ def test_bitstruct_signals():
     [  bs(0, -1), b32(0), b32(-1), ],
     [  bs(0, 42), b32(42), b32(84), ],
   ], tv_in, tv_out )
+
+def _value_changes( vcd_file_name ):
+  with open(vcd_file_name+".vcd") as fd:
+    header, body = fd.read().split( "$enddefinitions $end\n" )
+  symbols = {}
+  for line in header.splitlines():
+    words = line.split()
+    if words and words[0] == "$var":
+      symbols[ words[4] ] = words[3]
+  # { symbol: [ (time, value) ] } of everything after the initial values
+  changes = defaultdict( list )
+  time = None
+  for line in body.splitlines():
+    if line.startswith( "#" ):
+      time = int( line[1:] )
+    elif line and time is not None:
+      value, symbol = line.split()
+      changes[ symbol ].append( (time, value) )
+  return symbols, changes
+
+def test_only_changes_are_dumped():
+  class A3( Component ):
+    def construct( s ):
+      s.in0 = InPort( Bits8 )
+      s.out = OutPort( Bits8 )
+      s.cnt = OutPort( Bits4 )
+
+      @update
+      def up_out():
+        s.out @= s.in0 + 1
+
+      @update_ff
+      def up_cnt():
+        s.cnt <<= s.cnt + 1
+
+  dut = A3()
+  dut.elaborate()
+  vcd_file_name = "A3_changes"
+  dut.set_metadata( VcdGenerationPass.vcd_file_name, vcd_file_name )
+  dut.apply( DefaultPassGroup() )
+  dut.sim_reset()
+
+  for i in range(5):
+    dut.in0 @= 7
+    dut.sim_tick()
+
+  dut.get_metadata( VcdGenerationPass.vcd_file ).flush()
+  symbols, changes = _value_changes( vcd_file_name )
+  # sim_reset ticks three times, so in0 is set in the cycle at #300
+  assert changes[ symbols['out'] ] == [ (0, 'b0b00000001'), (300, 'b0b00001000') ]
+  assert changes[ symbols['in0'] ] == [ (300, 'b0b00000111') ]
+  assert [ v for _, v in changes[ symbols['cnt'] ] ] == \
+         [ f"b0b{x:04b}" for x in range(1, 8) ]
+  # The clock goes down and up every cycle
+  assert len( changes[ symbols['clk'] ] ) == 1 + 2 * 8
+
+def test_signal_becomes_another_type():
+  class A4( Component ):
+    def construct( s ):
+      s.in0 = InPort( Bits8 )
+      s.out = OutPort( Bits8 )
+
+      @update
+      def up_out():
+        s.out @= s.in0
+
+  dut = A4()
+  dut.elaborate()
+  dut.set_metadata( VcdGenerationPass.vcd_file_name, "A4_type" )
+  dut.apply( DefaultPassGroup() )
+  dut.sim_reset()
+
+  dut.in0 = 3
+  with pytest.raises( TypeError ) as e:
+    dut.sim_tick()
+  assert "s.in0 becomes another type" in str(e.value)
+
+def test_async_same_as_sync():
+  class A5( Component ):
+    def construct( s ):
+      s.in0 = InPort( Bits8 )
+      s.out = OutPort( Bits8 )
+      s.cnt = OutPort( Bits4 )
+
+      @update
+      def up_out():
+        s.out @= s.in0 + zext( s.cnt, 8 )
+
+      @update_ff
+      def up_cnt():
+        s.cnt <<= s.cnt + 1
+
+  waves = []
+  for vcd_async in [ False, True ]:
+    dut = A5()
+    dut.elaborate()
+    dut.apply( DefaultPassGroup( vcdwave=f"A5_async_{vcd_async}", vcdwave_async=vcd_async ) )
+    dut.sim_reset()
+    # More cycles than a chunk of the async writer
+    for i in range(1000):
+      dut.in0 @= i // 3 % 200
+      dut.sim_tick()
+    dut.sim_finalize()
+    # Calling it twice is fine
+    dut.sim_finalize()
+
+    # The order of the signals in the header can differ
+    symbols, changes = _value_changes( f"A5_async_{vcd_async}" )
+    waves.append( { name: changes[ symbol ] for name, symbol in symbols.items() } )
+
+  assert len( waves[0]['cnt'] ) == 1002
+  assert waves[0] == waves[1]
+
+def test_file_closed_with_model():
+  import gc
+  import weakref
+
+  class A6( Component ):
+    def construct( s ):
+      s.cnt = OutPort( Bits4 )
+
+      @update_ff
+      def up_cnt():
+        s.cnt <<= s.cnt + 1
+
+  for vcd_async in [ False, True ]:
+    dut = A6()
+    dut.elaborate()
+    dut.apply( DefaultPassGroup( vcdwave=f"A6_async_{vcd_async}", vcdwave_async=vcd_async ) )
+    dut.sim_reset()
+    for i in range(10):
+      dut.sim_tick()
+
+    # Without sim_finalize, the file is closed when the model goes away
+    vcd_file = dut.get_metadata( VcdGenerationPass.vcd_file )
+    ref = weakref.ref( dut )
+    del dut
+    gc.collect()
+    assert ref() is None
+    assert vcd_file.closed
+
+    symbols, changes = _value_changes( f"A6_async_{vcd_async}" )
+    assert len( changes[ symbols['cnt'] ] ) == 12
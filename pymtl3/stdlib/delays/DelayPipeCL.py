@@ -13,6 +13,13 @@ from pymtl3.extra import clone_deepcopy
 
 # This delay pipe is for cycle-level performance modeling purpose
 
+def _pipe_idle_cycles( pipeline ):
+  # Messages only move forward until the last one reaches the end
+  for i in range( len(pipeline)-1, -1, -1 ):
+    if pipeline[i] is not None:
+      return len(pipeline) - 1 - i
+  return None
+
 class DelayPipeDeqCL( Component ):
 
   @non_blocking( lambda s: s.pipeline[0] is None )
@@ -67,6 +74,17 @@ class DelayPipeDeqCL( Component ):
         U(up_delay) < M(s.enq.rdy),
       )
 
+  # Fast-forward hooks
+
+  def _sim_idle_cycles( s ):
+    if s.delay == 0:
+      return None if s.pipeline[0] is None else 0
+    return _pipe_idle_cycles( s.pipeline )
+
+  def _sim_skip_cycles( s, n ):
+    if s.delay > 0:
+      s.pipeline.rotate( n )
+
   def line_trace( s ):
     return "[{}]".format( "".join( [ " " if x is None else "*" for x in list(s.pipeline)[:-1] ] ) )
 
@@ -108,6 +126,17 @@ class DelayPipeSendCL( Component ):
         M(s.enq.rdy) > U(up_delay),  # pipe behavior
       )
 
+  # Fast-forward hooks
+
+  def _sim_idle_cycles( s ):
+    if s.delay == 0:
+      return None
+    return _pipe_idle_cycles( s.pipeline )
+
+  def _sim_skip_cycles( s, n ):
+    if s.delay > 0:
+      s.pipeline.rotate( n )
+
   def line_trace( s ):
     if s.delay > 0:
       return "[{}]".format( "".join( [ " " if x is None else "*" for x in s.pipeline ] ) )
@@ -35,5 +35,14 @@ class StallCL( Component ):
     )
 
 
+  # Fast-forward hooks: without stalls this is a pass-through. Otherwise
+  # every check of recv.rdy draws a random number, so it is never idle.
+
+  def _sim_idle_cycles( s ):
+    return None if s.stall_prob == 0 else 0
+
+  def _sim_skip_cycles( s, n ):
+    pass
+
   def line_trace( s ):
     return f"{s.recv}"
@@ -106,3 +106,26 @@ def test_delay_pipe_send( test_params, cmdline_opts ):
   run_sim( TestHarness( DelayPipeSendCL, msgs[::2], msgs[1::2],
                            test_params.lat,
                            test_params.src_lat, test_params.sink_lat ) )
+
+def test_delay_pipe_send_fast_forward():
+  msgs = basic_msgs()
+  ths  = []
+  for i in range(2):
+    th = TestHarness( DelayPipeSendCL, msgs[::2], msgs[1::2], 50, 20, 0 )
+    th.apply( DefaultPassGroup(linetrace=False) )
+    th.sim_reset()
+    ths.append( th )
+  ref, th = ths
+
+  skipped = 0
+  while not ref.done():
+    for i in range(9):
+      ref.sim_tick()
+    skipped += th.sim_fast_forward( 9 )
+
+    assert th.sim_cycle_count() == ref.sim_cycle_count()
+    assert list(th.dut.pipeline) == list(ref.dut.pipeline)
+    assert ( th.src.count, len(th.src.msgs) ) == ( ref.src.count, len(ref.src.msgs) )
+    assert ( th.sink.count, th.sink.idx ) == ( ref.sink.count, ref.sink.idx )
+  assert th.done()
+  assert skipped > ref.sim_cycle_count() // 2
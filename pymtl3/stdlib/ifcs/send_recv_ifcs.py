@@ -208,6 +208,14 @@ class RecvCL2SendRTL( Component ):
   def recv( s, msg ):
     s.entry = clone_deepcopy( msg )
 
+  # Fast-forward hooks
+
+  def _sim_idle_cycles( s ):
+    return None if s.entry is None else 0
+
+  def _sim_skip_cycles( s, n ):
+    pass
+
   def line_trace( s ):
     return "{}(){}".format( s.recv, s.send )
 
@@ -241,6 +249,14 @@ class RecvRTL2SendCL( Component ):
 
     s.add_constraints( U( up_recv_rtl_rdy ) < U( up_send_cl ) )
 
+  # Fast-forward hooks
+
+  def _sim_idle_cycles( s ):
+    return None if s.sent_msg is None else 0
+
+  def _sim_skip_cycles( s, n ):
+    pass
+
   def line_trace( s ):
     return "{}(){}".format(
       s.recv.line_trace(),
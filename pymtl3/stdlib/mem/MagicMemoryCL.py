@@ -141,6 +141,20 @@ class MagicMemoryCL( Component ):
 
           s.resp_qs[i].enq( resp )
 
+  #-----------------------------------------------------------------------
+  # Fast-forward hooks
+  #-----------------------------------------------------------------------
+  # up_mem only does something when a request reaches the end of its
+  # request pipe, so the memory is idle for the remaining latency of the
+  # oldest request. The pipes advance their own messages.
+
+  def _sim_idle_cycles( s ):
+    idle = [ x for x in ( q._sim_idle_cycles() for q in s.req_qs ) if x is not None ]
+    return min( idle ) if idle else None
+
+  def _sim_skip_cycles( s, n ):
+    pass
+
   #-----------------------------------------------------------------------
   # line_trace
   #-----------------------------------------------------------------------
@@ -1,4 +1,5 @@
 from pymtl3 import *
+from pymtl3.datatypes import bits_to_buffer
 from pymtl3.extra.pypy.fast_bytearray_funcs import (
     read_bytearray_bits,
     write_bytearray_bits,
@@ -57,9 +58,23 @@ class MagicMemoryFL( Component ):
     assert len(s.mem) > (addr + size)
     return s.mem[ addr : addr + size ]
 
+  # data is bytes-like, a BitsArray, or a sequence of Bits which is
+  # written as consecutive little-endian elements (see bits_to_buffer)
   def write_mem( s, addr, data ):
+    if isinstance( data, BitsArray ):
+      data = data.tobytes()
+    elif not isinstance( data, (bytes, bytearray, memoryview) ):
+      data = bits_to_buffer( data )
     assert len(s.mem) > (addr + len(data))
     s.mem[ addr : addr + len(data) ] = data
 
+  # Fast-forward hooks: the memory only acts when it is called
+
+  def _sim_idle_cycles( s ):
+    return None
+
+  def _sim_skip_cycles( s, n ):
+    s.trace = "     "
+
   def line_trace( s ):
     return s.trace
@@ -1,10 +1,13 @@
+from .parallel_runner import SimJob, SimJobResult, run_parallel_sims
 from .test_helpers import (
     RunTestVectorSimError,
     TestVectorSimulator,
     config_model_with_cmdline_opts,
     mk_test_case_table,
     run_sim,
+    run_sim_until_done,
     run_test_vector_sim,
+    run_test_vectors,
 )
 from .test_masters import TestMasterCL
 from .test_sinks import TestSinkCL
@@ -0,0 +1,181 @@
+"""
+========================================================================
+parallel_runner
+========================================================================
+Run many simulation jobs over a pool of worker processes. Each job is
+a model factory, the usual cmdline_opts, and a stimulus:
+
+  - None: the model is simulated like run_sim, i.e., until done()
+  - a list: the list is a test vector table like run_test_vector_sim
+  - a callable: called with the elaborated model (e.g., to load a
+    program into memory and the expected messages into the test sinks)
+    before the model is reset and simulated until done()
+
+sim_reset() only resets the hardware, not Python-side state like the
+messages of test sources and sinks or the contents of a test memory. So
+by default every job gets a freshly built model. With reuse_models=True,
+consecutive jobs of the same design that end up in the same worker
+reuse the elaborated (and, with --test-verilog, verilated) model if it
+declares that it can be re-initialized: the top component has to define
+reinit(), which brings all Python-side state back to the state right
+after construction. The runner then calls reinit(), the stimulus, and
+sim_reset() for the next job.
+
+Factories and stimuli are sent to the workers, so they have to be
+picklable (e.g., classes, module-level functions, functools.partial).
+
+Author : Shunning Jiang
+Date   : Oct 18, 2026
+"""
+import math
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from pymtl3 import *
+
+from .test_helpers import (
+    config_model_with_cmdline_opts,
+    finalize_sim,
+    run_sim_until_done,
+    run_test_vectors,
+)
+
+_default_cmdline_opts = {'dump_vcd': False, 'test_verilog': False,
+                         'max_cycles': None, 'dump_vtb': ''}
+
+class SimJob:
+
+  def __init__( s, factory, cmdline_opts=None, stimulus=None, name=None ):
+    s.factory      = factory
+    s.cmdline_opts = cmdline_opts or _default_cmdline_opts
+    s.stimulus     = stimulus
+    s.name         = name or getattr( factory, '__name__', repr(factory) )
+
+  def design_key( s ):
+    # Jobs with the same factory and cmdline_opts can share one model
+    return ( repr(s.factory), repr(sorted( s.cmdline_opts.items() )) )
+
+class SimJobResult:
+
+  def __init__( s, name, passed, cycles, wall_time, error=None ):
+    s.name      = name
+    s.passed    = passed
+    s.cycles    = cycles
+    s.wall_time = wall_time
+    s.error     = error
+
+  def __repr__( s ):
+    status = "PASS" if s.passed else "FAIL"
+    return f"SimJobResult({s.name!r}, {status}, cycles={s.cycles}, wall_time={s.wall_time:.3f}s)"
+
+#-------------------------------------------------------------------------
+# run_parallel_sims
+#-------------------------------------------------------------------------
+
+def run_parallel_sims( jobs, num_workers=None, print_line_trace=False,
+                       reuse_models=False ):
+  """Run jobs in parallel and return a list of SimJobResults in the
+  order of jobs. num_workers=0 runs everything in this process."""
+
+  jobs = list(jobs)
+  if num_workers is None:
+    num_workers = os.cpu_count() or 1
+
+  # Group jobs of the same design together so a worker sees them back to
+  # back, then split the groups into chunks to balance the load.
+
+  groups = {}
+  for i, job in enumerate( jobs ):
+    groups.setdefault( job.design_key(), [] ).append( (i, job) )
+
+  chunk_size = max( 1, math.ceil( len(jobs) / max( 1, num_workers * 4 ) ) )
+  chunks = []
+  for group in groups.values():
+    for i in range( 0, len(group), chunk_size ):
+      chunks.append( group[ i:i+chunk_size ] )
+
+  results = [ None ] * len(jobs)
+
+  if num_workers == 0:
+    for chunk in chunks:
+      for i, result in _run_chunk( chunk, print_line_trace, reuse_models ):
+        results[i] = result
+    return results
+
+  with ProcessPoolExecutor( max_workers=num_workers ) as executor:
+    futures = [ executor.submit( _run_chunk, chunk, print_line_trace, reuse_models )
+                for chunk in chunks ]
+    for future in futures:
+      for i, result in future.result():
+        results[i] = result
+
+  return results
+
+#-------------------------------------------------------------------------
+# Worker side
+#-------------------------------------------------------------------------
+
+def _run_chunk( chunk, print_line_trace, reuse_models ):
+  ret = []
+  model, model_key = None, None
+
+  try:
+    for i, job in chunk:
+      start = time.perf_counter()
+      cycles = 0
+      try:
+        if model is None or not reuse_models or model_key != job.design_key() or \
+           not hasattr( model, 'reinit' ):
+          if model is not None:
+            finalize_sim( model )
+            model = None
+          model = _build_model( job, print_line_trace )
+          model_key = job.design_key()
+        else:
+          model.reinit()
+          _load_stimulus( model, job )
+          model.sim_reset()
+
+        start_cycle = model.sim_cycle_count()
+        _run_stimulus( model, job, print_line_trace )
+        cycles = model.sim_cycle_count() - start_cycle
+
+        ret.append( (i, SimJobResult( job.name, True, cycles, time.perf_counter() - start )) )
+
+      except Exception:
+        ret.append( (i, SimJobResult( job.name, False, cycles, time.perf_counter() - start,
+                                      traceback.format_exc() )) )
+        # The state of a failed model cannot be trusted anymore
+        if model is not None:
+          finalize_sim( model )
+          model = None
+
+  finally:
+    if model is not None:
+      finalize_sim( model )
+
+  return ret
+
+def _build_model( job, print_line_trace ):
+  # Load the stimulus before the reset like run_sim, otherwise the test
+  # sinks are already done during the reset cycles
+  model = config_model_with_cmdline_opts( job.factory(), job.cmdline_opts, [] )
+  _load_stimulus( model, job )
+  model.apply( DefaultPassGroup(linetrace=print_line_trace) )
+  model.sim_reset()
+  return model
+
+def _load_stimulus( model, job ):
+  if job.stimulus is not None and not isinstance( job.stimulus, (list, tuple) ):
+    job.stimulus( model )
+
+def _run_stimulus( model, job, print_line_trace ):
+  max_cycles = job.cmdline_opts.get( 'max_cycles' ) or 10000
+
+  if isinstance( job.stimulus, (list, tuple) ):
+    run_test_vectors( model, job.stimulus, print_line_trace )
+    return
+
+  run_sim_until_done( model, max_cycles )
@@ -0,0 +1,126 @@
+#=========================================================================
+# parallel_runner_test
+#=========================================================================
+
+from functools import partial
+
+import pytest
+
+from pymtl3 import *
+from pymtl3.stdlib.delays.DelayPipeCL import DelayPipeSendCL
+from pymtl3.stdlib.test_utils import SimJob, TestSinkCL, TestSrcCL, run_parallel_sims
+
+#-------------------------------------------------------------------------
+# Test components, module-level so that they can be sent to workers
+#-------------------------------------------------------------------------
+
+class Incr( Component ):
+  def construct( s ):
+    s.in_ = InPort(8)
+    s.out = OutPort(8)
+
+    @update
+    def up():
+      s.out @= s.in_ + 1
+
+  # No Python-side state, so the model can be reused
+  def reinit( s ):
+    pass
+
+class Counter( Component ):
+  def construct( s, limit=5 ):
+    s.limit = Wire(8)
+    s.count = OutPort(8)
+
+    @update_ff
+    def up_count():
+      if s.reset:
+        s.count <<= 0
+      else:
+        s.count <<= s.count + 1
+
+    s.limit //= limit
+
+  def done( s ):
+    return s.count == s.limit
+
+  def reinit( s ):
+    pass
+
+# The messages reach the sink long after the source is done, so the
+# sink has to know the expected messages from the start
+class SrcSink( Component ):
+  def construct( s ):
+    s.src  = TestSrcCL ( Bits8, [] )
+    s.pipe = DelayPipeSendCL( 8 )
+    s.sink = TestSinkCL( Bits8, [] )
+    connect( s.src.send, s.pipe.enq )
+    connect( s.pipe.send, s.sink.recv )
+
+  def done( s ):
+    return s.src.done() and s.sink.done()
+
+class ReinitSrcSink( SrcSink ):
+  def reinit( s ):
+    s.src.msgs.clear()
+    s.sink.msgs.clear()
+    s.sink.idx       = 0
+    s.sink.error_msg = ''
+    s.sink.all_msg_recved = s.sink.done_flag = s.sink.recv_called = False
+
+def _load( src_msgs, sink_msgs, model ):
+  model.src.msgs.extend( [ Bits8( x ) for x in src_msgs ] )
+  model.sink.msgs.extend( [ Bits8( x ) for x in sink_msgs ] )
+
+def _set_nothing( model ):
+  pass
+
+def _mk_jobs():
+  jobs = []
+  for i in range(6):
+    jobs.append( SimJob( Incr, stimulus=[ 'in_ out*', [ i, i+1 ], [ i+1, i+2 ] ],
+                         name=f"incr{i}" ) )
+  for limit in [ 3, 7 ]:
+    jobs.append( SimJob( partial( Counter, limit ), stimulus=_set_nothing,
+                         name=f"counter{limit}" ) )
+  # A failing test vector
+  jobs.append( SimJob( Incr, stimulus=[ 'in_ out*', [ 1, 3 ] ], name="bad" ) )
+  return jobs
+
+def _check( results ):
+  assert [ x.name for x in results ] == [ f"incr{i}" for i in range(6) ] + \
+                                        [ "counter3", "counter7", "bad" ]
+  for x in results[:-1]:
+    assert x.passed, x.error
+  assert not results[-1].passed
+  assert "RunTestVectorSimError" in results[-1].error
+
+  # 2 test vectors plus 3 extra ticks
+  assert results[0].cycles == 5
+  # counts to the limit plus 3 extra ticks
+  assert results[6].cycles == 3 + 3
+  assert results[7].cycles == 7 + 3
+
+def test_in_process():
+  _check( run_parallel_sims( _mk_jobs(), num_workers=0 ) )
+
+def test_in_process_reuse():
+  _check( run_parallel_sims( _mk_jobs(), num_workers=0, reuse_models=True ) )
+
+def test_process_pool():
+  _check( run_parallel_sims( _mk_jobs(), num_workers=2, reuse_models=True ) )
+
+@pytest.mark.parametrize( "reuse_models", [ False, True ] )
+def test_src_sink_golden( reuse_models ):
+  jobs = []
+  for cls in [ SrcSink, ReinitSrcSink ]:
+    jobs += [ SimJob( cls, stimulus=partial( _load, [ 1, 2, 3 ], [ 1, 2, 3 ] ), name="good" ),
+              SimJob( cls, stimulus=partial( _load, [ 1, 2, 3 ], [ 1, 2, 4 ] ), name="bad" ),
+              SimJob( cls, stimulus=partial( _load, [ 4, 5 ], [ 4, 5 ] ), name="good" ) ]
+
+  results = run_parallel_sims( jobs, num_workers=0, reuse_models=reuse_models )
+  assert [ x.passed for x in results ] == [ True, False, True ] * 2, \
+         [ x.error for x in results ]
+  assert "PyMTLTestSinkError" in results[1].error
+  # The sinks checked every message instead of being done during reset
+  assert all( x.cycles >= 3 for x in results if x.passed )
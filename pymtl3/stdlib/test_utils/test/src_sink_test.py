@@ -10,6 +10,7 @@ Author : Yanghui Ou
 import pytest
 
 from pymtl3 import *
+from pymtl3.datatypes import bits_to_buffer
 
 from ..test_helpers import run_sim
 from ..test_sinks import PyMTLTestSinkError, TestSinkCL, TestSinkRTL
@@ -44,6 +45,13 @@ def test_cl_no_delay():
   th = TestHarnessSimple( Bits16, TestSrcCL, TestSinkCL, msgs, msgs )
   run_sim( th )
 
+def test_cl_buffer():
+  msgs = [ Bits16( 0 ), Bits16( 1 ), Bits16( 0xffff ), Bits16( 3 ) ]
+  buf  = bits_to_buffer( msgs )
+  th = TestHarnessSimple( Bits16, TestSrcCL, TestSinkCL, buf, bytearray( buf ) )
+  run_sim( th )
+  assert th.sink.msgs == msgs
+
 # int_msgs = [ 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 ]
 bit_msgs = [ Bits16( 0 ), Bits16( 1 ), Bits16( 2 ), Bits16( 3 ),
              Bits16( 0 ), Bits16( 1 ), Bits16( 2 ), Bits16( 3 ),
@@ -229,3 +237,42 @@ def test_customized_cmp():
   )
   th.set_param( 'top.sink.construct', cmp_fn=lambda a, b: a[0:2] == b[0:2] )
   run_sim( th )
+
+#-------------------------------------------------------------------------
+# Fast-forward test
+#-------------------------------------------------------------------------
+# Fast-forwarding over the delays must end up in exactly the same state
+# as ticking cycle by cycle.
+
+@pytest.mark.parametrize(
+  ('src_level', 'sink_level'),
+  [ ('cl', 'cl'), ('cl', 'rtl'), ('rtl', 'cl'), ('rtl', 'rtl') ],
+)
+def test_fast_forward( src_level, sink_level ):
+  ths = []
+  for i in range(2):
+    th = TestHarness( src_level, sink_level, Bits16, bit_msgs, bit_msgs,
+                      30, 40, 0, 15 )
+    th.apply( DefaultPassGroup(linetrace=False) )
+    th.sim_reset()
+    ths.append( th )
+  ref, th = ths
+
+  def cl_srcs( th ):
+    return [ x.src if src_level == 'rtl' else x for x in th.srcs ]
+  def cl_sinks( th ):
+    return [ x.sink if sink_level == 'rtl' else x for x in th.sinks ]
+
+  skipped = 0
+  while not ref.done():
+    for i in range(7):
+      ref.sim_tick()
+    skipped += th.sim_fast_forward( 7 )
+
+    assert th.sim_cycle_count() == ref.sim_cycle_count()
+    for x, y in zip( cl_srcs( th ), cl_srcs( ref ) ):
+      assert ( x.count, len(x.msgs) ) == ( y.count, len(y.msgs) )
+    for x, y in zip( cl_sinks( th ), cl_sinks( ref ) ):
+      assert ( x.count, x.idx, x.cycle_count ) == ( y.count, y.idx, y.cycle_count )
+  assert th.done()
+  assert skipped > ref.sim_cycle_count() // 2
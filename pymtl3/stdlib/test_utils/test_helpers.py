@@ -12,7 +12,7 @@ import collections
 import re
 
 from pymtl3 import *
-from pymtl3.datatypes import is_bitstruct_class
+from pymtl3.datatypes import bits_from_ints, is_bitstruct_class
 from pymtl3.passes.backends.verilog import *
 from pymtl3.passes.tracing import VcdGenerationPass
 
@@ -50,6 +50,12 @@ def finalize_verilator( model ):
   if hasattr( model, 'finalize' ):
     model.finalize()
 
+def finalize_sim( model ):
+  # Close the waveforms before finalizing the imported Verilog models
+  if hasattr( model, 'sim_finalize' ):
+    model.sim_finalize()
+  finalize_verilator( model )
+
 def _recursive_set_vl_trace( m, dump_vcd ):
   if ( m.has_metadata( VerilogTranslationImportPass.enable ) and \
        m.get_metadata( VerilogTranslationImportPass.enable ) ) or \
@@ -170,7 +176,7 @@ class TestVectorSimulator:
 
         self.model.sim_tick()
     finally:
-      finalize_verilator( self.model )
+      finalize_sim( self.model )
 
 def run_sim( model, cmdline_opts=None, print_line_trace=True, duts=None ):
 
@@ -189,19 +195,28 @@ def run_sim( model, cmdline_opts=None, print_line_trace=True, duts=None ):
     model.sim_reset()
 
     # Run simulation
-    while not model.done() and model.sim_cycle_count() < max_cycles:
-      model.sim_tick()
+    run_sim_until_done( model, max_cycles )
 
-    # Force a test failure if we timed out
-    assert model.sim_cycle_count() < max_cycles
+  finally:
+    finalize_sim( model )
 
-    # Extra ticks to make VCD easier to read
-    model.sim_tick()
-    model.sim_tick()
+def run_sim_until_done( model, max_cycles ):
+  """Tick a model that is already reset until model.done()."""
+
+  # Cycle counts are relative so that a reused model works the same
+  max_cycles += model.sim_cycle_count()
+
+  # Run simulation
+  while not model.done() and model.sim_cycle_count() < max_cycles:
     model.sim_tick()
 
-  finally:
-    finalize_verilator( model )
+  # Force a test failure if we timed out
+  assert model.sim_cycle_count() < max_cycles
+
+  # Extra ticks to make VCD easier to read
+  model.sim_tick()
+  model.sim_tick()
+  model.sim_tick()
 
 class RunTestVectorSimError( Exception ):
   pass
@@ -209,17 +224,6 @@ class RunTestVectorSimError( Exception ):
 def run_test_vector_sim( model, test_vectors, cmdline_opts=None, print_line_trace=True ):
   cmdline_opts = cmdline_opts or {'dump_vcd': False, 'test_verilog': False, 'dump_vtb': ''}
 
-  # First row in test vectors contains port names
-
-  if isinstance(test_vectors[0],str):
-    port_names = test_vectors[0].split()
-  else:
-    port_names = test_vectors[0]
-
-  # Remaining rows contain the actual test vectors
-
-  test_vectors = test_vectors[1:]
-
   # Setup the model
 
   model = config_model_with_cmdline_opts( model, cmdline_opts, [] )
@@ -231,57 +235,92 @@ def run_test_vector_sim( model, test_vectors, cmdline_opts=None, print_line_trac
     model.sim_reset()
 
     # Run the simulation
+    run_test_vectors( model, test_vectors, print_line_trace )
 
-    row_num = 0
-    in_ids  = []
-    out_ids = []
-    groups  = [ None ] * len(port_names)
-    types   = [ None ] * len(port_names)
-
-    # Preprocess default type
-    # Special case for lists of ports
-    # NOTE THAT WE ONLY SUPPORT 1D ARRAY and no interface
-    for i, port_full_name in enumerate( port_names ):
-      if port_full_name[-1] == "*":
-        out_ids.append( i )
-        port_name = port_full_name[:-1]
-      else:
-        in_ids.append( i )
-        port_name = port_full_name
-
-      if '[' in port_name:
-        # Get tokens of the full name
-        m = re.match( r'(\w+)\[(\d+)\]', port_name )
-        if not m:
-          raise Exception(f"Could not parse port name: {port_name}. "
-                          f"Currently we don't support interface or high-D array.")
-
-        groups[i] = g = ( True, m.group(1), int(m.group(2)) )
-
-        if not hasattr( model, g[1] ):
-          raise RunTestVectorSimError(f"Invalid port name: {g[1]}")
-
-        # Get type of all the ports
-        t = type( getattr( model, g[1] )[ int(g[2]) ] )
-        types[i] = None if is_bitstruct_class( t ) else t
+  finally:
+    finalize_sim( model )
 
-      else:
-        groups[i] = ( False, port_name )
+def run_test_vectors( model, test_vectors, print_line_trace=True ):
+  """Apply test vectors to a model that is already reset."""
 
-        if not hasattr( model, port_name ):
-          raise RunTestVectorSimError(f"Invalid port name: {port_name}")
+  # First row in test vectors contains port names
 
-        t = type( getattr( model, port_name ) )
-        types[i] = None if is_bitstruct_class( t ) else t
+  if isinstance(test_vectors[0],str):
+    port_names = test_vectors[0].split()
+  else:
+    port_names = test_vectors[0]
 
-    # Run simulation
+  # Remaining rows contain the actual test vectors
 
-    for row in test_vectors:
-      row_num += 1
+  test_vectors = test_vectors[1:]
 
-      # Apply test inputs
-      for i in in_ids:
-        in_value = row[i]
+  row_num = 0
+  in_ids  = []
+  out_ids = []
+  groups  = [ None ] * len(port_names)
+  types   = [ None ] * len(port_names)
+
+  # Preprocess default type
+  # Special case for lists of ports
+  # NOTE THAT WE ONLY SUPPORT 1D ARRAY and no interface
+  for i, port_full_name in enumerate( port_names ):
+    if port_full_name[-1] == "*":
+      out_ids.append( i )
+      port_name = port_full_name[:-1]
+    else:
+      in_ids.append( i )
+      port_name = port_full_name
+
+    if '[' in port_name:
+      # Get tokens of the full name
+      m = re.match( r'(\w+)\[(\d+)\]', port_name )
+      if not m:
+        raise Exception(f"Could not parse port name: {port_name}. "
+                        f"Currently we don't support interface or high-D array.")
+
+      groups[i] = g = ( True, m.group(1), int(m.group(2)) )
+
+      if not hasattr( model, g[1] ):
+        raise RunTestVectorSimError(f"Invalid port name: {g[1]}")
+
+      # Get type of all the ports
+      t = type( getattr( model, g[1] )[ int(g[2]) ] )
+      types[i] = None if is_bitstruct_class( t ) else t
+
+    else:
+      groups[i] = ( False, port_name )
+
+      if not hasattr( model, port_name ):
+        raise RunTestVectorSimError(f"Invalid port name: {port_name}")
+
+      t = type( getattr( model, port_name ) )
+      types[i] = None if is_bitstruct_class( t ) else t
+
+  # Convert each input column to the port type in one call. Columns
+  # with invalid values are converted row by row below so that the error
+  # points to the row.
+
+  in_columns = {}
+  converted  = set()
+  for i in in_ids:
+    column = [ row[i] for row in test_vectors ]
+    if types[i]:
+      try:
+        column = bits_from_ints( types[i], column )
+        converted.add( i )
+      except (TypeError, ValueError):
+        pass
+    in_columns[i] = column
+
+  # Run simulation
+
+  for row in test_vectors:
+    row_num += 1
+
+    # Apply test inputs
+    for i in in_ids:
+      in_value = in_columns[i][ row_num - 1 ]
+      if i not in converted:
         if in_value == '?':
           raise RunTestVectorSimError(f"""
 Invalid input value in row {row_num} ({row}:
@@ -291,52 +330,49 @@ Please double check the provided values.
 """ )
         t = types[i]
         if t: in_value = t( in_value )
-        g = groups[i]
-        x = getattr( model, g[1] )
-        if g[0]:  x[g[2]] @= in_value
-        else:     x       @= in_value
+      g = groups[i]
+      x = getattr( model, g[1] )
+      if g[0]:  x[g[2]] @= in_value
+      else:     x       @= in_value
 
-      # Evaluate combinational concurrent blocks
-      model.sim_eval_combinational()
+    # Evaluate combinational concurrent blocks
+    model.sim_eval_combinational()
 
-      # Check test outputs
-      for i in out_ids:
-        ref_value = row[i]
-        if ref_value == '?':  continue
+    # Check test outputs
+    for i in out_ids:
+      ref_value = row[i]
+      if ref_value == '?':  continue
 
-        g = groups[i]
-        if g[0]:  out_value = getattr( model, g[1] )[g[2]]
-        else:     out_value = getattr( model, g[1] )
+      g = groups[i]
+      if g[0]:  out_value = getattr( model, g[1] )[g[2]]
+      else:     out_value = getattr( model, g[1] )
 
-        if out_value != ref_value:
-          if print_line_trace:
-            model.print_line_trace()
+      if out_value != ref_value:
+        if print_line_trace:
+          model.print_line_trace()
 
-          port_name = g[1]
-          if g[0]:
-            port_name = f"{g[1]}[{g[2]}]"
+        port_name = g[1]
+        if g[0]:
+          port_name = f"{g[1]}[{g[2]}]"
 
-          error_msg = """
+        error_msg = """
 run_test_vector_sim received an incorrect value!
 - row number     : {row_number}
 - port name      : {port_name}
 - expected value : {expected_msg}
 - actual value   : {actual_msg}
 """
-          raise RunTestVectorSimError( error_msg.format(
-            row_number   = row_num,
-            port_name    = port_name,
-            expected_msg = ref_value,
-            actual_msg   = out_value
-          ))
-
-      # Tick the simulation
-      model.sim_tick()
-
-    # Extra ticks to make VCD easier to read
-    model.sim_tick()
-    model.sim_tick()
+        raise RunTestVectorSimError( error_msg.format(
+          row_number   = row_num,
+          port_name    = port_name,
+          expected_msg = ref_value,
+          actual_msg   = out_value
+        ))
+
+    # Tick the simulation
     model.sim_tick()
 
-  finally:
-    finalize_verilator( model )
+  # Extra ticks to make VCD easier to read
+  model.sim_tick()
+  model.sim_tick()
+  model.sim_tick()
@@ -9,6 +9,7 @@ Author : Yanghui Ou
 """
 
 from pymtl3 import *
+from pymtl3.datatypes import bits_from_buffer
 from pymtl3.stdlib.ifcs import RecvIfcRTL, RecvRTL2SendCL
 
 
@@ -25,6 +26,11 @@ class TestSinkCL( Component ):
 
     s.recv.Type = Type
 
+    # A golden output trace can be passed as a buffer in the layout of
+    # bits_to_buffer and is decoded in one call
+    if isinstance( msgs, (bytes, bytearray, memoryview) ):
+      msgs = bits_from_buffer( Type, msgs )
+
     # [msgs] and [arrival_time] must have the same length.
     if arrival_time is not None:
       assert len( msgs ) == len( arrival_time )
@@ -113,6 +119,20 @@ class TestSinkCL( Component ):
   def done( s ):
     return s.done_flag
 
+  # Fast-forward hooks: the sink is idle while it waits for a message,
+  # but becomes ready after count cycles
+
+  def _sim_idle_cycles( s ):
+    if s.error_msg or s.recv_called:
+      return 0
+    if s.idx >= len( s.msgs ) and not s.done_flag:
+      return 0
+    return s.count if s.count > 0 else None
+
+  def _sim_skip_cycles( s, n ):
+    s.cycle_count = 0 if s.reset else s.cycle_count + n
+    s.count = max( 0, s.count - n )
+
   # Line trace
   def line_trace( s ):
     return "{}".format( s.recv )
@@ -10,6 +10,7 @@ Author : Yanghui Ou
 from collections import deque
 
 from pymtl3 import *
+from pymtl3.datatypes import bits_from_buffer
 from pymtl3.stdlib.ifcs import RecvCL2SendRTL, SendIfcRTL
 
 #-------------------------------------------------------------------------
@@ -20,6 +21,11 @@ class TestSrcCL( Component ):
 
   def construct( s, Type, msgs, initial_delay=0, interval_delay=0 ):
 
+    # A stimulus file can be passed as a buffer in the layout of
+    # bits_to_buffer and is decoded in one call
+    if isinstance( msgs, (bytes, bytearray, memoryview) ):
+      msgs = bits_from_buffer( Type, msgs )
+
     s.send = CallerIfcCL( Type=Type )
     s.msgs = deque( msgs )
 
@@ -38,6 +44,16 @@ class TestSrcCL( Component ):
   def done( s ):
     return not s.msgs
 
+  # Fast-forward hooks: the source only counts down while it waits
+
+  def _sim_idle_cycles( s ):
+    if s.count > 0:
+      return s.count
+    return None if not s.msgs else 0
+
+  def _sim_skip_cycles( s, n ):
+    s.count = max( 0, s.count - n )
+
   # Line trace
 
   def line_trace( s ):